@@ -41,6 +41,7 @@ class KinematicsAPI(object):
         sampling_number=1000,
         num_kin_sampling=1000,
         num_psf_sampling=100,
+        mge_kinematics=False,
     ):
         """Initialize the class with the lens model and cosmology.
 
@@ -88,7 +89,20 @@ class KinematicsAPI(object):
         :param num_kin_sampling: number of kinematic renderings on a total IFU
         :param num_psf_sampling: number of PSF displacements for each kinematic
             rendering on the IFU
+        :param mge_kinematics: bool, if True, computes the kinematics of the MGE mass
+            and light profiles semi-analytically with analytic seeing and aperture
+            integrals instead of Monte-Carlo renderings (requires MGE_light=True,
+            MGE_mass=True and a Gaussian PSF, see MGEKinematics)
         """
+        if mge_kinematics is True:
+            if not (MGE_light is True and MGE_mass is True):
+                raise ValueError(
+                    "mge_kinematics=True requires MGE_light=True and MGE_mass=True."
+                )
+            if multi_observations is True:
+                raise ValueError(
+                    "mge_kinematics=True is not supported with multi_observations."
+                )
         self.z_d = z_lens
         self.z_s = z_source
         self._kwargs_aperture_kin = kwargs_aperture
@@ -139,6 +153,7 @@ class KinematicsAPI(object):
         self._MGE_light = MGE_light
         self._MGE_mass = MGE_mass
         self._multi_observations = multi_observations
+        self._mge_kinematics = mge_kinematics
 
     def velocity_dispersion(
         self,
@@ -189,6 +204,7 @@ class KinematicsAPI(object):
         direct_convolve=False,
         supersampling_factor=1,
         voronoi_bins=None,
+        radial_rtol=None,
     ):
         """API for both, analytic and numerical JAM to compute the velocity dispersion
         map with IFU data [km/s]
@@ -207,6 +223,9 @@ class KinematicsAPI(object):
         :param supersampling_factor: supersampling factor for 2D integration grid
         :param voronoi_bins: mapping of the voronoi bins, -1 values for  pixels not
             binned
+        :param radial_rtol: None or float, relative accuracy of the adaptive radial
+            grid of the projected integrals with direct_convolve=True (see
+            Galkin.dispersion_map_grid_convolved())
         :return: velocity dispersion map in specified bins or grid in `kwargs_aperture`,
             in [km/s] unit
         """
@@ -226,6 +245,7 @@ class KinematicsAPI(object):
                 kwargs_anisotropy,
                 supersampling_factor=supersampling_factor,
                 voronoi_bins=voronoi_bins,
+                radial_rtol=radial_rtol,
             )
 
             sigma_v_map = self.transform_kappa_ext(sigma_v_map, kappa_ext=kappa_ext)
@@ -233,7 +253,10 @@ class KinematicsAPI(object):
             return sigma_v_map
         else:
             if not self._multi_observations:
-                if self._kwargs_aperture_kin["aperture_type"] == "IFU_grid":
+                if (
+                    self._kwargs_aperture_kin["aperture_type"] == "IFU_grid"
+                    and not self._mge_kinematics
+                ):
                     warnings.warn(
                         'direct_convolve=False may be slow with aperture type "IFU_grid", '
                         "you may want to use direct_convolve=True instead."
@@ -361,6 +384,7 @@ class KinematicsAPI(object):
         elif (
             self._kwargs_aperture_kin["aperture_type"] == "IFU_shells"
             and not self._analytic_kinematics
+            and not self._mge_kinematics
         ):
             galkin = GalkinShells(
                 kwargs_model=kwargs_model,
@@ -378,6 +402,7 @@ class KinematicsAPI(object):
                 kwargs_cosmo=self._kwargs_cosmo,
                 kwargs_numerics=self._kwargs_numerics_kin,
                 analytic_kinematics=self._analytic_kinematics,
+                mge_kinematics=self._mge_kinematics,
             )
 
         return galkin, kwargs_profile, kwargs_light
@@ -163,8 +163,11 @@ class MultiPatchReconstruction(MultiBandImageReconstruction):
                 kwargs_lens = kwargs_params["kwargs_lens"]
                 lens_model = image_model.LensModel
                 x_grid, y_grid = image_model.Data.pixel_coordinates
-                kappa = lens_model.kappa(x_grid, y_grid, kwargs_lens)
-                magnification = lens_model.magnification(x_grid, y_grid, kwargs_lens)
+                quantities = lens_model.lensing_quantities(
+                    x_grid, y_grid, kwargs_lens, which=["kappa", "magnification"]
+                )
+                kappa = quantities["kappa"]
+                magnification = quantities["magnification"]
                 alpha_x, alpha_y = lens_model.alpha(x_grid, y_grid, kwargs_lens)
 
                 data_class_i = image_model.Data
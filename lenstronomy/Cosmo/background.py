@@ -10,25 +10,62 @@ __all__ = ["Background"]
 class Background(object):
     """Class to compute cosmological distances."""
 
-    def __init__(self, cosmo=None, interp=False, **kwargs_interp):
+    def __init__(self, cosmo=None, interp=False, distance_table=None, **kwargs_interp):
         """
 
         :param cosmo: instance of astropy.cosmology
         :param interp: boolean, if True, uses interpolated cosmology to evaluate specific redshifts
+        :param distance_table: None or DistanceTable instance (possibly shared with other classes) used to
+         evaluate the distances between redshifts. Can not be used together with interp=True.
         :param kwargs_interp: keyword arguments of CosmoInterp specifying the interpolation interval and maximum
          redshift
         :return: Background class with instance of astropy.cosmology
         """
         self.rhoc = 2.77536627e11  # critical density [h^2 M_sun Mpc^-3]
+        if interp and distance_table is not None:
+            raise ValueError(
+                "distance_table can not be used together with interpolated cosmology (interp=True)."
+            )
+        self._distance_table = distance_table
         if cosmo is None:
-            from astropy.cosmology import default_cosmology
+            if distance_table is not None:
+                cosmo = distance_table.cosmo
+            else:
+                from astropy.cosmology import default_cosmology
 
-            cosmo = default_cosmology.get()
+                cosmo = default_cosmology.get()
         if interp:
             self.cosmo = CosmoInterp(cosmo, **kwargs_interp)
         else:
             self.cosmo = cosmo
 
+    @property
+    def cosmo(self):
+        """
+
+        :return: astropy.cosmology instance
+        """
+        return self._cosmo
+
+    @cosmo.setter
+    def cosmo(self, cosmo):
+        """Sets the cosmology (and updates the distance table if present).
+
+        :param cosmo: astropy.cosmology instance
+        :return: None
+        """
+        self._cosmo = cosmo
+        if self._distance_table is not None:
+            self._distance_table.cosmo = cosmo
+
+    @property
+    def distance_table(self):
+        """
+
+        :return: DistanceTable instance or None
+        """
+        return self._distance_table
+
     @staticmethod
     def a_z(z):
         """Returns scale factor (a_0 = 1) for given redshift.
@@ -45,6 +82,8 @@ class Background(object):
         :param z_source: source redshift
         :return: angular diameter distance in units of Mpc
         """
+        if self._distance_table is not None:
+            return self._distance_table.d_xy(z_observer, z_source)
         D_xy = self.cosmo.angular_diameter_distance_z1z2(z_observer, z_source)
         return D_xy.value
 
@@ -69,6 +108,8 @@ class Background(object):
         :param z_source: source
         :return: transverse comoving distance in units of Mpc
         """
+        if self._distance_table is not None:
+            return self._distance_table.T_xy(z_observer, z_source)
         D_xy = self.d_xy(z_observer, z_source)
         T_xy = D_xy * (1 + z_source)
         return T_xy
@@ -0,0 +1,159 @@
+__author__ = "sibirrer"
+
+import numpy as np
+from scipy.interpolate import interp1d
+
+__all__ = ["DistanceTable"]
+
+
+class DistanceTable(object):
+    """Table of line-of-sight comoving distances of a cosmology from which the
+    (transverse) comoving and angular diameter distances between any pair of redshifts
+    are computed with vectorized look-ups.
+
+    The comoving distances of the redshifts of the table (e.g. the lens and source
+    redshifts of a multi-plane lens model) are computed once with the astropy cosmology
+    and re-used for all distances between them. Distances to redshifts not yet in the
+    table are computed (exactly) on demand and added to it. Optionally, a dense redshift
+    grid is interpolated for redshifts not in the table, such that sampled (continuous)
+    source redshifts do not require new astropy evaluations.
+
+    The same instance can be shared between several classes (e.g. Background instances
+    of MultiPlane, Image2SourceMapping and LensCosmo) operating in the same cosmology.
+    """
+
+    def __init__(
+        self,
+        cosmo=None,
+        z_list=None,
+        z_interp_stop=None,
+        num_z_interp=1000,
+        max_size=1000,
+    ):
+        """
+
+        :param cosmo: instance of astropy.cosmology
+        :param z_list: list of redshifts to be computed in advance
+        :param z_interp_stop: None or float, maximum redshift of the interpolated dense
+            redshift grid. If None, all redshifts are computed exactly.
+        :param num_z_interp: int, number of redshifts of the dense redshift grid
+        :param max_size: int, maximum number of exactly computed redshifts kept in the
+            table (the table is emptied when exceeding this number)
+        """
+        if cosmo is None:
+            from astropy.cosmology import default_cosmology
+
+            cosmo = default_cosmology.get()
+        self._z_interp_stop = z_interp_stop
+        self._num_z_interp = num_z_interp
+        self._max_size = max_size
+        self._z_list = [] if z_list is None else list(z_list)
+        self._cosmo = None
+        self.cosmo = cosmo
+
+    @property
+    def cosmo(self):
+        """
+
+        :return: astropy.cosmology instance of the table
+        """
+        return self._cosmo
+
+    @cosmo.setter
+    def cosmo(self, cosmo):
+        """Sets a new cosmology and re-computes the table (if the cosmology changed).
+
+        :param cosmo: astropy.cosmology instance
+        :return: None
+        """
+        if cosmo is self._cosmo:
+            return
+        self._cosmo = cosmo
+        self._table = {0.0: 0.0}
+        Ok0 = cosmo.Ok0
+        self._dh = cosmo.hubble_distance.value
+        self._sqrt_Ok0 = np.sqrt(abs(Ok0))
+        self._sign_Ok0 = np.sign(Ok0)
+        if self._z_interp_stop is not None:
+            z_grid = np.linspace(0, self._z_interp_stop, int(self._num_z_interp))
+            self._interp = interp1d(
+                z_grid, self._compute(z_grid), kind="cubic", assume_sorted=True
+            )
+        else:
+            self._interp = None
+        if len(self._z_list) > 0:
+            self.comoving_distance(self._z_list)
+
+    @property
+    def size(self):
+        """
+
+        :return: number of exactly computed redshifts in the table
+        """
+        return len(self._table)
+
+    def _compute(self, z):
+        """Comoving distances computed with the astropy cosmology.
+
+        :param z: 1d array of redshifts
+        :return: comoving distances in Mpc
+        """
+        return np.atleast_1d(self._cosmo.comoving_distance(z).value)
+
+    def comoving_distance(self, z):
+        """Line-of-sight comoving distance.
+
+        :param z: redshift (float or array)
+        :return: comoving distance in units of Mpc
+        """
+        if np.ndim(z) == 0 and z in self._table:
+            return self._table[z]
+        z_array = np.atleast_1d(np.asarray(z, dtype=float))
+        z_unique, inverse = np.unique(z_array, return_inverse=True)
+        chi = np.empty(len(z_unique))
+        missing = []
+        for i, z_i in enumerate(z_unique):
+            chi_i = self._table.get(z_i)
+            if chi_i is None:
+                missing.append(i)
+            else:
+                chi[i] = chi_i
+        if len(missing) > 0:
+            missing = np.array(missing)
+            z_missing = z_unique[missing]
+            if self._interp is not None and np.all(z_missing <= self._z_interp_stop):
+                chi[missing] = self._interp(z_missing)
+            else:
+                chi[missing] = self._compute(z_missing)
+                if len(self._table) + len(missing) > self._max_size:
+                    self._table = {0.0: 0.0}
+                for z_i, chi_i in zip(z_missing, chi[missing]):
+                    self._table[float(z_i)] = float(chi_i)
+        chi = chi[inverse.reshape(-1)]
+        if np.ndim(z) == 0:
+            return chi[0]
+        return chi.reshape(np.shape(z))
+
+    def T_xy(self, z_observer, z_source):
+        """Transverse comoving distance between two redshifts.
+
+        :param z_observer: observer redshift (float or array)
+        :param z_source: source redshift (float or array)
+        :return: transverse comoving distance in units of Mpc
+        """
+        chi = self.comoving_distance(z_source) - self.comoving_distance(z_observer)
+        if self._sign_Ok0 == 0:
+            return chi
+        x = self._sqrt_Ok0 * chi / self._dh
+        if self._sign_Ok0 > 0:
+            return self._dh / self._sqrt_Ok0 * np.sinh(x)
+        return self._dh / self._sqrt_Ok0 * np.sin(x)
+
+    def d_xy(self, z_observer, z_source):
+        """Angular diameter distance between two redshifts.
+
+        :param z_observer: observer redshift (float or array)
+        :param z_source: source redshift (float or array)
+        :return: angular diameter distance in units of Mpc
+        """
+        return self.T_xy(z_observer, z_source) / (1.0 + np.asarray(z_source))
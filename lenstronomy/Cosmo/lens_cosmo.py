@@ -16,17 +16,19 @@ class LensCosmo(object):
     """Class to manage the physical units and distances present in a single plane lens
     with fixed input cosmology."""
 
-    def __init__(self, z_lens, z_source, cosmo=None):
+    def __init__(self, z_lens, z_source, cosmo=None, distance_table=None):
         """
 
         :param z_lens: redshift of lens
         :param z_source: redshift of source
         :param cosmo: ~astropy.cosmology instance
+        :param distance_table: None or DistanceTable instance (e.g. shared with a
+            multi-plane lens model) to evaluate the distances
         """
 
         self.z_lens = z_lens
         self.z_source = z_source
-        self.background = Background(cosmo=cosmo)
+        self.background = Background(cosmo=cosmo, distance_table=distance_table)
         self.nfw_param = NFWParam(cosmo=cosmo)
         self.gnfw_param = GNFWParam(cosmo=cosmo)
 
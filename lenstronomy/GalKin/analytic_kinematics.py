@@ -114,16 +114,18 @@ class AnalyticKinematics(Anisotropy):
         return a
 
     @classmethod
-    def draw_light(cls, kwargs_light):
-        """Draws a random light tracer particle from the Hernquist light profile.
+    def draw_light(cls, kwargs_light, n=None):
+        """Draws random light tracer particles from the Hernquist light profile.
 
         :param kwargs_light: keyword argument (list) of the light model
+        :param n: None or int, number of draws. If None, a single draw is returned as
+            floats
         :return: 3d radius (if possible), 2d projected radius, x-projected coordinate,
             y-projected coordinate
         """
         a = cls._get_hernquist_scale_radius(kwargs_light)
 
-        r = vel_util.draw_hernquist(a)
+        r = vel_util.draw_hernquist(a, size=n)
         R, x, y = vel_util.project2d_random(r)
         return r, R, x, y
 
@@ -364,3 +366,4 @@ class AnalyticKinematics(Anisotropy):
         """
         if hasattr(self, "_interp_sigma_r2"):
             del self._interp_sigma_r2
+        self.light_profile.delete_cache()
@@ -50,6 +50,36 @@ class Aperture(object):
         """
         return self._aperture.aperture_select(ra, dec)
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select() for arrays of photons/rays.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :return: bool array, True if photon/ray is within the aperture, False otherwise,
+            int array of the (flattened) segment index
+        """
+        return self._aperture.aperture_select_array(ra, dec)
+
+    def select_probability(self, ra, dec, sigma):
+        """Probability that photons/rays are within each segment of the aperture after
+        displacing them with a Gaussian PSF.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :param sigma: standard deviation of the Gaussian PSF
+        :return: array of probabilities with shape (number of flattened segments,
+            len(ra))
+        """
+        return self._aperture.select_probability(ra, dec, sigma)
+
+    @property
+    def max_radius(self):
+        """Maximum distance of the aperture from the origin.
+
+        :return: float
+        """
+        return self._aperture.max_radius
+
     @property
     def num_segments(self):
         return self._aperture.num_segments
@@ -1,6 +1,7 @@
 __author__ = "sibirrer"
 
 import numpy as np
+from scipy.special import ndtr, chndtr
 
 from lenstronomy.Util.package_util import exporter
 
@@ -45,6 +46,43 @@ class Slit(object):
             0,
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :return: bool array, True if photon/ray is within the slit, False otherwise, int
+            array of the segment index
+        """
+        x, y = _rotate(ra, dec, self._center_ra, self._center_dec, self._angle)
+        bool_ap = (np.abs(x) < self._length / 2.0) & (np.abs(y) < self._width / 2.0)
+        return bool_ap, np.zeros(np.shape(bool_ap), dtype=int)
+
+    def select_probability(self, ra, dec, sigma):
+        """Probability that a photon/ray is within the slit after displacing it with a
+        Gaussian PSF.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :param sigma: standard deviation of the Gaussian PSF
+        :return: array of probabilities with shape (1, len(ra))
+        """
+        x, y = _rotate(ra, dec, self._center_ra, self._center_dec, self._angle)
+        p = _box_probability(x, self._length / 2.0, sigma) * _box_probability(
+            y, self._width / 2.0, sigma
+        )
+        return np.atleast_2d(p)
+
+    @property
+    def max_radius(self):
+        """Maximum distance of the slit from the origin.
+
+        :return: float
+        """
+        return np.hypot(self._center_ra, self._center_dec) + np.hypot(
+            self._length / 2.0, self._width / 2.0
+        )
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -117,6 +155,49 @@ class Frame(object):
             0,
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :return: bool array, True if photon/ray is within the frame, False otherwise,
+            int array of the segment index
+        """
+        x, y = _rotate(ra, dec, self._center_ra, self._center_dec, self._angle)
+        x, y = np.abs(x), np.abs(y)
+        outer = (x < self._width_outer / 2.0) & (y < self._width_outer / 2.0)
+        inner = (x < self._width_inner / 2.0) & (y < self._width_inner / 2.0)
+        bool_ap = outer & ~inner
+        return bool_ap, np.zeros(np.shape(bool_ap), dtype=int)
+
+    def select_probability(self, ra, dec, sigma):
+        """Probability that a photon/ray is within the frame after displacing it with a
+        Gaussian PSF.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :param sigma: standard deviation of the Gaussian PSF
+        :return: array of probabilities with shape (1, len(ra))
+        """
+        x, y = _rotate(ra, dec, self._center_ra, self._center_dec, self._angle)
+        p_outer = _box_probability(x, self._width_outer / 2.0, sigma) * (
+            _box_probability(y, self._width_outer / 2.0, sigma)
+        )
+        p_inner = _box_probability(x, self._width_inner / 2.0, sigma) * (
+            _box_probability(y, self._width_inner / 2.0, sigma)
+        )
+        return np.atleast_2d(p_outer - p_inner)
+
+    @property
+    def max_radius(self):
+        """Maximum distance of the frame from the origin.
+
+        :return: float
+        """
+        return np.hypot(
+            self._center_ra, self._center_dec
+        ) + self._width_outer / np.sqrt(2)
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -180,6 +261,41 @@ class Shell(object):
             0,
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :return: bool array, True if photon/ray is within the shell, False otherwise,
+            int array of the segment index
+        """
+        r = np.sqrt((ra - self._center_ra) ** 2 + (dec - self._center_dec) ** 2)
+        bool_ap = (r >= self._r_in) & (r < self._r_out)
+        return bool_ap, np.zeros(np.shape(bool_ap), dtype=int)
+
+    def select_probability(self, ra, dec, sigma):
+        """Probability that a photon/ray is within the shell after displacing it with a
+        Gaussian PSF.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :param sigma: standard deviation of the Gaussian PSF
+        :return: array of probabilities with shape (1, len(ra))
+        """
+        r = np.sqrt((ra - self._center_ra) ** 2 + (dec - self._center_dec) ** 2)
+        p = _disk_probability(r, self._r_out, sigma) - _disk_probability(
+            r, self._r_in, sigma
+        )
+        return np.atleast_2d(p)
+
+    @property
+    def max_radius(self):
+        """Maximum distance of the shell from the origin.
+
+        :return: float
+        """
+        return np.hypot(self._center_ra, self._center_dec) + self._r_out
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -237,6 +353,40 @@ class IFUShells(object):
             ra, dec, self._r_bins, self._center_ra, self._center_dec
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :return: bool array, True if photon/ray is within any of the shells, False
+            otherwise, int array of the index of the shell (0 if not within)
+        """
+        r = np.sqrt((ra - self._center_ra) ** 2 + (dec - self._center_dec) ** 2)
+        index = np.searchsorted(self._r_bins, r, side="right") - 1
+        bool_ap = (index >= 0) & (index < len(self._r_bins) - 1)
+        return bool_ap, np.where(bool_ap, index, 0)
+
+    def select_probability(self, ra, dec, sigma):
+        """Probability that a photon/ray is within each shell after displacing it with a
+        Gaussian PSF.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :param sigma: standard deviation of the Gaussian PSF
+        :return: array of probabilities with shape (num_segments, len(ra))
+        """
+        r = np.sqrt((ra - self._center_ra) ** 2 + (dec - self._center_dec) ** 2)
+        p = _disk_probability(r, np.reshape(self._r_bins, (-1, 1)), sigma)
+        return np.diff(p, axis=0)
+
+    @property
+    def max_radius(self):
+        """Maximum distance of the shells from the origin.
+
+        :return: float
+        """
+        return np.hypot(self._center_ra, self._center_dec) + self._r_bins[-1]
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion
@@ -267,6 +417,62 @@ class IFUGrid(object):
         """
         return grid_ifu_select(ra, dec, self._x_grid, self._y_grid)
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select() for a regular grid.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :return: bool array, True if photon/ray is within the grid, False otherwise, int
+            array of the flattened pixel index (0 if not within)
+        """
+        x_pixel_size = self._x_grid[0, 1] - self._x_grid[0, 0]
+        y_pixel_size = self._y_grid[1, 0] - self._y_grid[0, 0]
+        j = np.floor(
+            (ra - self._x_grid[0, 0] + x_pixel_size / 2.0) / x_pixel_size
+        ).astype(int)
+        i = np.floor(
+            (dec - self._y_grid[0, 0] + y_pixel_size / 2.0) / y_pixel_size
+        ).astype(int)
+        n_y, n_x = self._x_grid.shape
+        bool_ap = (i >= 0) & (i < n_y) & (j >= 0) & (j < n_x)
+        return bool_ap, np.where(bool_ap, i * n_x + j, 0)
+
+    def select_probability(self, ra, dec, sigma):
+        """Probability that a photon/ray is within each pixel of a regular grid after
+        displacing it with a Gaussian PSF.
+
+        :param ra: array of angular coordinates of photons/rays
+        :param dec: array of angular coordinates of photons/rays
+        :param sigma: standard deviation of the Gaussian PSF
+        :return: array of probabilities with shape (n_y * n_x, len(ra)) in the order of
+            the flattened pixel index
+        """
+        x_pixel_size = np.abs(self._x_grid[0, 1] - self._x_grid[0, 0])
+        y_pixel_size = np.abs(self._y_grid[1, 0] - self._y_grid[0, 0])
+        p_x = _box_probability(
+            np.subtract.outer(self._x_grid[0, :], ra), x_pixel_size / 2.0, sigma
+        )
+        p_y = _box_probability(
+            np.subtract.outer(self._y_grid[:, 0], dec), y_pixel_size / 2.0, sigma
+        )
+        n_y, n_x = self._x_grid.shape
+        return (p_y[:, np.newaxis, :] * p_x[np.newaxis, :, :]).reshape(n_y * n_x, -1)
+
+    @property
+    def max_radius(self):
+        """Maximum distance of the grid from the origin.
+
+        :return: float
+        """
+        x_pixel_size = np.abs(self._x_grid[0, 1] - self._x_grid[0, 0])
+        y_pixel_size = np.abs(self._y_grid[1, 0] - self._y_grid[0, 0])
+        return np.max(
+            np.hypot(
+                np.abs(self._x_grid) + x_pixel_size / 2.0,
+                np.abs(self._y_grid) + y_pixel_size / 2.0,
+            )
+        )
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -332,3 +538,44 @@ def shell_ifu_select(ra, dec, r_bin, center_ra=0, center_dec=0):
         if (r >= r_bin[i]) and (r < r_bin[i + 1]):
             return True, i
     return False, None
+
+
+def _rotate(ra, dec, center_ra, center_dec, angle):
+    """Coordinates relative to the center in the frame rotated by angle.
+
+    :param ra: angular coordinate of photon/ray
+    :param dec: angular coordinate of photon/ray
+    :param center_ra: center of the aperture
+    :param center_dec: center of the aperture
+    :param angle: orientation angle of the aperture
+    :return: x, y in the rotated frame
+    """
+    ra_ = ra - center_ra
+    dec_ = dec - center_dec
+    x = np.cos(angle) * ra_ + np.sin(angle) * dec_
+    y = -np.sin(angle) * ra_ + np.cos(angle) * dec_
+    return x, y
+
+
+def _box_probability(x, half_width, sigma):
+    """Probability that a coordinate displaced by a Gaussian lies within an interval
+    centered at zero.
+
+    :param x: coordinate relative to the center of the interval
+    :param half_width: half width of the interval
+    :param sigma: standard deviation of the Gaussian displacement
+    :return: probability
+    """
+    return ndtr((half_width - x) / sigma) - ndtr((-half_width - x) / sigma)
+
+
+def _disk_probability(r, radius, sigma):
+    """Probability that a point displaced by a circular Gaussian lies within a disk
+    (non-central chi-squared distribution with two degrees of freedom).
+
+    :param r: distance of the point from the center of the disk
+    :param radius: radius of the disk
+    :param sigma: standard deviation of the Gaussian displacement (per axis)
+    :return: probability
+    """
+    return chndtr((radius / sigma) ** 2, 2, (r / sigma) ** 2)
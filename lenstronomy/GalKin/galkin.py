@@ -1,9 +1,9 @@
 from lenstronomy.GalKin.observation import GalkinObservation
 from lenstronomy.GalKin.galkin_model import GalkinModel
+import lenstronomy.Util.util as util
 
 import numpy as np
-from scipy.signal import convolve2d
-from scipy.interpolate import interp1d
+from scipy.fft import rfft2, irfft2
 
 __all__ = ["Galkin"]
 
@@ -57,6 +57,7 @@ class Galkin(GalkinModel, GalkinObservation):
         kwargs_cosmo,
         kwargs_numerics=None,
         analytic_kinematics=False,
+        mge_kinematics=False,
     ):
         """
 
@@ -67,6 +68,9 @@ class Galkin(GalkinModel, GalkinObservation):
          involved
         :param kwargs_numerics: numerics keyword arguments
         :param analytic_kinematics: bool, if True uses the analytic kinematic model
+        :param mge_kinematics: bool, if True uses the semi-analytic kinematics of Multi-Gaussian expanded mass and
+         light profiles (see MGEKinematics) and integrates the seeing and the aperture analytically instead of with
+         Monte-Carlo draws (requires a Gaussian PSF)
         """
         GalkinModel.__init__(
             self,
@@ -74,13 +78,24 @@ class Galkin(GalkinModel, GalkinObservation):
             kwargs_cosmo,
             kwargs_numerics=kwargs_numerics,
             analytic_kinematics=analytic_kinematics,
+            mge_kinematics=mge_kinematics,
         )
         GalkinObservation.__init__(
             self, kwargs_aperture=kwargs_aperture, kwargs_psf=kwargs_psf
         )
+        if mge_kinematics is True and self.psf_type != "GAUSSIAN":
+            raise ValueError(
+                "mge_kinematics requires a Gaussian PSF, not psf_type %s."
+                % self.psf_type
+            )
 
     def dispersion(
-        self, kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=1000
+        self,
+        kwargs_mass,
+        kwargs_light,
+        kwargs_anisotropy,
+        sampling_number=1000,
+        vectorized=False,
     ):
         """Computes the averaged LOS velocity dispersion in the slit (convolved)
 
@@ -93,16 +108,31 @@ class Galkin(GalkinModel, GalkinObservation):
             the parameters.
         :param sampling_number: int, number of spectral sampling of the light
             distribution
+        :param vectorized: bool, if True, draws, displaces and selects all light tracers
+            in batches of arrays instead of one by one (same estimator)
         :return: integrated LOS velocity dispersion in units [km/s]
         """
-        sigma2_IR_sum = 0
-        IR_sum = 0
-        for i in range(0, sampling_number):
-            sigma2_IR, IR = self._draw_one_sigma2(
+        if self._mge_kinematics is True:
+            sigma2_IR, IR = self._sigma2_segments_mge(
                 kwargs_mass, kwargs_light, kwargs_anisotropy
             )
-            sigma2_IR_sum += sigma2_IR
-            IR_sum += IR
+            sigma2_IR_sum = np.sum(sigma2_IR)
+            IR_sum = np.sum(IR)
+        elif vectorized is True:
+            sigma2_IR, IR = self._draw_sigma2(
+                kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number
+            )
+            sigma2_IR_sum = np.sum(sigma2_IR)
+            IR_sum = np.sum(IR)
+        else:
+            sigma2_IR_sum = 0
+            IR_sum = 0
+            for i in range(0, sampling_number):
+                sigma2_IR, IR = self._draw_one_sigma2(
+                    kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                sigma2_IR_sum += sigma2_IR
+                IR_sum += IR
         sigma_s2_average = sigma2_IR_sum / IR_sum
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
         self.numerics.delete_cache()
@@ -115,6 +145,7 @@ class Galkin(GalkinModel, GalkinObservation):
         kwargs_anisotropy,
         num_kin_sampling=1000,
         num_psf_sampling=100,
+        vectorized=False,
     ):
         """Computes the velocity dispersion in each Integral Field Unit.
 
@@ -125,6 +156,8 @@ class Galkin(GalkinModel, GalkinObservation):
             LOS
         :param num_psf_sampling: int, number of displacements/render from a spectra to
             be displaced on the IFU
+        :param vectorized: bool, if True, draws, displaces and bins all light tracers as
+            arrays instead of one by one (same estimator)
         :return: ordered array of velocity dispersions [km/s] for each unit
         """
         # draw from light profile (3d and 2d option)
@@ -134,20 +167,36 @@ class Galkin(GalkinModel, GalkinObservation):
         # compute average in each segment
         # return value per segment
         num_segments = self.num_segments
-        sigma2_IR_sum = np.zeros(num_segments)
-        count_draws = np.zeros(num_segments)
-
-        for i in range(0, num_kin_sampling):
-            r, R, x, y = self.numerics.draw_light(kwargs_light)
-            sigma2_IR, IR = self.numerics.sigma_s2(
-                r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        if self._mge_kinematics is True:
+            sigma2_IR_sum, count_draws = self._sigma2_segments_mge(
+                kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            sigma2_IR_sum = np.reshape(sigma2_IR_sum, num_segments)
+            count_draws = np.reshape(count_draws, num_segments)
+        elif vectorized is True:
+            sigma2_IR_sum, count_draws = self._sigma2_segments(
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
+                num_kin_sampling,
+                num_psf_sampling,
             )
-            for k in range(0, num_psf_sampling):
-                x_, y_ = self.displace_psf(x, y)
-                bool_ap, ifu_index = self.aperture_select(x_, y_)
-                if bool_ap is True:
-                    sigma2_IR_sum[ifu_index] += sigma2_IR
-                    count_draws[ifu_index] += IR
+            sigma2_IR_sum = np.reshape(sigma2_IR_sum, num_segments)
+            count_draws = np.reshape(count_draws, num_segments)
+        else:
+            sigma2_IR_sum = np.zeros(num_segments)
+            count_draws = np.zeros(num_segments)
+            for i in range(0, num_kin_sampling):
+                r, R, x, y = self.numerics.draw_light(kwargs_light)
+                sigma2_IR, IR = self.numerics.sigma_s2(
+                    r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                for k in range(0, num_psf_sampling):
+                    x_, y_ = self.displace_psf(x, y)
+                    bool_ap, ifu_index = self.aperture_select(x_, y_)
+                    if bool_ap is True:
+                        sigma2_IR_sum[ifu_index] += sigma2_IR
+                        count_draws[ifu_index] += IR
 
         sigma_s2_average = sigma2_IR_sum / count_draws
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
@@ -251,6 +300,7 @@ class Galkin(GalkinModel, GalkinObservation):
         kwargs_anisotropy,
         supersampling_factor=1,
         voronoi_bins=None,
+        radial_rtol=None,
     ):
         """Computes the velocity dispersion in each Integral Field Unit.
 
@@ -261,107 +311,248 @@ class Galkin(GalkinModel, GalkinObservation):
             convolution on
         :param voronoi_bins: mapping of the voronoi bins, bin indices should start from
             0, -1 values for pixels not binned
+        :param radial_rtol: None or float, relative accuracy of the radial interpolation
+            of the projected integrals. If None, a fixed logarithmic grid of 300
+            projected radii is used, otherwise the grid is refined adaptively (see
+            _radial_profiles())
         :return: ordered array of velocity dispersions [km/s] for each unit
         """
+        return self.dispersion_map_grid_convolved_batch(
+            [kwargs_mass],
+            [kwargs_light],
+            [kwargs_anisotropy],
+            supersampling_factor=supersampling_factor,
+            voronoi_bins=voronoi_bins,
+            radial_rtol=radial_rtol,
+        )[0]
+
+    def dispersion_map_grid_convolved_batch(
+        self,
+        kwargs_mass_list,
+        kwargs_light_list,
+        kwargs_anisotropy_list,
+        supersampling_factor=1,
+        voronoi_bins=None,
+        radial_rtol=None,
+        chunk_size=16,
+    ):
+        """Computes the velocity dispersion in each Integral Field Unit for a batch of
+        model parameters (e.g. samples of a chain). The supersampled grid, the range of
+        the radial interpolation grid and the Fourier transform of the convolution
+        kernel are shared among all samples and the convolutions of chunk_size samples
+        are performed at once.
+
+        :param kwargs_mass_list: list of keyword arguments of the mass model
+        :param kwargs_light_list: list of keyword arguments of the light model
+        :param kwargs_anisotropy_list: list of anisotropy keyword arguments
+        :param supersampling_factor: sampling factor for the grid to do the 2D
+            convolution on
+        :param voronoi_bins: mapping of the voronoi bins, bin indices should start from
+            0, -1 values for pixels not binned
+        :param radial_rtol: None or float, relative accuracy of the radial interpolation
+            of the projected integrals. If None, a fixed logarithmic grid of 300
+            projected radii is used, otherwise the grid is refined adaptively (see
+            _radial_profiles())
+        :param chunk_size: int, number of samples whose supersampled maps are convolved
+            at once
+        :return: velocity dispersions [km/s] of shape (n_samples, n_bins) with
+            voronoi_bins, (n_samples, n_y, n_x) otherwise
+        """
         if hasattr(self.numerics, "lum_weight_int_method"):
             if not self.numerics.lum_weight_int_method:
                 raise ValueError("'lum_weight_int_method' must be True!")
 
-        (
-            x_grid_supersmapled,
-            y_grid_supersmapled,
-            log10_radial_distance_from_center,
-        ) = self._get_grid(kwargs_mass, supersampling_factor=supersampling_factor)
-
-        x_grid = self._aperture.x_grid
-        y_grid = self._aperture.y_grid
-
-        mass_center_x, mass_center_y = self._extract_center(kwargs_mass)
-        R_max = np.sqrt(
-            (x_grid_supersmapled - mass_center_x) ** 2
-            + (y_grid_supersmapled - mass_center_y) ** 2
-        ).max()
-        Rs = np.logspace(
-            np.log10(self.numerics.min_integrate), np.log10(R_max + 0.1), 300
-        )
-        sigma2_IRs = np.zeros_like(Rs)
-        IRs = np.zeros_like(Rs)
-
-        for i, R in enumerate(Rs):
-            sigma2_IRs[i], IRs[i] = self.numerics.I_R_sigma2_and_IR(
-                R, kwargs_mass, kwargs_light, kwargs_anisotropy
-            )
-
-        log10_Rs = np.log10(Rs)
-        log10_sigma2_IRs = np.log10(sigma2_IRs)
-        log10_IRs = np.log10(IRs)
-
-        log10_sigma2_interp = interp1d(
-            log10_Rs,
-            log10_sigma2_IRs,
-            kind="linear",
-            bounds_error=False,
-            fill_value=(log10_sigma2_IRs[0], log10_sigma2_IRs[-1]),
-            assume_sorted=True,
+        x_grid_supersampled, y_grid_supersampled, _ = self._get_grid(
+            kwargs_mass_list[0], supersampling_factor=supersampling_factor
         )
-        log10_IR_interp = interp1d(
-            log10_Rs,
-            log10_IRs,
-            kind="linear",
-            bounds_error=False,
-            fill_value=(log10_IRs[0], log10_IRs[-1]),
-            assume_sorted=True,
+        centers = [
+            self._extract_center(kwargs_mass) for kwargs_mass in kwargs_mass_list
+        ]
+        R_max = np.max(
+            [
+                np.sqrt(
+                    (x_grid_supersampled - center_x) ** 2
+                    + (y_grid_supersampled - center_y) ** 2
+                ).max()
+                for center_x, center_y in centers
+            ]
         )
 
-        sigma2_IR_grid = 10 ** log10_sigma2_interp(log10_radial_distance_from_center)
-        IR_grid = 10 ** log10_IR_interp(log10_radial_distance_from_center)
+        num_samples = len(kwargs_mass_list)
+        grid_shape = x_grid_supersampled.shape
 
+        # convolution in Fourier space with zero padding, cropped to the grid
+        # (equivalent to scipy.signal.convolve2d with mode='same')
         convolution_kernel = self._get_convolution_kernel(
             fwhm_factor=3, supersampling_factor=supersampling_factor
         )
-
-        sigma2_IR_convolved = convolve2d(
-            sigma2_IR_grid, convolution_kernel, mode="same"
-        )
-        IR_convolved = convolve2d(IR_grid, convolution_kernel, mode="same")
+        fft_shape = tuple(np.array(grid_shape) + np.array(convolution_kernel.shape) - 1)
+        kernel_fft = rfft2(convolution_kernel, s=fft_shape)
+        i_0, j_0 = (np.array(convolution_kernel.shape) - 1) // 2
 
         if voronoi_bins is not None:
             n_bins = int(np.max(voronoi_bins)) + 1
-
-            sigma_IR_integrated = np.zeros(n_bins)
-            IR_integrated = np.zeros(n_bins)
-
             supersampled_voronoi_bins = voronoi_bins.repeat(
                 supersampling_factor, axis=0
             ).repeat(supersampling_factor, axis=1)
-
-            for n in range(n_bins):
-                sigma_IR_integrated[n] = np.sum(
-                    sigma2_IR_convolved[supersampled_voronoi_bins == n]
-                )
-                IR_integrated[n] = np.sum(IR_convolved[supersampled_voronoi_bins == n])
+            maps_integrated = np.zeros((num_samples, 2, n_bins))
         else:
-            sigma_IR_integrated = (
-                sigma2_IR_convolved.reshape(
-                    len(x_grid), supersampling_factor, len(y_grid), supersampling_factor
+            n_y, n_x = self._aperture.x_grid.shape
+            maps_integrated = np.zeros((num_samples, 2, n_y, n_x))
+
+        # the samples are processed in chunks to limit the memory of the maps and the
+        # padded Fourier transforms
+        for i_start in range(0, num_samples, chunk_size):
+            i_end = min(i_start + chunk_size, num_samples)
+            maps = np.zeros((i_end - i_start, 2) + grid_shape)
+            for k, i in enumerate(range(i_start, i_end)):
+                log10_Rs, log10_sigma2_IRs, log10_IRs = self._radial_profiles(
+                    self.numerics.min_integrate,
+                    R_max + 0.1,
+                    kwargs_mass_list[i],
+                    kwargs_light_list[i],
+                    kwargs_anisotropy_list[i],
+                    radial_rtol=radial_rtol,
                 )
-                .sum(3)
-                .sum(1)
-            )
-            IR_integrated = (
-                IR_convolved.reshape(
-                    len(x_grid), supersampling_factor, len(y_grid), supersampling_factor
+                self.numerics.delete_cache()
+                center_x, center_y = centers[i]
+                log10_radial_distance_from_center = np.log10(
+                    np.sqrt(
+                        (x_grid_supersampled - center_x) ** 2
+                        + (y_grid_supersampled - center_y) ** 2
+                    )
                 )
-                .sum(3)
-                .sum(1)
-            )
+                maps[k, 0] = 10 ** np.interp(
+                    log10_radial_distance_from_center, log10_Rs, log10_sigma2_IRs
+                )
+                maps[k, 1] = 10 ** np.interp(
+                    log10_radial_distance_from_center, log10_Rs, log10_IRs
+                )
+
+            maps_convolved = irfft2(rfft2(maps, s=fft_shape) * kernel_fft, s=fft_shape)
+            maps_convolved = maps_convolved[
+                ..., i_0 : i_0 + grid_shape[0], j_0 : j_0 + grid_shape[1]
+            ]
 
-        sigma2_grid = sigma_IR_integrated / IR_integrated
+            if voronoi_bins is not None:
+                for n in range(n_bins):
+                    maps_integrated[i_start:i_end, :, n] = np.sum(
+                        maps_convolved[..., supersampled_voronoi_bins == n], axis=-1
+                    )
+            else:
+                maps_integrated[i_start:i_end] = (
+                    maps_convolved.reshape(
+                        i_end - i_start,
+                        2,
+                        n_y,
+                        supersampling_factor,
+                        n_x,
+                        supersampling_factor,
+                    )
+                    .sum(5)
+                    .sum(3)
+                )
+
+        sigma2_grid = maps_integrated[:, 0] / maps_integrated[:, 1]
 
         # apply unit conversion from arc seconds and deflections to physical velocity
         # dispersion in (km/s)
         return np.sqrt(sigma2_grid) / 1000.0  # in units of km/s
 
+    def _radial_profiles(
+        self,
+        R_min,
+        R_max,
+        kwargs_mass,
+        kwargs_light,
+        kwargs_anisotropy,
+        radial_rtol=None,
+        num_radial=300,
+        max_refinement=20,
+    ):
+        """Log10 of I(R)*sigma^2 and I(R) on a logarithmic grid of projected radii to be
+        linearly interpolated in log space.
+
+        With radial_rtol, the grid starts with 17 radii and every interval is bisected
+        until the interpolation of the coarser grid at the midpoint is accurate to
+        radial_rtol, such that the projected integrals are only evaluated where the
+        profiles require it.
+
+        :param R_min: minimal projected radius
+        :param R_max: maximal projected radius
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param radial_rtol: None or float, relative accuracy of the interpolation. If
+            None, the grid has num_radial radii
+        :param num_radial: int, number of radii of the fixed grid
+        :param max_refinement: int, maximum number of bisections of an interval
+        :return: log10(R), log10(I(R)*sigma^2), log10(I(R))
+        """
+        if radial_rtol is None:
+            num_start = num_radial
+        else:
+            num_start = 17
+        log10_Rs = np.linspace(np.log10(R_min), np.log10(R_max), num_start)
+        log10_values = np.log10(
+            self._I_R_sigma2_and_IR_radial(
+                10**log10_Rs, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+        )
+        if radial_rtol is None:
+            return log10_Rs, log10_values[0], log10_values[1]
+
+        tolerance = np.log10(1 + radial_rtol)
+        refine = np.ones(len(log10_Rs) - 1, dtype=bool)
+        for _ in range(max_refinement):
+            log10_Rs_mid = ((log10_Rs[1:] + log10_Rs[:-1]) / 2.0)[refine]
+            log10_values_mid = np.log10(
+                self._I_R_sigma2_and_IR_radial(
+                    10**log10_Rs_mid, kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+            )
+            log10_values_interp = ((log10_values[:, 1:] + log10_values[:, :-1]) / 2.0)[
+                :, refine
+            ]
+            inaccurate = np.max(np.abs(log10_values_mid - log10_values_interp), axis=0)
+            inaccurate = inaccurate > tolerance
+
+            # both halves of inaccurate intervals are bisected again
+            log10_Rs = np.append(log10_Rs, log10_Rs_mid)
+            order = np.argsort(log10_Rs)
+            log10_Rs = log10_Rs[order]
+            log10_values = np.append(log10_values, log10_values_mid, axis=1)[:, order]
+            inaccurate = np.append(np.zeros(len(order) - len(inaccurate)), inaccurate)
+            inaccurate = inaccurate[order].astype(bool)
+            refine = inaccurate[1:] | inaccurate[:-1]
+            if not np.any(refine):
+                break
+        return log10_Rs, log10_values[0], log10_values[1]
+
+    def _I_R_sigma2_and_IR_radial(
+        self, Rs, kwargs_mass, kwargs_light, kwargs_anisotropy
+    ):
+        """I(R)*sigma^2 and I(R) on a grid of projected radii.
+
+        :param Rs: array of projected radii
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :return: arrays of I(R)*sigma^2 and I(R)
+        """
+        if self._analytic_kinematics is True:
+            sigma2_IRs = np.zeros_like(Rs)
+            IRs = np.zeros_like(Rs)
+            for i, R in enumerate(Rs):
+                sigma2_IRs[i], IRs[i] = self.numerics.I_R_sigma2_and_IR(
+                    R, kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+            return sigma2_IRs, IRs
+        # the interpolated numerical solution is evaluated at all radii at once
+        return self.numerics.I_R_sigma2_and_IR(
+            Rs, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+
     def _draw_one_sigma2(self, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """
 
@@ -382,3 +573,126 @@ class Galkin(GalkinModel, GalkinObservation):
             r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
         )
         return sigma2_IR, IR
+
+    def _draw_sigma2(
+        self, kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number
+    ):
+        """Vectorized version of _draw_one_sigma2() for sampling_number draws of the
+        light distribution that fall in the aperture after displacing with the seeing.
+        Light tracers are drawn in batches of sampling_number until enough fall in the
+        aperture.
+
+        :param kwargs_mass: mass model parameters (following lenstronomy lens model
+            conventions)
+        :param kwargs_light: deflector light parameters (following lenstronomy light
+            model conventions)
+        :param kwargs_anisotropy: anisotropy parameters, may vary according to
+            anisotropy type chosen. We refer to the Anisotropy() class for details on
+            the parameters.
+        :param sampling_number: int, number of draws within the aperture
+        :return: arrays of the LOS velocity dispersion in angular units and the weights
+        """
+        r_list, R_list = [], []
+        num_selected = 0
+        while num_selected < sampling_number:
+            r, R, x, y = self.numerics.draw_light(kwargs_light, n=sampling_number)
+            x_, y_ = self.displace_psf(x, y)
+            bool_ap, _ = self.aperture_select_array(x_, y_)
+            r_list.append(r[bool_ap])
+            R_list.append(R[bool_ap])
+            num_selected += np.sum(bool_ap)
+        r = np.concatenate(r_list)[:sampling_number]
+        R = np.concatenate(R_list)[:sampling_number]
+        sigma2_IR, IR = self.numerics.sigma_s2(
+            r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        return sigma2_IR, np.broadcast_to(IR, np.shape(sigma2_IR))
+
+    def _sigma2_segments(
+        self,
+        kwargs_mass,
+        kwargs_light,
+        kwargs_anisotropy,
+        num_kin_sampling,
+        num_psf_sampling,
+    ):
+        """Vectorized rendering of the light weighted LOS velocity dispersion on the
+        segments of the aperture. All light tracers are drawn at once, each is displaced
+        num_psf_sampling times by the seeing and the draws are binned on the segments.
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param num_kin_sampling: int, number of draws from a kinematic prediction of a
+            LOS
+        :param num_psf_sampling: int, number of displacements/render from a spectra to
+            be displaced on the IFU
+        :return: flattened arrays of the summed sigma2_IR and IR of each segment
+        """
+        r, R, x, y = self.numerics.draw_light(kwargs_light, n=num_kin_sampling)
+        sigma2_IR, IR = self.numerics.sigma_s2(
+            r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        IR = np.broadcast_to(IR, np.shape(sigma2_IR))
+        x_, y_ = self.displace_psf(
+            np.repeat(x, num_psf_sampling), np.repeat(y, num_psf_sampling)
+        )
+        bool_ap, ifu_index = self.aperture_select_array(x_, y_)
+        ifu_index = ifu_index[bool_ap]
+        num_bins = int(np.prod(self.num_segments))
+        sigma2_IR_sum = np.bincount(
+            ifu_index,
+            weights=np.repeat(sigma2_IR, num_psf_sampling)[bool_ap],
+            minlength=num_bins,
+        )
+        count_draws = np.bincount(
+            ifu_index,
+            weights=np.repeat(IR, num_psf_sampling)[bool_ap],
+            minlength=num_bins,
+        )
+        return sigma2_IR_sum, count_draws
+
+    def _sigma2_segments_mge(
+        self, kwargs_mass, kwargs_light, kwargs_anisotropy, num_phi=64
+    ):
+        """Deterministic integral of the light weighted LOS velocity dispersion over the
+        segments of the aperture for a Gaussian PSF. I(R)*sigma^2(R) and I(R) are
+        integrated radially over polar cells in the plane of the sky and each cell is
+        weighted with its analytic probability to be displaced by the PSF into the
+        segments of the aperture (see Aperture.select_probability()).
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param num_phi: int, number of azimuthal cells
+        :return: flattened arrays of the summed sigma2_IR and IR of each segment
+        """
+        sigma_psf = util.fwhm2sigma(self._psf.fwhm)
+        r_max = self.max_radius + 5 * sigma_psf
+        num_r = int(max(100, np.ceil(4 * r_max / sigma_psf)))
+        r_edges = np.linspace(0, r_max, num_r + 1)
+        r_mid = (r_edges[1:] + r_edges[:-1]) / 2.0
+
+        # cumulative radial integrals of I(R)*sigma^2(R) R dR and I(R) R dR in log(R)
+        R = np.logspace(np.log10(self.numerics.min_integrate), np.log10(r_max), 2000)
+        sigma2_IR, IR = self.numerics.I_R_sigma2_and_IR(
+            R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        dlog_R = np.log(R[1] / R[0])
+        R = np.append(0, R)
+        cell_integrals = []
+        for f in [sigma2_IR * R[1:] ** 2, IR * R[1:] ** 2]:
+            # the innermost integral from 0 to min_integrate assumes a constant I(R)
+            cumulative = f[0] / 2.0 + np.cumsum((f[1:] + f[:-1]) / 2.0) * dlog_R
+            cumulative = np.append([0, f[0] / 2.0], cumulative)
+            cell_integrals.append(np.diff(np.interp(r_edges, R, cumulative)))
+
+        # azimuthally averaged probability of each radial cell to land in the segments
+        phi = (np.arange(num_phi) + 0.5) * 2 * np.pi / num_phi
+        x = np.outer(r_mid, np.cos(phi)).flatten()
+        y = np.outer(r_mid, np.sin(phi)).flatten()
+        p = self.select_probability(x, y, sigma_psf)
+        p = np.mean(np.reshape(p, (len(p), num_r, num_phi)), axis=2)
+        sigma2_IR_sum = 2 * np.pi * p.dot(cell_integrals[0])
+        IR_sum = 2 * np.pi * p.dot(cell_integrals[1])
+        return sigma2_IR_sum, IR_sum
@@ -1,5 +1,6 @@
 from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
 from lenstronomy.GalKin.analytic_kinematics import AnalyticKinematics
+from lenstronomy.GalKin.mge_kinematics import MGEKinematics
 
 __all__ = ["GalkinModel"]
 
@@ -46,6 +47,7 @@ class GalkinModel(object):
         kwargs_cosmo,
         kwargs_numerics=None,
         analytic_kinematics=False,
+        mge_kinematics=False,
     ):
         """
 
@@ -54,6 +56,8 @@ class GalkinModel(object):
          involved
         :param kwargs_numerics: numerics keyword arguments
         :param analytic_kinematics: bool, if True uses the analytic kinematic model
+        :param mge_kinematics: bool, if True uses the semi-analytic kinematics of Multi-Gaussian expanded mass and
+         light profiles (see MGEKinematics)
         """
         if kwargs_numerics is None:
             kwargs_numerics = {
@@ -64,6 +68,10 @@ class GalkinModel(object):
                 "min_integrate": 1e-4,  # lower bound of numerical integrals
             }
 
+        if analytic_kinematics is True and mge_kinematics is True:
+            raise ValueError(
+                "analytic_kinematics and mge_kinematics can not be used simultaneously."
+            )
         if analytic_kinematics is True:
             anisotropy_model = kwargs_model.get("anisotropy_model")
             if not anisotropy_model == "OM":
@@ -73,11 +81,16 @@ class GalkinModel(object):
             self.numerics = AnalyticKinematics(
                 kwargs_cosmo=kwargs_cosmo, **kwargs_numerics
             )
+        elif mge_kinematics is True:
+            self.numerics = MGEKinematics(
+                kwargs_model=kwargs_model, kwargs_cosmo=kwargs_cosmo, **kwargs_numerics
+            )
         else:
             self.numerics = NumericKinematics(
                 kwargs_model=kwargs_model, kwargs_cosmo=kwargs_cosmo, **kwargs_numerics
             )
         self._analytic_kinematics = analytic_kinematics
+        self._mge_kinematics = mge_kinematics
 
     def check_df(self, r, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """
@@ -0,0 +1,296 @@
+__author__ = "sibirrer"
+
+import json
+import numpy as np
+
+import lenstronomy.Util.constants as const
+from lenstronomy.LightModel.Profiles.hernquist import Hernquist
+from lenstronomy.LightModel.Profiles.gaussian import Gaussian
+
+__all__ = ["KinematicTable", "build_kinematic_table"]
+
+# light profile families of the tables and the light profiles they describe
+_LIGHT_FAMILIES = {
+    "HERNQUIST": ["HERNQUIST"],
+    "GAUSSIAN": ["GAUSSIAN", "MULTI_GAUSSIAN"],
+}
+# anisotropy models and their (dimensionless) table axis
+_ANISOTROPY_AXIS = {"OM": "r_ani", "const": "beta", "isotropic": None}
+
+
+class KinematicTable(object):
+    """Pre-computed table of the luminosity-weighted line-of-sight velocity dispersion
+    of a spherical power-law mass profile (SPP) with a light profile family and an
+    anisotropy model.
+
+    For a power-law mass M(r) ~ r^(3-gamma), the projected velocity dispersion of a
+    light profile with scale s (Rs for HERNQUIST, sigma for GAUSSIAN) is
+
+    .. math::
+        \\sigma^2(R) = \\frac{G M(s)}{s} T(\\gamma, r_{\\rm ani}/s, R/s)
+
+    with a dimensionless function T that is independent of the Einstein radius, the
+    light amplitude, the light scale and the cosmology. T is tabulated on a regular grid
+    of (gamma, anisotropy parameter, R/s) with build_kinematic_table() and
+    stored on disk. At load time the table is memory-mapped and evaluated with
+    multi-linear interpolation. Since I(R) sigma^2(R) is linear in the light profile,
+    Multi-Gaussian light profiles are evaluated as the sum of their components.
+
+    The table is stored in two files: file_name + '.npy' (values of log10(T)) and
+    file_name + '.json' (model and grid axes).
+    """
+
+    def __init__(self, file_name):
+        """
+
+        :param file_name: path of the table (without the .npy/.json extension)
+        """
+        with open(file_name + ".json", "r") as json_file:
+            config = json.load(json_file)
+        self._light_profile = config["light_profile"]
+        self._anisotropy_model = config["anisotropy_model"]
+        self._gamma_grid = np.array(config["gamma"])
+        if _ANISOTROPY_AXIS[self._anisotropy_model] is None:
+            self._anisotropy_grid = None
+        else:
+            self._anisotropy_grid = np.array(config["anisotropy"])
+            if self._anisotropy_model == "OM":
+                # anisotropy radii are interpolated in log space
+                self._anisotropy_grid = np.log10(self._anisotropy_grid)
+        self._log_r_grid = np.log10(config["r"])
+        self._log_values = np.load(file_name + ".npy", mmap_mode="r")
+        if self._light_profile == "HERNQUIST":
+            self._light = Hernquist()
+        else:
+            self._light = Gaussian()
+
+    @property
+    def light_profile(self):
+        """
+
+        :return: light profile family of the table
+        """
+        return self._light_profile
+
+    @property
+    def anisotropy_model(self):
+        """
+
+        :return: anisotropy model of the table
+        """
+        return self._anisotropy_model
+
+    def check_model(self, mass_profile_list, light_profile_list, anisotropy_model):
+        """Checks whether the kinematic model can be evaluated with the table.
+
+        :param mass_profile_list: list of mass profiles
+        :param light_profile_list: list of light profiles
+        :param anisotropy_model: anisotropy model
+        :return: None
+        :raises: ValueError if the model is not described by the table
+        """
+        if list(mass_profile_list) != ["SPP"]:
+            raise ValueError(
+                "kinematic tables require mass_profile_list=['SPP'], not %s."
+                % mass_profile_list
+            )
+        for light_profile in light_profile_list:
+            if light_profile not in _LIGHT_FAMILIES[self._light_profile]:
+                raise ValueError(
+                    "light profile %s is not described by a kinematic table of the %s "
+                    "light profile family." % (light_profile, self._light_profile)
+                )
+        if anisotropy_model != self._anisotropy_model:
+            raise ValueError(
+                "anisotropy model %s does not match anisotropy model %s of the "
+                "kinematic table." % (anisotropy_model, self._anisotropy_model)
+            )
+
+    def sigma2_dimensionless(self, R, gamma, anisotropy=None):
+        """Dimensionless projected velocity dispersion T of the table.
+
+        :param R: projected radius in units of the light profile scale
+        :param gamma: power-law slope of the mass profile
+        :param anisotropy: anisotropy radius in units of the light profile scale (OM),
+            anisotropy parameter beta (const) or None (isotropic). Anisotropy radii
+            outside the grid are evaluated at the edge of the grid.
+        :return: T(gamma, anisotropy, R)
+        """
+        log_values = self._interpolate_axis(
+            self._log_values, self._gamma_grid, gamma, "gamma"
+        )
+        if self._anisotropy_grid is not None:
+            if self._anisotropy_model == "OM":
+                anisotropy = np.clip(
+                    np.log10(anisotropy),
+                    self._anisotropy_grid[0],
+                    self._anisotropy_grid[-1],
+                )
+            log_values = self._interpolate_axis(
+                log_values, self._anisotropy_grid, anisotropy, "anisotropy"
+            )
+        return 10 ** np.interp(np.log10(R), self._log_r_grid, log_values)
+
+    def I_R_sigma2_and_IR(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """I(R)*sigma^2 (in units of G M(r=1)) and I(R) summed over the light
+        components.
+
+        :param R: projected radius
+        :param kwargs_mass: mass model keyword argument list (SPP)
+        :param kwargs_light: light model keyword argument list
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :return: I(R)*sigma^2 / (G M(r=1)), I(R)
+        """
+        gamma = kwargs_mass[0]["gamma"]
+        I_R_sigma2, I_R = 0, 0
+        for amp, scale in self._light_components(kwargs_light):
+            I_R_k = self._light.function(R, 0, amp, scale)
+            if self._anisotropy_model == "OM":
+                anisotropy = kwargs_anisotropy["r_ani"] / scale
+            else:
+                anisotropy = kwargs_anisotropy.get("beta")
+            sigma2_k = self.sigma2_dimensionless(R / scale, gamma, anisotropy)
+            I_R_sigma2 += I_R_k * sigma2_k * scale ** (2 - gamma)
+            I_R += I_R_k
+        return I_R_sigma2, I_R
+
+    def _light_components(self, kwargs_light):
+        """Amplitudes and scales of the light components.
+
+        :param kwargs_light: light model keyword argument list
+        :return: list of (amp, scale)
+        """
+        components = []
+        for kwargs in kwargs_light:
+            if self._light_profile == "HERNQUIST":
+                components.append((kwargs["amp"], kwargs["Rs"]))
+            else:
+                amp = np.atleast_1d(kwargs["amp"])
+                sigma = np.atleast_1d(kwargs["sigma"])
+                components.extend(zip(amp, sigma))
+        return components
+
+    @staticmethod
+    def _interpolate_axis(values, grid, value, name):
+        """Linear interpolation along the first axis of the table.
+
+        :param values: table values (first axis corresponds to grid)
+        :param grid: grid of the first axis
+        :param value: value to be interpolated at
+        :param name: name of the axis (for error messages)
+        :return: interpolated values with the first axis removed
+        """
+        if value < grid[0] or value > grid[-1]:
+            raise ValueError(
+                "%s = %s outside the range [%s, %s] of the kinematic table."
+                % (name, value, grid[0], grid[-1])
+            )
+        i = min(max(np.searchsorted(grid, value) - 1, 0), len(grid) - 2)
+        w = (value - grid[i]) / (grid[i + 1] - grid[i])
+        return (1 - w) * values[i] + w * values[i + 1]
+
+
+def build_kinematic_table(
+    file_name,
+    light_profile,
+    anisotropy_model,
+    gamma_list=None,
+    anisotropy_list=None,
+    r_list=None,
+    kwargs_numerics=None,
+):
+    """Computes the dimensionless projected velocity dispersion of a power-law mass
+    profile with NumericKinematics on a grid and stores it on disk (see KinematicTable).
+
+    :param file_name: path of the table (without the .npy/.json extension)
+    :param light_profile: light profile family, 'HERNQUIST' or 'GAUSSIAN' (the latter
+        also describes 'MULTI_GAUSSIAN' light profiles)
+    :param anisotropy_model: anisotropy model, 'OM', 'const' or 'isotropic'
+    :param gamma_list: grid of power-law slopes
+    :param anisotropy_list: grid of anisotropy radii in units of the light profile scale
+        (OM) or of anisotropy parameters beta (const)
+    :param r_list: grid of projected radii in units of the light profile scale
+    :param kwargs_numerics: keyword arguments of NumericKinematics used to compute the
+        table (with distances in units of the light profile scale)
+    :return: KinematicTable instance of the stored table
+    """
+    from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+
+    if light_profile not in _LIGHT_FAMILIES:
+        raise ValueError(
+            "light profile %s not supported for kinematic tables. Supported are %s."
+            % (light_profile, list(_LIGHT_FAMILIES.keys()))
+        )
+    if anisotropy_model not in _ANISOTROPY_AXIS:
+        raise ValueError(
+            "anisotropy model %s not supported for kinematic tables. Supported are %s."
+            % (anisotropy_model, list(_ANISOTROPY_AXIS.keys()))
+        )
+    if gamma_list is None:
+        gamma_list = np.linspace(1.5, 2.5, 41)
+    if r_list is None:
+        r_list = np.logspace(-3, 1.5, 91)
+    anisotropy_key = _ANISOTROPY_AXIS[anisotropy_model]
+    if anisotropy_key is None:
+        anisotropy_list = [None]
+    elif anisotropy_list is None:
+        if anisotropy_model == "OM":
+            anisotropy_list = np.logspace(-1, 2, 61)
+        else:
+            # K(r, R) of the const model is singular at beta = -0.5 and beta = 0.5
+            anisotropy_list = np.linspace(-0.475, 0.875, 28)
+    if kwargs_numerics is None:
+        kwargs_numerics = {
+            "interpol_grid_num": 1000,
+            "max_integrate": 1000,
+            "min_integrate": 0.0001,
+        }
+    kwargs_model = {
+        "mass_profile_list": ["SPP"],
+        "light_profile_list": [light_profile],
+        "anisotropy_model": anisotropy_model,
+    }
+    kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+    numerics = NumericKinematics(kwargs_model, kwargs_cosmo, **kwargs_numerics)
+    scale_key = "Rs" if light_profile == "HERNQUIST" else "sigma"
+    kwargs_light = [{"amp": 1, scale_key: 1}]
+
+    log_values = np.zeros((len(gamma_list), len(anisotropy_list), len(r_list)))
+    for i, gamma in enumerate(gamma_list):
+        kwargs_mass = [{"theta_E": 1, "gamma": gamma}]
+        # G M(r=1) in the units of the projected Jeans integral
+        sigma2_unit = (
+            const.G
+            * numerics.mass_3d(1, kwargs_mass)
+            / (const.arcsec * numerics.cosmo.dd * const.Mpc)
+        )
+        for j, anisotropy in enumerate(anisotropy_list):
+            if anisotropy_key is None:
+                kwargs_anisotropy = {}
+            else:
+                kwargs_anisotropy = {anisotropy_key: anisotropy}
+            for k, R in enumerate(r_list):
+                I_R_sigma2, I_R = numerics._I_R_sigma2(
+                    R, kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                log_values[i, j, k] = np.log10(I_R_sigma2 / I_R / sigma2_unit)
+            numerics.delete_cache()
+    if not np.all(np.isfinite(log_values)):
+        raise ValueError(
+            "kinematic table has non-finite entries, please choose a different grid."
+        )
+    if anisotropy_key is None:
+        log_values = log_values[:, 0, :]
+
+    np.save(file_name + ".npy", log_values)
+    config = {
+        "light_profile": light_profile,
+        "anisotropy_model": anisotropy_model,
+        "gamma": list(np.array(gamma_list, dtype=float)),
+        "r": list(np.array(r_list, dtype=float)),
+    }
+    if anisotropy_key is not None:
+        config["anisotropy"] = list(np.array(anisotropy_list, dtype=float))
+    with open(file_name + ".json", "w") as json_file:
+        json.dump(config, json_file)
+    return KinematicTable(file_name)
@@ -0,0 +1,128 @@
+__author__ = "sibirrer"
+
+import numpy as np
+from scipy.integrate import trapezoid
+from scipy.interpolate import interp1d
+
+import lenstronomy.Util.constants as const
+from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+
+__all__ = ["MGEKinematics"]
+
+
+class MGEKinematics(NumericKinematics):
+    """Semi-analytic spherical Jeans kinematics of Multi-Gaussian expanded (MGE) mass
+    and light profiles.
+
+    The luminosity-weighted projected velocity dispersion (equation A15 in Mamon & Lokas 2005)
+
+    .. math::
+        I(R) \\sigma^2(R) = 2 G \\int_R^{\\infty} K(r/R, r_{\\rm ani}/R) l(r) M(r) / r dr
+
+    is linear in the 3d light l(r) and the enclosed mass M(r), i.e. it is the sum of the Jeans solutions of all pairs
+    of light and mass Gaussians. Both are analytic for Gaussians, such that the sum over all pairs reduces to a single
+    tabulated 1D integrand l(r) M(r) / r. The integral is performed as a deterministic quadrature in log(r - R),
+    vectorized over all projected radii of the interpolation grid. The projected light I(R) is analytic.
+
+    Together with Galkin(mge_kinematics=True), the seeing convolution (Gaussian PSF) and the aperture integral are
+    performed analytically instead of with Monte-Carlo draws.
+    """
+
+    def __init__(
+        self, kwargs_model, kwargs_cosmo, num_quadrature=200, **kwargs_numerics
+    ):
+        """
+
+        :param kwargs_model: keyword arguments describing the model components with 'mass_profile_list' and
+         'light_profile_list' being ['MULTI_GAUSSIAN']
+        :param kwargs_cosmo: keyword arguments that define the cosmology in terms of the angular diameter distances
+         involved
+        :param num_quadrature: number of quadrature points of the Jeans integral per projected radius
+        :param kwargs_numerics: numerics keyword arguments of NumericKinematics
+        """
+        for key in ["mass_profile_list", "light_profile_list"]:
+            if list(kwargs_model.get(key, [])) != ["MULTI_GAUSSIAN"]:
+                raise ValueError(
+                    "MGE kinematics require %s=['MULTI_GAUSSIAN'], not %s."
+                    % (key, kwargs_model.get(key))
+                )
+        if kwargs_numerics.get("kinematic_table") is not None:
+            raise ValueError("MGE kinematics do not support kinematic tables.")
+        super(MGEKinematics, self).__init__(
+            kwargs_model, kwargs_cosmo, **kwargs_numerics
+        )
+        self._num_quadrature = num_quadrature
+
+    def _I_R_sigma2(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Equation A15 in Mamon & Lokas 2005 as a quadrature in log(r - R) of the
+        tabulated integrand, vectorized in R.
+
+        :param R: 2d projected radius (in angular units), float or numpy array
+        :param kwargs_mass: mass model parameters (following lenstronomy lens model
+            conventions)
+        :param kwargs_light: deflector light parameters (following lenstronomy light
+            model conventions)
+        :param kwargs_anisotropy: anisotropy parameters, may vary according to
+            anisotropy type chosen. We refer to the Anisotropy() class for details on
+            the parameters.
+        :return: I(R)*sigma^2 equation A15 in Mamon&Lokas 2005, I(R)
+        """
+        R = np.maximum(R, self._min_integrate)
+        R_ = np.atleast_1d(R)[:, np.newaxis]
+        # l(r) M(r) / r tabulated on a fine logarithmic grid
+        r_table = np.logspace(
+            np.log10(self._min_integrate),
+            np.log10(self._max_integrate),
+            10 * self._num_quadrature,
+        )
+        integrand_table = (
+            self.lightProfile.light_3d(r_table, kwargs_light)
+            * self.mass_3d(r_table, kwargs_mass)
+            / r_table
+        )
+        # r = R + delta with delta logarithmically spaced, vanishing for R >= max_integrate
+        log_delta_min = np.log(R_ * 1e-4)
+        log_delta_max = np.log(np.maximum(self._max_integrate - R_, R_ * 1e-4))
+        log_delta = np.linspace(
+            log_delta_min, log_delta_max, self._num_quadrature, axis=1
+        )[:, :, 0]
+        delta = np.exp(log_delta)
+        r = R_ + delta
+        integrand = (
+            self.K(r, R_, **kwargs_anisotropy)
+            * np.interp(np.log(r), np.log(r_table), integrand_table)
+            * delta
+        )
+        IR_sigma2 = trapezoid(integrand, log_delta, axis=1)
+        IR = self.lightProfile.light_2d(R_[:, 0], kwargs_light)
+        IR_sigma2 *= 2 * const.G / (const.arcsec * self.cosmo.dd * const.Mpc)
+        if np.ndim(R) == 0:
+            return IR_sigma2[0], IR[0]
+        return IR_sigma2, IR
+
+    def _I_R_sigma2_interp(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Equation A15 in Mamon&Lokas 2005 as interpolation in log space.
+
+        :param R: projected radius
+        :param kwargs_mass: mass profile keyword arguments
+        :param kwargs_light: light model keyword arguments
+        :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :return: interpolated value of I(R)*sigma^2, I(R)
+        """
+        R = np.maximum(R, self._min_integrate)
+        if not hasattr(self, "_interp_I_R_sigma2"):
+            R_array = np.logspace(
+                np.log10(self._min_integrate),
+                np.log10(self._max_integrate),
+                self._interp_grid_num,
+            )
+            I_R_sigma2_array, I_R_array = self._I_R_sigma2(
+                R_array, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            self._interp_I_R_sigma2 = interp1d(
+                np.log(R_array), I_R_sigma2_array, fill_value="extrapolate"
+            )
+            self._interp_I_R = interp1d(
+                np.log(R_array), I_R_array, fill_value="extrapolate"
+            )
+        return self._interp_I_R_sigma2(np.log(R)), self._interp_I_R(np.log(R))
@@ -5,6 +5,7 @@ import lenstronomy.Util.constants as const
 from lenstronomy.GalKin.light_profile import LightProfile
 from lenstronomy.GalKin.anisotropy import Anisotropy
 from lenstronomy.GalKin.cosmo import Cosmo
+from lenstronomy.GalKin.kinematic_table import KinematicTable
 from lenstronomy.LensModel.single_plane import SinglePlane
 import lenstronomy.GalKin.velocity_util as util
 
@@ -22,6 +23,7 @@ class NumericKinematics(Anisotropy):
         min_integrate=0.0001,
         max_light_draw=None,
         lum_weight_int_method=True,
+        kinematic_table=None,
     ):
         """
         What we need:
@@ -37,6 +39,9 @@ class NumericKinematics(Anisotropy):
         :param lum_weight_int_method: bool, luminosity weighted dispersion integral to calculate LOS projected Jean's
          solution. ATTENTION: currently less accurate than 3d solution
         :param min_integrate:
+        :param kinematic_table: None, KinematicTable instance or path of a table created with build_kinematic_table().
+         If set, the luminosity-weighted projected integrals are interpolated from the table instead of being
+         integrated numerically.
         """
         mass_profile_list = kwargs_model.get("mass_profile_list")
         light_profile_list = kwargs_model.get("light_profile_list")
@@ -65,6 +70,13 @@ class NumericKinematics(Anisotropy):
         self.cosmo = Cosmo(**kwargs_cosmo)
         self._mass_profile = SinglePlane(mass_profile_list)
         self._lum_weight_int_method = lum_weight_int_method
+        if kinematic_table is not None:
+            if not isinstance(kinematic_table, KinematicTable):
+                kinematic_table = KinematicTable(kinematic_table)
+            kinematic_table.check_model(
+                mass_profile_list, light_profile_list, anisotropy_model
+            )
+        self._kinematic_table = kinematic_table
 
     @property
     def lum_weight_int_method(self):
@@ -244,13 +256,17 @@ class NumericKinematics(Anisotropy):
         grav_pot = -const.G * mass_dim / (r * const.arcsec * self.cosmo.dd * const.Mpc)
         return grav_pot
 
-    def draw_light(self, kwargs_light):
+    def draw_light(self, kwargs_light, n=None):
         """
 
         :param kwargs_light: keyword argument (list) of the light model
+        :param n: None or int, number of draws. If None, a single draw is returned as floats
         :return: 3d radius (if possible), 2d projected radius, x-projected coordinate, y-projected coordinate
         """
-        r = self.lightProfile.draw_light_3d(kwargs_light, n=1)[0]
+        if n is None:
+            r = self.lightProfile.draw_light_3d(kwargs_light, n=1)[0]
+        else:
+            r = self.lightProfile.draw_light_3d(kwargs_light, n=n)
         R, x, y = util.project2d_random(r)
         return r, R, x, y
 
@@ -339,6 +355,10 @@ class NumericKinematics(Anisotropy):
         :return: interpolated value of I(R)*sigma^2
         """
         R = np.maximum(R, self._min_integrate)
+        if self._kinematic_table is not None:
+            return self._I_R_sigma2_table(
+                R, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
 
         if not hasattr(self, "_interp_I_R_sigma2"):
             min_log = np.log10(self._min_integrate)
@@ -363,6 +383,25 @@ class NumericKinematics(Anisotropy):
             )
         return self._interp_I_R_sigma2(np.log(R)), self._interp_I_R(np.log(R))
 
+    def _I_R_sigma2_table(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Equation A15 in Mamon&Lokas 2005 interpolated from the kinematic table.
+
+        :param R: projected radius
+        :param kwargs_mass: mass profile keyword arguments
+        :param kwargs_light: light model keyword arguments
+        :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :return: I(R)*sigma^2, I(R)
+        """
+        I_R_sigma2, I_R = self._kinematic_table.I_R_sigma2_and_IR(
+            R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        sigma2_unit = (
+            const.G
+            * self.mass_3d(1, kwargs_mass)
+            / (const.arcsec * self.cosmo.dd * const.Mpc)
+        )
+        return I_R_sigma2 * sigma2_unit, I_R
+
     def _integrand_A15(self, r, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """Integrand of A15 (in log space) in Mamon&Lokas 2005.
 
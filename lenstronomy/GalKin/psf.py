@@ -26,6 +26,7 @@ class PSF(object):
             self._psf = PSFMoffat(**kwargs_psf)
         else:
             raise ValueError("psf_type %s not supported for convolution!" % psf_type)
+        self.psf_type = psf_type
 
     def displace_psf(self, x, y):
         """
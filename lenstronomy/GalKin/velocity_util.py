@@ -28,8 +28,9 @@ def displace_PSF_gaussian(x, y, FWHM):
     """
     sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
     sigma_one_direction = sigma
-    x_ = x + np.random.normal() * sigma_one_direction
-    y_ = y + np.random.normal() * sigma_one_direction
+    size = _size(x)
+    x_ = x + np.random.normal(size=size) * sigma_one_direction
+    y_ = y + np.random.normal(size=size) * sigma_one_direction
     return x_, y_
 
 
@@ -57,15 +58,16 @@ def moffat_fwhm_alpha(FWHM, beta):
 
 
 @export
-def draw_moffat_r(FWHM, beta):
+def draw_moffat_r(FWHM, beta, size=None):
     """
 
     :param FWHM: full width at half maximum
     :param beta: Moffat beta parameter
+    :param size: None or int/tuple, shape of the draws
     :return: draw from radial Moffat distribution
     """
     alpha = moffat_fwhm_alpha(FWHM, beta)
-    y = draw_cdf_Y(beta)
+    y = draw_cdf_Y(beta, size=size)
     # equation B3 in Berge et al. paper
     X = alpha * np.sqrt((y - 1))
     return X
@@ -81,19 +83,21 @@ def displace_PSF_moffat(x, y, FWHM, beta):
     :param beta: Moffat beta parameter
     :return: displaced ray by PSF
     """
-    X = draw_moffat_r(FWHM, beta)
+    X = draw_moffat_r(FWHM, beta, size=_size(x))
     dx, dy = draw_xy(X)
     return x + dx, y + dy
 
 
 @export
-def draw_cdf_Y(beta):
+def draw_cdf_Y(beta, size=None):
     """Draw c.d.f for Moffat function according to Berge et al. Ufig paper, equation B2
     cdf(Y) = 1-Y**(1-beta)
 
+    :param beta: Moffat beta parameter
+    :param size: None or int/tuple, shape of the draws
     :return:
     """
-    x = np.random.uniform(0, 1)
+    x = np.random.uniform(0, 1, size=size)
     return (1 - x) ** (1.0 / (1 - beta))
 
 
@@ -125,21 +129,34 @@ def draw_xy(R):
     :param R: projected radius
     :return:
     """
-    phi = np.random.uniform(0, 2 * np.pi)
+    phi = np.random.uniform(0, 2 * np.pi, size=_size(R))
     x = R * np.cos(phi)
     y = R * np.sin(phi)
     return x, y
 
 
 @export
-def draw_hernquist(a):
+def draw_hernquist(a, size=None):
     """
 
     :param a: 0.551*r_eff
+    :param size: None or int/tuple, shape of the draws
     :return: realisation of radius of Hernquist luminosity weighting in 3d
     """
-    P = np.random.uniform()  # draws uniform between [0,1)
+    P = np.random.uniform(size=size)  # draws uniform between [0,1)
     r = (
         a * np.sqrt(P) * (np.sqrt(P) + 1) / (1 - P)
     )  # solves analytically to r from P(r)
     return r
+
+
+def _size(x):
+    """Shape of the random draws to displace x (None for a scalar, such that a single
+    float is drawn).
+
+    :param x: float or array
+    :return: None or shape of x
+    """
+    if np.ndim(x) == 0:
+        return None
+    return np.shape(x)
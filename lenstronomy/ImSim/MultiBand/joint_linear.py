@@ -21,7 +21,17 @@ class JointLinear(MultiLinear):
         kwargs_model,
         compute_bool=None,
         likelihood_mask_list=None,
+        wls_solver="inv",
     ):
+        """
+
+        :param multi_band_list: list of imaging band configurations [[kwargs_data, kwargs_psf, kwargs_numerics],[...], ...]
+        :param kwargs_model: model option keyword arguments
+        :param compute_bool: (optional), bool list to indicate which band to be included in the modeling
+        :param likelihood_mask_list: list of likelihood masks (booleans with size of the individual images)
+        :param wls_solver: string, solver of the joint weighted linear least square problem ('inv' or 'cholesky'), see
+         ImageLinearFit
+        """
         # TODO: make this raise statement valid
         # if kwargs_model.get('index_source_light_model_list', None) is not None or \
         #        kwargs_model.get('index_lens_light_model_list', None) is not None or \
@@ -33,8 +43,12 @@ class JointLinear(MultiLinear):
             kwargs_model=kwargs_model,
             compute_bool=compute_bool,
             likelihood_mask_list=likelihood_mask_list,
+            wls_solver=wls_solver,
         )
         self.type = "joint-linear"
+        self._wls_solver = wls_solver
+        # log determinant of the last covariance matrix computed with the 'cholesky' solver
+        self._cov_log_det = None, None
 
     def image_linear_solve(
         self,
@@ -71,11 +85,24 @@ class JointLinear(MultiLinear):
             kwargs_extinction,
             kwargs_special,
         )
-        C_D_response, model_error_list = self.error_response(kwargs_lens, kwargs_ps)
+        with self._profiler.timer("error_response"):
+            C_D_response, model_error_list = self.error_response(kwargs_lens, kwargs_ps)
         d = self.data_response
-        param, cov_param, wls_model = de_lens.get_param_WLS(
-            A.T, 1 / C_D_response, d, inv_bool=inv_bool
-        )
+        with self._profiler.timer("linear_solve"):
+            if self._wls_solver == "cholesky":
+                (
+                    param,
+                    cov_param,
+                    wls_model,
+                    log_det,
+                ) = de_lens.get_param_WLS_cholesky(
+                    A.T, 1 / C_D_response, d, inv_bool=inv_bool
+                )
+                self._cov_log_det = cov_param, log_det
+            else:
+                param, cov_param, wls_model = de_lens.get_param_WLS(
+                    A.T, 1 / C_D_response, d, inv_bool=inv_bool
+                )
         wls_list = self._array2image_list(wls_model)
         return wls_list, model_error_list, cov_param, param
 
@@ -204,19 +231,25 @@ class JointLinear(MultiLinear):
             inv_bool=source_marg,
         )
         # compute X^2
-        logL = 0
-        index = 0
-        for i in range(self._num_bands):
-            if self._compute_bool[i] is True:
-                logL += self._imageModel_list[i].Data.log_likelihood(
-                    im_sim_list[index],
-                    self._imageModel_list[i].likelihood_mask,
-                    model_error_list[index],
+        with self._profiler.timer("chi2"):
+            logL = 0
+            index = 0
+            for i in range(self._num_bands):
+                if self._compute_bool[i] is True:
+                    logL += self._imageModel_list[i].Data.log_likelihood(
+                        im_sim_list[index],
+                        self._imageModel_list[i].likelihood_mask,
+                        model_error_list[index],
+                    )
+                    index += 1
+            if cov_matrix is not None and source_marg:
+                cov_cached, log_det = self._cov_log_det
+                if cov_cached is not cov_matrix:
+                    log_det = None
+                marg_const = de_lens.marginalization_new(
+                    cov_matrix, d_prior=linear_prior, log_det=log_det
                 )
-                index += 1
-        if cov_matrix is not None and source_marg:
-            marg_const = de_lens.marginalization_new(cov_matrix, d_prior=linear_prior)
-            logL += marg_const
+                logL += marg_const
         if check_positive_flux is True and self._num_bands > 0:
             bool_ = self._imageModel_list[0].check_positive_flux(
                 kwargs_source, kwargs_lens_light, kwargs_ps
@@ -1,3 +1,5 @@
+from lenstronomy.Util.profiler import NullProfiler
+
 __all__ = ["MultiDataBase"]
 
 
@@ -24,6 +26,7 @@ class MultiDataBase(object):
         self._num_response_list = []
         for imageModel in image_model_list:
             self._num_response_list.append(imageModel.num_data_evaluate)
+        self._profiler = NullProfiler()
 
     @property
     def num_bands(self):
@@ -45,6 +48,50 @@ class MultiDataBase(object):
         for imageModel in self._imageModel_list:
             imageModel.reset_point_source_cache(cache=cache)
 
+    def set_profiler(self, profiler):
+        """Sets a profiler recording the stages of the image computation of all bands.
+
+        :param profiler: Profiler() instance, or NullProfiler() to turn the profiling
+            off
+        :return: None
+        """
+        self._profiler = profiler
+        for imageModel in self._imageModel_list:
+            imageModel.set_profiler(profiler)
+
+    def set_response_cache(self, cache=True):
+        """Turns on (or off) the re-use of unchanged ray-shooting and lens light
+        responses of all bands, see ImageModel.set_response_cache().
+
+        :param cache: bool, if True, re-uses unchanged components
+        :return: None
+        """
+        for imageModel in self._imageModel_list:
+            imageModel.set_response_cache(cache)
+
+    def set_static_lens(self, static=True, max_grids=4):
+        """Turns on (or off) the static lens mode of all bands, see
+        ImageModel.set_static_lens().
+
+        :param static: bool, if True, turns on the static lens mode
+        :param max_grids: int, maximum number of coordinate grids kept per band
+        :return: None
+        """
+        for imageModel in self._imageModel_list:
+            imageModel.set_static_lens(static, max_grids=max_grids)
+
+    def set_lens_emulation(self, emulate=True, **kwargs_emulation):
+        """Emulates the supported lens profiles of the lens models of all bands, see
+        ImageModel.set_lens_emulation().
+
+        :param emulate: bool, if True, emulates the supported profiles, otherwise
+            evaluates them exactly
+        :param kwargs_emulation: keyword arguments of EmulatedProfile
+        :return: None
+        """
+        for imageModel in self._imageModel_list:
+            imageModel.set_lens_emulation(emulate, **kwargs_emulation)
+
     @property
     def num_data_evaluate(self):
         num = 0
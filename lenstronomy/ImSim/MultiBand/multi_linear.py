@@ -29,6 +29,7 @@ class MultiLinear(MultiDataBase):
         compute_bool=None,
         kwargs_pixelbased=None,
         linear_solver=True,
+        wls_solver="inv",
     ):
         """
 
@@ -38,6 +39,8 @@ class MultiLinear(MultiDataBase):
         :param compute_bool: (optional), bool list to indicate which band to be included in the modeling
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param wls_solver: string, solver of the weighted linear least square problem ('inv' or 'cholesky'), see
+         ImageLinearFit
         """
         self.type = "multi-linear"
         imageModel_list = []
@@ -53,6 +56,7 @@ class MultiLinear(MultiDataBase):
                 band_index=band_index,
                 kwargs_pixelbased=kwargs_pixelbased,
                 linear_solver=linear_solver,
+                wls_solver=wls_solver,
             )
             imageModel_list.append(imageModel)
         super(MultiLinear, self).__init__(imageModel_list, compute_bool=compute_bool)
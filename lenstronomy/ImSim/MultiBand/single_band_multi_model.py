@@ -34,6 +34,7 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
         band_index=0,
         kwargs_pixelbased=None,
         linear_solver=True,
+        wls_solver="inv",
     ):
         """
 
@@ -45,6 +46,8 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param wls_solver: string, solver of the weighted linear least square problem ('inv' or 'cholesky'), see
+         ImageLinearFit
         """
         self.type = "single-band-multi-model"
         if likelihood_mask_list is None:
@@ -85,10 +88,15 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
         self._index_optical_depth = index_optical_depth[band_index]
         self.linear_solver = linear_solver
 
+        kwargs_image = {}
         if linear_solver:
             imageClass = ImageLinearFit
+            kwargs_image["wls_solver"] = wls_solver
         else:
             imageClass = ImageModel
+            # settings of the linear solver in case it is called explicitly
+            self._wls_solver = wls_solver
+            self._cov_log_det = None, None
 
         imageClass.__init__(
             self,
@@ -102,6 +110,7 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
             kwargs_numerics=kwargs_numerics,
             likelihood_mask=likelihood_mask_list[band_index],
             kwargs_pixelbased=kwargs_pixelbased,
+            **kwargs_image,
         )
 
     def image(
@@ -1,6 +1,9 @@
 from scipy import fftpack, ndimage, signal
+import scipy.fft
 import numpy as np
 import threading
+import hashlib
+from collections import OrderedDict
 import lenstronomy.Util.kernel_util as kernel_util
 import lenstronomy.Util.util as util
 import lenstronomy.Util.image_util as image_util
@@ -23,21 +26,165 @@ def _centered(arr, newshape):
     return arr[tuple(myslice)]
 
 
+@export
+class KernelSpectrumCache(object):
+    """Size-bounded least-recently-used cache of Fourier transformed convolution kernels
+    and their associated padded shapes.
+
+    The cache is shared by all PixelKernelConvolution instances of the process such that
+    identical kernels (e.g. the same PSF in different bands or after re- instantiating
+    the image model) are only transformed once per image shape. Entries are keyed by the
+    kernel content hash, the image shape and the fft backend.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+
+        :param maxsize: int, maximum number of kernel spectra stored. 0 disables the
+            cache.
+        """
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = int(maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def kernel_hash(kernel):
+        """Content hash of a kernel.
+
+        :param kernel: numpy array
+        :return: string, hash of the kernel values, shape and dtype
+        """
+        kernel = np.ascontiguousarray(kernel)
+        digest = hashlib.sha1(kernel.tobytes())
+        digest.update(str((kernel.shape, kernel.dtype.str)).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Looks up an entry and marks it as most recently used.
+
+        :param key: hashable cache key
+        :return: cached value, or None if not present
+        """
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Stores an entry, evicting the least recently used one if the cache is full.
+
+        :param key: hashable cache key
+        :param value: value to be stored
+        :return: None
+        """
+        with self._lock:
+            if self._maxsize <= 0:
+                return
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        while len(self._cache) > max(self._maxsize, 0):
+            self._cache.popitem(last=False)
+
+    @property
+    def maxsize(self):
+        """
+
+        :return: maximum number of stored kernel spectra
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        with self._lock:
+            self._maxsize = int(maxsize)
+            self._evict()
+
+    def clear(self):
+        """Removes all entries and resets the hit/miss counters.
+
+        :return: None
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+
+        :return: dictionary with 'hits', 'misses', 'maxsize' and 'currsize'
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "maxsize": self._maxsize,
+                "currsize": len(self._cache),
+            }
+
+
+_kernel_spectrum_cache = KernelSpectrumCache()
+
+
+@export
+def kernel_spectrum_cache_info():
+    """Hit/miss statistics of the process-wide kernel spectrum cache.
+
+    :return: dictionary with 'hits', 'misses', 'maxsize' and 'currsize'
+    """
+    return _kernel_spectrum_cache.info()
+
+
+@export
+def clear_kernel_spectrum_cache(maxsize=None):
+    """Empties the process-wide kernel spectrum cache and resets its counters.
+
+    :param maxsize: int or None, if set, new maximum number of cached kernel spectra
+    :return: None
+    """
+    _kernel_spectrum_cache.clear()
+    if maxsize is not None:
+        _kernel_spectrum_cache.maxsize = maxsize
+
+
 @export
 class PixelKernelConvolution(object):
     """Class to compute convolutions for a given pixelized kernel (fft, grid)"""
 
-    def __init__(self, kernel, convolution_type="fft_static"):
+    def __init__(
+        self,
+        kernel,
+        convolution_type="fft_static",
+        fft_backend="numpy",
+        fft_workers=None,
+    ):
         """
 
         :param kernel: 2d array, convolution kernel
         :param convolution_type: string, 'fft', 'grid', 'fft_static' mode of 2d convolution
+        :param fft_backend: string, 'numpy' or 'scipy' (scipy.fft/pocketfft), fft implementation used in the
+         'fft_static' mode
+        :param fft_workers: int or None, number of threads used by the 'scipy' fft backend (negative values count
+         from the number of available cores)
         """
         self._kernel = kernel
         if convolution_type not in ["fft", "grid", "fft_static"]:
             raise ValueError("convolution_type %s not supported!" % convolution_type)
+        if fft_backend not in ["numpy", "scipy"]:
+            raise ValueError("fft_backend %s not supported!" % fft_backend)
         self._type = convolution_type
+        self._fft_backend = fft_backend
+        self._fft_workers = fft_workers
         self._pre_computed = False
+        self._kernel_hash = None
 
     def pixel_kernel(self, num_pix=None):
         """Access pixelated kernel.
@@ -55,7 +202,12 @@ class PixelKernelConvolution(object):
 
         :return: copy of the class with kernel set to the transpose of original one
         """
-        return PixelKernelConvolution(self._kernel.T, convolution_type=self._type)
+        return PixelKernelConvolution(
+            self._kernel.T,
+            convolution_type=self._type,
+            fft_backend=self._fft_backend,
+            fft_workers=self._fft_workers,
+        )
 
     def convolution2d(self, image):
         """
@@ -73,6 +225,48 @@ class PixelKernelConvolution(object):
             raise ValueError("convolution_type %s not supported!" % self._type)
         return image_conv
 
+    def convolution2d_batch(self, images):
+        """Convolves a stack of images with the same kernel. In 'fft_static' mode, all
+        images are transformed in a single multi-dimensional FFT call against the cached
+        kernel spectrum.
+
+        :param images: 3d array of shape (n_images, nx, ny) to be convolved
+        :return: 3d array of convolved images of shape (n_images, nx, ny)
+        """
+        images = np.asarray(images)
+        if self._type == "fft_static":
+            return self._static_fft_batch(images)
+        return np.array([self.convolution2d(image) for image in images])
+
+    def _static_fft_batch(self, images):
+        """Scipy fft convolution of a stack of images with saved static fft kernel in
+        'same' mode. The transforms are performed over the last two axes.
+
+        :param images: 3d numpy array of shape (n_images, nx, ny)
+        :return: 3d numpy array of convolved images
+        """
+        self._static_set_up(images[0])
+        s1, complex_result, fshape, fslice, sp2 = (
+            self._s1,
+            self._complex_result,
+            self._fshape,
+            self._fslice,
+            self._sp2,
+        )
+        complex_result = complex_result or np.issubdtype(
+            images.dtype, np.complexfloating
+        )
+        fslice = (slice(None),) + fslice
+        if not complex_result:
+            sp1 = self._rfftn(images, fshape, axes=(-2, -1))
+            ret = self._irfftn(sp1 * sp2, fshape, axes=(-2, -1))[fslice]
+        else:
+            sp1 = fftpack.fftn(images, fshape, axes=(-2, -1))
+            ret = fftpack.ifftn(sp1 * sp2, axes=(-2, -1))[fslice]
+            if not np.issubdtype(images.dtype, np.complexfloating):
+                ret = ret.real
+        return _centered(ret, (len(images),) + tuple(s1)).copy()
+
     def _static_fft(self, image, mode="same"):
         """Scipy fft convolution with saved static fft kernel.
 
@@ -81,17 +275,7 @@ class PixelKernelConvolution(object):
         """
         in1 = image
         in1 = np.asarray(in1)
-        if self._pre_computed is False:
-            (
-                self._s1,
-                self._s2,
-                self._complex_result,
-                self._shape,
-                self._fshape,
-                self._fslice,
-                self._sp2,
-            ) = self._static_pre_compute(image)
-            self._pre_computed = True
+        self._static_set_up(in1)
         s1, s2, complex_result, shape, fshape, fslice, sp2 = (
             self._s1,
             self._s2,
@@ -118,8 +302,8 @@ class PixelKernelConvolution(object):
         # sure we only call rfftn/irfftn from one thread at a time.
         if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
             try:
-                sp1 = np.fft.rfftn(in1, fshape)
-                ret = np.fft.irfftn(sp1 * sp2, fshape)[fslice].copy()
+                sp1 = self._rfftn(in1, fshape)
+                ret = self._irfftn(sp1 * sp2, fshape)[fslice].copy()
             finally:
                 if not _rfft_mt_safe:
                     _rfft_lock.release()
@@ -142,6 +326,73 @@ class PixelKernelConvolution(object):
         else:
             raise ValueError("Acceptable mode flags are 'valid'," " 'same', or 'full'.")
 
+    def _static_set_up(self, image):
+        """Loads the kernel spectrum and shape quantities matching the shape of the
+        image, either from the instance or from the process-wide kernel spectrum cache.
+
+        :param image: 2d numpy array
+        :return: None
+        """
+        if self._pre_computed is True and tuple(self._s1) == np.shape(image):
+            return
+        (
+            self._s1,
+            self._s2,
+            self._complex_result,
+            self._shape,
+            self._fshape,
+            self._fslice,
+            self._sp2,
+        ) = self._static_pre_compute_cached(image)
+        self._pre_computed = True
+
+    def _static_pre_compute_cached(self, image):
+        """Same as _static_pre_compute() but looks up the results in the process-wide
+        kernel spectrum cache first.
+
+        :param image: 2d numpy array
+        :return: output of _static_pre_compute()
+        """
+        if self._kernel_hash is None:
+            self._kernel_hash = KernelSpectrumCache.kernel_hash(self._kernel)
+        key = (
+            self._kernel_hash,
+            np.shape(image),
+            bool(np.issubdtype(np.asarray(image).dtype, np.complexfloating)),
+            self._fft_backend,
+        )
+        pre_computed = _kernel_spectrum_cache.get(key)
+        if pre_computed is None:
+            pre_computed = self._static_pre_compute(image)
+            # the spectrum is shared between instances and must not be altered
+            pre_computed[-1].setflags(write=False)
+            _kernel_spectrum_cache.put(key, pre_computed)
+        return pre_computed
+
+    def _rfftn(self, a, s, axes=None):
+        """Real n-dimensional fft of the selected fft backend.
+
+        :param a: input array
+        :param s: shape (length of each transformed axis) of the output
+        :param axes: axes over which to compute the fft
+        :return: complex array
+        """
+        if self._fft_backend == "scipy":
+            return scipy.fft.rfftn(a, s, axes=axes, workers=self._fft_workers)
+        return np.fft.rfftn(a, s, axes=axes)
+
+    def _irfftn(self, a, s, axes=None):
+        """Inverse of _rfftn().
+
+        :param a: input array
+        :param s: shape (length of each transformed axis) of the output
+        :param axes: axes over which to compute the inverse fft
+        :return: real array
+        """
+        if self._fft_backend == "scipy":
+            return scipy.fft.irfftn(a, s, axes=axes, workers=self._fft_workers)
+        return np.fft.irfftn(a, s, axes=axes)
+
     def _static_pre_compute(self, image):
         """Pre-compute Fourier transformed kernel and shape quantities to speed up
         convolution.
@@ -171,7 +422,7 @@ class PixelKernelConvolution(object):
         # sure we only call rfftn/irfftn from one thread at a time.
         if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
             try:
-                sp2 = np.fft.rfftn(in2, fshape)
+                sp2 = self._rfftn(in2, fshape)
             finally:
                 if not _rfft_mt_safe:
                     _rfft_lock.release()
@@ -192,6 +443,15 @@ class PixelKernelConvolution(object):
         """
         return self.convolution2d(image_low_res)
 
+    def re_size_convolve_batch(self, images_low_res, images_high_res=None):
+        """
+
+        :param images_low_res: 3d array, stack of regular sampled images/models
+        :param images_high_res: stack of supersampled images/models (not used)
+        :return: stack of convolved and re-sized images
+        """
+        return self.convolution2d_batch(images_low_res)
+
 
 @export
 class SubgridKernelConvolution(object):
@@ -204,6 +464,8 @@ class SubgridKernelConvolution(object):
         supersampling_factor,
         supersampling_kernel_size=None,
         convolution_type="fft_static",
+        fft_backend="numpy",
+        fft_workers=None,
     ):
         """
 
@@ -211,6 +473,9 @@ class SubgridKernelConvolution(object):
         :param supersampling_factor: supersampling factor relative to the image pixel grid
         :param supersampling_kernel_size: number of pixels (in units of the image pixels) that are convolved with the
          supersampled kernel
+        :param convolution_type: string, 'fft', 'grid', 'fft_static' mode of 2d convolution
+        :param fft_backend: string, 'numpy' or 'scipy', fft implementation used in the 'fft_static' mode
+        :param fft_workers: int or None, number of threads used by the 'scipy' fft backend
         """
         # n_high = len(kernel_supersampled)
         self._supersampling_factor = supersampling_factor
@@ -230,10 +495,16 @@ class SubgridKernelConvolution(object):
             )
             self._low_res_convolution = True
         self._low_res_conv = PixelKernelConvolution(
-            kernel_low_res, convolution_type=convolution_type
+            kernel_low_res,
+            convolution_type=convolution_type,
+            fft_backend=fft_backend,
+            fft_workers=fft_workers,
         )
         self._high_res_conv = PixelKernelConvolution(
-            kernel_high_res, convolution_type=convolution_type
+            kernel_high_res,
+            convolution_type=convolution_type,
+            fft_backend=fft_backend,
+            fft_workers=fft_workers,
         )
 
     def convolution2d(self, image):
@@ -266,6 +537,24 @@ class SubgridKernelConvolution(object):
             image_resized_conv += self._low_res_conv.convolution2d(image_low_res)
         return image_resized_conv
 
+    def re_size_convolve_batch(self, images_low_res, images_high_res):
+        """
+
+        :param images_low_res: 3d array, stack of regular sampled images/models
+        :param images_high_res: 3d array, stack of supersampled images/models to be
+            convolved on a regular pixel grid
+        :return: stack of convolved and re-sized images
+        """
+        images_high_res_conv = self._high_res_conv.convolution2d_batch(images_high_res)
+        images_resized_conv = image_util.re_size_batch(
+            images_high_res_conv, self._supersampling_factor
+        )
+        if self._low_res_convolution is True:
+            images_resized_conv += self._low_res_conv.convolution2d_batch(
+                images_low_res
+            )
+        return images_resized_conv
+
 
 @export
 class MultiGaussianConvolution(object):
@@ -346,6 +635,35 @@ class MultiGaussianConvolution(object):
             image_resized_conv = self.convolution2d(image_low_res)
         return image_resized_conv
 
+    def re_size_convolve_batch(self, images_low_res, images_high_res):
+        """The Gaussian filters are applied over the last two axes of the stacks only.
+
+        :param images_low_res: 3d array, stack of regular sampled images/models
+        :param images_high_res: 3d array, stack of supersampled images/models to be
+            convolved on a regular pixel grid
+        :return: stack of convolved and re-sized images
+        """
+        if self._supersampling_convolution is True:
+            images = images_high_res
+        else:
+            images = images_low_res
+        images_conv = np.zeros_like(images, dtype=float)
+        for i in range(self._num_gaussians):
+            images_conv += (
+                ndimage.gaussian_filter(
+                    images,
+                    (0, self._sigmas_scaled[i], self._sigmas_scaled[i]),
+                    mode="nearest",
+                    truncate=self._truncation,
+                )
+                * self._fraction_list[i]
+            )
+        if self._supersampling_convolution is True:
+            images_conv = image_util.re_size_batch(
+                images_conv, self._supersampling_factor
+            )
+        return images_conv
+
     def pixel_kernel(self, num_pix):
         """Computes a pixelized kernel from the MGE parameters.
 
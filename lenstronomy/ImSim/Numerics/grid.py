@@ -58,11 +58,12 @@ class AdaptiveGrid(Coordinates1D):
 
         :return: 1d array of all coordinates being evaluated to perform the image computation
         """
-        ra_low, dec_low = self._x_low_res, self._y_low_res
-        ra_high, dec_high = self._high_res_coordinates
-        ra_joint = np.append(ra_low, ra_high)
-        dec_joint = np.append(dec_low, dec_high)
-        return ra_joint, dec_joint
+        if not hasattr(self, "_ra_joint"):
+            ra_low, dec_low = self._x_low_res, self._y_low_res
+            ra_high, dec_high = self._high_res_coordinates
+            self._ra_joint = np.append(ra_low, ra_high)
+            self._dec_joint = np.append(dec_low, dec_high)
+        return self._ra_joint, self._dec_joint
 
     def flux_array2image_low_high(self, flux_array, high_res_return=True):
         """
@@ -81,6 +82,26 @@ class AdaptiveGrid(Coordinates1D):
             image_high_res_partial = None
         return image_low_res, image_high_res_partial
 
+    def flux_array2image_low_high_batch(self, flux_arrays, high_res_return=True):
+        """Stacked version of flux_array2image_low_high().
+
+        :param flux_arrays: 2d array of shape (n, num_evaluate), each row corresponding
+            to the coordinates_evaluate order
+        :param high_res_return: bool, if True also returns the high resolution images
+        :return: 3d array of low resolution images, list of (partial) high resolution
+            images (or None)
+        """
+        images_low_res, images_high_res = [], []
+        for flux_array in flux_arrays:
+            image_low_res, image_high_res = self.flux_array2image_low_high(
+                flux_array, high_res_return=high_res_return
+            )
+            images_low_res.append(image_low_res)
+            images_high_res.append(image_high_res)
+        if high_res_return is not True:
+            images_high_res = None
+        return np.array(images_low_res), images_high_res
+
     @property
     def _high_res_coordinates(self):
         """
@@ -275,6 +296,25 @@ class RegularGrid(Coordinates1D):
             image_low_res = image
         return image_low_res, image_high_res
 
+    def flux_array2image_low_high_batch(self, flux_arrays, **kwargs):
+        """Stacked version of flux_array2image_low_high().
+
+        :param flux_arrays: 2d array of shape (n, num_evaluate), each row corresponding
+            to the coordinates_evaluate order
+        :return: 3d arrays of shape (n, nx, ny), corresponding to (partial) images in
+            low and high resolution (to be convolved)
+        """
+        images = self._array2image_batch(flux_arrays)
+        if self._supersampling_factor > 1:
+            images_high_res = images
+            images_low_res = image_util.re_size_batch(
+                images, self._supersampling_factor
+            )
+        else:
+            images_high_res = None
+            images_low_res = images
+        return images_low_res, images_high_res
+
     @staticmethod
     def _subgrid_index(idex_mask, subgrid_res, nx, ny):
         """
@@ -304,3 +344,18 @@ class RegularGrid(Coordinates1D):
         grid1d[self._compute_indexes] = array
         grid2d = util.array2image(grid1d, nx, ny)
         return grid2d
+
+    def _array2image_batch(self, arrays):
+        """Maps a 2d array of shape (n, num_evaluate) into a (n, nx, ny) 3d grid with
+        each row populating the idex_mask indices.
+
+        :param arrays: 2d array
+        :return: 3d array
+        """
+        nx, ny = (
+            self._nx * self._supersampling_factor,
+            self._ny * self._supersampling_factor,
+        )
+        grid = np.zeros((len(arrays), nx * ny))
+        grid[:, self._compute_indexes] = arrays
+        return grid.reshape(len(arrays), nx, ny)
@@ -33,6 +33,8 @@ class Numerics(PointSourceRendering):
         convolution_kernel_size=None,
         convolution_type="fft_static",
         truncation_conv=None,
+        fft_backend="numpy",
+        fft_workers=None,
     ):
         """
 
@@ -61,6 +63,9 @@ class Numerics(PointSourceRendering):
         :param truncation_conv: Truncation used for the construction of the convolution kernels (only relevant for Gaussian convolution). By default,
             the truncation from the psf class will be used. Can be overwritten so that different PSFs are used for
             convolution and point source rendering.
+        :param fft_backend: string, 'numpy' or 'scipy' (scipy.fft with multithreading support), fft implementation
+            of the 'fft_static' convolution
+        :param fft_workers: int or None, number of threads of the 'scipy' fft backend
         """
         if compute_mode not in ["regular", "adaptive"]:
             raise ValueError(
@@ -143,6 +148,8 @@ class Numerics(PointSourceRendering):
                     supersampling_factor,
                     supersampling_kernel_size=supersampling_kernel_size,
                     convolution_type=convolution_type,
+                    fft_backend=fft_backend,
+                    fft_workers=fft_workers,
                 )
             else:
                 kernel = psf.kernel_point_source
@@ -150,7 +157,10 @@ class Numerics(PointSourceRendering):
                     kernel, convolution_kernel_size, supersampling_factor=1
                 )
                 self._conv = PixelKernelConvolution(
-                    kernel, convolution_type=convolution_type
+                    kernel,
+                    convolution_type=convolution_type,
+                    fft_backend=fft_backend,
+                    fft_workers=fft_workers,
                 )
 
         elif self._psf_type == "GAUSSIAN":
@@ -206,6 +216,38 @@ class Numerics(PointSourceRendering):
             )
         return image_conv * self._pixel_width**2
 
+    def re_size_convolve_batch(self, flux_arrays, unconvolved=False):
+        """Stacked version of re_size_convolve(). Convolution classes supporting batched
+        convolutions (e.g. PixelKernelConvolution in 'fft_static' mode) process the
+        whole stack at once, otherwise each image is convolved separately.
+
+        :param flux_arrays: 2d array of shape (n, num_evaluate), each row being flux
+            values corresponding to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array of shape (n, nx, ny)
+        """
+        images_low_res, images_high_res = self._grid.flux_array2image_low_high_batch(
+            flux_arrays, high_res_return=self._high_res_return
+        )
+        if unconvolved is True or self._psf_type == "NONE":
+            images_conv = images_low_res
+        elif hasattr(self._conv, "re_size_convolve_batch"):
+            images_conv = self._conv.re_size_convolve_batch(
+                images_low_res, images_high_res
+            )
+        else:
+            if images_high_res is None:
+                images_high_res = [None] * len(images_low_res)
+            images_conv = np.array(
+                [
+                    self._conv.re_size_convolve(image_low_res, image_high_res)
+                    for image_low_res, image_high_res in zip(
+                        images_low_res, images_high_res
+                    )
+                ]
+            )
+        return images_conv * self._pixel_width**2
+
     @property
     def grid_supersampling_factor(self):
         """
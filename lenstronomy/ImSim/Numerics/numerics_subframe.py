@@ -26,6 +26,8 @@ class NumericsSubFrame(PointSourceRendering):
         convolution_kernel_size=None,
         convolution_type="fft_static",
         truncation_conv=None,
+        fft_backend="numpy",
+        fft_workers=None,
     ):
         """
 
@@ -54,6 +56,9 @@ class NumericsSubFrame(PointSourceRendering):
         :param truncation_conv: Truncation used for the construction of the convolution kernels (only relevant for Gaussian convolution). By default,
             the truncation from the psf class will be used. Can be overwritten so that different PSFs are used for
             convolution and point source rendering.
+        :param fft_backend: string, 'numpy' or 'scipy' (scipy.fft with multithreading support), fft implementation
+            of the 'fft_static' convolution
+        :param fft_workers: int or None, number of threads of the 'scipy' fft backend
 
         """
         # if no super sampling, turn the supersampling convolution off
@@ -75,6 +80,8 @@ class NumericsSubFrame(PointSourceRendering):
             convolution_kernel_size=convolution_kernel_size,
             convolution_type=convolution_type,
             truncation_conv=truncation_conv,
+            fft_backend=fft_backend,
+            fft_workers=fft_workers,
         )
         super(NumericsSubFrame, self).__init__(
             pixel_grid=pixel_grid,
@@ -94,6 +101,19 @@ class NumericsSubFrame(PointSourceRendering):
         )
         return self._complete_frame(image_sub_frame)
 
+    def re_size_convolve_batch(self, flux_arrays, unconvolved=False):
+        """
+
+        :param flux_arrays: 2d array of shape (n, num_evaluate), each row being flux
+            values corresponding to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array of shape (n, nx, ny)
+        """
+        images_sub_frame = self._numerics_subframe.re_size_convolve_batch(
+            flux_arrays, unconvolved=unconvolved
+        )
+        return self._complete_frame_batch(images_sub_frame)
+
     @property
     def grid_supersampling_factor(self):
         """
@@ -141,6 +161,23 @@ class NumericsSubFrame(PointSourceRendering):
             image = image_sub_frame
         return image
 
+    def _complete_frame_batch(self, images_sub_frame):
+        """
+        :param images_sub_frame: 3d numpy array of stacked images of size of the sub-frame
+        :return: 3d numpy array of stacked images of size of image with added zeros on
+            their edges
+        """
+        if self._subframe_calc is True:
+            images = np.zeros((len(images_sub_frame), self._nx, self._ny))
+            images[
+                :,
+                self._x_min_sub : self._x_max_sub + 1,
+                self._y_min_sub : self._y_max_sub + 1,
+            ] = images_sub_frame
+        else:
+            images = images_sub_frame
+        return images
+
     def _init_sub_frame(self, flux_evaluate_indexes):
         """Smaller frame that encloses all the idex_mask :return:"""
         if flux_evaluate_indexes is None:
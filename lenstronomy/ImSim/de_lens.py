@@ -2,6 +2,7 @@ __author__ = "sibirrer"
 
 import numpy as np
 import sys
+from scipy import linalg
 
 from lenstronomy.Util.package_util import exporter
 
@@ -9,7 +10,7 @@ export, __all__ = exporter()
 
 
 @export
-def get_param_WLS(A, C_D_inv, d, inv_bool=True):
+def get_param_WLS(A, C_D_inv, d, inv_bool=True, solver="inv"):
     """Returns the parameter values given.
 
     :param A: response matrix Nd x Ns (Nd = # data points, Ns = # parameters)
@@ -17,8 +18,16 @@ def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     :param d: data array, 1-d Nd
     :param inv_bool: boolean, whether returning also the inverse matrix or just solve
         the linear system
+    :param solver: string, 'inv' (default) or 'cholesky' (see get_param_WLS_cholesky)
     :return: 1-d array of parameter values
     """
+    if solver == "cholesky":
+        B, M_inv, image, _ = get_param_WLS_cholesky(A, C_D_inv, d, inv_bool=inv_bool)
+        return B, M_inv, image
+    elif solver != "inv":
+        raise ValueError(
+            "solver %s not supported! Chose either 'inv' or 'cholesky'." % solver
+        )
     M = A.T.dot(np.multiply(C_D_inv, A.T).T)
     if inv_bool:
         if np.linalg.cond(M) < 5 / sys.float_info.epsilon:
@@ -42,6 +51,51 @@ def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     return B, M_inv, image
 
 
+@export
+def get_param_WLS_cholesky(A, C_D_inv, d, inv_bool=True):
+    """Weighted least square solution using a Cholesky factorization of the weighted
+    Gram matrix M = A^T C_D^-1 A. M is computed with a symmetric rank-k update (BLAS
+    syrk) and the conditioning of the problem is estimated from the diagonal of the
+    Cholesky factor instead of a separate singular value decomposition.
+
+    :param A: response matrix Nd x Ns (Nd = # data points, Ns = # parameters)
+    :param C_D_inv: inverse covariance matrix of the data, Nd x Nd, diagonal form
+    :param d: data array, 1-d Nd
+    :param inv_bool: boolean, whether returning also the inverse matrix or just solve
+        the linear system
+    :return: 1-d array of parameter values, inverse matrix (or None), model array, log
+        determinant of the inverse matrix (or None if ill-conditioned)
+    """
+    A = np.asarray(A, dtype=float)
+    # Fortran ordered weighted response such that syrk does not need to copy
+    A_w = np.asfortranarray(A * np.sqrt(C_D_inv)[:, np.newaxis])
+    syrk = linalg.blas.get_blas_funcs("syrk", (A_w,))
+    M = syrk(alpha=1.0, a=A_w, trans=1, lower=0)
+    R = A.T.dot(np.multiply(C_D_inv, d))
+    n = np.shape(M)[0]
+    c, success = _cholesky_stable(M)
+    if success:
+        B = linalg.cho_solve((c, False), R, check_finite=False)
+        log_det_inv = -2 * np.sum(np.log(np.diag(c)))
+        if inv_bool:
+            M_inv, info = linalg.lapack.dpotri(c, lower=0)
+            if info == 0:
+                M_inv = np.triu(M_inv) + np.triu(M_inv, k=1).T
+            else:
+                M_inv = _stable_inv(np.triu(M) + np.triu(M, k=1).T)
+        else:
+            M_inv = None
+    else:
+        B = np.zeros(n)
+        log_det_inv = None
+        if inv_bool:
+            M_inv = np.zeros_like(M)
+        else:
+            M_inv = None
+    image = A.dot(B)
+    return B, M_inv, image, log_det_inv
+
+
 @export
 def marginalisation_const(M_inv):
     """Get marginalisation constant 1/2 log(M_beta) for flat priors.
@@ -57,14 +111,18 @@ def marginalisation_const(M_inv):
 
 
 @export
-def marginalization_new(M_inv, d_prior=None):
+def marginalization_new(M_inv, d_prior=None, log_det=None):
     """
 
     :param M_inv: 2D covariance matrix
     :param d_prior: maximum prior length of linear parameters
+    :param log_det: (optional) log determinant of M_inv (e.g. from a Cholesky
+        factorization) to avoid re-computing it when no prior is applied
     :return: log determinant with eigenvalues to be smaller or equal d_prior
     """
     if d_prior is None:
+        if log_det is not None:
+            return log_det / 2
         return marginalisation_const(M_inv)
     v, w = np.linalg.eig(M_inv)
     sign_v = np.sign(v)
@@ -104,3 +162,26 @@ def _solve_stable(m, r):
         n = np.shape(m)[0]
         b = np.zeros(n)
     return b
+
+
+def _cholesky_stable(m):
+    """Upper Cholesky factorization with an estimate of the conditioning of m from the
+    diagonal of the factor.
+
+    :param m: symmetric matrix (only the upper triangle is used)
+    :return: upper triangular factor, bool whether the factorization succeeded and m is
+        well conditioned
+    """
+    if np.shape(m)[0] == 0:
+        return m, False
+    try:
+        c = linalg.cholesky(m, lower=False, check_finite=False)
+    except (linalg.LinAlgError, ValueError):
+        return m, False
+    diag = np.diag(c)
+    if not np.all(np.isfinite(diag)) or np.min(diag) <= 0:
+        return c, False
+    # (max(diag) / min(diag))**2 is a lower bound on the condition number of m
+    if (np.max(diag) / np.min(diag)) ** 2 >= 5 / sys.float_info.epsilon:
+        return c, False
+    return c, True
@@ -2,6 +2,8 @@ import numpy as np
 from lenstronomy.Cosmo.background import Background
 from lenstronomy.ImSim.multiplane_organizer import MultiPlaneOrganizer
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
+from lenstronomy.Util.profiler import NullProfiler
+from lenstronomy.Util.cache_util import KwargsCache, GridCache
 
 __all__ = ["Image2SourceMapping"]
 
@@ -36,6 +38,8 @@ class Image2SourceMapping(object):
 
         self._light_model = source_model
         self._lens_model = lens_model
+        self._profiler = NullProfiler()
+        self._ray_shooting_cache = None
         light_model_list = source_model.profile_type_list
         self._multi_lens_plane = lens_model.multi_plane
         self._distance_ratio_sampling = False
@@ -73,7 +77,11 @@ class Image2SourceMapping(object):
                     "multi-lens plane modeling. You have to specify the redshifts of the sources instead."
                 )
 
-            self._bkg_cosmo = Background(lens_model.cosmo)
+            # shares the distance table of the multi-plane lens model
+            self._bkg_cosmo = Background(
+                lens_model.cosmo,
+                distance_table=getattr(lens_model.lens_model, "distance_table", None),
+            )
 
             if len(self._source_redshift_list) != len(light_model_list):
                 raise ValueError(
@@ -122,6 +130,62 @@ class Image2SourceMapping(object):
                 self._bkg_cosmo,
             )
 
+    def set_profiler(self, profiler):
+        """Sets a profiler recording the time spent in the ray-shooting and in the
+        evaluation of the source light profiles.
+
+        :param profiler: Profiler() or NullProfiler() instance
+        :return: None
+        """
+        self._profiler = profiler
+
+    def set_ray_shooting_cache(self, cache=True):
+        """Turns on (or off) the memory of the source plane coordinates of the last ray-
+        shooting. The coordinates are re-used when the same coordinate arrays are mapped
+        with unchanged lens model and special keyword arguments (e.g. when only source
+        or lens light parameters change between likelihood evaluations).
+
+        :param cache: bool, if True, re-uses the source plane coordinates
+        :return: None
+        """
+        if cache is True:
+            self._ray_shooting_cache = KwargsCache()
+        else:
+            self._ray_shooting_cache = None
+
+    def set_static_lens(self, static=True, max_grids=4):
+        """Turns on (or off) the static lens mode. The source plane coordinates are kept
+        for up to max_grids different coordinate grids (compared by value, such that re-
+        created grids, e.g. after a PSF update, are recognized) and are only re-computed
+        when the lens model or special keyword arguments change. This replaces the ray-
+        shooting cache of set_ray_shooting_cache().
+
+        :param static: bool, if True, turns on the static lens mode
+        :param max_grids: int, maximum number of coordinate grids kept
+        :return: None
+        """
+        if static is True:
+            self._ray_shooting_cache = GridCache(max_grids=max_grids)
+        else:
+            self._ray_shooting_cache = None
+
+    @property
+    def static_lens(self):
+        """
+
+        :return: bool, True if the static lens mode is turned on
+        """
+        return isinstance(self._ray_shooting_cache, GridCache)
+
+    @property
+    def ray_shooting_cache(self):
+        """
+
+        :return: KwargsCache instance of the source plane coordinates (None if turned
+            off)
+        """
+        return self._ray_shooting_cache
+
     def set_T_ij_arrays(self):
         """Sets the transverse distance arrays for the multi-lens-plane case."""
         self._T0z_list = []
@@ -153,6 +217,8 @@ class Image2SourceMapping(object):
         self._lens_model.lens_model.set_background_cosmo(cosmo)
         self._bkg_cosmo.cosmo = cosmo
         self.set_T_ij_arrays()
+        if self._ray_shooting_cache is not None:
+            self._ray_shooting_cache.reset()
 
     @property
     def T_ij_start_list(self):
@@ -255,57 +321,29 @@ class Image2SourceMapping(object):
             y)
         """
         self.update_distances(kwargs_special)
+        coordinates = self._source_plane_coordinates(x, y, kwargs_lens, kwargs_special)
 
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
+            x_source, y_source = coordinates[0]
             return self._light_model.surface_brightness(
                 x_source, y_source, kwargs_source, k=k
             )
         else:
             flux = np.zeros_like(x)
             if self._multi_lens_plane is False:
-                x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
                 for i in range(len(self._deflection_scaling_list)):
-                    scale_factor = self._deflection_scaling_list[i]
-                    x_source = x - x_alpha * scale_factor
-                    y_source = y - y_alpha * scale_factor
+                    x_source, y_source = coordinates[i]
                     if k is None or k == i:
                         flux += self._light_model.surface_brightness(
                             x_source, y_source, kwargs_source, k=i
                         )
             else:
-                alpha_x, alpha_y = x, y
-                x_source, y_source = np.zeros_like(x), np.zeros_like(y)
-                z_start = 0
                 for i, index_source in enumerate(self._sorted_source_redshift_index):
-                    z_stop = self._source_redshift_list[index_source]
-                    if z_stop > z_start:
-                        T_ij_start = self._T_ij_start_list[i]
-                        T_ij_end = self._T_ij_end_list[i]
-
-                        (
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                        ) = self._lens_model.lens_model.ray_shooting_partial(
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                            z_start,
-                            z_stop,
-                            kwargs_lens,
-                            include_z_start=False,
-                            T_ij_start=T_ij_start,
-                            T_ij_end=T_ij_end,
-                        )
-
+                    x_source, y_source = coordinates[i]
                     if k is None or k == i:
                         flux += self._light_model.surface_brightness(
                             x_source, y_source, kwargs_source, k=index_source
                         )
-                    z_start = z_stop
             return flux
 
     def image_flux_split(self, x, y, kwargs_lens, kwargs_source, kwargs_special=None):
@@ -320,66 +358,111 @@ class Image2SourceMapping(object):
             amplitude amp=1, in the same order as the light_model_list
         """
         self.update_distances(kwargs_special)
+        coordinates = self._source_plane_coordinates(x, y, kwargs_lens, kwargs_special)
 
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
-            return self._light_model.functions_split(x_source, y_source, kwargs_source)
+            x_source, y_source = coordinates[0]
+            with self._profiler.timer("source_evaluation"):
+                return self._light_model.functions_split(
+                    x_source, y_source, kwargs_source
+                )
         else:
             response = []
             n = 0
             if self._multi_lens_plane is False:
-                x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
                 for i in range(len(self._deflection_scaling_list)):
-                    scale_factor = self._deflection_scaling_list[i]
-                    x_source = x - x_alpha * scale_factor
-                    y_source = y - y_alpha * scale_factor
-                    response_i, n_i = self._light_model.functions_split(
-                        x_source, y_source, kwargs_source, k=i
-                    )
+                    x_source, y_source = coordinates[i]
+                    with self._profiler.timer("source_evaluation"):
+                        response_i, n_i = self._light_model.functions_split(
+                            x_source, y_source, kwargs_source, k=i
+                        )
                     response += response_i
                     n += n_i
             else:
-                n_i_list = []
-                alpha_x, alpha_y = x, y
-                x_source, y_source = np.zeros_like(x), np.zeros_like(y)
-                z_start = 0
                 for i, index_source in enumerate(self._sorted_source_redshift_index):
-                    z_stop = self._source_redshift_list[index_source]
-                    if z_stop > z_start:
-                        T_ij_start = self._T_ij_start_list[i]
-                        T_ij_end = self._T_ij_end_list[i]
-
-                        (
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                        ) = self._lens_model.lens_model.ray_shooting_partial(
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                            z_start,
-                            z_stop,
-                            kwargs_lens,
-                            include_z_start=False,
-                            T_ij_start=T_ij_start,
-                            T_ij_end=T_ij_end,
+                    x_source, y_source = coordinates[i]
+                    with self._profiler.timer("source_evaluation"):
+                        response_i, n_i = self._light_model.functions_split(
+                            x_source, y_source, kwargs_source, k=index_source
                         )
-
-                    response_i, n_i = self._light_model.functions_split(
-                        x_source, y_source, kwargs_source, k=index_source
-                    )
-
-                    n_i_list.append(n_i)
                     response += response_i
                     n += n_i
-                    z_start = z_stop
                 n_list = self._light_model.num_param_linear_list(kwargs_source)
                 response = self._re_order_split(response, n_list)
 
             return response, n
 
+    def _source_plane_coordinates(self, x, y, kwargs_lens, kwargs_special=None):
+        """Source plane coordinates of the image plane coordinates for all source planes
+        (re-used from the last evaluation if the ray-shooting cache is turned on and the
+        inputs are unchanged).
+
+        :param x: coordinate in image plane
+        :param y: coordinate in image plane
+        :param kwargs_lens: lens model kwargs list
+        :param kwargs_special: special keyword arguments
+        :return: list of (x_source, y_source); a single entry for a single source plane,
+            one entry per light component with deflection scaling, or one entry per
+            source ordered in redshift in multi-lens-plane mode
+        """
+        cache = self._ray_shooting_cache
+        if cache is not None:
+            coordinates = cache.get((x, y), [kwargs_lens, kwargs_special])
+            if coordinates is not None:
+                return coordinates
+        with self._profiler.timer("ray_shooting"):
+            coordinates = self._ray_shooting(x, y, kwargs_lens)
+        if cache is not None:
+            cache.set(coordinates, (x, y), [kwargs_lens, kwargs_special])
+        return coordinates
+
+    def _ray_shooting(self, x, y, kwargs_lens):
+        """Ray-shooting to all source planes, see _source_plane_coordinates().
+
+        :param x: coordinate in image plane
+        :param y: coordinate in image plane
+        :param kwargs_lens: lens model kwargs list
+        :return: list of (x_source, y_source)
+        """
+        if self._multi_source_plane is False:
+            return [self._lens_model.ray_shooting(x, y, kwargs_lens)]
+        coordinates = []
+        if self._multi_lens_plane is False:
+            x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
+            for scale_factor in self._deflection_scaling_list:
+                coordinates.append(
+                    (x - x_alpha * scale_factor, y - y_alpha * scale_factor)
+                )
+        else:
+            alpha_x, alpha_y = x, y
+            x_source, y_source = np.zeros_like(x), np.zeros_like(y)
+            z_start = 0
+            for i, index_source in enumerate(self._sorted_source_redshift_index):
+                z_stop = self._source_redshift_list[index_source]
+                if z_stop > z_start:
+                    T_ij_start = self._T_ij_start_list[i]
+                    T_ij_end = self._T_ij_end_list[i]
+                    (
+                        x_source,
+                        y_source,
+                        alpha_x,
+                        alpha_y,
+                    ) = self._lens_model.lens_model.ray_shooting_partial(
+                        x_source,
+                        y_source,
+                        alpha_x,
+                        alpha_y,
+                        z_start,
+                        z_stop,
+                        kwargs_lens,
+                        include_z_start=False,
+                        T_ij_start=T_ij_start,
+                        T_ij_end=T_ij_end,
+                    )
+                coordinates.append((x_source, y_source))
+                z_start = z_stop
+        return coordinates
+
     @staticmethod
     def _index_ordering(redshift_list):
         """Orders the redshifts in ascending order.
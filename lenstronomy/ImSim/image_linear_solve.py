@@ -28,6 +28,7 @@ class ImageLinearFit(ImageModel):
         likelihood_mask=None,
         psf_error_map_bool_list=None,
         kwargs_pixelbased=None,
+        wls_solver="inv",
     ):
         """
 
@@ -45,6 +46,9 @@ class ImageLinearFit(ImageModel):
          Indicates whether PSF error map is used for the point source model stated as the index.
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
          (see SLITronomy documentation) being applied to the point sources.
+        :param wls_solver: string, solver of the weighted linear least square problem. Options are 'inv' (default,
+         condition number from SVD and matrix inversion) and 'cholesky' (Cholesky factorization of the weighted Gram
+         matrix, which is also re-used for the marginalization constant)
         """
         super(ImageLinearFit, self).__init__(
             data_class,
@@ -60,6 +64,15 @@ class ImageLinearFit(ImageModel):
             kwargs_pixelbased=kwargs_pixelbased,
         )
 
+        if wls_solver not in ["inv", "cholesky"]:
+            raise ValueError(
+                "wls_solver %s not supported! Chose either 'inv' or 'cholesky'."
+                % wls_solver
+            )
+        self._wls_solver = wls_solver
+        # log determinant of the last covariance matrix computed with the 'cholesky' solver
+        self._cov_log_det = None, None
+
         # prepare to use fft convolution for the natwt linear solver
         if self.Data.likelihood_method() == "interferometry_natwt":
             self._convolution = PixelKernelConvolution(
@@ -117,13 +130,26 @@ class ImageLinearFit(ImageModel):
                 kwargs_extinction,
                 kwargs_special,
             )
-            C_D_response, model_error = ImageModel.error_response(
-                self, kwargs_lens, kwargs_ps, kwargs_special=kwargs_special
-            )
+            with self._profiler.timer("error_response"):
+                C_D_response, model_error = ImageModel.error_response(
+                    self, kwargs_lens, kwargs_ps, kwargs_special=kwargs_special
+                )
             d = self.data_response
-            param, cov_param, wls_model = de_lens.get_param_WLS(
-                A.T, 1 / C_D_response, d, inv_bool=inv_bool
-            )
+            with self._profiler.timer("linear_solve"):
+                if self._wls_solver == "cholesky":
+                    (
+                        param,
+                        cov_param,
+                        wls_model,
+                        log_det,
+                    ) = de_lens.get_param_WLS_cholesky(
+                        A.T, 1 / C_D_response, d, inv_bool=inv_bool
+                    )
+                    self._cov_log_det = cov_param, log_det
+                else:
+                    param, cov_param, wls_model = de_lens.get_param_WLS(
+                        A.T, 1 / C_D_response, d, inv_bool=inv_bool
+                    )
             model = self.array_masked2image(wls_model)
             _, _, _, _ = ImageLinearFit.update_linear_kwargs(
                 self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
@@ -286,14 +312,18 @@ class ImageLinearFit(ImageModel):
         :return: float, likelihood data given model
         """
 
-        logL = self.Data.log_likelihood(model, self.likelihood_mask, model_error)
-
-        if self._pixelbased_bool is False:
-            if cov_matrix is not None and source_marg:
-                marg_const = de_lens.marginalization_new(
-                    cov_matrix, d_prior=linear_prior
-                )
-                logL += marg_const
+        with self._profiler.timer("chi2"):
+            logL = self.Data.log_likelihood(model, self.likelihood_mask, model_error)
+
+            if self._pixelbased_bool is False:
+                if cov_matrix is not None and source_marg:
+                    cov_cached, log_det = self._cov_log_det
+                    if cov_cached is not cov_matrix:
+                        log_det = None
+                    marg_const = de_lens.marginalization_new(
+                        cov_matrix, d_prior=linear_prior, log_det=log_det
+                    )
+                    logL += marg_const
         if check_positive_flux is True:
             _, _, _, _ = ImageLinearFit.update_linear_kwargs(
                 self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
@@ -363,41 +393,58 @@ class ImageLinearFit(ImageModel):
             kwargs_extinction=kwargs_extinction,
             kwargs_special=kwargs_special,
         )
-        lens_light_response, n_lens_light = self.LensLightModel.functions_split(
-            x_grid, y_grid, kwargs_lens_light
-        )
+        lens_light_block = None
+        if self._lens_light_cache is not None:
+            lens_light_block = self._lens_light_cache.get(
+                (x_grid, y_grid), [kwargs_lens_light, unconvolved]
+            )
+        if lens_light_block is None:
+            with self._profiler.timer("lens_light_evaluation"):
+                lens_light_response, n_lens_light = self.LensLightModel.functions_split(
+                    x_grid, y_grid, kwargs_lens_light
+                )
+        else:
+            n_lens_light = len(lens_light_block)
 
-        ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
-            kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
-        )
+        with self._profiler.timer("point_source_response"):
+            ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
+                kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
+            )
         num_param = n_points + n_lens_light + n_source
 
         num_response = self.num_data_evaluate
         A = np.zeros((num_param, num_response))
         n = 0
         # response of lensed source profile
-        for i in range(0, n_source):
-            image = source_light_response[i]
+        if n_source > 0:
+            images = np.array(source_light_response, dtype=float)
 
             # multiply with primary beam before convolution
             if self._pb is not None:
-                image *= self._pb_1d
+                images *= self._pb_1d
 
-            image *= extinction
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
+            images *= extinction
+            self._response_batch2matrix(images, A[n : n + n_source], unconvolved)
+            n += n_source
         # response of deflector light profile (or any other un-lensed extended components)
-        for i in range(0, n_lens_light):
-            image = lens_light_response[i]
+        if lens_light_block is not None:
+            A[n : n + n_lens_light] = lens_light_block
+            n += n_lens_light
+        elif n_lens_light > 0:
+            images = np.array(lens_light_response, dtype=float)
 
             # multiply with primary beam before convolution
             if self._pb is not None:
-                image *= self._pb_1d
-
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
+                images *= self._pb_1d
+
+            self._response_batch2matrix(images, A[n : n + n_lens_light], unconvolved)
+            if self._lens_light_cache is not None:
+                self._lens_light_cache.set(
+                    A[n : n + n_lens_light].copy(),
+                    (x_grid, y_grid),
+                    [kwargs_lens_light, unconvolved],
+                )
+            n += n_lens_light
         # response of point sources
         for i in range(0, n_points):
             # raise warnings when primary beam is attempted to be applied for point sources
@@ -411,6 +458,25 @@ class ImageLinearFit(ImageModel):
             n += 1
         return A * self._flux_scaling
 
+    def _response_batch2matrix(self, flux_arrays, A_block, unconvolved=False):
+        """Convolves a stack of basis responses in a single batched call and writes the
+        masked pixels directly into the provided block of the response matrix.
+
+        :param flux_arrays: 2d array of shape (n, num_evaluate) of basis responses
+            evaluated at the ImageNumerics coordinates
+        :param A_block: view of the response matrix with shape (n, num_data_evaluate) to
+            be filled in place
+        :param unconvolved: bool, if True, computes components without convolution
+            kernel
+        :return: None
+        """
+        with self._profiler.timer("convolution"):
+            images = self.ImageNumerics.re_size_convolve_batch(
+                flux_arrays, unconvolved=unconvolved
+            )
+        np.compress(self._mask1d, images.reshape(len(images), -1), axis=1, out=A_block)
+        np.nan_to_num(A_block, copy=False)
+
     def update_linear_kwargs(
         self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
     ):
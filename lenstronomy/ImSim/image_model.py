@@ -7,6 +7,8 @@ from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.PointSource.point_source import PointSource
 from lenstronomy.ImSim.differential_extinction import DifferentialExtinction
 from lenstronomy.Util import util
+from lenstronomy.Util.profiler import NullProfiler
+from lenstronomy.Util.cache_util import KwargsCache
 
 import numpy as np
 
@@ -141,6 +143,8 @@ class ImageModel(object):
                 self.PointSource.point_source_type_list
             )
         self._psf_error_map_bool_list = psf_error_map_bool_list
+        self._profiler = NullProfiler()
+        self._lens_light_cache = None
 
     def likelihood_data_given_model(
         self,
@@ -596,6 +600,81 @@ class ImageModel(object):
         self.PointSource.delete_lens_model_cache()
         self.PointSource.set_save_cache(cache)
 
+    def set_profiler(self, profiler):
+        """Sets a profiler recording wall time and number of calls of the stages of the
+        image computation and the linear inversion (ray-shooting, source evaluation,
+        convolution, linear solve, chi2, ...).
+
+        :param profiler: Profiler() instance, or NullProfiler() to turn the profiling
+            off
+        :return: None
+        """
+        self._profiler = profiler
+        if self.source_mapping is not None:
+            self.source_mapping.set_profiler(profiler)
+
+    def set_response_cache(self, cache=True):
+        """Turns on (or off) the re-use of the ray-shot source plane coordinates when
+        the lens model and special keyword arguments are unchanged, and of the lens
+        light response of the linear inversion when the lens light keyword arguments are
+        unchanged between evaluations.
+
+        :param cache: bool, if True, re-uses unchanged components
+        :return: None
+        """
+        if self.source_mapping is not None:
+            self.source_mapping.set_ray_shooting_cache(cache)
+        if cache is True:
+            self._lens_light_cache = KwargsCache()
+        else:
+            self._lens_light_cache = None
+
+    def set_static_lens(self, static=True, max_grids=4):
+        """Turns on (or off) the static lens mode. The source plane coordinates of the
+        (supersampled) coordinate grids are computed once and re-used for as long as the
+        lens model and special keyword arguments are unchanged, also when the numerics
+        are re-initialized (e.g. with update_psf()). This is useful when the lens model
+        is kept fixed, e.g. in source-only fits or the PSF iteration.
+
+        :param static: bool, if True, turns on the static lens mode
+        :param max_grids: int, maximum number of coordinate grids of which the source
+            plane coordinates are kept
+        :return: None
+        """
+        if self.source_mapping is None:
+            return
+        if static is False and self._lens_light_cache is not None:
+            # falls back to the response cache of set_response_cache()
+            self.source_mapping.set_ray_shooting_cache(True)
+        else:
+            self.source_mapping.set_static_lens(static, max_grids=max_grids)
+
+    @property
+    def static_lens(self):
+        """
+
+        :return: bool, True if the static lens mode is turned on
+        """
+        if self.source_mapping is None:
+            return False
+        return self.source_mapping.static_lens
+
+    def set_lens_emulation(self, emulate=True, **kwargs_emulation):
+        """Replaces the supported (expensive) lens profiles by interpolated emulations
+        of their deflection angles (see LensModel.set_emulation()), e.g. for the early
+        stages of a fit, or switches back to the exact profiles.
+
+        :param emulate: bool, if True, emulates the supported profiles
+        :param kwargs_emulation: keyword arguments of EmulatedProfile
+        :return: None
+        """
+        self.LensModel.set_emulation(emulate, **kwargs_emulation)
+        if (
+            self.source_mapping is not None
+            and self.source_mapping.ray_shooting_cache is not None
+        ):
+            self.source_mapping.ray_shooting_cache.reset()
+
     def update_psf(self, psf_class):
         """Update the instance of the class with a new instance of PSF() with a
         potentially different point spread function.
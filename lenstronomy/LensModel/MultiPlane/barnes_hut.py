@@ -0,0 +1,240 @@
+__author__ = "sibirrer"
+
+import time
+import numpy as np
+
+from lenstronomy.LensModel.profile_list_base import lens_class
+from lenstronomy.Util.cache_util import kwargs_equal
+
+__all__ = ["BarnesHutDeflection", "benchmark"]
+
+
+class BarnesHutDeflection(object):
+    """Approximate deflection angles of a large population of halos of the same profile
+    type on a single plane with a Barnes-Hut tree code.
+
+    The halos are sorted into a quadtree. For each node, the complex multipole
+    coefficients of the halo masses around the center of mass of the node are computed
+    up to the specified order. The deflection of a node at a distance d is evaluated
+    with its multipole expansion when the extent of the node (including the extent of
+    its halos) is smaller than opening_angle * d. Otherwise, the children of the node
+    are opened. Halos of leaves that can not be approximated are summed exactly.
+
+    In complex notation (z = x + i y) the far field deflection of halos with masses
+    q_i = M_i / pi (in lensing units) is
+
+    .. math::
+        \\alpha^*(z) = \\sum_i \\frac{q_i}{z - z_i} = \\sum_k \\frac{a_k}{(z - z_c)^{k+1}}
+        \\quad \\text{with} \\quad a_k = \\sum_i q_i (z_i - z_c)^k
+
+    Only profiles with finite total mass are supported (POINT_MASS and TNFW). The
+    extent of a TNFW halo is its truncation radius.
+    """
+
+    SUPPORTED_MODELS = ["POINT_MASS", "TNFW"]
+
+    def __init__(self, lens_model, opening_angle=0.5, order=4, leaf_size=16):
+        """
+
+        :param lens_model: string, lens model name of all halos (see SUPPORTED_MODELS)
+        :param opening_angle: float, accuracy parameter; ratio of node extent to
+            distance below which the multipole expansion of a node is used. 0 results
+            in the exact sum.
+        :param order: int, highest order of the multipole expansion
+        :param leaf_size: int, maximum number of halos in a leaf of the tree
+        """
+        if lens_model not in self.SUPPORTED_MODELS:
+            raise ValueError(
+                "lens model %s not supported by BarnesHutDeflection. Supported are %s."
+                % (lens_model, self.SUPPORTED_MODELS)
+            )
+        self._lens_model = lens_model
+        self._profile = lens_class(lens_model)
+        self._opening_angle = opening_angle
+        self._order = int(order)
+        self._leaf_size = max(int(leaf_size), 1)
+        self._kwargs_list = None
+        self._nodes = None
+
+    @property
+    def num_nodes(self):
+        """
+
+        :return: number of nodes of the current tree (0 if no tree is built)
+        """
+        if self._nodes is None:
+            return 0
+        return len(self._nodes)
+
+    def set_halos(self, kwargs_list):
+        """Builds the tree of the halos. The tree is re-used as long as the keyword
+        arguments are unchanged.
+
+        :param kwargs_list: list of keyword arguments of the halos
+        :return: None
+        """
+        if self._nodes is not None and kwargs_equal(kwargs_list, self._kwargs_list):
+            return
+        self._kwargs_list = [dict(kwargs) for kwargs in kwargs_list]
+        self._kwargs_stacked = {}
+        for key in self._profile.param_names:
+            if key in ["center_x", "center_y"]:
+                values = [kwargs.get(key, 0) for kwargs in kwargs_list]
+            else:
+                values = [kwargs[key] for kwargs in kwargs_list]
+            self._kwargs_stacked[key] = np.array(values, dtype=float)
+        self._z = (
+            self._kwargs_stacked["center_x"] + 1j * self._kwargs_stacked["center_y"]
+        )
+        self._q, self._extent = self._mass_extent(self._kwargs_stacked)
+        self._nodes = []
+        self._build(np.arange(len(kwargs_list)))
+
+    def derivatives(self, x, y, kwargs_list):
+        """Summed deflection angles of all halos.
+
+        :param x: x-coordinates (float or array)
+        :param y: y-coordinates (float or array)
+        :param kwargs_list: list of keyword arguments of the halos
+        :return: f_x, f_y in the shape of x
+        """
+        self.set_halos(kwargs_list)
+        shape = np.shape(x)
+        z = np.ravel(np.asarray(x, dtype=float)) + 1j * np.ravel(
+            np.asarray(y, dtype=float)
+        )
+        alpha = np.zeros(len(z), dtype=complex)
+        self._evaluate(0, z, np.arange(len(z)), alpha)
+        return np.reshape(alpha.real, shape), np.reshape(alpha.imag, shape)
+
+    def _mass_extent(self, kwargs):
+        """Masses (in units of Sigma_crit * angle^2 / pi, i.e. the asymptotic deflection
+        times the distance) and extents of the halos.
+
+        :param kwargs: stacked keyword arguments of the halos
+        :return: q, extent (arrays)
+        """
+        if self._lens_model == "POINT_MASS":
+            q = kwargs["theta_E"] ** 2
+            extent = np.zeros_like(q)
+        else:
+            Rs, r_trunc = kwargs["Rs"], kwargs["r_trunc"]
+            rho0 = self._profile.alpha2rho0(alpha_Rs=kwargs["alpha_Rs"], Rs=Rs)
+            tau = r_trunc / Rs
+            g_inf = (
+                tau**2
+                / (tau**2 + 1) ** 2
+                * ((tau**2 - 1) * np.log(tau) + tau * np.pi - (tau**2 + 1))
+            )
+            q = 4 * rho0 * Rs**3 * g_inf
+            extent = r_trunc
+        return q, extent
+
+    def _build(self, index):
+        """Recursively adds the node of the halos with the given indexes (and its
+        children) to the tree.
+
+        :param index: indexes of the halos of the node
+        :return: index of the node
+        """
+        z, q = self._z[index], self._q[index]
+        q_sum = np.sum(q)
+        if q_sum != 0:
+            z_c = np.sum(q * z) / q_sum
+        else:
+            z_c = np.mean(z)
+        radius = np.max(np.abs(z - z_c) + self._extent[index])
+        coeffs = np.array([np.sum(q * (z - z_c) ** k) for k in range(self._order + 1)])
+        node = [z_c, radius, coeffs, index, []]
+        node_index = len(self._nodes)
+        self._nodes.append(node)
+        if len(index) > self._leaf_size:
+            x_mid = (np.max(z.real) + np.min(z.real)) / 2.0
+            y_mid = (np.max(z.imag) + np.min(z.imag)) / 2.0
+            quadrant = (z.real > x_mid).astype(int) + 2 * (z.imag > y_mid)
+            if len(np.unique(quadrant)) > 1:
+                for i in range(4):
+                    if np.any(quadrant == i):
+                        node[4].append(self._build(index[quadrant == i]))
+        return node_index
+
+    def _evaluate(self, node_index, z, points, alpha):
+        """Adds the deflection of a node to the points.
+
+        :param node_index: index of the node
+        :param z: complex coordinates of all points
+        :param points: indexes of the points to be evaluated
+        :param alpha: complex deflection of all points (updated in place)
+        :return: None
+        """
+        z_c, radius, coeffs, index, children = self._nodes[node_index]
+        dz = z[points] - z_c
+        far = radius < self._opening_angle * np.abs(dz)
+        if np.any(far):
+            inv_dz = 1.0 / dz[far]
+            alpha_conj = np.zeros(len(inv_dz), dtype=complex)
+            inv_dz_k = inv_dz
+            for a_k in coeffs:
+                alpha_conj += a_k * inv_dz_k
+                inv_dz_k = inv_dz_k * inv_dz
+            alpha[points[far]] += np.conj(alpha_conj)
+        near = points[~far]
+        if len(near) == 0:
+            return
+        if len(children) > 0:
+            for child in children:
+                self._evaluate(child, z, near, alpha)
+        else:
+            kwargs = {
+                key: value[index][:, np.newaxis]
+                for key, value in self._kwargs_stacked.items()
+            }
+            f_x, f_y = self._profile.derivatives(
+                z[near].real[np.newaxis, :], z[near].imag[np.newaxis, :], **kwargs
+            )
+            alpha[near] += np.sum(f_x, axis=0) + 1j * np.sum(f_y, axis=0)
+
+
+def benchmark(lens_model, kwargs_list, x, y, opening_angle=0.5, order=4, leaf_size=16):
+    """Compares accuracy and speed of the Barnes-Hut approximation against the exact sum
+    of the deflection angles of the halos.
+
+    :param lens_model: string, lens model name of all halos
+    :param kwargs_list: list of keyword arguments of the halos
+    :param x: x-coordinates
+    :param y: y-coordinates
+    :param opening_angle: accuracy parameter of BarnesHutDeflection
+    :param order: highest order of the multipole expansion
+    :param leaf_size: maximum number of halos in a leaf of the tree
+    :return: dictionary with the maximum absolute and relative (to the maximum exact
+        deflection) error, the time of the exact sum, the time to build the tree and the
+        time of the tree evaluation [seconds]
+    """
+    profile = lens_class(lens_model)
+    time_start = time.time()
+    f_x, f_y = np.zeros_like(x, dtype=float), np.zeros_like(y, dtype=float)
+    for kwargs in kwargs_list:
+        f_x_, f_y_ = profile.derivatives(x, y, **kwargs)
+        f_x += f_x_
+        f_y += f_y_
+    time_exact = time.time() - time_start
+
+    tree = BarnesHutDeflection(
+        lens_model, opening_angle=opening_angle, order=order, leaf_size=leaf_size
+    )
+    time_start = time.time()
+    tree.set_halos(kwargs_list)
+    time_build = time.time() - time_start
+    time_start = time.time()
+    f_x_tree, f_y_tree = tree.derivatives(x, y, kwargs_list)
+    time_tree = time.time() - time_start
+
+    error = np.sqrt((f_x_tree - f_x) ** 2 + (f_y_tree - f_y) ** 2)
+    alpha_max = np.max(np.sqrt(f_x**2 + f_y**2))
+    return {
+        "max_error": np.max(error),
+        "max_relative_error": np.max(error) / alpha_max,
+        "time_exact": time_exact,
+        "time_build": time_build,
+        "time_tree": time_tree,
+    }
@@ -32,6 +32,9 @@ class MultiPlaneDecoupled(MultiPlane):
         alpha_x_interp_background=None,
         alpha_y_interp_background=None,
         z_split=None,
+        distance_table=None,
+        plane_grouping=False,
+        tree_planes=None,
     ):
         """A class for multiplane lensing in which the deflection angles at certain
         coordinates are fixed through user-specified interpolation functions. These
@@ -62,6 +65,13 @@ class MultiPlaneDecoupled(MultiPlane):
             y-component of the deflection angle at (x,y)
         :param z_interp_list: a list of redshifts corresponding to the
             alpha_x_interp_list and alpha_y_interp_list entries
+        :param distance_table: None or DistanceTable instance of the cosmological
+            distances (see MultiPlane)
+        :param plane_grouping: bool, if True, groups the deflectors into redshift planes
+            (see MultiPlane)
+        :param tree_planes: None or dict {plane redshift: keyword arguments of
+            BarnesHutDeflection}, planes with halos evaluated approximately with a
+            Barnes-Hut tree code (requires plane_grouping=True, see MultiPlaneBase)
         """
         self._alphax_interp_foreground = alpha_x_interp_foreground
         self._alphay_interp_foreground = alpha_y_interp_foreground
@@ -86,9 +96,12 @@ class MultiPlaneDecoupled(MultiPlane):
             distance_ratio_sampling=distance_ratio_sampling,
             cosmology_sampling=cosmology_sampling,
             cosmology_model=cosmology_model,
+            distance_table=distance_table,
+            plane_grouping=plane_grouping,
+            tree_planes=tree_planes,
         )
 
-        cosmo_bkg = Background(cosmo)
+        cosmo_bkg = Background(cosmo, distance_table=self.distance_table)
         d_xy_source = cosmo_bkg.d_xy(0, z_source)
         d_xy_lens_source = cosmo_bkg.d_xy(self._z_split, z_source)
         self._reduced_to_phys = d_xy_source / d_xy_lens_source
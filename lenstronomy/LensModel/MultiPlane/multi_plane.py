@@ -35,6 +35,9 @@ class MultiPlane(object):
         distance_ratio_sampling=False,
         cosmology_sampling=False,
         cosmology_model="FlatLambdaCDM",
+        distance_table=None,
+        plane_grouping=False,
+        tree_planes=None,
     ):
         """
 
@@ -63,6 +66,16 @@ class MultiPlane(object):
             distance ratios to update T_ij value in multi-lens plane computation.
         :param cosmology_sampling: bool, if True, will use sampled cosmology
         :param cosmology_model: str, name of the cosmology model to use for
+        :param distance_table: None or DistanceTable instance of the cosmological
+            distances (shared with other instances in the same cosmology, e.g. when
+            changing the source redshift). If None, a new table is created (unless
+            cosmo_interp=True).
+        :param plane_grouping: bool, if True, performs a single ray step per redshift
+            plane and evaluates deflectors sharing the same profile type on a plane with
+            stacked parameter arrays (see MultiPlaneBase)
+        :param tree_planes: None or dict {plane redshift: keyword arguments of
+            BarnesHutDeflection}, planes with halos evaluated approximately with a
+            Barnes-Hut tree code (requires plane_grouping=True, see MultiPlaneBase)
         """
         self.cosmology_sampling = cosmology_sampling
         self.cosmology_model = cosmology_model
@@ -106,6 +119,9 @@ class MultiPlane(object):
             "distance_ratio_sampling": distance_ratio_sampling,
             "cosmology_sampling": cosmology_sampling,
             "cosmology_model": cosmology_model,
+            "distance_table": distance_table,
+            "plane_grouping": plane_grouping,
+            "tree_planes": tree_planes,
         }
         if z_source_convention is None:
             z_source_convention = z_source
@@ -137,7 +153,12 @@ class MultiPlane(object):
             z_interp_stop=z_interp_stop,
             num_z_interp=num_z_interp,
             profile_kwargs_list=profile_kwargs_list,
+            distance_table=distance_table,
+            plane_grouping=plane_grouping,
+            tree_planes=tree_planes,
         )
+        if self._multi_plane_base.distance_table is not None:
+            self.kwargs_class["distance_table"] = self._multi_plane_base.distance_table
         self._z_source = z_source
         self._set_source_distances(z_source)
         self._observed_convention_index = observed_convention_index
@@ -166,6 +187,15 @@ class MultiPlane(object):
     def multi_plane_base(self):
         return self._multi_plane_base
 
+    @property
+    def distance_table(self):
+        """
+
+        :return: DistanceTable instance of the cosmological distances (None if
+            interpolated cosmology is used)
+        """
+        return self._multi_plane_base.distance_table
+
     @property
     def z_source(self):
         return self._z_source
@@ -686,6 +716,25 @@ class MultiPlane(object):
         self.ignore_observed_positions = False
         self._multi_plane_base.set_dynamic()
 
+    def set_emulation(self, emulate=True, **kwargs_emulation):
+        """Replaces the supported lens profiles by interpolated emulations, see
+        ProfileListBase.set_emulation().
+
+        :param emulate: bool, if True, emulates the supported profiles
+        :param kwargs_emulation: keyword arguments of EmulatedProfile
+        :return: None
+        """
+        self._multi_plane_base.set_emulation(emulate, **kwargs_emulation)
+
+    @property
+    def emulation_error_list(self):
+        """
+
+        :return: list of the estimated relative errors of the deflection angles of the
+            emulated profiles
+        """
+        return self._multi_plane_base.emulation_error_list
+
     @staticmethod
     def _check_raise(k=None):
         """Checks whether no option to select a specific subset of deflector models is
@@ -1,5 +1,7 @@
 import numpy as np
 from lenstronomy.Cosmo.background import Background
+from lenstronomy.Cosmo.distance_table import DistanceTable
+from lenstronomy.LensModel.MultiPlane.barnes_hut import BarnesHutDeflection
 from lenstronomy.LensModel.profile_list_base import ProfileListBase
 import lenstronomy.Util.constants as const
 
@@ -23,6 +25,10 @@ class MultiPlaneBase(ProfileListBase):
         z_interp_stop=None,
         num_z_interp=100,
         profile_kwargs_list=None,
+        distance_table=None,
+        plane_grouping=False,
+        batch_size=20000,
+        tree_planes=None,
     ):
         """
         A description of the recursive multi-plane formalism can be found e.g. here: https://arxiv.org/abs/1312.1536
@@ -35,13 +41,36 @@ class MultiPlaneBase(ProfileListBase):
         :param profile_kwargs_list: list of dicts, keyword arguments used to initialize profile classes
             in the same order of the lens_model_list. If any of the profile_kwargs are None, then that
             profile will be initialized using default settings.
+        :param distance_table: None or DistanceTable instance (e.g. shared with other
+            MultiPlane instances in the same cosmology). If None and cosmo_interp=False, a
+            new table of the lens redshifts is created.
+        :param plane_grouping: bool, if True, groups the lens models into redshift planes
+            with a single ray step per plane. Deflectors on the same plane sharing the
+            same profile instance (e.g. all TNFW halos) and supporting numpy
+            broadcasting are evaluated in one call with stacked parameter arrays.
+        :param batch_size: int, maximum number of (deflector x coordinate) evaluations
+            of a single call of stacked deflectors (only with plane_grouping=True). If
+            less than 10 deflectors fit into a call (i.e. for many coordinates, where the
+            per-call overhead is negligible), the deflectors are evaluated one by one.
+        :param tree_planes: None or dict {plane redshift: keyword arguments of
+            BarnesHutDeflection (opening_angle, order, leaf_size)}. The halos of a
+            supported profile type (POINT_MASS, TNFW) on these planes are evaluated
+            approximately with a Barnes-Hut tree code (requires plane_grouping=True).
         """
         self._lens_model_list = lens_model_list
 
         if z_interp_stop is None:
             z_interp_stop = z_source_convention
+        if distance_table is None and not cosmo_interp:
+            distance_table = DistanceTable(
+                cosmo, z_list=list(lens_redshift_list) + [z_source_convention]
+            )
         self._cosmo_bkg = Background(
-            cosmo, interp=cosmo_interp, z_stop=z_interp_stop, num_interp=num_z_interp
+            cosmo,
+            interp=cosmo_interp,
+            distance_table=distance_table,
+            z_stop=z_interp_stop,
+            num_interp=num_z_interp,
         )
         self._z_source_convention = z_source_convention
         if len(lens_redshift_list) > 0:
@@ -76,34 +105,40 @@ class MultiPlaneBase(ProfileListBase):
         self._reduced2physical_factor = []
 
         self.set_T_zs_and_T_ijs()
+        self._plane_grouping = plane_grouping
+        self._batch_size = batch_size
+        self._planes = self._group_planes()
+        if tree_planes is None:
+            tree_planes = {}
+        if len(tree_planes) > 0 and plane_grouping is not True:
+            raise ValueError("tree_planes requires plane_grouping=True.")
+        self._trees = self._plane_trees(tree_planes)
 
     def set_T_zs_and_T_ijs(self):
         """Set the transverse angular diameter distances between the observer and the
         lens planes and between the lens planes."""
-        z_before = 0
-        T_z = 0
-        # Sort redshift for vectorized reduced2physical factor calculation
+        # Sort redshift for vectorized distance calculations
         if len(self._lens_model_list) < 1:
             self._reduced2physical_factor = []
-        else:
-            z_sort = np.array(self._lens_redshift_list)[self._sorted_redshift_index]
-            z_source_array = np.ones(z_sort.shape) * self._z_source_convention
-            self._reduced2physical_factor = self._cosmo_bkg.d_xy(
-                0, self._z_source_convention
-            ) / self._cosmo_bkg.d_xy(z_sort, z_source_array)
-
-        self._T_ij_list = []
-        self._T_z_list = []
-        for idex in self._sorted_redshift_index:
-            z_lens = self._lens_redshift_list[idex]
-            if z_before == z_lens:
-                delta_T = 0
-            else:
-                T_z = self._cosmo_bkg.T_xy(0, z_lens)
-                delta_T = self._cosmo_bkg.T_xy(z_before, z_lens)
-            self._T_ij_list.append(delta_T)
-            self._T_z_list.append(T_z)
-            z_before = z_lens
+            self._T_ij_list = []
+            self._T_z_list = []
+            return
+        z_sort = np.array(self._lens_redshift_list, dtype=float)[
+            self._sorted_redshift_index
+        ]
+        z_source_array = np.ones(z_sort.shape) * self._z_source_convention
+        self._reduced2physical_factor = self._cosmo_bkg.d_xy(
+            0, self._z_source_convention
+        ) / self._cosmo_bkg.d_xy(z_sort, z_source_array)
+
+        z_before = np.append(0, z_sort[:-1])
+        T_z = np.atleast_1d(self._cosmo_bkg.T_xy(np.zeros_like(z_sort), z_sort))
+        delta_T = np.atleast_1d(self._cosmo_bkg.T_xy(z_before, z_sort))
+        # lens planes at the same redshift are not separated
+        delta_T[z_before == z_sort] = 0
+        T_z[z_sort == 0] = 0
+        self._T_ij_list = list(delta_T)
+        self._T_z_list = list(T_z)
 
     def set_background_cosmo(self, cosmo):
         """Set the cosmology instance of the background class.
@@ -113,6 +148,27 @@ class MultiPlaneBase(ProfileListBase):
         self._cosmo_bkg.cosmo = cosmo
         self.set_T_zs_and_T_ijs()
 
+    def set_emulation(self, emulate=True, **kwargs_emulation):
+        """Replaces the supported lens profiles by interpolated emulations, see
+        ProfileListBase.set_emulation().
+
+        :param emulate: bool, if True, emulates the supported profiles
+        :param kwargs_emulation: keyword arguments of EmulatedProfile
+        :return: None
+        """
+        super(MultiPlaneBase, self).set_emulation(emulate, **kwargs_emulation)
+        # emulated profiles are individual instances
+        self._planes = self._group_planes()
+
+    @property
+    def distance_table(self):
+        """
+
+        :return: DistanceTable instance of the cosmological distances (None if
+            interpolated cosmology is used)
+        """
+        return self._cosmo_bkg.distance_table
+
     @property
     def z_source_convention(self):
         """Redshift of the source to define the reduced deflection angles of the lens
@@ -189,6 +245,20 @@ class MultiPlaneBase(ProfileListBase):
         alpha_x = np.array(alpha_x)
         alpha_y = np.array(alpha_y)
 
+        if self._plane_grouping is True:
+            return self._ray_shooting_partial_comoving_planes(
+                x,
+                y,
+                alpha_x,
+                alpha_y,
+                z_start,
+                z_stop,
+                kwargs_lens,
+                include_z_start=include_z_start,
+                T_ij_start=T_ij_start,
+                T_ij_end=T_ij_end,
+            )
+
         z_lens_last = z_start
         first_deflector = True
         for i, idex in enumerate(self._sorted_redshift_index):
@@ -224,6 +294,70 @@ class MultiPlaneBase(ProfileListBase):
         x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
         return x, y, alpha_x, alpha_y
 
+    def _ray_shooting_partial_comoving_planes(
+        self,
+        x,
+        y,
+        alpha_x,
+        alpha_y,
+        z_start,
+        z_stop,
+        kwargs_lens,
+        include_z_start=False,
+        T_ij_start=None,
+        T_ij_end=None,
+    ):
+        """Same as ray_shooting_partial_comoving() with a single ray step and deflection
+        evaluation per redshift plane.
+
+        :param x: co-moving position [Mpc]
+        :param y: co-moving position [Mpc]
+        :param alpha_x: ray angle at z_start [arcsec]
+        :param alpha_y: ray angle at z_start [arcsec]
+        :param z_start: redshift of start of computation
+        :param z_stop: redshift where output is computed
+        :param kwargs_lens: lens model keyword argument list
+        :param include_z_start: bool, if True, includes the computation of the
+            deflection angle at the same redshift as the start of the ray-tracing.
+        :param T_ij_start: transverse angular distance between the starting redshift to
+            the first lens plane to follow.
+        :param T_ij_end: transverse angular distance between the last lens plane being
+            computed and z_end.
+        :return: co-moving position and angles at redshift z_stop
+        """
+        z_lens_last = z_start
+        first_deflector = True
+        for i, z_lens, groups in self._planes:
+            if (
+                self._start_condition(include_z_start, z_lens, z_start)
+                and z_lens <= z_stop
+            ):
+                if first_deflector is True:
+                    if T_ij_start is None:
+                        if z_start == 0:
+                            delta_T = self._T_ij_list[0]
+                        else:
+                            delta_T = self._cosmo_bkg.T_xy(z_start, z_lens)
+                    else:
+                        delta_T = T_ij_start
+                    first_deflector = False
+                else:
+                    delta_T = self._T_ij_list[i]
+                x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+                alpha_x, alpha_y = self._add_deflection_plane(
+                    x, y, alpha_x, alpha_y, kwargs_lens, i, groups
+                )
+                z_lens_last = z_lens
+        if T_ij_end is None:
+            if z_lens_last == z_stop:
+                delta_T = 0
+            else:
+                delta_T = self._cosmo_bkg.T_xy(z_lens_last, z_stop)
+        else:
+            delta_T = T_ij_end
+        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+        return x, y, alpha_x, alpha_y
+
     def ray_shooting_partial(
         self,
         theta_x,
@@ -523,6 +657,155 @@ class MultiPlaneBase(ProfileListBase):
         alpha_y_phys = self._reduced2physical_deflection(alpha_y_red, index)
         return alpha_x - alpha_x_phys, alpha_y - alpha_y_phys
 
+    def _group_planes(self):
+        """Groups the lens models into redshift planes and, within each plane, the
+        deflectors that can be evaluated with stacked parameter arrays.
+
+        :return: list of (index of the first lens model of the plane in sorted redshift
+            list convention, redshift, list of groups), where each group is a list of
+            indexes in sorted redshift list convention
+        """
+        planes = []
+        for i, idex in enumerate(self._sorted_redshift_index):
+            z_lens = self._lens_redshift_list[idex]
+            if len(planes) == 0 or z_lens != planes[-1][1]:
+                planes.append((i, z_lens, []))
+            groups = planes[-1][2]
+            func = self.func_list[idex]
+            # deflectors sharing the same profile instance (i.e. the same profile
+            # settings) are stacked if the profile supports broadcasting
+            for group in groups:
+                func_group = self.func_list[self._sorted_redshift_index[group[0]]]
+                if func_group is func and func._batch_broadcast is True:
+                    group.append(i)
+                    break
+            else:
+                groups.append([i])
+        return planes
+
+    def _plane_trees(self, tree_planes):
+        """Barnes-Hut tree codes of the groups of halos on the selected planes.
+
+        :param tree_planes: dict {plane redshift: keyword arguments of
+            BarnesHutDeflection}
+        :return: dict {first index of the group in sorted redshift list convention:
+            BarnesHutDeflection instance}
+        """
+        trees = {}
+        z_planes = [z_lens for _, z_lens, _ in self._planes]
+        for z_tree in tree_planes:
+            if z_tree not in z_planes:
+                raise ValueError(
+                    "tree plane redshift %s does not match any lens plane." % z_tree
+                )
+        for _, z_lens, groups in self._planes:
+            if z_lens not in tree_planes:
+                continue
+            kwargs_tree = tree_planes[z_lens]
+            if kwargs_tree is None:
+                kwargs_tree = {}
+            for group in groups:
+                lens_model = self._lens_model_list[
+                    self._sorted_redshift_index[group[0]]
+                ]
+                if (
+                    len(group) > 1
+                    and lens_model in BarnesHutDeflection.SUPPORTED_MODELS
+                ):
+                    trees[group[0]] = BarnesHutDeflection(lens_model, **kwargs_tree)
+        return trees
+
+    def _add_deflection_plane(self, x, y, alpha_x, alpha_y, kwargs_lens, index, groups):
+        """Adds the physical deflection angles of all deflectors of a redshift plane to
+        the deflection field.
+
+        :param x: co-moving distance at the deflector plane
+        :param y: co-moving distance at the deflector plane
+        :param alpha_x: physical angle (radian) before the deflector plane
+        :param alpha_y: physical angle (radian) before the deflector plane
+        :param kwargs_lens: lens model parameter kwargs
+        :param index: index of the first lens model of the plane in sorted redshift list
+            convention
+        :param groups: list of groups of indexes (in sorted redshift list convention) of
+            the deflectors of the plane
+        :return: updated physical deflection after deflector plane (in a backwards ray-
+            tracing perspective)
+        """
+        theta_x, theta_y = self._co_moving2angle(x, y, index)
+        alpha_x_red, alpha_y_red = 0, 0
+        for group in groups:
+            if group[0] in self._trees:
+                kwargs_group = [
+                    kwargs_lens[self._sorted_redshift_index[j]] for j in group
+                ]
+                f_x, f_y = self._trees[group[0]].derivatives(
+                    theta_x, theta_y, kwargs_group
+                )
+            elif len(group) == 1:
+                k = self._sorted_redshift_index[group[0]]
+                f_x, f_y = self.func_list[k].derivatives(
+                    theta_x, theta_y, **kwargs_lens[k]
+                )
+            else:
+                f_x, f_y = self._derivatives_stacked(
+                    theta_x, theta_y, kwargs_lens, group
+                )
+            alpha_x_red = alpha_x_red + f_x
+            alpha_y_red = alpha_y_red + f_y
+        alpha_x_phys = self._reduced2physical_deflection(alpha_x_red, index)
+        alpha_y_phys = self._reduced2physical_deflection(alpha_y_red, index)
+        return alpha_x - alpha_x_phys, alpha_y - alpha_y_phys
+
+    def _derivatives_stacked(self, theta_x, theta_y, kwargs_lens, group):
+        """Sum of the reduced deflection angles of deflectors sharing the same profile
+        instance, evaluated with stacked parameter arrays of shape (n_deflectors, 1)
+        broadcast against the coordinates.
+
+        :param theta_x: angular coordinates
+        :param theta_y: angular coordinates
+        :param kwargs_lens: lens model parameter kwargs
+        :param group: list of indexes (in sorted redshift list convention) of the
+            deflectors
+        :return: summed reduced deflection angles in the shape of theta_x
+        """
+        k_list = [self._sorted_redshift_index[j] for j in group]
+        func = self.func_list[k_list[0]]
+        keys = kwargs_lens[k_list[0]].keys()
+        num_points = np.size(theta_x)
+        num_stack = int(self._batch_size / max(num_points, 1))
+        stackable = num_stack >= 10
+        for k in k_list:
+            if kwargs_lens[k].keys() != keys or any(
+                [np.ndim(value) > 0 for value in kwargs_lens[k].values()]
+            ):
+                stackable = False
+                break
+        if stackable is False:
+            f_x, f_y = 0, 0
+            for k in k_list:
+                f_x_k, f_y_k = func.derivatives(theta_x, theta_y, **kwargs_lens[k])
+                f_x, f_y = f_x + f_x_k, f_y + f_y_k
+            return f_x, f_y
+        kwargs_stacked = {
+            key: np.array([kwargs_lens[k][key] for k in k_list], dtype=float)[:, None]
+            for key in keys
+        }
+        shape = np.shape(theta_x)
+        theta_x_ = np.reshape(theta_x, (1, -1))
+        theta_y_ = np.reshape(theta_y, (1, -1))
+        f_x = np.zeros(num_points)
+        f_y = np.zeros(num_points)
+        for start in range(0, len(k_list), num_stack):
+            kwargs_chunk = {
+                key: value[start : start + num_stack]
+                for key, value in kwargs_stacked.items()
+            }
+            f_x_, f_y_ = func.derivatives(theta_x_, theta_y_, **kwargs_chunk)
+            num_chunk = len(k_list[start : start + num_stack])
+            f_x += np.sum(np.broadcast_to(f_x_, (num_chunk, num_points)), axis=0)
+            f_y += np.sum(np.broadcast_to(f_y_, (num_chunk, num_points)), axis=0)
+        return np.reshape(f_x, shape), np.reshape(f_y, shape)
+
     @staticmethod
     def _start_condition(inclusive, z_lens, z_start):
         """
@@ -1,3 +1,9 @@
+import numpy as np
+from lenstronomy.LensModel.profile_list_base import (
+    num_samples_batch,
+    select_sample_batch,
+)
+
 __all__ = ["LensProfileBase"]
 
 
@@ -28,6 +34,10 @@ class LensProfileBase(object):
     Further definitions in the class are optional and only used for certain applications (such as kinematics)
     """
 
+    # set to True in profiles whose derivatives() support numpy broadcasting of parameter arrays of shape
+    # (n_samples, 1) against coordinate arrays of shape (1, n_points), see derivatives_batch()
+    _batch_broadcast = False
+
     def __init__(self, *args, **kwargs):
         self._static = False
 
@@ -52,6 +62,40 @@ class LensProfileBase(object):
             "derivatives definition is not defined in the profile you want to execute."
         )
 
+    def derivatives_batch(self, x, y, **kwargs):
+        """Deflection angles for a batch of parameter sets evaluated at the same
+        coordinates. Profiles supporting numpy broadcasting are evaluated in a single
+        call, all others are evaluated in a loop over the samples.
+
+        :param x: 1d array of x-coordinates of length n_points
+        :param y: 1d array of y-coordinates of length n_points
+        :param kwargs: keywords of the profile, either floats (shared among all samples)
+            or 1d arrays of length n_samples
+        :return: f_x, f_y, 2d arrays of shape (n_samples, n_points)
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        n_samples = num_samples_batch([kwargs])
+        shape = (n_samples, len(x))
+        if self._batch_broadcast is True:
+            kwargs_column = {
+                key: np.reshape(value, (-1, 1)) if np.ndim(value) > 0 else value
+                for key, value in kwargs.items()
+            }
+            f_x, f_y = self.derivatives(
+                x[np.newaxis, :], y[np.newaxis, :], **kwargs_column
+            )
+            if np.shape(f_x) != shape:
+                f_x = np.broadcast_to(f_x, shape).copy()
+            if np.shape(f_y) != shape:
+                f_y = np.broadcast_to(f_y, shape).copy()
+            return f_x, f_y
+        f_x, f_y = np.zeros(shape), np.zeros(shape)
+        for i in range(n_samples):
+            kwargs_i = select_sample_batch([kwargs], i)[0]
+            f_x[i], f_y[i] = self.derivatives(x, y, **kwargs_i)
+        return f_x, f_y
+
     def hessian(self, *args, **kwargs):
         """Returns Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2.
 
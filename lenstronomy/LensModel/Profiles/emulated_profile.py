@@ -0,0 +1,309 @@
+__author__ = "sibirrer"
+
+import numpy as np
+
+from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.profile_list_base import lens_class
+from lenstronomy.Util import param_util
+
+__all__ = ["EmulatedProfile"]
+
+
+class EmulatedProfile(LensProfileBase):
+    """Emulation of an (expensive) lens profile by interpolation of its radial
+    deflection angle and its radial derivative, tabulated on an adaptive logarithmic
+    radial grid for a given set of parameters.
+
+    Supported are spherical profiles and profiles with an ellipticity defined in the
+    potential (the '_ELLIPSE_POTENTIAL' profiles using elliptical coordinates of the
+    spherical profile). For the latter, the table of the spherical profile is evaluated
+    in the elliptical coordinates and the deflection and Hessian are rescaled
+    accordingly, such that a single table serves all ellipticities. Profiles with an
+    ellipticity defined in the convergence can not be emulated this way.
+
+    The table is re-used as long as the shape parameters of the profile stay within a
+    relative tolerance rtol of the ones the table was computed for. Changes in the
+    center, the ellipticity and the amplitude parameter (which is linear in the
+    deflection) do not require a new table. The lensing potential is evaluated exactly.
+
+    The accuracy of a table is estimated at the (logarithmic) mid-points of the radial
+    grid and is available as emulation_error. Outside the tabulated radial range, the
+    deflection is extrapolated linearly in r (inside) and as 1/r (outside).
+    """
+
+    # spherical profile that is tabulated, whether the ellipticity is defined in the
+    # potential, and the parameter linear in the deflection
+    SUPPORTED_MODELS = {
+        "NFW": ("NFW", False, "alpha_Rs"),
+        "TNFW": ("TNFW", False, "alpha_Rs"),
+        "CNFW": ("CNFW", False, "alpha_Rs"),
+        "GNFW": ("GNFW", False, "alpha_Rs"),
+        "coreBURKERT": ("coreBURKERT", False, "alpha_Rs"),
+        "HERNQUIST": ("HERNQUIST", False, "sigma0"),
+        "PJAFFE": ("PJAFFE", False, "sigma0"),
+        "SERSIC": ("SERSIC", False, "k_eff"),
+        "MULTI_GAUSSIAN": ("MULTI_GAUSSIAN", False, None),
+        "NFW_ELLIPSE_POTENTIAL": ("NFW", True, "alpha_Rs"),
+        "TNFW_ELLIPSE_POTENTIAL": ("TNFW", True, "alpha_Rs"),
+        "HERNQUIST_ELLIPSE_POTENTIAL": ("HERNQUIST", True, "sigma0"),
+        "PJAFFE_ELLIPSE_POTENTIAL": ("PJAFFE", True, "sigma0"),
+        "SERSIC_ELLIPSE_POTENTIAL": ("SERSIC", True, "k_eff"),
+    }
+
+    def __init__(
+        self,
+        lens_model,
+        profile=None,
+        rtol=0.001,
+        r_min=0.0001,
+        r_max=1000,
+        num_r=100,
+        accuracy=0.0001,
+        max_refine=5,
+    ):
+        """
+
+        :param lens_model: string, name of the emulated lens model (see
+            SUPPORTED_MODELS)
+        :param profile: None or instance of the exact lens model (used for the lensing
+            potential)
+        :param rtol: relative tolerance of the shape parameters within which a table is
+            re-used
+        :param r_min: minimum radius of the table (angular units)
+        :param r_max: maximum radius of the table (angular units)
+        :param num_r: number of initial logarithmically spaced radii of the table
+        :param accuracy: relative accuracy (to the maximum deflection) at which the
+            radial grid is refined
+        :param max_refine: maximum number of refinement iterations of the radial grid
+        """
+        if lens_model not in self.SUPPORTED_MODELS:
+            raise ValueError(
+                "lens model %s can not be emulated. Supported are %s."
+                % (lens_model, list(self.SUPPORTED_MODELS.keys()))
+            )
+        model_spherical, self._ellipse, self._amp_name = self.SUPPORTED_MODELS[
+            lens_model
+        ]
+        if profile is None:
+            profile = lens_class(lens_model)
+        self._profile = profile
+        self._profile_spherical = lens_class(model_spherical)
+        self.param_names = profile.param_names
+        self.lower_limit_default = profile.lower_limit_default
+        self.upper_limit_default = profile.upper_limit_default
+        self._rtol = rtol
+        self._log_r_min = np.log(r_min)
+        self._log_r_max = np.log(r_max)
+        self._num_r = int(num_r)
+        self._accuracy = accuracy
+        self._max_refine = int(max_refine)
+        self._kwargs_table = None
+        self._emulation_error = None
+        self._num_tables = 0
+        super(EmulatedProfile, self).__init__()
+
+    @property
+    def emulation_error(self):
+        """
+
+        :return: estimated maximum relative error of the deflection angle (relative to
+            the maximum deflection) of the current table (None if no table is computed)
+        """
+        return self._emulation_error
+
+    @property
+    def num_tables(self):
+        """
+
+        :return: number of tables computed
+        """
+        return self._num_tables
+
+    def function(self, x, y, **kwargs):
+        """Lensing potential (evaluated exactly)
+
+        :param x: x-coordinate (angular position)
+        :param y: y-coordinate (angular position)
+        :param kwargs: keyword arguments of the emulated profile
+        :return: lensing potential
+        """
+        return self._profile.function(x, y, **kwargs)
+
+    def derivatives(self, x, y, **kwargs):
+        """Emulated deflection angles.
+
+        :param x: x-coordinate (angular position)
+        :param y: y-coordinate (angular position)
+        :param kwargs: keyword arguments of the emulated profile
+        :return: f_x, f_y
+        """
+        x_, y_, r, amp_scale, kwargs_ellipse = self._prepare(x, y, kwargs)
+        alpha = self._alpha(r) * amp_scale
+        f_x, f_y = alpha * x_ / r, alpha * y_ / r
+        if self._ellipse is True:
+            s1, s2, cos_phi, sin_phi = kwargs_ellipse
+            f_x, f_y = f_x * s1, f_y * s2
+            f_x, f_y = cos_phi * f_x - sin_phi * f_y, sin_phi * f_x + cos_phi * f_y
+        return f_x, f_y
+
+    def hessian(self, x, y, **kwargs):
+        """Emulated Hessian matrix.
+
+        :param x: x-coordinate (angular position)
+        :param y: y-coordinate (angular position)
+        :param kwargs: keyword arguments of the emulated profile
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        x_, y_, r, amp_scale, kwargs_ellipse = self._prepare(x, y, kwargs)
+        alpha_r = self._alpha(r) / r * amp_scale
+        d_alpha = self._d_alpha(r) * amp_scale
+        cos2, sin2, cos_sin = (x_ / r) ** 2, (y_ / r) ** 2, x_ * y_ / r**2
+        f_xx = d_alpha * cos2 + alpha_r * sin2
+        f_yy = d_alpha * sin2 + alpha_r * cos2
+        f_xy = (d_alpha - alpha_r) * cos_sin
+        if self._ellipse is True:
+            # Hessian in the elliptical coordinates x' = M x is M^T H M
+            s1, s2, cos_phi, sin_phi = kwargs_ellipse
+            m11, m12, m21, m22 = s1 * cos_phi, s1 * sin_phi, -s2 * sin_phi, s2 * cos_phi
+            h_xx, h_xy, h_yy = f_xx, f_xy, f_yy
+            f_xx = m11**2 * h_xx + 2 * m11 * m21 * h_xy + m21**2 * h_yy
+            f_yy = m12**2 * h_xx + 2 * m12 * m22 * h_xy + m22**2 * h_yy
+            f_xy = m11 * m12 * h_xx + (m11 * m22 + m21 * m12) * h_xy + m21 * m22 * h_yy
+        return f_xx, f_xy, f_xy, f_yy
+
+    def _prepare(self, x, y, kwargs):
+        """Updates the table (if needed) and computes the (elliptical) coordinates.
+
+        :param x: x-coordinate (angular position)
+        :param y: y-coordinate (angular position)
+        :param kwargs: keyword arguments of the emulated profile
+        :return: x_, y_, r (coordinates of the spherical profile), amplitude scaling of
+            the table, (sqrt(1-e), sqrt(1+e), cos(phi), sin(phi)) of the ellipticity
+        """
+        kwargs_shape = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in ["center_x", "center_y", "e1", "e2", self._amp_name]
+        }
+        self._update_table(kwargs_shape)
+        amp_scale = 1
+        if self._amp_name is not None:
+            amp_scale = kwargs[self._amp_name] / self._amp_table
+        center_x, center_y = kwargs.get("center_x", 0), kwargs.get("center_y", 0)
+        kwargs_ellipse = None
+        if self._ellipse is True:
+            e1, e2 = kwargs["e1"], kwargs["e2"]
+            x_, y_ = param_util.transform_e1e2_square_average(
+                x, y, e1, e2, center_x, center_y
+            )
+            phi_G, q = param_util.ellipticity2phi_q(e1, e2)
+            e = param_util.q2e(q)
+            kwargs_ellipse = (
+                np.sqrt(1 - e),
+                np.sqrt(1 + e),
+                np.cos(phi_G),
+                np.sin(phi_G),
+            )
+        else:
+            x_, y_ = x - center_x, y - center_y
+        r = np.maximum(np.sqrt(x_**2 + y_**2), 10 ** (-15))
+        return x_, y_, r, amp_scale, kwargs_ellipse
+
+    def _update_table(self, kwargs_shape):
+        """Computes a new table if the shape parameters differ by more than the
+        tolerance from the ones of the current table.
+
+        :param kwargs_shape: keyword arguments of the profile without center,
+            ellipticity and amplitude
+        :return: None
+        """
+        if self._kwargs_table is not None and self._within_tolerance(kwargs_shape):
+            return
+        self._kwargs_table = {
+            key: np.copy(value) for key, value in kwargs_shape.items()
+        }
+        self._amp_table = 1.0
+        kwargs = dict(kwargs_shape)
+        if self._amp_name is not None:
+            kwargs[self._amp_name] = self._amp_table
+
+        log_r = np.linspace(self._log_r_min, self._log_r_max, self._num_r)
+        alpha, d_alpha = self._exact(log_r, kwargs)
+        for i in range(self._max_refine + 1):
+            log_r_mid = (log_r[:-1] + log_r[1:]) / 2.0
+            alpha_mid, d_alpha_mid = self._exact(log_r_mid, kwargs)
+            error = np.abs(alpha_mid - (alpha[:-1] + alpha[1:]) / 2.0)
+            error /= max(np.max(np.abs(alpha)), 10 ** (-15))
+            refine = error > self._accuracy
+            if i == self._max_refine or not np.any(refine):
+                break
+            log_r = np.append(log_r, log_r_mid[refine])
+            alpha = np.append(alpha, alpha_mid[refine])
+            d_alpha = np.append(d_alpha, d_alpha_mid[refine])
+            index = np.argsort(log_r)
+            log_r, alpha, d_alpha = log_r[index], alpha[index], d_alpha[index]
+        self._emulation_error = np.max(error)
+        self._log_r_table = log_r
+        self._alpha_table = alpha
+        self._d_alpha_table = d_alpha
+        self._num_tables += 1
+
+    def _within_tolerance(self, kwargs_shape):
+        """Whether the shape parameters are within the tolerance of the ones of the
+        current table.
+
+        :param kwargs_shape: keyword arguments of the profile without center,
+            ellipticity and amplitude
+        :return: bool
+        """
+        if kwargs_shape.keys() != self._kwargs_table.keys():
+            return False
+        for key, value in kwargs_shape.items():
+            value_table = self._kwargs_table[key]
+            if np.shape(value) != np.shape(value_table):
+                return False
+            if not np.all(
+                np.abs(value - value_table) <= self._rtol * np.abs(value_table)
+            ):
+                return False
+        return True
+
+    def _exact(self, log_r, kwargs):
+        """Exact radial deflection and its radial derivative of the spherical profile.
+
+        :param log_r: natural logarithm of the radii
+        :param kwargs: keyword arguments of the spherical profile (centered at 0)
+        :return: alpha(r), d alpha / dr
+        """
+        r = np.exp(log_r)
+        alpha, _ = self._profile_spherical.derivatives(r, np.zeros_like(r), **kwargs)
+        d_alpha, _, _, _ = self._profile_spherical.hessian(
+            r, np.zeros_like(r), **kwargs
+        )
+        return alpha, d_alpha
+
+    def _alpha(self, r):
+        """Radial deflection angle interpolated in log(r), extrapolated linearly in r
+        inside and as 1/r outside the tabulated range.
+
+        :param r: radii
+        :return: alpha(r) of the table
+        """
+        log_r = np.log(r)
+        alpha = np.interp(log_r, self._log_r_table, self._alpha_table)
+        r_min, r_max = np.exp(self._log_r_min), np.exp(self._log_r_max)
+        alpha = np.where(r < r_min, self._alpha_table[0] * r / r_min, alpha)
+        return np.where(r > r_max, self._alpha_table[-1] * r_max / r, alpha)
+
+    def _d_alpha(self, r):
+        """Radial derivative of the deflection angle interpolated in log(r), consistent
+        with the extrapolation of _alpha().
+
+        :param r: radii
+        :return: d alpha / dr of the table
+        """
+        log_r = np.log(r)
+        d_alpha = np.interp(log_r, self._log_r_table, self._d_alpha_table)
+        r_min, r_max = np.exp(self._log_r_min), np.exp(self._log_r_max)
+        d_alpha = np.where(r < r_min, self._alpha_table[0] / r_min, d_alpha)
+        return np.where(r > r_max, -self._alpha_table[-1] * r_max / r**2, d_alpha)
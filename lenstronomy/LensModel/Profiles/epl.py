@@ -5,10 +5,14 @@ import lenstronomy.Util.util as util
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 from lenstronomy.LensModel.Profiles.spp import SPP
+from lenstronomy.LensModel.Profiles import epl_numba
+from lenstronomy.Util import numba_util
 from scipy.special import hyp2f1
 
 __all__ = ["EPL", "EPLMajorAxis", "EPLQPhi"]
 
+SUPPORTED_BACKENDS = ["scipy", "numba"]
+
 
 class EPL(LensProfileBase):
     """Elliptical Power Law mass profile.
@@ -63,8 +67,15 @@ class EPL(LensProfileBase):
         "center_y": 100,
     }
 
-    def __init__(self):
-        self.epl_major_axis = EPLMajorAxis()
+    _batch_broadcast = True
+
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' or 'numba', implementation of the deflection (see
+            EPLMajorAxis)
+        """
+        self.epl_major_axis = EPLMajorAxis(backend=backend)
         self.spp = SPP()
         super(EPL, self).__init__()
 
@@ -255,7 +266,20 @@ class EPLMajorAxis(LensProfileBase):
 
     param_names = ["b", "t", "q", "center_x", "center_y"]
 
-    def __init__(self):
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' (default) evaluates the angular part of the deflection
+            with scipy.special.hyp2f1, 'numba' with the numba-compiled iterative scheme
+            of the EPL_NUMBA profile (and with parallel kernels for large arrays when
+            enabled in the numba configuration)
+        """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(
+                "backend %s not supported. Chose among %s."
+                % (backend, SUPPORTED_BACKENDS)
+            )
+        self._backend = backend
         super(EPLMajorAxis, self).__init__()
 
     def function(self, x, y, b, t, q):
@@ -286,18 +310,28 @@ class EPLMajorAxis(LensProfileBase):
         :param q: axis ratio
         :return: f_x, f_y
         """
-        # elliptical radius, eq. (5)
-        Z = np.empty(np.shape(x), dtype=complex)
-        Z.real = q * x
-        Z.imag = y
-        R = np.abs(Z)
-        R = np.maximum(R, 0.000000001)
-
-        # angular dependency with extra factor of R, eq. (23)
-        R_omega = Z * hyp2f1(1, t / 2, 2 - t / 2, -(1 - q) / (1 + q) * (Z / Z.conj()))
-
-        # deflection, eq. (22)
-        alpha = 2 / (1 + q) * (b / R) ** t * R_omega
+        if (
+            self._backend == "numba"
+            and np.ndim(b) == 0
+            and np.ndim(t) == 0
+            and np.ndim(q) == 0
+        ):
+            alpha = self._alpha_numba(x, y, b, t, q)
+        else:
+            # elliptical radius, eq. (5)
+            Z = np.empty(np.shape(x), dtype=complex)
+            Z.real = q * x
+            Z.imag = y
+            R = np.abs(Z)
+            R = np.maximum(R, 0.000000001)
+
+            # angular dependency with extra factor of R, eq. (23)
+            R_omega = Z * hyp2f1(
+                1, t / 2, 2 - t / 2, -(1 - q) / (1 + q) * (Z / Z.conj())
+            )
+
+            # deflection, eq. (22)
+            alpha = 2 / (1 + q) * (b / R) ** t * R_omega
 
         # return real and imaginary part
         alpha_real = np.nan_to_num(alpha.real, posinf=10**10, neginf=-(10**10))
@@ -305,6 +339,29 @@ class EPLMajorAxis(LensProfileBase):
 
         return alpha_real, alpha_imag
 
+    @staticmethod
+    def _alpha_numba(x, y, b, t, q):
+        """Complex deflection with the numba-compiled iterative scheme of Tessore &
+        Metcalf (2015) (shared with the EPL_NUMBA profile).
+
+        :param x: x-coordinate in image plane relative to center (major axis)
+        :param y: y-coordinate in image plane relative to center (minor axis)
+        :param b: critical radius (float)
+        :param t: projected power-law slope (float)
+        :param q: axis ratio (float)
+        :return: complex deflection with the shape of x
+        """
+        x_, y_ = np.broadcast_arrays(x, y)
+        shape = x_.shape
+        x_ = np.ascontiguousarray(x_, dtype=float).ravel()
+        y_ = np.ascontiguousarray(y_, dtype=float).ravel()
+        b, t, q = float(b), float(t), float(q)
+        if numba_util.prange_enabled and len(x_) >= numba_util.prange_min_size:
+            alpha = epl_numba.alpha_parallel(x_, y_, b, q, t)
+        else:
+            alpha = epl_numba.alpha(x_, y_, b, q, t)
+        return alpha.reshape(shape)
+
     def hessian(self, x, y, b, t, q):
         """Hessian matrix of the lensing potential.
 
@@ -364,8 +421,13 @@ class EPLQPhi(LensProfileBase):
         "center_y": 100,
     }
 
-    def __init__(self):
-        self._EPL = EPL()
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' or 'numba', implementation of the deflection (see
+            EPLMajorAxis)
+        """
+        self._EPL = EPL(backend=backend)
         super(EPLQPhi, self).__init__()
 
     def function(self, x, y, theta_E, gamma, q, phi, center_x=0, center_y=0):
@@ -53,8 +53,13 @@ class EPL_BOXYDISKY_ELL(LensProfileBase):
         "a4_a": +0.1,
     }
 
-    def __init__(self):
-        self._epl = EPL()
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' or 'numba', implementation of the EPL deflection (see
+            EPLMajorAxis)
+        """
+        self._epl = EPL(backend=backend)
         self._multipole = EllipticalMultipole()
         self._m = int(4)
         super(EPL_BOXYDISKY_ELL, self).__init__()
@@ -211,8 +216,13 @@ class EPL_BOXYDISKY(LensProfileBase):
         "a4_a": +0.1,
     }
 
-    def __init__(self):
-        self._epl = EPL()
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' or 'numba', implementation of the EPL deflection (see
+            EPLMajorAxis)
+        """
+        self._epl = EPL(backend=backend)
         self._multipole = Multipole()
         self._m = int(4)
         super(EPL_BOXYDISKY, self).__init__()
@@ -62,8 +62,13 @@ class EPL_MULTIPOLE_M1M3M4_ELL(LensProfileBase):
         "delta_phi_m4": np.pi / 8,
     }
 
-    def __init__(self):
-        self._epl = EPL()
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' or 'numba', implementation of the EPL deflection (see
+            EPLMajorAxis)
+        """
+        self._epl = EPL(backend=backend)
         self._multipole = EllipticalMultipole()
         super(EPL_MULTIPOLE_M1M3M4_ELL, self).__init__()
 
@@ -452,8 +457,13 @@ class EPL_MULTIPOLE_M1M3M4(LensProfileBase):
         "delta_phi_m4": np.pi / 8,
     }
 
-    def __init__(self):
-        self._epl = EPL()
+    def __init__(self, backend="scipy"):
+        """
+
+        :param backend: 'scipy' or 'numba', implementation of the EPL deflection (see
+            EPLMajorAxis)
+        """
+        self._epl = EPL(backend=backend)
         self._multipole = Multipole()
         super(EPL_MULTIPOLE_M1M3M4, self).__init__()
 
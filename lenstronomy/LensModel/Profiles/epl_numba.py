@@ -3,7 +3,7 @@ __author__ = "ewoudwempe"
 import numpy as np
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
-from lenstronomy.Util.numba_util import jit
+from lenstronomy.Util.numba_util import jit, prange
 
 __all__ = ["EPL_numba"]
 
@@ -207,3 +207,36 @@ def omega(phi, t, q, niter_max=200, tol=1e-16):
         Omega *= (2 * n - (2 - t)) / (2 * n + (2 - t)) * fact
     omegas += Omega
     return omegas
+
+
+@jit(parallel=True)
+def alpha_parallel(x, y, b, q, t, niter_max=200, tol=1e-16):
+    """Calculates the complex deflection in parallel (prange) loops over the
+    coordinates, with the same iterative scheme as alpha() and omega().
+
+    :param x: 1d array of x-coordinates (angle)
+    :param y: 1d array of y-coordinates (angle)
+    :param b: Einstein radius (angle), pay attention to specific definition!
+    :param q: axis ratio
+    :param t: logarithmic power-law slope. Is t=gamma-1
+    :return: complex deflection angle
+    """
+    f = (1 - q) / (1 + q)
+    niter = min(niter_max, int(np.log(tol) / np.log(f)) + 2)
+    alph = np.zeros(len(x), dtype=np.complex128)
+    for i in prange(len(x)):
+        zz = x[i] * q + 1j * y[i]
+        R = np.abs(zz)
+        phi = np.angle(zz)
+        Omega = 1 * np.exp(1j * phi)
+        fact = -f * np.exp(2j * phi)
+        omegas = 0j
+        for n in range(1, niter):
+            omegas += Omega
+            Omega *= (2 * n - (2 - t)) / (2 * n + (2 - t)) * fact
+        omegas += Omega
+        scale = (b / R) ** t * R / b
+        if np.isnan(scale):
+            scale = 0.0
+        alph[i] = (2 * b) / (1 + q) * scale * omegas
+    return alph
@@ -58,6 +58,8 @@ class NFW(LensProfileBase):
     lower_limit_default = {"Rs": 0, "alpha_Rs": 0, "center_x": -100, "center_y": -100}
     upper_limit_default = {"Rs": 100, "alpha_Rs": 10, "center_x": 100, "center_y": 100}
 
+    _batch_broadcast = True
+
     def __init__(self, interpol=False, num_interp_X=1000, max_interp_X=10):
         """
 
@@ -110,8 +112,7 @@ class NFW(LensProfileBase):
         :return: deflection angle in x, deflection angle in y
         """
         rho0_input = self.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
-        if Rs < 0.0000001:
-            Rs = 0.0000001
+        Rs = np.maximum(Rs, 0.0000001)
         x_ = x - center_x
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
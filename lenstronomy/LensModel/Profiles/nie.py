@@ -33,6 +33,8 @@ class NIE(LensProfileBase):
         "center_y": 100,
     }
 
+    _batch_broadcast = True
+
     def __init__(self):
         self.nie_major_axis = NIEMajorAxis()
         super(NIE, self).__init__()
@@ -256,8 +258,7 @@ class NIEMajorAxis(LensProfileBase):
 
     def derivatives(self, x, y, b, s, q):
         """Returns df/dx and df/dy of the function."""
-        if q >= 1:
-            q = 0.99999999
+        q = np.minimum(q, 0.99999999)
         psi = self._psi(x, y, q, s)
         f_x = b / np.sqrt(1.0 - q**2) * np.arctan(np.sqrt(1.0 - q**2) * x / (psi + s))
         f_y = (
@@ -15,6 +15,8 @@ class PointMass(LensProfileBase):
     lower_limit_default = {"theta_E": 0, "center_x": -100, "center_y": -100}
     upper_limit_default = {"theta_E": 100, "center_x": 100, "center_y": 100}
 
+    _batch_broadcast = True
+
     def __init__(self):
         self.r_min = 10 ** (-25)
         super(PointMass, self).__init__()
@@ -15,6 +15,8 @@ class Shear(LensProfileBase):
     lower_limit_default = {"gamma1": -0.5, "gamma2": -0.5, "ra_0": -100, "dec_0": -100}
     upper_limit_default = {"gamma1": 0.5, "gamma2": 0.5, "ra_0": 100, "dec_0": 100}
 
+    _batch_broadcast = True
+
     def function(self, x, y, gamma1, gamma2, ra_0=0, dec_0=0):
         """
 
@@ -46,6 +46,8 @@ class SIE(LensProfileBase):
         "center_y": 100,
     }
 
+    _batch_broadcast = True
+
     def __init__(self, NIE=True):
         """
 
@@ -20,6 +20,8 @@ class SIS(LensProfileBase):
     lower_limit_default = {"theta_E": 0, "center_x": -100, "center_y": -100}
     upper_limit_default = {"theta_E": 100, "center_x": 100, "center_y": 100}
 
+    _batch_broadcast = True
+
     def function(self, x, y, theta_E, center_x=0, center_y=0):
         x_shift = x - center_x
         y_shift = y - center_y
@@ -34,10 +36,12 @@ class SIS(LensProfileBase):
         if isinstance(R, int) or isinstance(R, float):
             a = theta_E / max(0.000001, R)
         else:
-            a = np.empty_like(R)
-            r = R[R > 0]  # in the SIS regime
-            a[R == 0] = 0
-            a[R > 0] = theta_E / r
+            # theta_E may be an array broadcasting against R (see derivatives_batch)
+            shape = np.broadcast(R, theta_E).shape
+            R = np.broadcast_to(R, shape)
+            a = np.zeros(shape)
+            r_bool = R > 0  # in the SIS regime
+            a[r_bool] = np.broadcast_to(theta_E, shape)[r_bool] / R[r_bool]
         f_x = a * x_shift
         f_y = a * y_shift
         return f_x, f_y
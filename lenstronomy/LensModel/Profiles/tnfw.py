@@ -39,6 +39,8 @@ class TNFW(LensProfileBase):
         "center_y": 100,
     }
 
+    _batch_broadcast = True
+
     def __init__(self):
         """"""
         self._s = 0.001
@@ -236,7 +238,7 @@ class TNFW(LensProfileBase):
         """
         x = R / Rs
         x = np.maximum(x, self._s)
-        tau = float(r_trunc) / Rs
+        tau = r_trunc / Rs
         hx = self._h(x, tau)
         return 2 * rho0 * Rs**3 * hx
 
@@ -258,7 +260,7 @@ class TNFW(LensProfileBase):
         R = np.maximum(R, self._s * Rs)
         x = R / Rs
         x = np.maximum(x, self._s)
-        tau = float(r_trunc) / Rs
+        tau = r_trunc / Rs
         gx = self._g(x, tau)
         a = 4 * rho0 * Rs * gx / x**2
         return a * ax_x, a * ax_y
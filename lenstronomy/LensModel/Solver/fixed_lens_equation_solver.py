@@ -0,0 +1,242 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+import lenstronomy.Util.util as util
+import lenstronomy.Util.image_util as image_util
+from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
+
+__all__ = ["FixedLensEquationSolver"]
+
+
+class FixedLensEquationSolver(object):
+    """Lens equation solver for many source positions behind the same lens model.
+
+    The image plane grid of the search window is ray-traced once when the instance is
+    created. Each grid cell is split into two triangles and the source plane images of
+    the triangles are stored in a KD-tree of their centroids. Solving the lens equation
+    for a source position then only requires a look-up of the source plane triangles
+    enclosing (or coming close to) the source position, a linear interpolation of their
+    image plane position as starting points and a few Newton iterations of the
+    LensEquationSolver.
+
+    Triangles crossing a critical curve and triangles with an extent in the source plane
+    much larger than the typical triangle (e.g. at the center of singular profiles) are
+    not stored in the KD-tree but are tested for every source position.
+    """
+
+    def __init__(
+        self,
+        lensModel,
+        kwargs_lens,
+        min_distance=0.01,
+        search_window=5,
+        x_center=0,
+        y_center=0,
+        tolerance=0.1,
+    ):
+        """
+
+        :param lensModel: instance of the LensModel() class
+        :param kwargs_lens: lens model keyword argument list (kept fixed)
+        :param min_distance: pixel size of the ray-traced grid and minimum separation to
+            consider for two images in units of angle
+        :param search_window: window size to be considered by the solver. Will not find
+            image position outside this window
+        :param x_center: float, center of the window to search for point sources
+        :param y_center: float, center of the window to search for point sources
+        :param tolerance: float, triangles are selected when the barycentric coordinates
+            of the source position are larger than -tolerance (i.e. also triangles
+            coming close to the source position are considered)
+        """
+        self._lensModel = lensModel
+        self._kwargs_lens = kwargs_lens
+        self._solver = LensEquationSolver(lensModel)
+        self._min_distance = min_distance
+        self._tolerance = tolerance
+        num_pix = int(round(search_window / min_distance) + 0.5)
+        x_grid, y_grid = util.make_grid(num_pix + 1, min_distance)
+        x_grid += x_center
+        y_grid += y_center
+        x_mapped, y_mapped = lensModel.ray_shooting(x_grid, y_grid, self._kwargs_lens)
+        det_A = 1.0 / lensModel.magnification(x_grid, y_grid, self._kwargs_lens)
+
+        # vertex indexes of the two triangles of each grid cell
+        i, j = np.meshgrid(np.arange(num_pix), np.arange(num_pix))
+        corner = (j * (num_pix + 1) + i).flatten()
+        triangles = np.concatenate(
+            [
+                np.stack([corner, corner + 1, corner + num_pix + 2], axis=1),
+                np.stack([corner, corner + num_pix + 2, corner + num_pix + 1], axis=1),
+            ]
+        )
+        self._x_image = x_grid[triangles]
+        self._y_image = y_grid[triangles]
+        self._x_source = x_mapped[triangles]
+        self._y_source = y_mapped[triangles]
+        finite = np.all(
+            np.isfinite(self._x_source) & np.isfinite(self._y_source), axis=1
+        )
+
+        # critical curve regions: the sign of the Jacobian determinant changes
+        det_triangle = det_A[triangles]
+        self._critical = np.any(det_triangle > 0, axis=1) & np.any(
+            det_triangle <= 0, axis=1
+        )
+
+        # spatial index of the source plane triangles
+        x_centroid = np.mean(self._x_source, axis=1)
+        y_centroid = np.mean(self._y_source, axis=1)
+        radius = np.max(
+            np.sqrt(
+                (self._x_source - x_centroid[:, None]) ** 2
+                + (self._y_source - y_centroid[:, None]) ** 2
+            ),
+            axis=1,
+        )
+        self._radius = radius
+        regular = finite & ~self._critical
+        if np.any(regular):
+            radius_max = 10 * np.median(radius[regular])
+        else:
+            radius_max = 0
+        indexed = regular & (radius <= radius_max)
+        self._index_tree = np.where(indexed)[0]
+        self._index_always = np.where(~indexed & finite)[0]
+        self._radius_tree = radius_max
+        self._tree = cKDTree(
+            np.stack(
+                [x_centroid[self._index_tree], y_centroid[self._index_tree]], axis=1
+            )
+        )
+
+    @property
+    def critical_triangles(self):
+        """
+
+        :return: image plane vertices x, y (each of shape (n, 3)) of the triangles
+            crossing a critical curve
+        """
+        return self._x_image[self._critical], self._y_image[self._critical]
+
+    def candidate_solutions(self, sourcePos_x, sourcePos_y):
+        """Approximate image positions from the look-up of the source plane triangles.
+
+        :param sourcePos_x: source position in units of angle
+        :param sourcePos_y: source position in units of angle
+        :return: image plane positions x, y of the candidate solutions
+        """
+        index_near = self._tree.query_ball_point(
+            [sourcePos_x, sourcePos_y], r=self._radius_tree * (1 + self._tolerance)
+        )
+        index = np.append(
+            self._index_tree[np.array(index_near, dtype=int)], self._index_always
+        ).astype(int)
+        x_s, y_s = self._x_source[index], self._y_source[index]
+        # barycentric coordinates of the source position in the source plane triangles
+        det = (y_s[:, 1] - y_s[:, 2]) * (x_s[:, 0] - x_s[:, 2]) + (
+            x_s[:, 2] - x_s[:, 1]
+        ) * (y_s[:, 0] - y_s[:, 2])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            b_0 = (
+                (y_s[:, 1] - y_s[:, 2]) * (sourcePos_x - x_s[:, 2])
+                + (x_s[:, 2] - x_s[:, 1]) * (sourcePos_y - y_s[:, 2])
+            ) / det
+            b_1 = (
+                (y_s[:, 2] - y_s[:, 0]) * (sourcePos_x - x_s[:, 2])
+                + (x_s[:, 0] - x_s[:, 2]) * (sourcePos_y - y_s[:, 2])
+            ) / det
+        b_2 = 1 - b_0 - b_1
+        inside = (
+            (b_0 >= -self._tolerance)
+            & (b_1 >= -self._tolerance)
+            & (b_2 >= -self._tolerance)
+        )
+        # the linear mapping of the oversized triangles (e.g. close to singular
+        # profiles) is not reliable, they are selected when the source position is
+        # within their extent
+        oversized = self._radius[index] > self._radius_tree
+        distance = np.sqrt(
+            (np.mean(x_s, axis=1) - sourcePos_x) ** 2
+            + (np.mean(y_s, axis=1) - sourcePos_y) ** 2
+        )
+        inside |= oversized & (distance <= self._radius[index] * (1 + self._tolerance))
+        b = np.clip(np.stack([b_0, b_1, b_2], axis=1)[inside], 0, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            b /= np.sum(b, axis=1)[:, None]
+        x_image, y_image = self._x_image[index][inside], self._y_image[index][inside]
+        x_mins = np.sum(b * x_image, axis=1)
+        y_mins = np.sum(b * y_image, axis=1)
+        # degenerate and oversized triangles are represented by their centroid
+        centroid = ~np.isfinite(x_mins) | ~np.isfinite(y_mins) | oversized[inside]
+        x_mins[centroid] = np.mean(x_image[centroid], axis=1)
+        y_mins[centroid] = np.mean(y_image[centroid], axis=1)
+        return x_mins, y_mins
+
+    def image_position_from_source(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        precision_limit=10 ** (-10),
+        num_iter_max=100,
+        arrival_time_sort=True,
+        magnification_limit=None,
+        initial_guess_cut=True,
+    ):
+        """Solves the lens equation for the fixed lens model.
+
+        :param sourcePos_x: source position in units of angle
+        :param sourcePos_y: source position in units of angle
+        :param precision_limit: required precision in the lens equation solver (in units
+            of angle in the source plane).
+        :param num_iter_max: maximum iteration of lens-source mapping conducted by
+            solver to match the required precision
+        :param arrival_time_sort: bool, if True, sorts image position in arrival time
+            (first arrival photon first listed)
+        :param magnification_limit: None or float, if set will only return image
+            positions that have an abs(magnification) larger than this number
+        :param initial_guess_cut: bool, if True, cuts the candidate solutions based on
+            distance criteria from the source position (as in
+            LensEquationSolver.image_position_lenstronomy)
+        :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units
+            of angle
+        """
+        x_mins, y_mins = self.candidate_solutions(sourcePos_x, sourcePos_y)
+        # candidates from neighbouring triangles converge to the same image
+        x_mins, y_mins = image_util.findOverlap(
+            x_mins, y_mins, self._min_distance / 10.0
+        )
+        if initial_guess_cut and len(x_mins) > 0:
+            x_mapped, y_mapped = self._lensModel.ray_shooting(
+                x_mins, y_mins, self._kwargs_lens
+            )
+            delta = util.displaceAbs(x_mapped, y_mapped, sourcePos_x, sourcePos_y)
+            mag = np.abs(
+                self._lensModel.magnification(x_mins, y_mins, self._kwargs_lens)
+            )
+            mag[mag < 1] = 1
+            cut = delta <= self._min_distance * mag * 5
+            x_mins, y_mins = x_mins[cut], y_mins[cut]
+        x_mins, y_mins, solver_precision = self._solver.refine_solutions(
+            x_mins,
+            y_mins,
+            sourcePos_x,
+            sourcePos_y,
+            self._kwargs_lens,
+            precision_limit=precision_limit,
+            num_iter_max=num_iter_max,
+            min_distance=self._min_distance,
+        )
+        x_mins = x_mins[solver_precision <= precision_limit]
+        y_mins = y_mins[solver_precision <= precision_limit]
+        x_mins, y_mins = image_util.findOverlap(x_mins, y_mins, self._min_distance)
+        if arrival_time_sort:
+            x_mins, y_mins = self._solver.sort_arrival_times(
+                x_mins, y_mins, self._kwargs_lens
+            )
+        if magnification_limit is not None:
+            mag = np.abs(
+                self._lensModel.magnification(x_mins, y_mins, self._kwargs_lens)
+            )
+            x_mins = x_mins[mag >= magnification_limit]
+            y_mins = y_mins[mag >= magnification_limit]
+        return x_mins, y_mins
@@ -122,6 +122,8 @@ class LensEquationSolver(object):
         verbose=False,
         x_center=0,
         y_center=0,
+        hierarchical=False,
+        num_pix_coarse=16,
     ):
         """Finds pixels in the image plane possibly hosting a solution of the lens
         equation, for the given source position and lens model.
@@ -136,6 +138,12 @@ class LensEquationSolver(object):
         :param verbose: bool, if True, prints some useful information for the user
         :param x_center: float, center of the window to search for point sources
         :param y_center: float, center of the window to search for point sources
+        :param hierarchical: bool, if True, starts with a coarse grid and only refines
+            the cells whose ray-traced corners enclose (or come close to) the source
+            position down to the resolution of min_distance (quadtree refinement)
+            instead of ray-shooting the full grid at min_distance resolution.
+        :param num_pix_coarse: int, minimum number of cells per axis of the coarsest
+            grid of the hierarchical search
         :returns: (approximate) angular position of (multiple) images ra_pos, dec_pos in
             units of angles, related ray-traced source displacements and pixel width
         :raises: AttributeError, KeyError
@@ -143,6 +151,18 @@ class LensEquationSolver(object):
         kwargs_lens = self.lensModel.set_static(kwargs_lens)
         # compute number of pixels to cover the search window with the required min_distance
         numPix = int(round(search_window / min_distance) + 0.5)
+        if hierarchical is True:
+            x_mins, y_mins, delta_map = self._candidate_solutions_hierarchical(
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                numPix,
+                min_distance,
+                x_center,
+                y_center,
+                num_pix_coarse,
+            )
+            return x_mins, y_mins, delta_map, min_distance
         x_grid, y_grid = util.make_grid(numPix, min_distance)
         x_grid += x_center
         y_grid += y_center
@@ -157,6 +177,105 @@ class LensEquationSolver(object):
 
         return x_mins, y_mins, delta_map, pixel_width
 
+    def _candidate_solutions_hierarchical(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        num_pix,
+        min_distance,
+        x_center,
+        y_center,
+        num_pix_coarse=16,
+        margin=0.5,
+    ):
+        """Quadtree version of the grid search of candidate_solutions(). The cells of a
+        coarse grid covering the search window are ray-traced at their corners and only
+        cells with the source position inside the bounding box of their ray-traced
+        corners (enlarged by a margin relative to its size) are divided into four sub-
+        cells. This is repeated until the cells have the size min_distance. The final
+        cells that are local minima of the ray-traced distance of their centers to the
+        source position are returned.
+
+        :param sourcePos_x: source position in units of angle
+        :param sourcePos_y: source position in units of angle
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param num_pix: int, number of pixels of size min_distance per axis of the
+            search window
+        :param min_distance: size of the finest cells in units of angle
+        :param x_center: float, center of the search window
+        :param y_center: float, center of the search window
+        :param num_pix_coarse: int, minimum number of cells per axis of the coarsest
+            grid
+        :param margin: float, enlargement of the bounding box of the ray-traced cell
+            corners relative to its size
+        :return: x_mins, y_mins, delta_map of the candidate solutions
+        """
+        # cells are labeled by the indexes of their lower-left corner on the grid of the
+        # finest resolution and have a size of 2**level pixels
+        level = max(int(np.ceil(np.log2(max(num_pix / num_pix_coarse, 1)))), 0)
+        size = 2**level
+        num_coarse = int(np.ceil(num_pix / size))
+        i_cell, j_cell = np.meshgrid(np.arange(num_coarse), np.arange(num_coarse))
+        i_cell, j_cell = i_cell.flatten() * size, j_cell.flatten() * size
+        x_0 = x_center - num_pix * min_distance / 2.0
+        y_0 = y_center - num_pix * min_distance / 2.0
+        while size > 1 and len(i_cell) > 0:
+            i_corner = np.concatenate([i_cell, i_cell + size, i_cell, i_cell + size])
+            j_corner = np.concatenate([j_cell, j_cell, j_cell + size, j_cell + size])
+            # the corners shared by neighbouring cells are only ray-traced once
+            keys, inverse = np.unique(
+                i_corner * (num_pix + size + 1) + j_corner, return_inverse=True
+            )
+            i_unique = keys // (num_pix + size + 1)
+            j_unique = keys % (num_pix + size + 1)
+            x_mapped, y_mapped = self.lensModel.ray_shooting(
+                x_0 + i_unique * min_distance,
+                y_0 + j_unique * min_distance,
+                kwargs_lens,
+            )
+            x_mapped = x_mapped[inverse].reshape(4, -1)
+            y_mapped = y_mapped[inverse].reshape(4, -1)
+            x_min, x_max = np.min(x_mapped, axis=0), np.max(x_mapped, axis=0)
+            y_min, y_max = np.min(y_mapped, axis=0), np.max(y_mapped, axis=0)
+            extent = margin * np.maximum(x_max - x_min, y_max - y_min)
+            # cells with undefined ray-tracing (nan) are kept
+            outside = (
+                (sourcePos_x < x_min - extent)
+                | (sourcePos_x > x_max + extent)
+                | (sourcePos_y < y_min - extent)
+                | (sourcePos_y > y_max + extent)
+            )
+            i_cell, j_cell = i_cell[~outside], j_cell[~outside]
+            size //= 2
+            i_cell = np.concatenate([i_cell, i_cell + size, i_cell, i_cell + size])
+            j_cell = np.concatenate([j_cell, j_cell, j_cell + size, j_cell + size])
+            inside = (i_cell < num_pix) & (j_cell < num_pix)
+            i_cell, j_cell = i_cell[inside], j_cell[inside]
+        if len(i_cell) == 0:
+            return np.zeros(0), np.zeros(0), np.zeros(0)
+        x_cell = x_0 + (i_cell + 0.5) * min_distance
+        y_cell = y_0 + (j_cell + 0.5) * min_distance
+        x_mapped, y_mapped = self.lensModel.ray_shooting(x_cell, y_cell, kwargs_lens)
+        delta = util.displaceAbs(x_mapped, y_mapped, sourcePos_x, sourcePos_y)
+        # local minima among the refined cells (cells without refined neighbours do not
+        # constrain the minimum)
+        keys = i_cell * (num_pix + 1) + j_cell
+        sort = np.argsort(keys)
+        keys_sorted, delta_sorted = keys[sort], delta[sort]
+        is_minimum = np.ones(len(keys), dtype=bool)
+        for di in [-1, 0, 1]:
+            for dj in [-1, 0, 1]:
+                if di == 0 and dj == 0:
+                    continue
+                keys_neighbour = (i_cell + di) * (num_pix + 1) + j_cell + dj
+                index = np.minimum(
+                    np.searchsorted(keys_sorted, keys_neighbour), len(keys) - 1
+                )
+                found = keys_sorted[index] == keys_neighbour
+                is_minimum[found & ~(delta < delta_sorted[index])] = False
+        return x_cell[is_minimum], y_cell[is_minimum], delta[is_minimum]
+
     def image_position_analytical(
         self,
         x,
@@ -254,11 +373,11 @@ class LensEquationSolver(object):
         :param sourcePos_x: source position in units of angle
         :param sourcePos_y: source position in units of angle
         :param kwargs_lens: lens model parameters as keyword arguments
-        :param solver: which solver to use, can be 'lenstronomy' (default), 'analytical'
-            or 'stochastic'.
+        :param solver: which solver to use, can be 'lenstronomy' (default),
+            'vectorized', 'analytical' or 'stochastic'.
         :param kwargs: Any additional kwargs are passed to the chosen solver, see the
-            documentation of image_position_lenstronomy, image_position_analytical and
-            image_position_stochastic
+            documentation of image_position_lenstronomy, image_position_vectorized,
+            image_position_analytical and image_position_stochastic
         :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units
             of angle
         """
@@ -266,6 +385,10 @@ class LensEquationSolver(object):
             return self.image_position_lenstronomy(
                 sourcePos_x, sourcePos_y, kwargs_lens, **kwargs
             )
+        if solver == "vectorized":
+            return self.image_position_vectorized(
+                sourcePos_x, sourcePos_y, kwargs_lens, **kwargs
+            )
         if solver == "analytical":
             return self.image_position_analytical(
                 sourcePos_x, sourcePos_y, kwargs_lens, **kwargs
@@ -293,6 +416,8 @@ class LensEquationSolver(object):
         num_random=0,
         non_linear=False,
         magnification_limit=None,
+        vectorized=False,
+        hierarchical=False,
     ):
         """Finds image position  given source position and lens model. The solver first
         samples does a grid search in the lens plane, and the grid points that are
@@ -323,6 +448,10 @@ class LensEquationSolver(object):
             Hessian computation
         :param magnification_limit: None or float, if set will only return image
             positions that have an abs(magnification) larger than this number
+        :param vectorized: bool, if True, iterates all candidate solutions together (see
+            image_position_vectorized)
+        :param hierarchical: bool, if True, uses a coarse-to-fine (quadtree) grid search
+            for the candidate solutions (see candidate_solutions)
         :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units
             of angle
         :raises: AttributeError, KeyError
@@ -338,6 +467,7 @@ class LensEquationSolver(object):
             verbose,
             x_center,
             y_center,
+            hierarchical=hierarchical,
         )
         if verbose:
             print(
@@ -374,18 +504,35 @@ class LensEquationSolver(object):
         )
         # iterative solving of the lens equation for the selected grid points
         # print("Candidates:", x_mins.shape, y_mins.shape)
-        x_mins, y_mins, solver_precision = self._find_gradient_decent(
-            x_mins,
-            y_mins,
-            sourcePos_x,
-            sourcePos_y,
-            kwargs_lens,
-            precision_limit,
-            num_iter_max,
-            verbose=verbose,
-            min_distance=min_distance,
-            non_linear=non_linear,
-        )
+        if vectorized is True:
+            if non_linear is True:
+                raise ValueError(
+                    "the vectorized solver does not support the non_linear option."
+                )
+            x_mins, y_mins, solver_precision = self._find_gradient_decent_vectorized(
+                x_mins,
+                y_mins,
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                precision_limit,
+                num_iter_max,
+                verbose=verbose,
+                min_distance=min_distance,
+            )
+        else:
+            x_mins, y_mins, solver_precision = self._find_gradient_decent(
+                x_mins,
+                y_mins,
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                precision_limit,
+                num_iter_max,
+                verbose=verbose,
+                min_distance=min_distance,
+                non_linear=non_linear,
+            )
         # only select iterative results that match the precision limit
         x_mins = x_mins[solver_precision <= precision_limit]
         y_mins = y_mins[solver_precision <= precision_limit]
@@ -400,6 +547,158 @@ class LensEquationSolver(object):
         self.lensModel.set_dynamic()
         return x_mins, y_mins
 
+    def image_position_vectorized(
+        self, sourcePos_x, sourcePos_y, kwargs_lens, **kwargs
+    ):
+        """Finds image positions given source position and lens model with the same grid
+        search and gradient-based root finder as image_position_lenstronomy, but
+        iterating all candidate solutions together. The ray-shooting and Hessian
+        evaluations of each iteration are conducted with arrays of all unconverged
+        candidates instead of one candidate at a time.
+
+        :param sourcePos_x: source position in units of angle
+        :param sourcePos_y: source position in units of angle
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param kwargs: additional keyword arguments of image_position_lenstronomy (the
+            non_linear option is not supported)
+        :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units
+            of angle
+        """
+        return self.image_position_lenstronomy(
+            sourcePos_x, sourcePos_y, kwargs_lens, vectorized=True, **kwargs
+        )
+
+    def refine_solutions(
+        self,
+        x_min,
+        y_min,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        precision_limit=10 ** (-10),
+        num_iter_max=200,
+        verbose=False,
+        min_distance=0.01,
+    ):
+        """Iterates a set of candidate solutions (e.g. from candidate_solutions()) of
+        the lens equation to the required precision with the vectorized gradient-based
+        root finder of image_position_vectorized().
+
+        :param x_min: np.array, list of 'good guess' solutions of the lens equation
+        :param y_min: np.array, list of 'good guess' solutions of the lens equation
+        :param sourcePos_x: source position for which to solve the lens equation
+        :param sourcePos_y: source position for which to solve the lens equation
+        :param kwargs_lens: keyword argument list of the lens model
+        :param precision_limit: float, required match in the solution in the source
+            plane
+        :param num_iter_max: int, maximum number of iterations before the algorithm
+            stops
+        :param verbose: bool, if True inserts print statements about the behavior of the
+            solver
+        :param min_distance: maximum correction applied per step (to avoid over-shooting
+            in unstable regions)
+        :return: x_position array, y_position array, error in the source plane array
+        """
+        return self._find_gradient_decent_vectorized(
+            x_min,
+            y_min,
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            precision_limit=precision_limit,
+            num_iter_max=num_iter_max,
+            verbose=verbose,
+            min_distance=min_distance,
+        )
+
+    def _find_gradient_decent_vectorized(
+        self,
+        x_min,
+        y_min,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        precision_limit=10 ** (-10),
+        num_iter_max=200,
+        verbose=False,
+        min_distance=0.01,
+    ):
+        """Vectorized version of _find_gradient_decent(). All candidates perform the
+        same steps as in _solve_single_proposal() and _gradient_step(), but the
+        iterations are conducted for the arrays of candidates that have not yet
+        converged (or exceeded the maximum number of iterations).
+
+        :param x_min: np.array, list of 'good guess' solutions of the lens equation
+        :param y_min: np.array, list of 'good guess' solutions of the lens equation
+        :param sourcePos_x: source position for which to solve the lens equation
+        :param sourcePos_y: source position for which to solve the lens equation
+        :param kwargs_lens: keyword argument list of the lens model
+        :param precision_limit: float, required match in the solution in the source
+            plane
+        :param num_iter_max: int, maximum number of iterations before the algorithm
+            stops
+        :param verbose: bool, if True inserts print statements about the behavior of the
+            solver
+        :param min_distance: maximum correction applied per step (to avoid over-shooting
+            in unstable regions)
+        :return: x_position array, y_position array, error in the source plane array
+        """
+        x_guess = np.array(x_min, dtype=float)
+        y_guess = np.array(y_min, dtype=float)
+        num_iter = np.zeros(len(x_guess), dtype=int)
+        if len(x_guess) == 0:
+            return x_guess, y_guess, np.zeros(0)
+        x_mapped, y_mapped = self.lensModel.ray_shooting(x_guess, y_guess, kwargs_lens)
+        delta = np.sqrt((x_mapped - sourcePos_x) ** 2 + (y_mapped - sourcePos_y) ** 2)
+        active = np.where((delta > precision_limit) & (num_iter < num_iter_max))[0]
+        while len(active) > 0:
+            x_mapped, y_mapped = self.lensModel.ray_shooting(
+                x_guess[active], y_guess[active], kwargs_lens
+            )
+            f_xx, f_xy, f_yx, f_yy = self.lensModel.hessian(
+                x_guess[active], y_guess[active], kwargs_lens
+            )
+            dx_source = x_mapped - sourcePos_x
+            dy_source = y_mapped - sourcePos_y
+            with np.errstate(divide="ignore", invalid="ignore"):
+                det = (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+                step_x = ((1 - f_yy) * dx_source + f_yx * dy_source) / det
+                step_y = (f_xy * dx_source + (1 - f_xx) * dy_source) / det
+                dist = np.sqrt(step_x**2 + step_y**2)
+                rescale = dist > min_distance
+                step_x[rescale] *= min_distance / dist[rescale]
+                step_y[rescale] *= min_distance / dist[rescale]
+            # step proposals of the active candidates, re-drawn in a random direction as
+            # long as they do not improve the precision in the source plane
+            pending = np.arange(len(active))
+            while len(pending) > 0:
+                index = active[pending]
+                x_new = x_guess[index] - step_x[pending]
+                y_new = y_guess[index] - step_y[pending]
+                x_mapped, y_mapped = self.lensModel.ray_shooting(
+                    x_new, y_new, kwargs_lens
+                )
+                delta_new = np.sqrt(
+                    (x_mapped - sourcePos_x) ** 2 + (y_mapped - sourcePos_y) ** 2
+                )
+                num_iter[index] += 1
+                accept = ~(delta_new > delta[index])
+                x_guess[index[accept]] = x_new[accept]
+                y_guess[index[accept]] = y_new[accept]
+                delta[index[accept]] = delta_new[accept]
+                retry = ~accept & (num_iter[index] <= num_iter_max)
+                pending = pending[retry]
+                step_x[pending] *= np.random.normal(loc=0, scale=0.5, size=len(pending))
+                step_y[pending] *= np.random.normal(loc=0, scale=0.5, size=len(pending))
+            active = np.where((delta > precision_limit) & (num_iter < num_iter_max))[0]
+        if verbose:
+            for i in range(len(x_guess)):
+                print(
+                    "Solution found for region %s with required precision at iteration %s"
+                    % (i, num_iter[i])
+                )
+        return x_guess, y_guess, delta
+
     def _find_gradient_decent(
         self,
         x_min,
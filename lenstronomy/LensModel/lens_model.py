@@ -6,14 +6,31 @@ from lenstronomy.LensModel.LineOfSight.single_plane_los_flexion import (
 )
 from lenstronomy.LensModel.MultiPlane.multi_plane import MultiPlane
 from lenstronomy.LensModel.MultiPlane.decoupled_multi_plane import MultiPlaneDecoupled
+from lenstronomy.LensModel.profile_list_base import (
+    backend_profile_kwargs,
+    num_samples_batch,
+    select_sample_batch,
+)
 from lenstronomy.Cosmo.lens_cosmo import LensCosmo
 from lenstronomy.Util import constants as const
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
+from lenstronomy.Util.cache_util import KwargsCache
 from astropy.cosmology import default_cosmology
+import numpy as np
 import warnings
 
 __all__ = ["LensModel"]
 
+_LENSING_QUANTITIES = [
+    "kappa",
+    "gamma",
+    "gamma1",
+    "gamma2",
+    "magnification",
+    "curl",
+    "hessian",
+]
+
 
 class LensModel(object):
     """Class to handle an arbitrary list of lens models.
@@ -41,6 +58,9 @@ class LensModel(object):
         distance_ratio_sampling=False,
         cosmology_sampling=False,
         cosmology_model="FlatLambdaCDM",
+        backend=None,
+        plane_grouping=False,
+        tree_planes=None,
     ):
         """
 
@@ -76,11 +96,23 @@ class LensModel(object):
             to update T_ij value in multi-lens plane computation.
         :param cosmology_model: str, name of the cosmology model to be used for
             cosmology sampling. Default is 'FlatLambdaCDM'.
+        :param backend: None or 'numba'. If 'numba', the profiles with a numba
+            implementation (EPL and its multipole and boxy/disky variants) use it with
+            identical parameter semantics
+        :param plane_grouping: bool (only employed in multi-plane mode), if True, performs
+            a single ray step per redshift plane and evaluates deflectors of the same
+            profile type on a plane with stacked parameter arrays (faster for many
+            halos sharing redshift planes)
+        :param tree_planes: None or dict {plane redshift: keyword arguments of
+            BarnesHutDeflection} (only employed in multi-plane mode with
+            plane_grouping=True), planes on which many POINT_MASS or TNFW halos are
+            evaluated approximately with a Barnes-Hut tree code
         """
         self.lens_model_list = lens_model_list
         self.z_lens = z_lens
-        if profile_kwargs_list is None:
-            profile_kwargs_list = [{} for _ in range(len(lens_model_list))]
+        profile_kwargs_list = backend_profile_kwargs(
+            lens_model_list, profile_kwargs_list, backend=backend
+        )
         self.profile_kwargs_list = profile_kwargs_list
 
         if z_source_convention is None and z_source is not None:
@@ -142,7 +174,7 @@ class LensModel(object):
             raise ValueError(
                 "You can only have one model for line-of-sight flexion corrections."
             )
-        if z_lens is not None and z_source is not None:
+        if z_lens is not None and z_source is not None and not multi_plane:
             self._lensCosmo = LensCosmo(z_lens, z_source, cosmo=cosmo)
         # Multi-plane or single-plane lensing?
         self.multi_plane = multi_plane
@@ -178,6 +210,8 @@ class LensModel(object):
                     z_interp_stop=z_interp_stop,
                     num_z_interp=num_z_interp,
                     profile_kwargs_list=profile_kwargs_list,
+                    plane_grouping=plane_grouping,
+                    tree_planes=tree_planes,
                     **kwargs_multiplane_model
                 )
                 self.type = "MultiPlaneDecoupled"
@@ -197,8 +231,18 @@ class LensModel(object):
                     distance_ratio_sampling=distance_ratio_sampling,
                     cosmology_sampling=cosmology_sampling,
                     cosmology_model=cosmology_model,
+                    plane_grouping=plane_grouping,
+                    tree_planes=tree_planes,
                 )
                 self.type = "MultiPlane"
+            if z_lens is not None:
+                # shares the distances computed by the multi-plane lens model
+                self._lensCosmo = LensCosmo(
+                    z_lens,
+                    z_source,
+                    cosmo=cosmo,
+                    distance_table=self._distance_table,
+                )
 
         else:
             if los_effects is True:
@@ -241,6 +285,7 @@ class LensModel(object):
                             )
                             self.lens_model.change_redshift_scaling(alpha_scaling)
         self._ddt_scaling = 1
+        self._hessian_memo = None
         if (
             self.z_lens is not None
             and self._z_source_convention is not None
@@ -251,6 +296,17 @@ class LensModel(object):
             )
             self._ddt_scaling = ddt_scaling
 
+    @property
+    def _distance_table(self):
+        """
+
+        :return: DistanceTable instance of the multi-plane lens model (None in single
+            plane mode or with interpolated cosmology)
+        """
+        if self.multi_plane is True:
+            return self.lens_model.distance_table
+        return None
+
     def info(self):
         """Shows what models are being initialized and what parameters are being
         requested for.
@@ -273,6 +329,37 @@ class LensModel(object):
         """
         return self.lens_model.ray_shooting(x, y, kwargs, k=k)
 
+    def ray_shooting_batch(self, x, y, kwargs_batch, k=None):
+        """Maps image to source positions for a batch of lens model parameter sets (e.g.
+        the walkers of a sampler or a population of lenses) evaluated at the same image
+        positions.
+
+        In single plane mode, profiles supporting numpy broadcasting (EPL, SIE, NFW,
+        SHEAR, SIS) are evaluated for all samples at once, all others in a loop over the
+        samples. Other lens model types (multi-plane, line-of-sight) loop over
+        ray_shooting() for each sample.
+
+        :param x: x-position (preferentially arcsec)
+        :type x: 1d numpy array of length n_points
+        :param y: y-position (preferentially arcsec)
+        :type y: 1d numpy array of length n_points
+        :param kwargs_batch: list of keyword arguments of lens model parameters matching
+            the lens model classes, with floats (shared among all samples) or 1d arrays
+            of length n_samples as values
+        :param k: only evaluate the k-th lens model
+        :return: source plane positions, 2d arrays of shape (n_samples, n_points)
+        """
+        if self.type == "SinglePlane":
+            return self.lens_model.ray_shooting_batch(x, y, kwargs_batch, k=k)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        n_samples = num_samples_batch(kwargs_batch)
+        beta_x, beta_y = np.zeros((n_samples, len(x))), np.zeros((n_samples, len(x)))
+        for i in range(n_samples):
+            kwargs_i = select_sample_batch(kwargs_batch, i)
+            beta_x[i], beta_y[i] = self.lens_model.ray_shooting(x, y, kwargs_i, k=k)
+        return beta_x, beta_y
+
     def fermat_potential(
         self, x_image, y_image, kwargs_lens, x_source=None, y_source=None
     ):
@@ -408,6 +495,28 @@ class LensModel(object):
             differentials are computed from a cross or a square of points around (x, y)
         :return: f_xx, f_xy, f_yx, f_yy components
         """
+        if self._hessian_memo is None:
+            return self._hessian(x, y, kwargs, k=k, diff=diff, diff_method=diff_method)
+        kwargs_memo = {"kwargs": kwargs, "k": k, "diff": diff, "method": diff_method}
+        hessian = self._hessian_memo.get((x, y), kwargs_memo)
+        if hessian is None:
+            hessian = self._hessian(
+                x, y, kwargs, k=k, diff=diff, diff_method=diff_method
+            )
+            self._hessian_memo.set(hessian, (x, y), kwargs_memo)
+        return hessian
+
+    def _hessian(self, x, y, kwargs, k=None, diff=None, diff_method="square"):
+        """Hessian matrix (without memo), see hessian()
+
+        :param x: x-position (preferentially arcsec)
+        :param y: y-position (preferentially arcsec)
+        :param kwargs: list of keyword arguments of lens model parameters
+        :param k: only evaluate the k-th lens model
+        :param diff: float or None, scale of the finite numerical differential
+        :param diff_method: string, 'square' or 'cross'
+        :return: f_xx, f_xy, f_yx, f_yy components
+        """
         if diff is None:
             return self.lens_model.hessian(x, y, kwargs, k=k)
         elif diff_method == "square":
@@ -515,6 +624,89 @@ class LensModel(object):
         det_A = (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
         return 1.0 / det_A  # attention, if dividing by zero
 
+    def lensing_quantities(
+        self,
+        x,
+        y,
+        kwargs,
+        which=("kappa", "gamma", "magnification"),
+        k=None,
+        diff=None,
+        diff_method="square",
+    ):
+        """Lensing quantities derived from a single evaluation of the Hessian matrix.
+        This is faster than calling kappa(), gamma(), magnification() and curl()
+        separately, in particular with finite numerical differentials (e.g. in the
+        multi-plane setting).
+
+        :param x: x-position (preferentially arcsec)
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec)
+        :type y: numpy array
+        :param kwargs: list of keyword arguments of lens model parameters matching the
+            lens model classes
+        :param which: list of strings of the requested quantities among 'kappa', 'gamma'
+            (gamma1, gamma2), 'gamma1', 'gamma2', 'magnification', 'curl' and 'hessian'
+            (f_xx, f_xy, f_yx, f_yy)
+        :param k: only evaluate the k-th lens model
+        :param diff: float, scale over which the finite numerical differential is
+            computed. If None, then using the exact (if available) differentials.
+        :param diff_method: string, 'square' or 'cross', indicating whether finite
+            differentials are computed from a cross or a square of points around (x, y)
+        :return: dictionary with the requested quantities
+        """
+        for name in which:
+            if name not in _LENSING_QUANTITIES:
+                raise ValueError(
+                    "lensing quantity %s not supported. Chose among %s."
+                    % (name, _LENSING_QUANTITIES)
+                )
+        f_xx, f_xy, f_yx, f_yy = self.hessian(
+            x, y, kwargs, k=k, diff=diff, diff_method=diff_method
+        )
+        quantities = {}
+        for name in which:
+            if name == "kappa":
+                quantities[name] = 1.0 / 2 * (f_xx + f_yy)
+            elif name == "gamma1":
+                quantities[name] = 1.0 / 2 * (f_xx - f_yy)
+            elif name == "gamma2":
+                quantities[name] = f_xy
+            elif name == "gamma":
+                quantities[name] = 1.0 / 2 * (f_xx - f_yy), f_xy
+            elif name == "magnification":
+                det_A = (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+                quantities[name] = 1.0 / det_A
+            elif name == "curl":
+                quantities[name] = f_xy - f_yx
+            else:
+                quantities[name] = f_xx, f_xy, f_yx, f_yy
+        return quantities
+
+    def set_hessian_memo(self, memo=True):
+        """Turns on (or off) the memory of the last Hessian evaluation. When the same
+        coordinate arrays (compared by identity) are evaluated with unchanged keyword
+        arguments (compared by value), the Hessian is not re-computed. This avoids
+        repeated (finite differential) evaluations when calling e.g. kappa(), gamma()
+        and magnification() on the same coordinates.
+
+        :param memo: bool, if True, keeps the last Hessian evaluation
+        :return: None
+        """
+        if memo is True:
+            self._hessian_memo = KwargsCache()
+        else:
+            self._hessian_memo = None
+
+    def _reset_hessian_memo(self):
+        """Deletes the memory of the last Hessian evaluation (if turned on) when the
+        lens model changes independently of its keyword arguments.
+
+        :return: None
+        """
+        if self._hessian_memo is not None:
+            self._hessian_memo.reset()
+
     def flexion(self, x, y, kwargs, k=None, diff=0.0001, hessian_diff=False):
         """Third derivatives (flexion)
 
@@ -568,6 +760,7 @@ class LensModel(object):
         :return: kwargs_updated (in case of image position convention in multiplane
             lensing this is changed)
         """
+        self._reset_hessian_memo()
         return self.lens_model.set_static(kwargs)
 
     def set_dynamic(self):
@@ -578,8 +771,32 @@ class LensModel(object):
 
         :return: None
         """
+        self._reset_hessian_memo()
         self.lens_model.set_dynamic()
 
+    def set_emulation(self, emulate=True, **kwargs_emulation):
+        """Replaces the supported (expensive) lens profiles by interpolated emulations
+        of their deflection angles and Hessian, tabulated on an adaptive radial grid
+        (see EmulatedProfile). This can speed up the early stages of a fit; the exact
+        profiles are restored with emulate=False.
+
+        :param emulate: bool, if True, emulates the supported profiles
+        :param kwargs_emulation: keyword arguments of EmulatedProfile (e.g. rtol,
+            accuracy, r_min, r_max)
+        :return: None
+        """
+        self._reset_hessian_memo()
+        self.lens_model.set_emulation(emulate, **kwargs_emulation)
+
+    @property
+    def emulation_error_list(self):
+        """
+
+        :return: list of the estimated relative errors of the deflection angles of the
+            emulated profiles (None for profiles evaluated exactly)
+        """
+        return self.lens_model.emulation_error_list
+
     def change_source_redshift(self, z_source):
         """Changes the ray-tracing (and all relevant default calculations) to a
         different source redshift while preserving the deflection angles to
@@ -592,6 +809,7 @@ class LensModel(object):
             return 0
         if z_source == self.z_source:
             return 0
+        self._reset_hessian_memo()
         if self.multi_plane is True:
             if self._decouple_multi_plane:
                 raise NotImplementedError(
@@ -615,7 +833,12 @@ class LensModel(object):
             self.lens_model.change_redshift_scaling(alpha_scaling)
 
         if self.z_lens is not None:
-            self._lensCosmo = LensCosmo(self.z_lens, z_source, cosmo=self.cosmo)
+            self._lensCosmo = LensCosmo(
+                self.z_lens,
+                z_source,
+                cosmo=self.cosmo,
+                distance_table=self._distance_table,
+            )
             if self._z_source_convention is not None:
                 ddt_scaling = self._lensCosmo.background.ddt_scaling(
                     self.z_lens, self._z_source_convention, z_source
@@ -630,9 +853,15 @@ class LensModel(object):
         :return: updated LensModel class with new cosmology
         """
         self.cosmo = cosmo
+        self._reset_hessian_memo()
 
         if self.z_lens is not None and self.z_source is not None:
-            self._lensCosmo = LensCosmo(self.z_lens, self.z_source, cosmo=cosmo)
+            self._lensCosmo = LensCosmo(
+                self.z_lens,
+                self.z_source,
+                cosmo=cosmo,
+                distance_table=self._distance_table,
+            )
             if self._z_source_convention is not None:
                 ddt_scaling = self._lensCosmo.background.ddt_scaling(
                     self.z_lens, self._z_source_convention, self.z_source
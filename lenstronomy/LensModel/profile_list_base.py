@@ -1,6 +1,12 @@
+import numpy as np
 from lenstronomy.Util.util import convert_bool_list
 
-__all__ = ["ProfileListBase"]
+__all__ = [
+    "ProfileListBase",
+    "num_samples_batch",
+    "select_sample_batch",
+    "backend_profile_kwargs",
+]
 
 
 _SUPPORTED_MODELS = [
@@ -124,6 +130,22 @@ DYNAMIC_PROFILES = [
 ]
 
 
+# profiles with an alternative implementation selectable with the 'backend' keyword
+# argument of their class
+BACKEND_PROFILES = {
+    "numba": [
+        "EPL",
+        "EPL_BOXYDISKY",
+        "EPL_BOXYDISKY_ELL",
+        "EPL_MULTIPOLE_M1M3M4",
+        "EPL_MULTIPOLE_M1M3M4_ELL",
+        "EPL_MULTIPOLE_M3M4",
+        "EPL_MULTIPOLE_M3M4_ELL",
+        "EPL_Q_PHI",
+    ]
+}
+
+
 class ProfileListBase(object):
     """Class that manages the list of lens model class instances.
 
@@ -152,6 +174,7 @@ class ProfileListBase(object):
         )
         self._num_func = len(self.func_list)
         self._model_list = lens_model_list
+        self._func_list_exact = None
 
     def _load_model_instances(
         self,
@@ -229,6 +252,42 @@ class ProfileListBase(object):
         for i, func in enumerate(self.func_list):
             func.set_dynamic()
 
+    def set_emulation(self, emulate=True, **kwargs_emulation):
+        """Replaces the supported (expensive) lens profiles by interpolated emulations
+        of their deflection angles and Hessian (see EmulatedProfile), e.g. for the early
+        stages of a fit, or switches back to the exact profiles.
+
+        :param emulate: bool, if True, emulates the supported profiles, otherwise
+            evaluates all profiles exactly
+        :param kwargs_emulation: keyword arguments of EmulatedProfile (e.g. rtol,
+            accuracy)
+        :return: None
+        """
+        from lenstronomy.LensModel.Profiles.emulated_profile import EmulatedProfile
+
+        if self._func_list_exact is not None:
+            self.func_list = self._func_list_exact
+            self._func_list_exact = None
+        if emulate is not True:
+            return
+        self._func_list_exact = self.func_list
+        self.func_list = []
+        for lens_type, func in zip(self._model_list, self._func_list_exact):
+            if lens_type in EmulatedProfile.SUPPORTED_MODELS:
+                func = EmulatedProfile(lens_type, profile=func, **kwargs_emulation)
+            self.func_list.append(func)
+
+    @property
+    def emulation_error_list(self):
+        """
+
+        :return: list of the estimated relative errors of the deflection angles of the
+            emulated profiles (None for profiles evaluated exactly or not yet evaluated)
+        """
+        if self._func_list_exact is None:
+            return [None] * self._num_func
+        return [getattr(func, "emulation_error", None) for func in self.func_list]
+
     def model_info(self):
         """Shows what models are being initialized and what parameters are being
         requested for.
@@ -242,6 +301,75 @@ class ProfileListBase(object):
             )
 
 
+def num_samples_batch(kwargs_batch):
+    """Number of parameter sets in batched lens model keyword arguments.
+
+    :param kwargs_batch: list of keyword argument dictionaries (one per lens model) with
+        floats (shared among all samples) or 1d arrays of length n_samples as values
+    :return: int, number of samples (1 if all values are floats)
+    """
+    n_samples = 1
+    for kwargs in kwargs_batch:
+        for key, value in kwargs.items():
+            if np.ndim(value) > 0 and len(value) != 1:
+                if n_samples != 1 and len(value) != n_samples:
+                    raise ValueError(
+                        "batched keyword argument %s has length %s while other arguments "
+                        "have length %s" % (key, len(value), n_samples)
+                    )
+                n_samples = len(value)
+    return n_samples
+
+
+def select_sample_batch(kwargs_batch, i):
+    """Keyword arguments of a single sample of batched lens model keyword arguments.
+
+    :param kwargs_batch: list of keyword argument dictionaries (one per lens model) with
+        floats or 1d arrays of length n_samples as values
+    :param i: int, index of the sample
+    :return: list of keyword argument dictionaries with float values
+    """
+    kwargs_list = []
+    for kwargs in kwargs_batch:
+        kwargs_i = {}
+        for key, value in kwargs.items():
+            if np.ndim(value) > 0:
+                value = value[i] if len(value) != 1 else value[0]
+            kwargs_i[key] = value
+        kwargs_list.append(kwargs_i)
+    return kwargs_list
+
+
+def backend_profile_kwargs(lens_model_list, profile_kwargs_list=None, backend=None):
+    """Profile keyword arguments routing the profiles with an implementation in the
+    requested backend to it. The parameter semantics of the profiles are unchanged.
+    Profiles without implementation in the backend and profiles with an explicitly set
+    'backend' keyword argument are left unchanged.
+
+    :param lens_model_list: list of strings with lens model names
+    :param profile_kwargs_list: list of dicts (or None), keyword arguments used to
+        initialize profile classes
+    :param backend: None or string, e.g. 'numba'
+    :return: list of dicts, profile keyword arguments
+    """
+    if profile_kwargs_list is None:
+        profile_kwargs_list = [{} for _ in range(len(lens_model_list))]
+    if backend is None:
+        return profile_kwargs_list
+    if backend not in BACKEND_PROFILES:
+        raise ValueError(
+            "lens model backend %s not supported. Chose among %s."
+            % (backend, list(BACKEND_PROFILES.keys()))
+        )
+    profile_kwargs_list_ = []
+    for lens_type, profile_kwargs in zip(lens_model_list, profile_kwargs_list):
+        profile_kwargs = dict(profile_kwargs) if profile_kwargs is not None else {}
+        if lens_type in BACKEND_PROFILES[backend]:
+            profile_kwargs.setdefault("backend", backend)
+        profile_kwargs_list_.append(profile_kwargs)
+    return profile_kwargs_list_
+
+
 def lens_class(
     lens_type,
     profile_kwargs=None,
@@ -1,7 +1,10 @@
 __author__ = "sibirrer"
 
 import numpy as np
-from lenstronomy.LensModel.profile_list_base import ProfileListBase
+from lenstronomy.LensModel.profile_list_base import (
+    ProfileListBase,
+    num_samples_batch,
+)
 
 __all__ = ["SinglePlane"]
 
@@ -50,6 +53,23 @@ class SinglePlane(ProfileListBase):
         dx, dy = self.alpha(x, y, kwargs, k=k)
         return x - dx, y - dy
 
+    def ray_shooting_batch(self, x, y, kwargs_batch, k=None):
+        """Maps image to source positions for a batch of lens model parameter sets
+        evaluated at the same image positions.
+
+        :param x: x-position (preferentially arcsec)
+        :type x: 1d numpy array of length n_points
+        :param y: y-position (preferentially arcsec)
+        :type y: 1d numpy array of length n_points
+        :param kwargs_batch: list of keyword arguments of lens model parameters matching
+            the lens model classes, with floats (shared among all samples) or 1d arrays
+            of length n_samples as values
+        :param k: only evaluate the k-th lens model
+        :return: source plane positions, 2d arrays of shape (n_samples, n_points)
+        """
+        dx, dy = self.alpha_batch(x, y, kwargs_batch, k=k)
+        return x - dx, y - dy
+
     def fermat_potential(
         self, x_image, y_image, kwargs_lens, x_source=None, y_source=None, k=None
     ):
@@ -122,6 +142,35 @@ class SinglePlane(ProfileListBase):
 
         return f_x * self._alpha_scaling, f_y * self._alpha_scaling
 
+    def alpha_batch(self, x, y, kwargs_batch, k=None):
+        """Deflection angles for a batch of lens model parameter sets evaluated at the
+        same positions. Profiles supporting numpy broadcasting (e.g. EPL, SIE, NFW,
+        SHEAR, SIS) are evaluated for all samples at once, all others in a loop over the
+        samples (see LensProfileBase.derivatives_batch()).
+
+        :param x: x-position (preferentially arcsec)
+        :type x: 1d numpy array of length n_points
+        :param y: y-position (preferentially arcsec)
+        :type y: 1d numpy array of length n_points
+        :param kwargs_batch: list of keyword arguments of lens model parameters matching
+            the lens model classes, with floats (shared among all samples) or 1d arrays
+            of length n_samples as values
+        :param k: only evaluate the k-th lens model
+        :return: deflection angles in units of arcsec, 2d arrays of shape (n_samples,
+            n_points)
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        shape = (num_samples_batch(kwargs_batch), len(x))
+        bool_list = self._bool_list(k)
+        f_x, f_y = np.zeros(shape), np.zeros(shape)
+        for i, func in enumerate(self.func_list):
+            if bool_list[i] is True:
+                f_x_i, f_y_i = func.derivatives_batch(x, y, **kwargs_batch[i])
+                f_x += f_x_i
+                f_y += f_y_i
+        return f_x * self._alpha_scaling, f_y * self._alpha_scaling
+
     def hessian(self, x, y, kwargs, k=None):
         """Hessian matrix.
 
@@ -19,6 +19,7 @@ class ImageLikelihood(object):
         check_positive_flux=False,
         kwargs_pixelbased=None,
         linear_solver=True,
+        wls_solver="inv",
     ):
         """
 
@@ -36,6 +37,8 @@ class ImageLikelihood(object):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param wls_solver: string, solver of the weighted linear least square problem. Options are 'inv' (default)
+         and 'cholesky' (Cholesky factorization, faster for many linear parameters)
         """
         self.imSim = class_creator.create_im_sim(
             multi_band_list,
@@ -45,6 +48,7 @@ class ImageLikelihood(object):
             image_likelihood_mask_list=image_likelihood_mask_list,
             kwargs_pixelbased=kwargs_pixelbased,
             linear_solver=linear_solver,
+            wls_solver=wls_solver,
         )
         self._model_type = self.imSim.type
         self._source_marg = source_marg
@@ -0,0 +1,308 @@
+"""Persistent multiprocessing pool that keeps the likelihood resident in the worker
+processes.
+
+The pools created by choose_pool() for each sampling call receive the likelihood as part
+of each task, i.e. the LikelihoodModule, including all data arrays, is pickled and
+transferred to the workers with every chunk of the parameter samples. The PoolManager
+starts its worker processes once, transfers the likelihood to each worker only when it
+changes, and passes only the parameter vectors to the workers per task. Optionally, the
+large arrays of the likelihood are placed in shared memory such that the workers do not
+hold their own copies of the data (see SharedArrayStore).
+"""
+
+import threading
+
+import dill
+import multiprocess
+
+from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+from lenstronomy.Sampling.Pool.shared_memory import SharedArrayStore
+
+__all__ = ["PoolManager"]
+
+# state of a worker process of the PoolManager
+_worker_state = {
+    "barrier": None,
+    "version": None,
+    "likelihood": None,
+    "shared_memory": [],
+}
+
+
+def _worker_initializer(barrier):
+    """Initializes a worker process of the PoolManager.
+
+    :param barrier: multiprocess.Barrier shared among all the workers
+    :return: None
+    """
+    _worker_state["barrier"] = barrier
+    _worker_state["version"] = None
+    _worker_state["likelihood"] = None
+    _worker_state["shared_memory"] = []
+
+
+def _load_likelihood(task):
+    """Stores a likelihood in the worker process. Each worker waits for all other
+    workers such that every worker receives exactly one of the broadcast tasks.
+
+    :param task: (version, serialized likelihood, bool whether the likelihood has been
+        serialized with a SharedArrayStore)
+    :return: version
+    """
+    version, payload, shared = task
+    _worker_state["likelihood"] = None
+    _worker_state["shared_memory"] = []
+    if shared is True:
+        attached = []
+        _worker_state["likelihood"] = SharedArrayStore.loads(payload, attached)
+        _worker_state["shared_memory"] = attached
+    else:
+        _worker_state["likelihood"] = dill.loads(payload)
+    _worker_state["version"] = version
+    _worker_state["barrier"].wait(PoolManager.broadcast_timeout)
+    return version
+
+
+class _ResidentFunction(object):
+    """Callable evaluating a method of the likelihood resident in the process.
+
+    Only the name of the method and the version of the likelihood are pickled, such that
+    mapping this function over a pool does not transfer the likelihood.
+    """
+
+    def __init__(self, likelihood, method, version):
+        """
+
+        :param likelihood: likelihood instance (e.g. LikelihoodModule) of the main
+            process
+        :param method: string, name of the method of the likelihood to be evaluated
+        :param version: int, version of the likelihood in the worker processes
+        """
+        self._likelihood = likelihood
+        self._method = method
+        self._version = version
+
+    def __getstate__(self):
+        return {"_likelihood": None, "_method": self._method, "_version": self._version}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __call__(self, *args, **kwargs):
+        likelihood = self._likelihood
+        if likelihood is None:
+            if _worker_state["version"] != self._version:
+                raise RuntimeError(
+                    "The likelihood of version %s is not available in this worker "
+                    "process (current version %s)."
+                    % (self._version, _worker_state["version"])
+                )
+            likelihood = _worker_state["likelihood"]
+        return getattr(likelihood, self._method)(*args, **kwargs)
+
+
+class PoolManager(object):
+    """Multiprocessing pool with a likelihood resident in each of its worker processes.
+
+    The pool is started at the first use and persists until close() is called. The
+    likelihood is transferred to the workers with set_likelihood() whenever a different
+    instance is set. Functions returned by function() only transfer the parameters to
+    the workers. The class provides the map(), is_master() and is_worker() interface of
+    the schwimmbad pools and can be passed as pool to the samplers.
+
+    Calls from different threads are serialized such that a likelihood broadcast never
+    interleaves with the evaluation of a map.
+
+    The worker processes are forked. The numba parallel (prange) kernels of the lens
+    profiles ('prange: True' in conf_default.yaml) must not be combined with this pool
+    (nor with MultiPool) with numba's TBB or GNU OpenMP threading layer: the interpreter
+    does not exit after the pool has been used. Use the default 'workqueue' layer.
+
+    Usage::
+
+        pool_manager = PoolManager(processes=4)
+        pool_manager.set_likelihood(likelihood_module)
+        logL_list = pool_manager.map(pool_manager.function("logL"), args_list)
+        pool_manager.close()
+    """
+
+    broadcast_timeout = 3600
+
+    def __init__(
+        self, processes=None, shared_memory=False, shared_memory_min_bytes=65536
+    ):
+        """
+
+        :param processes: number of worker processes; default is the number of CPUs.
+            With processes=1, all evaluations are performed in the main process.
+        :param shared_memory: bool, if True, the numpy arrays of the likelihood (data,
+            noise maps, masks, PSF kernels, coordinate grids, ...) are placed in shared
+            memory and the workers use read-only views on them instead of copies
+        :param shared_memory_min_bytes: minimum size of an array in bytes to be placed in
+            shared memory
+        """
+        if processes is None:
+            processes = multiprocess.cpu_count()
+        if processes < 1:
+            raise ValueError("processes needs to be >= 1, got %s." % processes)
+        self._processes = int(processes)
+        self._pool = None
+        self._likelihood = None
+        self._version = 0
+        self._worker_version = None
+        self._lock = threading.RLock()
+        self._shared_memory = shared_memory
+        self._shared_memory_min_bytes = shared_memory_min_bytes
+        self._store = None
+        self.rank = 0
+
+    @property
+    def size(self):
+        """
+
+        :return: number of worker processes
+        """
+        return self._processes
+
+    @property
+    def version(self):
+        """
+
+        :return: int, number of times the likelihood has been changed
+        """
+        return self._version
+
+    @property
+    def started(self):
+        """
+
+        :return: bool, True if the worker processes are running
+        """
+        return self._pool is not None
+
+    @property
+    def shared_memory_nbytes(self):
+        """
+
+        :return: size in bytes of the arrays of the current likelihood in shared memory
+        """
+        if self._store is None:
+            return 0
+        return self._store.nbytes
+
+    def is_master(self):
+        return True
+
+    def is_worker(self):
+        return False
+
+    def set_likelihood(self, likelihood):
+        """Sets the likelihood evaluated by the functions of this pool. The likelihood
+        is only transferred to the workers when it is not the same instance as the
+        current one.
+
+        :param likelihood: likelihood instance (e.g. LikelihoodModule)
+        :return: bool, True if the likelihood has been updated
+        """
+        with self._lock:
+            if likelihood is self._likelihood:
+                return False
+            self._likelihood = likelihood
+            self._version += 1
+            return True
+
+    def function(self, method="logL"):
+        """Function evaluating a method of the current likelihood.
+
+        :param method: string, name of the method of the likelihood
+        :return: picklable callable
+        """
+        if self._likelihood is None:
+            raise ValueError("No likelihood set. Call set_likelihood() first.")
+        return _ResidentFunction(self._likelihood, method, self._version)
+
+    def map(self, func, iterable, chunksize=None, callback=None):
+        """Equivalent to the built-in map() function evaluated by the worker processes.
+
+        :param func: function to be evaluated. For functions of function() (also when
+            wrapped by the sampler), only the arguments are transferred to the workers.
+        :param iterable: list or iterable of arguments of func
+        :param chunksize: number of tasks sent to a worker at once (see
+            multiprocessing.pool.Pool.map)
+        :param callback: optional callable evaluated on each result in the main process
+        :return: list of results
+        """
+        if self._processes == 1:
+            results = list(map(func, iterable))
+            if callback is not None:
+                for result in results:
+                    callback(result)
+            return results
+        with self._lock:
+            pool = self._start()
+            if self._likelihood is not None:
+                self._broadcast(pool)
+            return pool.map(func, iterable, chunksize=chunksize, callback=callback)
+
+    def close(self):
+        """Terminates the worker processes. The pool is restarted at the next use.
+
+        :return: None
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+            self._worker_version = None
+            if self._store is not None:
+                self._store.release()
+                self._store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _start(self):
+        """Starts the worker processes if not already running.
+
+        :return: MultiPool instance
+        """
+        if self._pool is None:
+            barrier = multiprocess.Barrier(self._processes)
+            self._pool = MultiPool(
+                processes=self._processes,
+                initializer=_worker_initializer,
+                initargs=(barrier,),
+            )
+            self._worker_version = None
+        return self._pool
+
+    def _broadcast(self, pool):
+        """Transfers the current likelihood to all workers if they do not have it yet.
+
+        :param pool: MultiPool instance
+        :return: None
+        """
+        if self._worker_version == self._version:
+            return
+        store = None
+        if self._shared_memory is True:
+            store = SharedArrayStore(min_bytes=self._shared_memory_min_bytes)
+            payload = store.dumps(self._likelihood)
+        else:
+            payload = dill.dumps(self._likelihood)
+        tasks = [(self._version, payload, store is not None)] * self._processes
+        try:
+            pool.map(_load_likelihood, tasks, chunksize=1)
+        except BaseException:
+            if store is not None:
+                store.release()
+            raise
+        # the workers no longer use the arrays of the previous likelihood
+        if self._store is not None:
+            self._store.release()
+        self._store = store
+        self._worker_version = self._version
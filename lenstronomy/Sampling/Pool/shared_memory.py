@@ -0,0 +1,197 @@
+"""Serialization of objects with their large numpy arrays placed in shared memory.
+
+The read-only arrays of a likelihood (imaging data, noise maps, masks, PSF kernels,
+supersampled coordinate grids, ...) are copied once into blocks of
+multiprocessing.shared_memory. The serialized object only contains references to these
+blocks and the worker processes rebuild the arrays as views on the shared memory
+instead of holding their own copies.
+"""
+
+import io
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import dill
+import numpy as np
+
+__all__ = ["SharedArrayStore"]
+
+_PERSISTENT_TAG = "lenstronomy_shared_array"
+
+
+def _attach(name):
+    """Attaches to an existing shared memory block without registering it with the
+    resource tracker of this process, such that the block is not removed when this
+    process terminates. The block is owned (and removed) by the SharedArrayStore of the
+    serializing process.
+
+    :param name: name of the shared memory block
+    :return: SharedMemory instance
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class _SharedPickler(dill.Pickler):
+    """Pickler storing numpy arrays above a size threshold in a SharedArrayStore."""
+
+    def __init__(self, file, store, **kwargs):
+        super(_SharedPickler, self).__init__(file, **kwargs)
+        self._store = store
+
+    def persistent_id(self, obj):
+        if type(obj) is np.ndarray and self._store.shareable(obj):
+            return self._store.share(obj)
+        return None
+
+
+class _SharedUnpickler(dill.Unpickler):
+    """Unpickler re-building the arrays of a SharedArrayStore as views on the shared
+    memory."""
+
+    def __init__(self, file, attached, **kwargs):
+        super(_SharedUnpickler, self).__init__(file, **kwargs)
+        self._attached = attached
+        self._blocks = {}
+        self._arrays = {}
+
+    def persistent_load(self, pid):
+        tag, name, shape, dtype, order = pid
+        if tag != _PERSISTENT_TAG:
+            raise dill.UnpicklingError("unsupported persistent id %s" % str(tag))
+        if pid in self._arrays:
+            return self._arrays[pid]
+        if name not in self._blocks:
+            block = _attach(name)
+            self._blocks[name] = block
+            self._attached.append(block)
+        array = np.ndarray(
+            shape, dtype=np.dtype(dtype), buffer=self._blocks[name].buf, order=order
+        )
+        array.flags.writeable = False
+        self._arrays[pid] = array
+        return array
+
+
+class SharedArrayStore(object):
+    """Owner of the shared memory blocks of serialized numpy arrays.
+
+    Usage::
+
+        store = SharedArrayStore()
+        payload = store.dumps(likelihood_module)
+        # in other processes
+        attached = []
+        likelihood_module = SharedArrayStore.loads(payload, attached)
+        # in the owning process, once the arrays are no longer used
+        store.release()
+
+    The same array (same object) referenced at several places of the object is stored
+    only once. The re-built arrays are read-only.
+    """
+
+    def __init__(self, min_bytes=65536):
+        """
+
+        :param min_bytes: minimum size of an array (in bytes) to be placed in shared
+            memory. Smaller arrays are serialized as usual.
+        """
+        self._min_bytes = min_bytes
+        self._blocks = []
+        self._shared = {}
+
+    @property
+    def nbytes(self):
+        """
+
+        :return: total size of the shared memory blocks in bytes
+        """
+        return sum([block.size for block in self._blocks])
+
+    @property
+    def num_arrays(self):
+        """
+
+        :return: number of arrays placed in shared memory
+        """
+        return len(self._blocks)
+
+    def shareable(self, array):
+        """
+
+        :param array: numpy array
+        :return: bool, True if the array is placed in shared memory by this store
+        """
+        return array.nbytes >= max(self._min_bytes, 1) and not array.dtype.hasobject
+
+    def share(self, array):
+        """Copies an array into a shared memory block (once per array object).
+
+        :param array: numpy array
+        :return: persistent id of the array
+        """
+        key = id(array)
+        if key in self._shared:
+            return self._shared[key][1]
+        if array.flags.f_contiguous and not array.flags.c_contiguous:
+            order = "F"
+        else:
+            order = "C"
+        array_in = np.asarray(array, order=order)
+        block = shared_memory.SharedMemory(create=True, size=array_in.nbytes)
+        shared = np.ndarray(
+            array_in.shape, dtype=array_in.dtype, buffer=block.buf, order=order
+        )
+        shared[...] = array_in
+        pid = (_PERSISTENT_TAG, block.name, array.shape, array.dtype.str, order)
+        self._blocks.append(block)
+        # the array is kept referenced such that its id is not re-used
+        self._shared[key] = (array, pid)
+        return pid
+
+    def dumps(self, obj):
+        """Serializes an object with its large arrays placed in shared memory.
+
+        :param obj: object to be serialized
+        :return: bytes
+        """
+        file = io.BytesIO()
+        _SharedPickler(file, self, protocol=dill.settings["protocol"]).dump(obj)
+        return file.getvalue()
+
+    @staticmethod
+    def loads(payload, attached=None):
+        """De-serializes an object serialized with dumps().
+
+        :param payload: bytes returned by dumps()
+        :param attached: list, the attached shared memory blocks are appended to it.
+            They need to be kept referenced while the object is in use.
+        :return: object
+        """
+        if attached is None:
+            attached = []
+        return _SharedUnpickler(io.BytesIO(payload), attached).load()
+
+    def release(self):
+        """Closes and removes all shared memory blocks of this store. Processes still
+        attached to the blocks keep their memory until they close them.
+
+        :return: None
+        """
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+        self._shared = {}
+
+    def __del__(self):
+        self.release()
@@ -30,10 +30,22 @@ class ParticleSwarmOptimizer(object):
         object provided by ``pool`` is used for all parallelization. It
         can be any object with a ``map`` method that follows the same
         calling sequence as the built-in ``map`` function.
+    :param vectorized: (optional)
+        If True, the swarm is held as contiguous (n_particles, n_dim) arrays and
+        ``func`` is called with the full 2d array of positions, returning a 1d array
+        of log likelihoods.
     """
 
     def __init__(
-        self, func, low, high, particle_count=25, pool=None, args=None, kwargs=None
+        self,
+        func,
+        low,
+        high,
+        particle_count=25,
+        pool=None,
+        args=None,
+        kwargs=None,
+        vectorized=False,
     ):
         """
 
@@ -53,15 +65,24 @@ class ParticleSwarmOptimizer(object):
         :param kwargs: keyword arguments to send to `func`. The function
         will be called as `func(x, *args, **kwargs)`
         :type kwargs: `dict`
+        :param vectorized: if True, `func` evaluates a 2d array of shape
+         (particle_count, num_param) at once and returns a 1d array of log likelihoods.
+         The swarm is then stored in contiguous arrays instead of Particle() instances.
+        :type vectorized: bool
         """
         self.low = [l for l in low]
         self.high = [h for h in high]
         self.particleCount = particle_count
         self.pool = pool
+        self._vectorized = vectorized
 
         self.param_count = len(self.low)
 
-        self.swarm = self._init_swarm()
+        if self._vectorized:
+            self.swarm = None
+            self._init_swarm_arrays()
+        else:
+            self.swarm = self._init_swarm()
         self.global_best = Particle.create(self.param_count)
 
         self.func = _FunctionWrapper(func, args, kwargs)
@@ -109,6 +130,19 @@ class ParticleSwarmOptimizer(object):
 
         return swarm
 
+    def _init_swarm_arrays(self):
+        """Initiate the swarm as contiguous arrays (vectorized mode).
+
+        :return: None
+        """
+        self.positions = np.random.uniform(
+            self.low, self.high, size=(self.particleCount, self.param_count)
+        )
+        self.velocities = np.zeros((self.particleCount, self.param_count))
+        self.fitness = np.zeros(self.particleCount)
+        self.personal_best_positions = np.array(self.positions)
+        self.personal_best_fitness = np.full(self.particleCount, -np.inf)
+
     def sample(
         self,
         max_iter=1000,
@@ -134,6 +168,11 @@ class ParticleSwarmOptimizer(object):
         :param verbose: prints when it stopped
         :type verbose: boolean
         """
+        if self._vectorized:
+            yield from self._sample_vectorized(
+                max_iter, c1, c2, p, m, n, early_stop_tolerance, verbose
+            )
+            return
 
         self._get_fitness(self.swarm)
         i = 0
@@ -203,6 +242,78 @@ class ParticleSwarmOptimizer(object):
 
             i += 1
 
+    def _sample_vectorized(
+        self,
+        max_iter=1000,
+        c1=1.193,
+        c2=1.193,
+        p=0.7,
+        m=1e-3,
+        n=1e-2,
+        early_stop_tolerance=None,
+        verbose=True,
+    ):
+        """Launches the PSO with the swarm stored in arrays. Yields a copy of the
+        (n_particles, n_dim) positions per iteration.
+
+        :param max_iter: maximum iterations
+        :param c1: cognitive weight
+        :param c2: social weight
+        :param p: stop criterion, percentage of particles to use
+        :param m: stop criterion, difference between mean fitness and global best
+        :param n: stop criterion, difference between norm of the particle vector and
+            norm of the global best
+        :param early_stop_tolerance: will terminate at the given value (should be
+            specified as a chi^2)
+        :param verbose: prints when it stopped
+        :type verbose: boolean
+        """
+        self._get_fitness_vectorized()
+        i = 0
+        while True:
+            self._update_bests_vectorized()
+
+            if i >= max_iter:
+                if self.is_master():
+                    if verbose:
+                        print("Max iteration reached! Stopping.")
+                return
+
+            if self._converged_vectorized(p=p, m=m, n=n):
+                if self.is_master():
+                    if verbose:
+                        print("Converged after {} iterations!".format(i))
+                        print(
+                            "Best fit found: ",
+                            self.global_best.fitness,
+                            self.global_best.position,
+                        )
+                return
+
+            if early_stop_tolerance is not None:
+                if self._acceptable_convergence(early_stop_tolerance):
+                    return
+
+            shape = (self.particleCount, self.param_count)
+            w = 0.5 + np.random.uniform(0, 1, size=shape) / 2
+            cog_vel = (
+                c1
+                * np.random.uniform(0, 1, size=shape)
+                * (self.personal_best_positions - self.positions)
+            )
+            soc_vel = (
+                c2
+                * np.random.uniform(0, 1, size=shape)
+                * (np.array(self.global_best.position) - self.positions)
+            )
+            self.velocities = w * self.velocities + cog_vel + soc_vel
+            self.positions = self.positions + self.velocities
+
+            self._get_fitness_vectorized()
+            yield np.array(self.positions)
+
+            i += 1
+
     def optimize(
         self,
         max_iter=1000,
@@ -266,6 +377,59 @@ class ParticleSwarmOptimizer(object):
             particle.fitness = ln_probability[i]
             particle.position = position[i]
 
+    def _get_fitness_vectorized(self):
+        """Set fitness (probability) of all particles with a single call of the
+        vectorized function. With a pool, the swarm is split into one chunk per process.
+
+        :return: None
+        """
+        if self.pool is None:
+            ln_probability = self.func(self.positions)
+        else:
+            num_chunks = min(_pool_size(self.pool), self.particleCount)
+            chunks = np.array_split(self.positions, num_chunks)
+            ln_probability = np.concatenate(list(self.pool.map(self.func, chunks)))
+        self.fitness = np.asarray(ln_probability, dtype=float).reshape(
+            self.particleCount
+        )
+
+    def _update_bests_vectorized(self):
+        """Updates the personal best of each particle and the global best of the swarm.
+
+        :return: None
+        """
+        improved = self.fitness > self.personal_best_fitness
+        self.personal_best_fitness[improved] = self.fitness[improved]
+        self.personal_best_positions[improved] = self.positions[improved]
+
+        i_best = np.argmax(self.fitness)
+        if self.global_best.fitness < self.fitness[i_best]:
+            self.global_best = Particle(
+                self.positions[i_best],
+                self.velocities[i_best],
+                self.fitness[i_best],
+            )
+
+    def _converged_vectorized(self, p, m, n):
+        """Check for convergence of the vectorized swarm with the same criteria as
+        _converged().
+
+        :param p: stop criterion, percentage of particles to use
+        :param m: stop criterion, difference between mean fitness and global best
+        :param n: stop criterion, difference between norm of the particle vector and
+            norm of the global best
+        :return: bool
+        """
+        num_best = int(floor(self.particleCount * p))
+        best_sort = np.sort(self.personal_best_fitness)[::-1]
+        mean_fit = np.mean(best_sort[1:num_best])
+        if not abs(self.global_best.fitness - mean_fit) < m:
+            return False
+        best_of_best = np.argsort(-self.fitness, kind="stable")[0:num_best]
+        diffs = np.array(self.global_best.position) - self.positions[best_of_best]
+        max_norm = np.max(np.linalg.norm(diffs, axis=1))
+        return abs(max_norm) < n
+
     def _converged(self, it, p, m, n):
         """Check for convergence.
 
@@ -375,6 +539,20 @@ class ParticleSwarmOptimizer(object):
             return False
 
 
+def _pool_size(pool):
+    """Number of processes of a pool to split a vectorized evaluation into.
+
+    :param pool: MPIPool, MultiPool or SerialPool instance
+    :return: int
+    """
+    size = getattr(pool, "size", None)
+    if size is None:
+        size = getattr(pool, "_processes", None)
+    if size is None:
+        return 1
+    return max(int(size), 1)
+
+
 class Particle(object):
     """Implementation of a single particle.
 
@@ -8,6 +8,7 @@ from lenstronomy.Sampling.Likelihoods.flux_ratio_likelihood import FluxRatioLike
 from lenstronomy.Sampling.Likelihoods.prior_likelihood import PriorLikelihood
 from lenstronomy.Sampling.Likelihoods.kinematic_2D_likelihood import KinLikelihood
 import lenstronomy.Util.class_creator as class_creator
+from lenstronomy.Util.profiler import Profiler, NullProfiler
 import numpy as np
 
 __all__ = ["LikelihoodModule"]
@@ -75,6 +76,10 @@ class LikelihoodModule(object):
         kin_lens_light_idx=0,
         tracer_likelihood=False,
         tracer_likelihood_mask=None,
+        wls_solver="inv",
+        profiler=None,
+        response_cache=False,
+        kwargs_emulation=None,
     ):
         """Initializing class.
 
@@ -123,7 +128,29 @@ class LikelihoodModule(object):
         :param kinematic_2d_likelihood: bool, option to compute the kinematic likelihood
         :param tracer_likelihood: option to perform likelihood on tracer quantity
             derived from imaging or spectroscopy
+        :param wls_solver: string, solver of the weighted linear least square problem
+            of the imaging likelihood. Options are 'inv' (default) and 'cholesky'
+            (Cholesky factorization, faster for many linear parameters)
+        :param profiler: None, bool or Profiler() instance. If set, records wall time
+            and number of calls of the individual likelihood components and of the
+            stages of the imaging likelihood (see profiling_report())
+        :param response_cache: bool, if True, the imaging likelihood re-uses the
+            ray-shot source plane coordinates when the lens model and special keyword
+            arguments are unchanged, and the lens light response when the lens light
+            keyword arguments are unchanged between evaluations (e.g. for samplers
+            updating subsets of the parameters)
+        :param kwargs_emulation: None or dict, if set, the supported (expensive) lens
+            profiles of all likelihood components are replaced by interpolated
+            emulations with these settings (see LensModel.set_emulation()), e.g. for
+            the early stages of a fit
         """
+        if profiler is True:
+            profiler = Profiler()
+        elif profiler is None or profiler is False:
+            profiler = NullProfiler()
+        self._profiler = profiler
+        self._response_cache = response_cache
+        self._kwargs_emulation = kwargs_emulation
         # TODO unpack also tracer model from kwargs_data
         (
             multi_band_list,
@@ -184,6 +211,7 @@ class LikelihoodModule(object):
             "check_positive_flux": check_positive_flux,
             "kwargs_pixelbased": kwargs_pixelbased,
             "linear_solver": linear_solver,
+            "wls_solver": wls_solver,
         }
         self._kwargs_image_sim = {
             "multi_band_list": multi_band_list,
@@ -287,6 +315,8 @@ class LikelihoodModule(object):
             point_source_class,
             _,
         ) = class_creator.create_class_instances(all_models=True, **kwargs_model)
+        if self._kwargs_emulation is not None:
+            lens_model_class.set_emulation(True, **self._kwargs_emulation)
         self.PointSource = point_source_class
 
         if self._time_delay_likelihood is True:
@@ -327,6 +357,36 @@ class LikelihoodModule(object):
                 self._kin_lens_idx,
                 self._kin_lens_light_idx,
             )
+        if self._image_likelihood is True:
+            self.image_likelihood.imSim.set_profiler(self._profiler)
+            if self._response_cache is True:
+                self.image_likelihood.imSim.set_response_cache(True)
+            if self._kwargs_emulation is not None:
+                self.image_likelihood.imSim.set_lens_emulation(
+                    True, **self._kwargs_emulation
+                )
+
+    @property
+    def profiler(self):
+        """
+
+        :return: Profiler() instance recording the likelihood evaluations (or
+            NullProfiler() if profiling is turned off)
+        """
+        return self._profiler
+
+    def profiling_report(self, reset=False):
+        """Wall time and number of calls of the likelihood components recorded since the
+        profiler was last reset.
+
+        :param reset: bool, if True, resets the profiler after the report is generated
+        :return: dictionary with the stage names as keys and dictionaries with entries
+            'calls', 'total_time' and 'mean_time' (in seconds) as values
+        """
+        report = self._profiler.report()
+        if reset is True:
+            self._profiler.reset()
+        return report
 
     def __call__(self, a):
         return self.logL(a)
@@ -348,9 +408,24 @@ class LikelihoodModule(object):
             if bound_hit is True:
                 return -(10**18)
         # extract parameters
-        kwargs_return = self.param.args2kwargs(args)
+        with self._profiler.timer("args2kwargs"):
+            kwargs_return = self.param.args2kwargs(args)
         return self.log_likelihood(kwargs_return, verbose=verbose)
 
+    def logL_vectorized(self, args_array):
+        """Log likelihood of a batch of parameter vectors, e.g. all particles of a
+        vectorized ParticleSwarmOptimizer.
+
+        :param args_array: 2d array of shape (n_samples, num_param), each row being
+            ordered parameter values that are being sampled
+        :returns: 1d array of log likelihoods of length n_samples
+        """
+        args_array = np.atleast_2d(args_array)
+        logL = np.zeros(len(args_array))
+        for i, args in enumerate(args_array):
+            logL[i] = self.logL(args)
+        return logL
+
     def log_likelihood(self, kwargs_return, verbose=False):
         """
 
@@ -365,6 +440,19 @@ class LikelihoodModule(object):
         :returns:
          - logL (float) log likelihood of the data given the model (natural logarithm)
         """
+        with self._profiler.timer("log_likelihood"):
+            return self._log_likelihood(kwargs_return, verbose=verbose)
+
+    def _log_likelihood(self, kwargs_return, verbose=False):
+        """Computes the sum of all likelihood components, see log_likelihood().
+
+        :param kwargs_return: need to contain 'kwargs_lens', 'kwargs_source',
+            'kwargs_lens_light', 'kwargs_ps', 'kwargs_special'
+        :param verbose: if True, makes print statements about individual likelihood
+            components
+        :returns: log likelihood of the data given the model (natural logarithm)
+        """
+        profiler = self._profiler
         kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps, kwargs_special = (
             kwargs_return.get("kwargs_lens", {}),
             kwargs_return.get("kwargs_source", {}),
@@ -382,19 +470,22 @@ class LikelihoodModule(object):
         # computing custom loglikelihood function first so that the full
         # likelihood evaluation is skipped if it returns -inf
         if self._custom_logL_addition is not None:
-            logL_cond = self._custom_logL_addition(**kwargs_return)
+            with profiler.timer("custom_logL"):
+                logL_cond = self._custom_logL_addition(**kwargs_return)
             logL += logL_cond
             if verbose is True:
                 print("custom added logL = %s" % logL_cond)
 
         if logL > -(10**18):  # so that custom logL may return -1e18 instead of -inf
-            logL_prior = self._prior_likelihood.logL(**kwargs_return)
+            with profiler.timer("prior_logL"):
+                logL_prior = self._prior_likelihood.logL(**kwargs_return)
             logL += logL_prior
             if verbose is True:
                 print("Prior likelihood = %s" % logL_prior)
 
             if self._image_likelihood is True:
-                logL_image, param = self.image_likelihood.logL(**kwargs_return)
+                with profiler.timer("image_logL"):
+                    logL_image, param = self.image_likelihood.logL(**kwargs_return)
                 logL += logL_image
                 if verbose is True:
                     print("image logL = %s" % logL_image)
@@ -402,34 +493,41 @@ class LikelihoodModule(object):
                 param = None
 
             if self._time_delay_likelihood is True:
-                logL_time_delay = self.time_delay_likelihood.logL(
-                    kwargs_lens, kwargs_ps, kwargs_special
-                )
+                with profiler.timer("time_delay_logL"):
+                    logL_time_delay = self.time_delay_likelihood.logL(
+                        kwargs_lens, kwargs_ps, kwargs_special
+                    )
                 logL += logL_time_delay
                 if verbose is True:
                     print("time-delay logL = %s" % logL_time_delay)
             if self._flux_ratio_likelihood is True:
-                ra_image_list, dec_image_list = self.PointSource.image_position(
-                    kwargs_ps=kwargs_ps, kwargs_lens=kwargs_lens
-                )
-                logL_flux_ratios = self.flux_ratio_likelihood.logL(
-                    ra_image_list, dec_image_list, kwargs_lens, kwargs_special
-                )
+                with profiler.timer("flux_ratio_logL"):
+                    ra_image_list, dec_image_list = self.PointSource.image_position(
+                        kwargs_ps=kwargs_ps, kwargs_lens=kwargs_lens
+                    )
+                    logL_flux_ratios = self.flux_ratio_likelihood.logL(
+                        ra_image_list, dec_image_list, kwargs_lens, kwargs_special
+                    )
                 logL += logL_flux_ratios
                 if verbose is True:
                     print("flux ratio logL = %s" % logL_flux_ratios)
             if self._kinematic_2D_likelihood is True:
-                logL_kinematic_2d = self.kinematic_2D_likelihood.logL(
-                    kwargs_lens, kwargs_lens_light, kwargs_special
-                )
+                with profiler.timer("kinematic_2d_logL"):
+                    logL_kinematic_2d = self.kinematic_2D_likelihood.logL(
+                        kwargs_lens, kwargs_lens_light, kwargs_special
+                    )
                 logL += logL_kinematic_2d
                 if verbose is True:
                     print("kinematic logL = %s" % logL_kinematic_2d)
-            logL += self._position_likelihood.logL(
-                kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose
-            )
+            with profiler.timer("position_logL"):
+                logL += self._position_likelihood.logL(
+                    kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose
+                )
             if self._tracer_likelihood is True:
-                logL_tracer = self.tracer_likelihood.logL(param=param, **kwargs_return)
+                with profiler.timer("tracer_logL"):
+                    logL_tracer = self.tracer_likelihood.logL(
+                        param=param, **kwargs_return
+                    )
                 if verbose is True:
                     print("tracer logL = %s" % logL_tracer)
                 logL += logL_tracer
@@ -20,13 +20,18 @@ class Sampler(object):
 
     """
 
-    def __init__(self, likelihoodModule):
+    def __init__(self, likelihoodModule, pool_manager=None):
         """
 
         :param likelihoodModule: instance of LikelihoodModule class
+        :param pool_manager: PoolManager instance (optional). If provided, the PSO and
+            MCMC samplers are evaluated in its persistent worker processes with the
+            likelihood resident in the workers instead of creating a new pool per call
+            (the threadCount arguments are then ignored, not applicable for MPI)
         """
         self.chain = likelihoodModule
         self.lower_limit, self.upper_limit = self.chain.param_limits
+        self._pool_manager = pool_manager
 
     def simplex(self, init_pos, n_iterations, method, print_key="SIMPLEX"):
         """
@@ -70,6 +75,7 @@ class Sampler(object):
         mpi=False,
         print_key="PSO",
         verbose=True,
+        vectorized=False,
     ):
         """Return the best fit for the lens model on catalogue basis with particle swarm
         optimizer.
@@ -86,6 +92,8 @@ class Sampler(object):
         :param mpi: bool, if True, makes instance of MPIPool to allow for MPI execution
         :param print_key: string, prints the process name in the progress bar (optional)
         :param verbose: suppress or turn on print statements
+        :param vectorized: bool, if True, the swarm is stored in arrays and all
+            particles are passed at once to LikelihoodModule.logL_vectorized()
         :return: kwargs_result (of best fit), [lnlikelihood of samples, positions of
             samples, velocity of samples])
         """
@@ -98,13 +106,22 @@ class Sampler(object):
             lower_start = np.maximum(lower_start, self.lower_limit)
             upper_start = np.minimum(upper_start, self.upper_limit)
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        if vectorized is True:
+            method = "logL_vectorized"
+        else:
+            method = "logL"
+        pool, func = self._pool_function(mpi, threadCount, method=method)
 
         if mpi is True and pool.is_master():
             print("MPI option chosen for PSO.")
 
         pso = ParticleSwarmOptimizer(
-            self.chain.logL, lower_start, upper_start, n_particles, pool=pool
+            func,
+            lower_start,
+            upper_start,
+            n_particles,
+            pool=pool,
+            vectorized=vectorized,
         )
 
         if init_pos is None:
@@ -192,7 +209,7 @@ class Sampler(object):
                 size=n_walkers,
             )
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        pool, func = self._pool_function(mpi, threadCount)
 
         if backend_filename is not None:
             backend = emcee.backends.HDFBackend(
@@ -223,7 +240,7 @@ class Sampler(object):
         time_start = time.time()
 
         sampler = emcee.EnsembleSampler(
-            n_walkers, num_param, self.chain.logL, pool=pool, backend=backend
+            n_walkers, num_param, func, pool=pool, backend=backend
         )
 
         sampler.run_mcmc(initpos, n_run_eff, progress=progress)
@@ -368,12 +385,12 @@ class Sampler(object):
         else:
             pass
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        pool, func = self._pool_function(mpi, threadCount)
 
         sampler = zeus.EnsembleSampler(
             nwalkers=n_walkers,
             ndim=num_param,
-            logprob_fn=self.chain.logL,
+            logprob_fn=func,
             moves=moves,
             tune=tune,
             tolerance=tolerance,
@@ -398,6 +415,22 @@ class Sampler(object):
 
         return flat_samples, dist
 
+    def _pool_function(self, mpi, threadCount, method="logL"):
+        """Pool and likelihood function to be evaluated by the samplers.
+
+        :param mpi: bool, if True, makes instance of MPIPool
+        :param threadCount: number of processes of the pool (only applied if mpi=False
+            and no PoolManager is provided)
+        :param method: string, name of the method of the LikelihoodModule to be
+            evaluated
+        :return: pool, function
+        """
+        if self._pool_manager is not None and mpi is False:
+            self._pool_manager.set_likelihood(self.chain)
+            return self._pool_manager, self._pool_manager.function(method)
+        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        return pool, getattr(self.chain, method)
+
     def _print_result(self, result):
         kwargs_return = self.chain.param.args2kwargs(result)
         print(
@@ -0,0 +1,198 @@
+import copy
+import hashlib
+
+import numpy as np
+
+__all__ = ["KwargsCache", "GridCache", "kwargs_equal"]
+
+
+def kwargs_equal(kwargs_1, kwargs_2):
+    """Compares (nested) lists, tuples and dictionaries of keyword arguments, including
+    numpy arrays, by value.
+
+    :param kwargs_1: keyword arguments (list of dicts, dict, array, float, ...)
+    :param kwargs_2: keyword arguments (list of dicts, dict, array, float, ...)
+    :return: bool, True if equal
+    """
+    if kwargs_1 is kwargs_2:
+        return True
+    if isinstance(kwargs_1, dict):
+        if not isinstance(kwargs_2, dict) or kwargs_1.keys() != kwargs_2.keys():
+            return False
+        for key in kwargs_1:
+            if not kwargs_equal(kwargs_1[key], kwargs_2[key]):
+                return False
+        return True
+    if isinstance(kwargs_1, (list, tuple)):
+        if not isinstance(kwargs_2, (list, tuple)) or len(kwargs_1) != len(kwargs_2):
+            return False
+        for value_1, value_2 in zip(kwargs_1, kwargs_2):
+            if not kwargs_equal(value_1, value_2):
+                return False
+        return True
+    if isinstance(kwargs_1, np.ndarray) or isinstance(kwargs_2, np.ndarray):
+        try:
+            return bool(np.array_equal(kwargs_1, kwargs_2))
+        except Exception:
+            return False
+    try:
+        return bool(kwargs_1 == kwargs_2)
+    except Exception:
+        return False
+
+
+class KwargsCache(object):
+    """Memory of the result of the last evaluation of a computation depending on keyword
+    arguments (e.g. the source plane coordinates of a grid depending on the lens model
+    keyword arguments).
+
+    The keyword arguments are compared by value with a copy of the ones of the stored
+    evaluation, such that in-place changes of them are detected. Large arrays that are
+    not changed between evaluations (e.g. the coordinate grid) are instead compared by
+    identity.
+    """
+
+    def __init__(self):
+        self._arrays = None
+        self._kwargs = None
+        self._value = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        """
+
+        :return: number of evaluations returned from the cache
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+
+        :return: number of evaluations not found in the cache
+        """
+        return self._misses
+
+    def get(self, arrays, kwargs):
+        """Stored value of the evaluation with the same arrays and keyword arguments.
+
+        :param arrays: tuple of arrays (compared by identity)
+        :param kwargs: keyword arguments (compared by value)
+        :return: stored value, or None if the arrays or the keyword arguments changed
+        """
+        if (
+            self._arrays is not None
+            and len(arrays) == len(self._arrays)
+            and all([a is b for a, b in zip(arrays, self._arrays)])
+            and kwargs_equal(kwargs, self._kwargs)
+        ):
+            self._hits += 1
+            return self._value
+        self._misses += 1
+        return None
+
+    def set(self, value, arrays, kwargs):
+        """Stores the value of an evaluation.
+
+        :param value: value to be stored
+        :param arrays: tuple of arrays (compared by identity)
+        :param kwargs: keyword arguments (compared by value)
+        :return: None
+        """
+        self._arrays = tuple(arrays)
+        self._kwargs = copy.deepcopy(kwargs)
+        self._value = value
+
+    def reset(self):
+        """Deletes the stored value.
+
+        :return: None
+        """
+        self._arrays = None
+        self._kwargs = None
+        self._value = None
+
+
+class GridCache(KwargsCache):
+    """Memory of the results of a computation depending on keyword arguments on several
+    coordinate grids (e.g. the source plane coordinates of the supersampled pixel grids
+    of a fixed lens model).
+
+    Contrary to KwargsCache, the arrays are compared by value through a compact
+    fingerprint (hash) of their content, such that re-created but identical coordinate
+    grids (e.g. after a PSF update) are recognized. The results of up to max_grids
+    different grids are kept. All of them are deleted when the keyword arguments change.
+    """
+
+    def __init__(self, max_grids=4):
+        """
+
+        :param max_grids: int, maximum number of grids of which the results are kept
+        """
+        super(GridCache, self).__init__()
+        self._max_grids = max(int(max_grids), 1)
+        self._entries = []
+
+    @property
+    def num_grids(self):
+        """
+
+        :return: number of grids of which results are stored
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def _fingerprint(arrays):
+        """Compact fingerprint of the content of the arrays.
+
+        :param arrays: tuple of arrays
+        :return: tuple of (shape, hash digest) of the arrays
+        """
+        fingerprint = []
+        for array in arrays:
+            array = np.ascontiguousarray(array, dtype=float)
+            digest = hashlib.blake2b(array, digest_size=16).digest()
+            fingerprint.append((np.shape(array), digest))
+        return tuple(fingerprint)
+
+    def get(self, arrays, kwargs):
+        """Stored value of the evaluation with the same arrays and keyword arguments.
+
+        :param arrays: tuple of arrays (compared by value)
+        :param kwargs: keyword arguments (compared by value)
+        :return: stored value, or None if not stored
+        """
+        if len(self._entries) > 0 and kwargs_equal(kwargs, self._kwargs):
+            fingerprint = self._fingerprint(arrays)
+            for fingerprint_i, value in self._entries:
+                if fingerprint_i == fingerprint:
+                    self._hits += 1
+                    return value
+        self._misses += 1
+        return None
+
+    def set(self, value, arrays, kwargs):
+        """Stores the value of an evaluation. The values of the other grids are deleted
+        if the keyword arguments changed.
+
+        :param value: value to be stored
+        :param arrays: tuple of arrays (compared by value)
+        :param kwargs: keyword arguments (compared by value)
+        :return: None
+        """
+        if not kwargs_equal(kwargs, self._kwargs):
+            self._entries = []
+            self._kwargs = copy.deepcopy(kwargs)
+        self._entries.append((self._fingerprint(arrays), value))
+        if len(self._entries) > self._max_grids:
+            self._entries.pop(0)
+
+    def reset(self):
+        """Deletes all stored values.
+
+        :return: None
+        """
+        super(GridCache, self).reset()
+        self._entries = []
@@ -22,6 +22,7 @@ def create_class_instances(
     z_source_convention=None,
     lens_redshift_list=None,
     lens_profile_kwargs_list=None,
+    lens_model_backend=None,
     multi_plane=False,
     distance_ratio_sampling=False,
     cosmology_sampling=False,
@@ -68,6 +69,7 @@ def create_class_instances(
     :param z_source_convention: float, redshift of a source to define the reduced deflection angles of the lens models.
         If None, 'z_source' is used.
     :param lens_redshift_list: None or list of floats in the same order of the lens_model_list
+    :param lens_model_backend: None or 'numba', backend of the lens profiles (see LensModel)
     :param lens_profile_kwargs_list: list of dicts, keyword arguments used to initialize deflector profile
         classes in the same order of the lens_model_list. If any of the profile_kwargs are None, then that
         profile will be initialized using default settings.
@@ -179,6 +181,7 @@ def create_class_instances(
         profile_kwargs_list=lens_profile_kwargs_list,
         decouple_multi_plane=decouple_multi_plane,
         kwargs_multiplane_model=kwargs_multiplane_model,
+        backend=lens_model_backend,
     )
 
     if kwargs_multiplane_model_point_source is not None:
@@ -194,6 +197,7 @@ def create_class_instances(
             profile_kwargs_list=lens_profile_kwargs_list,
             decouple_multi_plane=decouple_multi_plane,
             kwargs_multiplane_model=kwargs_multiplane_model_point_source,
+            backend=lens_model_backend,
         )
     else:
         lens_model_class_point_source = lens_model_class
@@ -359,6 +363,7 @@ def create_im_sim(
     band_index=0,
     kwargs_pixelbased=None,
     linear_solver=True,
+    wls_solver="inv",
 ):
     """
 
@@ -376,6 +381,8 @@ def create_im_sim(
     :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver (see SLITronomy documentation)
     :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
      that they get overwritten by the linear solver solution.
+    :param wls_solver: string, solver of the weighted linear least square problem. Options are 'inv' (default) and
+     'cholesky' (see ImageLinearFit)
     :return: MultiBand class instance
     """
     if linear_solver is False and multi_band_type not in [
@@ -396,6 +403,7 @@ def create_im_sim(
             compute_bool=bands_compute,
             likelihood_mask_list=image_likelihood_mask_list,
             linear_solver=linear_solver,
+            wls_solver=wls_solver,
         )
     elif multi_band_type == "joint-linear":
         from lenstronomy.ImSim.MultiBand.joint_linear import JointLinear
@@ -405,6 +413,7 @@ def create_im_sim(
             kwargs_model,
             compute_bool=bands_compute,
             likelihood_mask_list=image_likelihood_mask_list,
+            wls_solver=wls_solver,
         )
     elif multi_band_type == "single-band":
         from lenstronomy.ImSim.MultiBand.single_band_multi_model import (
@@ -418,6 +427,7 @@ def create_im_sim(
             band_index=band_index,
             kwargs_pixelbased=kwargs_pixelbased,
             linear_solver=linear_solver,
+            wls_solver=wls_solver,
         )
     else:
         raise ValueError("type %s is not supported!" % multi_band_type)
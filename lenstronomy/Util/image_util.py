@@ -236,6 +236,29 @@ def re_size(image, factor=1):
         )
 
 
+@export
+def re_size_batch(images, factor=1):
+    """Re-sizes a stack of images with shape (n, nx, ny) to (n, nx/factor, ny/factor).
+
+    :param images: 3d array with shape (n, nx, ny)
+    :param factor: integer >=1
+    :return: 3d array of re-sized images
+    """
+    if factor < 1:
+        raise ValueError("scaling factor in re-sizing %s < 1" % factor)
+    elif factor == 1:
+        return images
+    f = int(factor)
+    n, nx, ny = np.shape(images)
+    if int(nx / f) == nx / f and int(ny / f) == ny / f:
+        small = images.reshape([n, int(nx / f), f, int(ny / f), f]).mean(4).mean(2)
+        return small
+    else:
+        raise ValueError(
+            "scaling with factor %s is not possible with grid size %s, %s" % (f, nx, ny)
+        )
+
+
 @export
 def rebin_image(bin_size, image, wht_map, sigma_bkg, ra_coords, dec_coords, idex_mask):
     """Re-bins pixels, updates cutout image, wht_map, sigma_bkg, coordinates, PSF.
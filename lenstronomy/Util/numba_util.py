@@ -17,6 +17,7 @@ parallel = numba_conf["parallel"]
 numba_enabled = numba_conf["enable"] and not environ.get("NUMBA_DISABLE_JIT", False)
 fastmath = numba_conf["fastmath"]
 error_model = numba_conf["error_model"]
+prange_min_size = numba_conf.get("prange_min_size", 100000)
 
 if numba_enabled:
     try:
@@ -27,6 +28,17 @@ if numba_enabled:
         numba = None
         extending = None
 
+prange_enabled = numba_enabled and numba_conf.get("prange", False)
+threading_layer = numba_conf.get("threading_layer", "workqueue")
+if prange_enabled and threading_layer is not None:
+    # the TBB layer breaks fork-based multiprocessing pools after a prange kernel ran
+    if "NUMBA_THREADING_LAYER" not in environ:
+        numba.config.THREADING_LAYER = threading_layer
+if numba_enabled:
+    prange = numba.prange
+else:
+    prange = range
+
 __all__ = ["jit"]
 
 
@@ -0,0 +1,166 @@
+import time
+from contextlib import nullcontext
+
+__all__ = ["Profiler", "NullProfiler"]
+
+
+class Profiler(object):
+    """Records the wall time and the number of calls of named stages of a computation
+    (e.g. the components of a likelihood evaluation).
+
+    Usage::
+
+        profiler = Profiler()
+        with profiler.timer("ray_shooting"):
+            x_source, y_source = lens_model.ray_shooting(x, y, kwargs_lens)
+        profiler.print_report()
+
+    Nested stages are recorded independently, i.e. the time of a stage includes the
+    time of all the stages executed within it.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._calls = {}
+        self._time = {}
+
+    def timer(self, name):
+        """Context manager measuring the wall time of the enclosed code block.
+
+        :param name: string, name of the stage
+        :return: context manager
+        """
+        return _Timer(self, name)
+
+    def add(self, name, time_elapsed, calls=1):
+        """Adds a measurement to a stage.
+
+        :param name: string, name of the stage
+        :param time_elapsed: wall time in seconds
+        :param calls: int, number of calls to be added
+        :return: None
+        """
+        self._calls[name] = self._calls.get(name, 0) + calls
+        self._time[name] = self._time.get(name, 0.0) + time_elapsed
+
+    def reset(self):
+        """Deletes all measurements.
+
+        :return: None
+        """
+        self._calls = {}
+        self._time = {}
+
+    def report(self):
+        """Structured report of all measurements in the order the stages were first
+        called.
+
+        :return: dictionary with the stage names as keys and dictionaries with entries
+            'calls', 'total_time' and 'mean_time' (in seconds) as values
+        """
+        report = {}
+        for name, calls in self._calls.items():
+            total_time = self._time[name]
+            report[name] = {
+                "calls": calls,
+                "total_time": total_time,
+                "mean_time": total_time / calls if calls > 0 else 0.0,
+            }
+        return report
+
+    @staticmethod
+    def format_report(report, title=None):
+        """Table of a report as returned by report().
+
+        :param report: dictionary as returned by report()
+        :param title: string, optional title of the table
+        :return: string
+        """
+        lines = []
+        if title is not None:
+            lines.append(title)
+        width = max([len(name) for name in report] + [5])
+        lines.append(
+            "{:<{w}} {:>10} {:>14} {:>14}".format(
+                "stage", "calls", "total [s]", "mean [ms]", w=width
+            )
+        )
+        for name, stats in report.items():
+            lines.append(
+                "{:<{w}} {:>10d} {:>14.4f} {:>14.4f}".format(
+                    name,
+                    stats["calls"],
+                    stats["total_time"],
+                    stats["mean_time"] * 1000,
+                    w=width,
+                )
+            )
+        return "\n".join(lines)
+
+    def print_report(self, title=None):
+        """Prints the table of the current measurements.
+
+        :param title: string, optional title of the table
+        :return: None
+        """
+        print(self.format_report(self.report(), title=title))
+
+
+class NullProfiler(object):
+    """Profiler with the same interface as Profiler() that does not record anything.
+
+    It is used as the default of the instrumented classes such that the instrumentation
+    adds no measurable cost when profiling is turned off.
+    """
+
+    enabled = False
+    _null_context = nullcontext()
+
+    def timer(self, name):
+        """
+
+        :param name: string, name of the stage (ignored)
+        :return: context manager doing nothing
+        """
+        return self._null_context
+
+    def add(self, name, time_elapsed, calls=1):
+        """Ignores the measurement.
+
+        :return: None
+        """
+        pass
+
+    def reset(self):
+        """
+
+        :return: None
+        """
+        pass
+
+    def report(self):
+        """
+
+        :return: empty dictionary
+        """
+        return {}
+
+
+class _Timer(object):
+    """Context manager adding the elapsed wall time to a stage of a Profiler()."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._profiler.add(self._name, time.perf_counter() - self._start)
+        return False
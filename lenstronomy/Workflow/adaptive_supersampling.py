@@ -0,0 +1,186 @@
+import copy
+
+import numpy as np
+from scipy import ndimage
+
+from lenstronomy.ImSim.MultiBand.single_band_multi_model import SingleBandMultiModel
+
+__all__ = ["AdaptiveSupersampling"]
+
+
+class AdaptiveSupersampling(object):
+    """Automatic choice of the pixels to be super-sampled in the 'adaptive' compute_mode
+    of the Numerics() class.
+
+    The need of super-sampling of a pixel is estimated from the model at given
+    parameters (e.g. the current best fit) as the difference between the pixel-averaged
+    surface brightness (evaluated at the super-sampling factor) and the surface
+    brightness evaluated at the pixel center. This difference is dominated by the
+    gradient of the source surface brightness times the lensing magnification for the
+    lensed source and by the curvature of the lens light. The lensed source and the lens
+    light are compared separately such that their contributions do not cancel. Pixels
+    where the difference exceeds a fraction of the noise are super-sampled.
+    """
+
+    def __init__(
+        self,
+        multi_band_list,
+        kwargs_model,
+        likelihood_mask_list=None,
+        band_index=0,
+        kwargs_pixelbased=None,
+    ):
+        """
+
+        :param multi_band_list: list of imaging band configurations [[kwargs_data, kwargs_psf, kwargs_numerics],[...], ...]
+        :param kwargs_model: model option keyword arguments
+        :param likelihood_mask_list: list of likelihood masks (booleans with size of the individual images
+        :param band_index: integer, index of the imaging band to model
+        :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
+         (see SLITronomy documentation)
+        """
+        self._multi_band_list = multi_band_list
+        self._kwargs_model = kwargs_model
+        self._likelihood_mask_list = likelihood_mask_list
+        self._band_index = band_index
+        self._kwargs_pixelbased = kwargs_pixelbased
+        self._image_model = self._image_model_class(
+            multi_band_list[band_index][2], linear_solver=True
+        )
+
+    def supersampling_error(self, kwargs_params, supersampling_factor):
+        """Absolute difference between the pixel-averaged and the pixel-center surface
+        brightness (before convolution) of the lensed source and the lens light.
+
+        :param kwargs_params: keyword arguments of the model parameters ('kwargs_lens',
+            'kwargs_source', 'kwargs_lens_light', 'kwargs_ps', 'kwargs_special',
+            'kwargs_extinction'). The linear amplitudes are solved for.
+        :param supersampling_factor: int, super-sampling factor of the pixel-averaged
+            surface brightness
+        :return: 2d array of the difference (in units of the data) and 2d array of the
+            model of the data
+        """
+        kwargs = self._kwargs_linear_solved(kwargs_params)
+        model = self._image_model.image(**kwargs)
+        image_high_res = self._image_model_class(
+            {"supersampling_factor": int(supersampling_factor)}, linear_solver=False
+        )
+        image_low_res = self._image_model_class(
+            {"supersampling_factor": 1}, linear_solver=False
+        )
+        error = np.zeros_like(model)
+        for source_add, lens_light_add in [(True, False), (False, True)]:
+            flux_high_res, flux_low_res = [
+                image_model.image(
+                    unconvolved=True,
+                    source_add=source_add,
+                    lens_light_add=lens_light_add,
+                    point_source_add=False,
+                    **kwargs
+                )
+                for image_model in [image_high_res, image_low_res]
+            ]
+            error += np.abs(flux_high_res - flux_low_res)
+        return error, model
+
+    def supersampled_indexes(
+        self, kwargs_params, supersampling_factor, threshold=0.1, num_pixel_buffer=1
+    ):
+        """Pixels to be super-sampled.
+
+        :param kwargs_params: keyword arguments of the model parameters
+        :param supersampling_factor: int, super-sampling factor of the super-sampled
+            pixels
+        :param threshold: float, pixels with a super-sampling error larger than
+            threshold times the noise of the pixel are super-sampled
+        :param num_pixel_buffer: int, number of pixels the super-sampled region is
+            extended by
+        :return: 2d boolean array of pixels to be super-sampled
+        """
+        error, model = self.supersampling_error(kwargs_params, supersampling_factor)
+        noise = np.sqrt(self._image_model.Data.C_D_model(model))
+        supersampled = error > threshold * noise
+        if num_pixel_buffer > 0 and np.any(supersampled):
+            supersampled = ndimage.binary_dilation(
+                supersampled, iterations=int(num_pixel_buffer)
+            )
+        mask = self._image_model.likelihood_mask
+        return supersampled & (mask > 0)
+
+    def update_kwargs_numerics(
+        self,
+        kwargs_params,
+        supersampling_factor=None,
+        threshold=0.1,
+        num_pixel_buffer=1,
+    ):
+        """Numerics settings of the band in 'adaptive' compute_mode with the pixels to
+        be super-sampled at the given model.
+
+        :param kwargs_params: keyword arguments of the model parameters
+        :param supersampling_factor: int, super-sampling factor of the super-sampled
+            pixels. If None, uses the supersampling_factor of the current numerics
+            settings of the band.
+        :param threshold: float, pixels with a super-sampling error larger than
+            threshold times the noise of the pixel are super-sampled
+        :param num_pixel_buffer: int, number of pixels the super-sampled region is
+            extended by
+        :return: updated kwargs_numerics (copy)
+        """
+        kwargs_numerics = copy.deepcopy(self._multi_band_list[self._band_index][2])
+        if supersampling_factor is None:
+            supersampling_factor = kwargs_numerics.get("supersampling_factor", 1)
+        if supersampling_factor < 2:
+            raise ValueError(
+                "adaptive super-sampling requires a supersampling_factor > 1, got %s."
+                % supersampling_factor
+            )
+        kwargs_numerics["supersampled_indexes"] = self.supersampled_indexes(
+            kwargs_params,
+            supersampling_factor,
+            threshold=threshold,
+            num_pixel_buffer=num_pixel_buffer,
+        )
+        kwargs_numerics["supersampling_factor"] = int(supersampling_factor)
+        kwargs_numerics["compute_mode"] = "adaptive"
+        return kwargs_numerics
+
+    def _image_model_class(self, kwargs_numerics, linear_solver):
+        """Model of the band with different numerics settings.
+
+        :param kwargs_numerics: keyword arguments of the Numerics() class
+        :param linear_solver: bool, see SingleBandMultiModel
+        :return: SingleBandMultiModel instance
+        """
+        multi_band_list = list(self._multi_band_list)
+        kwargs_data, kwargs_psf, _ = multi_band_list[self._band_index]
+        multi_band_list[self._band_index] = [kwargs_data, kwargs_psf, kwargs_numerics]
+        return SingleBandMultiModel(
+            multi_band_list,
+            self._kwargs_model,
+            likelihood_mask_list=self._likelihood_mask_list,
+            band_index=self._band_index,
+            kwargs_pixelbased=self._kwargs_pixelbased,
+            linear_solver=linear_solver,
+        )
+
+    def _kwargs_linear_solved(self, kwargs_params):
+        """Model parameters with the linear amplitudes solved for.
+
+        :param kwargs_params: keyword arguments of the model parameters
+        :return: keyword arguments of SingleBandMultiModel.image()
+        """
+        kwargs = {
+            key: copy.deepcopy(kwargs_params.get(key, None))
+            for key in [
+                "kwargs_lens",
+                "kwargs_source",
+                "kwargs_lens_light",
+                "kwargs_ps",
+                "kwargs_extinction",
+                "kwargs_special",
+            ]
+        }
+        # solves for the linear amplitudes and updates the keyword arguments with them
+        self._image_model.image_linear_solve(**kwargs)
+        return kwargs
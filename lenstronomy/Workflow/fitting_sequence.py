@@ -1,12 +1,16 @@
 import copy
 
+import dill
+
 from lenstronomy.Workflow.psf_fitting import PsfFitting
+from lenstronomy.Workflow.adaptive_supersampling import AdaptiveSupersampling
 from lenstronomy.Workflow.alignment_matching import AlignmentFitting
 from lenstronomy.Workflow.flux_calibration import FluxCalibration
 from lenstronomy.ImSim.MultiBand.single_band_multi_model import SingleBandMultiModel
 from lenstronomy.Workflow.multi_band_manager import MultiBandUpdateManager
 from lenstronomy.Sampling.likelihood import LikelihoodModule
 from lenstronomy.Sampling.sampler import Sampler
+from lenstronomy.Sampling.Pool.pool_manager import PoolManager
 from lenstronomy.Sampling.Samplers.multinest_sampler import MultiNestSampler
 from lenstronomy.Sampling.Samplers.polychord_sampler import DyPolyChordSampler
 from lenstronomy.Sampling.Samplers.dynesty_sampler import DynestySampler
@@ -14,6 +18,7 @@ from lenstronomy.Sampling.Samplers.nautilus_sampler import NautilusSampler
 from lenstronomy.Sampling.Samplers.cobaya_sampler import CobayaSampler
 import numpy as np
 import lenstronomy.Util.analysis_util as analysis_util
+from lenstronomy.Util.profiler import Profiler
 
 __all__ = ["FittingSequence"]
 
@@ -33,6 +38,9 @@ class FittingSequence(object):
         kwargs_params,
         mpi=False,
         verbose=True,
+        profiling=False,
+        pool_processes=None,
+        pool_shared_memory=False,
     ):
         """
 
@@ -55,6 +63,16 @@ class FittingSequence(object):
         :param mpi: MPI option (bool), if True, will launch an MPI Pool job for the steps in the fitting sequence where
          possible
         :param verbose: bool, if True prints temporary results and indicators of the fitting process
+        :param profiling: bool, if True, records wall time and number of calls of the likelihood components and the
+         stages of the imaging likelihood for each step of the fitting sequence (see profiling_reports). Evaluations
+         performed in other processes (MPI or multiprocessing pools) are not recorded.
+        :param pool_processes: int or None, if set (and mpi=False), the PSO and MCMC steps are evaluated in a
+         persistent pool of this number of worker processes owned by this class (see PoolManager). The pool is started
+         once and the likelihood is only transferred to the workers when the state of the fit changed. The
+         threadCount arguments of the individual steps are then ignored. Use close_pool() to terminate the workers.
+        :param pool_shared_memory: bool, if True, the data arrays of the likelihood (images, noise maps, masks, PSF
+         kernels, coordinate grids, ...) are placed in shared memory and read by all workers of the persistent pool
+         instead of each worker holding a copy (only applicable with pool_processes)
         """
         self.kwargs_data_joint = kwargs_data_joint
         self.multi_band_list = kwargs_data_joint.get("multi_band_list", [])
@@ -71,6 +89,20 @@ class FittingSequence(object):
         self._mcmc_init_samples = None
         self._psf_iteration_memory = []
         self._psf_iteration_index = 0  # index of the sequence of the PSF iteration (how many times it is being run)
+        if profiling is True:
+            self._profiler = Profiler()
+        else:
+            self._profiler = None
+        self._profiling_reports = []
+        if pool_processes is not None and mpi is False:
+            self._pool_manager = PoolManager(
+                processes=pool_processes, shared_memory=pool_shared_memory
+            )
+        else:
+            self._pool_manager = None
+        self._likelihood_state = None
+        self._sampling_likelihood_module = None
+        self._kwargs_adaptive_supersampling = None
 
     @property
     def kwargs_fixed(self):
@@ -80,6 +112,17 @@ class FittingSequence(object):
         """
         return self._updateManager.fixed_kwargs
 
+    @property
+    def profiling_reports(self):
+        """Profiling reports of the likelihood evaluations of all fitting steps executed
+        (only available with profiling=True).
+
+        :return: list of [fitting_type, report] with report being a dictionary with the
+            stage names as keys and dictionaries with entries 'calls', 'total_time' and
+            'mean_time' (in seconds) as values, see Profiler.report()
+        """
+        return self._profiling_reports
+
     def fit_sequence(self, fitting_list):
         """
 
@@ -91,6 +134,8 @@ class FittingSequence(object):
         for i, fitting in enumerate(fitting_list):
             fitting_type = fitting[0]
             kwargs = fitting[1]
+            if self._profiler is not None:
+                self._profiler.reset()
 
             if fitting_type in [
                 "PSO",
@@ -122,6 +167,9 @@ class FittingSequence(object):
             elif fitting_type == "psf_iteration":
                 self.psf_iteration(**kwargs)
 
+            elif fitting_type == "adaptive_supersampling":
+                self.adaptive_supersampling(**kwargs)
+
             elif fitting_type == "align_images":
                 self.align_images(**kwargs)
 
@@ -203,12 +251,40 @@ class FittingSequence(object):
                     "fitting_sequence {} is not supported. Please use: 'PSO', 'SIMPLEX', "
                     "'MCMC' or 'emcee', 'zeus', 'Cobaya', "
                     "'dynesty', 'dyPolyChord',  'Multinest', 'Nautilus, '"
-                    "'psf_iteration', 'restart', 'update_settings', 'calibrate_images' or "
-                    "'align_images'".format(fitting_type)
+                    "'psf_iteration', 'adaptive_supersampling', 'restart', 'update_settings', "
+                    "'calibrate_images' or 'align_images'".format(fitting_type)
                 )
+            if self._kwargs_adaptive_supersampling is not None and fitting_type in [
+                "PSO",
+                "SIMPLEX",
+                "emcee",
+                "zeus",
+                "Nautilus",
+            ]:
+                self._adaptive_supersampling(**self._kwargs_adaptive_supersampling)
+            if self._profiler is not None:
+                self._profiling_report(fitting_type)
 
         return chain_list
 
+    def _profiling_report(self, fitting_type):
+        """Stores (and prints if verbose) the profiling report of the likelihood
+        evaluations of a fitting step.
+
+        :param fitting_type: string, name of the fitting step
+        :return: None
+        """
+        report = self._profiler.report()
+        if len(report) == 0:
+            return
+        self._profiling_reports.append([fitting_type, report])
+        if self._verbose is True:
+            print(
+                Profiler.format_report(
+                    report, title="Likelihood profiling of %s:" % fitting_type
+                )
+            )
+
     def best_fit(self, bijective=False):
         """
 
@@ -273,11 +349,71 @@ class FittingSequence(object):
         """
         kwargs_model = self._updateManager.kwargs_model
         kwargs_likelihood = self._updateManager.kwargs_likelihood
+        if self._profiler is not None:
+            kwargs_likelihood = dict(kwargs_likelihood, profiler=self._profiler)
         likelihoodModule = LikelihoodModule(
             self.kwargs_data_joint, kwargs_model, self.param_class, **kwargs_likelihood
         )
         return likelihoodModule
 
+    @property
+    def pool_manager(self):
+        """
+
+        :return: PoolManager instance of the persistent worker pool (None if not used)
+        """
+        return self._pool_manager
+
+    def close_pool(self):
+        """Terminates the worker processes of the persistent pool (if used). The pool is
+        restarted when needed by a subsequent fitting step.
+
+        :return: None
+        """
+        if self._pool_manager is not None:
+            self._pool_manager.close()
+
+    def _sampling_likelihood(self):
+        """Likelihood module for the samplers. With a persistent pool, the same instance
+        is returned as long as the state of the UpdateManager is unchanged, such that
+        the likelihood is not transferred to the workers again.
+
+        :return: LikelihoodModule instance
+        """
+        if self._pool_manager is None:
+            return self.likelihoodModule
+        state = self._likelihood_state_key()
+        if (
+            state is None
+            or state != self._likelihood_state
+            or self._sampling_likelihood_module is None
+        ):
+            self._sampling_likelihood_module = self.likelihoodModule
+            self._likelihood_state = state
+        return self._sampling_likelihood_module
+
+    def _likelihood_state_key(self):
+        """Serialized state of the data settings and the UpdateManager defining the
+        likelihood.
+
+        :return: bytes, or None if the state can not be serialized
+        """
+        try:
+            return dill.dumps(
+                [
+                    self.kwargs_data_joint,
+                    self._updateManager.kwargs_model,
+                    self._updateManager.kwargs_constraints,
+                    self._updateManager.kwargs_likelihood,
+                    self._updateManager.fixed_kwargs,
+                    self._updateManager.lower_kwargs,
+                    self._updateManager.upper_kwargs,
+                    self._updateManager.parameter_state,
+                ]
+            )
+        except Exception:
+            return None
+
     def simplex(self, n_iterations, method="Nelder-Mead"):
         """Downhill simplex optimization using the Nelder-Mead algorithm.
 
@@ -336,7 +472,10 @@ class FittingSequence(object):
         """
         param_class = self.param_class
         # run PSO
-        mcmc_class = Sampler(likelihoodModule=self.likelihoodModule)
+        mcmc_class = Sampler(
+            likelihoodModule=self._sampling_likelihood(),
+            pool_manager=self._pool_manager,
+        )
         kwargs_temp = self._updateManager.parameter_state
         mean_start = param_class.kwargs2args(**kwargs_temp)
         kwargs_sigma = self._updateManager.sigma_kwargs
@@ -399,7 +538,13 @@ class FittingSequence(object):
         return output
 
     def pso(
-        self, n_particles, n_iterations, sigma_scale=1, print_key="PSO", threadCount=1
+        self,
+        n_particles,
+        n_iterations,
+        sigma_scale=1,
+        print_key="PSO",
+        threadCount=1,
+        vectorized=False,
     ):
         """Particle Swarm Optimization.
 
@@ -409,6 +554,8 @@ class FittingSequence(object):
             width in the initial settings
         :param print_key: string, printed text when executing this routine
         :param threadCount: number of CPU threads. If MPI option is set, threadCount=1
+        :param vectorized: bool, if True, evaluates all particles of an iteration in a
+            single call of the likelihood (see ParticleSwarmOptimizer)
         :return: result of the best fit, the PSO chain of the best fit parameter after
             each iteration [lnlikelihood, parameters, velocities], list of parameters in
             same order as in chain
@@ -430,7 +577,10 @@ class FittingSequence(object):
 
         num_param, param_list = param_class.num_param()
         # run PSO
-        sampler = Sampler(likelihoodModule=self.likelihoodModule)
+        sampler = Sampler(
+            likelihoodModule=self._sampling_likelihood(),
+            pool_manager=self._pool_manager,
+        )
         result, chain = sampler.pso(
             n_particles,
             n_iterations,
@@ -441,6 +591,7 @@ class FittingSequence(object):
             mpi=self._mpi,
             print_key=print_key,
             verbose=self._verbose,
+            vectorized=vectorized,
         )
         kwargs_result = param_class.args2kwargs(result, bijective=True)
         return kwargs_result, chain, param_list
@@ -617,6 +768,86 @@ class FittingSequence(object):
         self._psf_iteration_index += 1
         return 0
 
+    def adaptive_supersampling(
+        self,
+        supersampling_factor=None,
+        threshold=0.1,
+        num_pixel_buffer=1,
+        compute_bands=None,
+        rebuild=False,
+    ):
+        """Sets the numerics of the bands to the 'adaptive' compute_mode with the pixels
+        to be super-sampled estimated from the current best fit (see
+        AdaptiveSupersampling).
+
+        :param supersampling_factor: int, super-sampling factor of the super-sampled
+            pixels. If None, uses the supersampling_factor of the numerics settings of
+            the band.
+        :param threshold: float, pixels with a difference between pixel-averaged and
+            pixel-center surface brightness larger than threshold times the noise are
+            super-sampled
+        :param num_pixel_buffer: int, number of pixels the super-sampled region is
+            extended by
+        :param compute_bands: bool list, if multiple bands, this process can be limited
+            to a subset of bands
+        :param rebuild: bool, if True, the super-sampled pixels are re-computed with the
+            same settings after each subsequent PSO, SIMPLEX, MCMC and Nautilus step
+        :return: 0, updated numerics settings are stored in self.multi_band_list
+        """
+        kwargs_adaptive = {
+            "supersampling_factor": supersampling_factor,
+            "threshold": threshold,
+            "num_pixel_buffer": num_pixel_buffer,
+            "compute_bands": compute_bands,
+        }
+        if rebuild is True:
+            self._kwargs_adaptive_supersampling = kwargs_adaptive
+        else:
+            self._kwargs_adaptive_supersampling = None
+        self._adaptive_supersampling(**kwargs_adaptive)
+        return 0
+
+    def _adaptive_supersampling(
+        self, supersampling_factor, threshold, num_pixel_buffer, compute_bands
+    ):
+        """Updates the super-sampled pixels of the numerics settings, see
+        adaptive_supersampling().
+
+        :return: None
+        """
+        kwargs_model = self._updateManager.kwargs_model
+        kwargs_likelihood = self._updateManager.kwargs_likelihood
+        likelihood_mask_list = kwargs_likelihood.get("image_likelihood_mask_list", None)
+        kwargs_pixelbased = kwargs_likelihood.get("kwargs_pixelbased", None)
+        kwargs_temp = self.best_fit(bijective=False)
+        if compute_bands is None:
+            compute_bands = [True] * len(self.multi_band_list)
+        for band_index in range(len(self.multi_band_list)):
+            if compute_bands[band_index] is True:
+                adaptive = AdaptiveSupersampling(
+                    self.multi_band_list,
+                    kwargs_model,
+                    likelihood_mask_list=likelihood_mask_list,
+                    band_index=band_index,
+                    kwargs_pixelbased=kwargs_pixelbased,
+                )
+                kwargs_numerics = adaptive.update_kwargs_numerics(
+                    kwargs_temp,
+                    supersampling_factor=supersampling_factor,
+                    threshold=threshold,
+                    num_pixel_buffer=num_pixel_buffer,
+                )
+                self.multi_band_list[band_index][2] = kwargs_numerics
+                if self._verbose:
+                    print(
+                        "band %s: %s pixels super-sampled by a factor %s"
+                        % (
+                            band_index,
+                            np.sum(kwargs_numerics["supersampled_indexes"]),
+                            kwargs_numerics["supersampling_factor"],
+                        )
+                    )
+
     def align_images(
         self,
         n_particles=10,
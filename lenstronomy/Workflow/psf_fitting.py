@@ -99,63 +99,72 @@ class PsfFitting(object):
         :return: keyword argument of PSF constructor for PSF() class with updated PSF
         """
         self._image_model_class.PointSource.set_save_cache(True)
-        if "kernel_point_source_init" not in kwargs_psf:
-            kernel_point_source_init = copy.deepcopy(kwargs_psf["kernel_point_source"])
-        else:
-            kernel_point_source_init = kwargs_psf["kernel_point_source_init"]
-        kwargs_psf_new = copy.deepcopy(kwargs_psf)
-        kwargs_psf_final = copy.deepcopy(kwargs_psf)
-        if "psf_variance_map" in kwargs_psf:
-            error_map_final = kwargs_psf["psf_variance_map"]
-        else:
-            error_map_final = np.zeros_like(kernel_point_source_init)
-        error_map_init = copy.deepcopy(error_map_final)
-        psf_class = PSF(**kwargs_psf)
-        self._image_model_class.update_psf(psf_class)
-        _kwargs_params = copy.deepcopy(kwargs_params)
-        _kwargs_params.pop("kwargs_tracer_source", None)
-        logL_before, _ = self._image_model_class.likelihood_data_given_model(
-            **_kwargs_params
-        )
-        logL_best = copy.deepcopy(logL_before)
-        i_best = 0
-
-        corner_mask = None
-        if "corner_symmetry" in kwargs_psf_update.keys():
-            if type(kwargs_psf_update["corner_symmetry"]) == int:
-                psf_symmetry = kwargs_psf_update["psf_symmetry"]
-                kernel_size = len(kwargs_psf["kernel_point_source"])
-                corner_mask = self.calc_cornermask(kernel_size, psf_symmetry)
-
-        for i in range(num_iter):
-            kwargs_psf_new, logL_after, error_map = self.update_psf(
-                kwargs_psf_new, _kwargs_params, corner_mask, **kwargs_psf_update
-            )
-
-            if logL_after > logL_best:
-                kwargs_psf_final = copy.deepcopy(kwargs_psf_new)
-                error_map_final = copy.deepcopy(error_map)
-                logL_best = logL_after
-                i_best = i + 1
+        # the lens model is fixed, the source plane coordinates are only computed once
+        static_lens = self._image_model_class.static_lens
+        self._image_model_class.set_static_lens(True)
+        try:
+            if "kernel_point_source_init" not in kwargs_psf:
+                kernel_point_source_init = copy.deepcopy(
+                    kwargs_psf["kernel_point_source"]
+                )
             else:
-                if not no_break:
-                    if verbose:
-                        print(
-                            "iterative PSF reconstruction makes reconstruction worse in step %s - aborted"
-                            % i
-                        )
-                    break
-        if verbose is True:
-            print("iteration of step %s gave best reconstruction." % i_best)
-            print(
-                "log likelihood before: %s and log likelihood after: %s"
-                % (logL_before, logL_best)
-            )
-        if keep_psf_variance_map is True:
-            kwargs_psf_final["psf_variance_map"] = error_map_init
-        else:
-            kwargs_psf_final["psf_variance_map"] = error_map_final
-        kwargs_psf_final["kernel_point_source_init"] = kernel_point_source_init
+                kernel_point_source_init = kwargs_psf["kernel_point_source_init"]
+            kwargs_psf_new = copy.deepcopy(kwargs_psf)
+            kwargs_psf_final = copy.deepcopy(kwargs_psf)
+            if "psf_variance_map" in kwargs_psf:
+                error_map_final = kwargs_psf["psf_variance_map"]
+            else:
+                error_map_final = np.zeros_like(kernel_point_source_init)
+            error_map_init = copy.deepcopy(error_map_final)
+            psf_class = PSF(**kwargs_psf)
+            self._image_model_class.update_psf(psf_class)
+            _kwargs_params = copy.deepcopy(kwargs_params)
+            _kwargs_params.pop("kwargs_tracer_source", None)
+            logL_before, _ = self._image_model_class.likelihood_data_given_model(
+                **_kwargs_params
+            )
+            logL_best = copy.deepcopy(logL_before)
+            i_best = 0
+
+            corner_mask = None
+            if "corner_symmetry" in kwargs_psf_update.keys():
+                if type(kwargs_psf_update["corner_symmetry"]) == int:
+                    psf_symmetry = kwargs_psf_update["psf_symmetry"]
+                    kernel_size = len(kwargs_psf["kernel_point_source"])
+                    corner_mask = self.calc_cornermask(kernel_size, psf_symmetry)
+
+            for i in range(num_iter):
+                kwargs_psf_new, logL_after, error_map = self.update_psf(
+                    kwargs_psf_new, _kwargs_params, corner_mask, **kwargs_psf_update
+                )
+
+                if logL_after > logL_best:
+                    kwargs_psf_final = copy.deepcopy(kwargs_psf_new)
+                    error_map_final = copy.deepcopy(error_map)
+                    logL_best = logL_after
+                    i_best = i + 1
+                else:
+                    if not no_break:
+                        if verbose:
+                            print(
+                                "iterative PSF reconstruction makes reconstruction worse in step %s - aborted"
+                                % i
+                            )
+                        break
+            if verbose is True:
+                print("iteration of step %s gave best reconstruction." % i_best)
+                print(
+                    "log likelihood before: %s and log likelihood after: %s"
+                    % (logL_before, logL_best)
+                )
+            if keep_psf_variance_map is True:
+                kwargs_psf_final["psf_variance_map"] = error_map_init
+            else:
+                kwargs_psf_final["psf_variance_map"] = error_map_final
+            kwargs_psf_final["kernel_point_source_init"] = kernel_point_source_init
+        finally:
+            if static_lens is False:
+                self._image_model_class.set_static_lens(False)
         return kwargs_psf_final
 
     def update_psf(
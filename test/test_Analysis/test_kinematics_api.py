@@ -169,6 +169,29 @@ class TestKinematicsAPI(object):
         npt.assert_almost_equal(v_sigma_mge_lens / v_sigma, 1, decimal=1)
         npt.assert_almost_equal(v_sigma / v_sigma_hernquist, 1, decimal=1)
 
+        kinematicAPI = KinematicsAPI(
+            z_lens,
+            z_source,
+            kwargs_model,
+            kwargs_aperture=kwargs_aperture,
+            kwargs_seeing=kwargs_psf,
+            lens_model_kinematics_bool=[True, False, False, False, False],
+            anisotropy_model=anisotropy_model,
+            kwargs_mge_light=kwargs_mge,
+            kwargs_mge_mass=kwargs_mge,
+            MGE_light=True,
+            MGE_mass=True,
+            mge_kinematics=True,
+        )
+        v_sigma_mge_kinematics = kinematicAPI.velocity_dispersion(
+            kwargs_lens,
+            kwargs_lens_light,
+            kwargs_anisotropy,
+            r_eff=r_eff,
+            theta_E=theta_E,
+        )
+        npt.assert_almost_equal(v_sigma_mge_kinematics / v_sigma_mge_lens, 1, decimal=1)
+
     def test_galkin_settings(self):
         z_lens = 0.5
         z_source = 1.5
@@ -846,6 +869,21 @@ class TestKinematicsAPI(object):
 
         assert np.max(np.abs(jampy_vel_dis / vel_dis[14:28, 14:28] - 1)) < 0.009
 
+        vel_dis_adaptive = kinematics_api.velocity_dispersion_map(
+            kwargs_lens,
+            kwargs_lens_light,
+            kwargs_anisotropy,
+            r_eff=kwargs_lens_light[0]["R_sersic"],
+            theta_E=kwargs_lens[0]["theta_E"],
+            gamma=kwargs_lens[0]["gamma"],
+            kappa_ext=0,
+            direct_convolve=True,
+            supersampling_factor=5,
+            voronoi_bins=None,
+            radial_rtol=0.001,
+        )
+        npt.assert_allclose(vel_dis_adaptive, vel_dis, rtol=0.001)
+
     def test_velocity_dispersion_map(self):
         np.random.seed(42)
         z_lens = 0.5
@@ -1109,6 +1147,30 @@ class TestKinematicsAPI(object):
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
+        with self.assertRaises(ValueError):
+            KinematicsAPI(
+                0.5,
+                1.5,
+                {"lens_model_list": ["SIS"], "lens_light_model_list": ["HERNQUIST"]},
+                kwargs_aperture={"aperture_type": "slit", "length": 1, "width": 1},
+                kwargs_seeing={"psf_type": "GAUSSIAN", "fwhm": 0.7},
+                anisotropy_model="OM",
+                MGE_light=True,
+                mge_kinematics=True,
+            )
+        with self.assertRaises(ValueError):
+            KinematicsAPI(
+                0.5,
+                1.5,
+                {"lens_model_list": ["SIS"], "lens_light_model_list": ["HERNQUIST"]},
+                kwargs_aperture=[{"aperture_type": "slit", "length": 1, "width": 1}],
+                kwargs_seeing=[{"psf_type": "GAUSSIAN", "fwhm": 0.7}],
+                anisotropy_model="OM",
+                multi_observations=True,
+                MGE_light=True,
+                MGE_mass=True,
+                mge_kinematics=True,
+            )
         with self.assertRaises(ValueError):
             # self._kwargs_aperture_kin["aperture_type"] != "IFU_grid":
             z_lens = 0.5
@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+from astropy.cosmology import FlatLambdaCDM, LambdaCDM
+
+from lenstronomy.Cosmo.distance_table import DistanceTable
+from lenstronomy.Cosmo.background import Background
+
+
+class TestDistanceTable(object):
+    def setup_method(self):
+        self.cosmo = FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05)
+        self.table = DistanceTable(cosmo=self.cosmo, z_list=[0.5, 1, 2])
+
+    def test_d_xy(self):
+        for cosmo in [
+            self.cosmo,
+            LambdaCDM(H0=70, Om0=0.3, Ode0=0.6),
+            LambdaCDM(H0=70, Om0=0.3, Ode0=0.8),
+        ]:
+            table = DistanceTable(cosmo=cosmo)
+            for z1, z2 in [(0, 0.5), (0.3, 0.5), (0.5, 2.0), (0.5, 0.51)]:
+                d_xy = table.d_xy(z1, z2)
+                d_xy_astropy = cosmo.angular_diameter_distance_z1z2(z1, z2).value
+                npt.assert_almost_equal(d_xy / d_xy_astropy, 1, decimal=10)
+                T_xy = table.T_xy(z1, z2)
+                npt.assert_almost_equal(T_xy / d_xy, 1 + z2, decimal=10)
+
+    def test_vectorized(self):
+        z1 = np.array([0, 0.5, 0.5, 1])
+        z2 = np.array([0.5, 1, 2, 3])
+        d_xy = self.table.d_xy(z1, z2)
+        assert d_xy.shape == (4,)
+        for i in range(4):
+            npt.assert_almost_equal(d_xy[i], self.table.d_xy(z1[i], z2[i]), decimal=8)
+        npt.assert_almost_equal(self.table.comoving_distance(0), 0, decimal=10)
+
+    def test_table(self):
+        assert self.table.size == 4
+        self.table.d_xy(0.5, 1)
+        assert self.table.size == 4
+        self.table.d_xy(0.5, 1.5)
+        assert self.table.size == 5
+
+        table = DistanceTable(cosmo=self.cosmo, max_size=3)
+        table.comoving_distance([1, 2, 3])
+        assert table.size == 4
+        table.comoving_distance(4)
+        assert table.size == 2
+
+    def test_cosmo_update(self):
+        d_xy = self.table.d_xy(0.5, 2)
+        cosmo_new = FlatLambdaCDM(H0=80, Om0=0.3, Ob0=0.05)
+        self.table.cosmo = cosmo_new
+        assert self.table.size == 4
+        npt.assert_almost_equal(self.table.d_xy(0.5, 2) / d_xy, 70 / 80.0, decimal=8)
+
+    def test_interp(self):
+        table = DistanceTable(cosmo=self.cosmo, z_interp_stop=5, num_z_interp=500)
+        d_xy = table.d_xy(0.3, 1.2345)
+        d_xy_astropy = self.cosmo.angular_diameter_distance_z1z2(0.3, 1.2345).value
+        npt.assert_almost_equal(d_xy / d_xy_astropy, 1, decimal=6)
+        assert table.size == 1
+        table.d_xy(0.3, 6)
+        assert table.size == 2
+
+    def test_background(self):
+        bkg = Background(cosmo=self.cosmo)
+        bkg_table = Background(distance_table=self.table)
+        assert bkg_table.cosmo is self.cosmo
+        assert bkg_table.distance_table is self.table
+        npt.assert_almost_equal(
+            bkg_table.d_xy(0.5, 2) / bkg.d_xy(0.5, 2), 1, decimal=10
+        )
+        npt.assert_almost_equal(
+            bkg_table.T_xy(0.5, 2) / bkg.T_xy(0.5, 2), 1, decimal=10
+        )
+        cosmo_new = FlatLambdaCDM(H0=80, Om0=0.3, Ob0=0.05)
+        bkg_table.cosmo = cosmo_new
+        assert self.table.cosmo is cosmo_new
+
+
+class TestRaise(object):
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            Background(interp=True, distance_table=DistanceTable())
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -3,6 +3,7 @@ from lenstronomy.GalKin.aperture import Aperture
 import pytest
 import unittest
 import numpy as np
+import numpy.testing as npt
 
 
 class TestAperture(object):
@@ -60,6 +61,78 @@ class TestAperture(object):
         assert bool is False
         assert frame.num_segments == (10, 10)
 
+    def test_aperture_select_array(self):
+        x_grid, y_grid = np.meshgrid(
+            np.arange(-0.9, 0.95, 0.20),
+            np.arange(-0.9, 0.95, 0.20),
+        )
+        kwargs_aperture_list = [
+            {"aperture_type": "slit", "length": 2, "width": 0.5, "angle": 0.3},
+            {"aperture_type": "shell", "r_in": 0.2, "r_out": 1.0, "center_ra": 0.1},
+            {
+                "aperture_type": "frame",
+                "width_outer": 1,
+                "width_inner": 0.5,
+                "angle": -0.4,
+            },
+            {"aperture_type": "IFU_shells", "r_bins": np.linspace(0, 1.5, 4)},
+            {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid},
+        ]
+        np.random.seed(42)
+        ra = np.random.uniform(-1.5, 1.5, 200)
+        dec = np.random.uniform(-1.5, 1.5, 200)
+        for kwargs_aperture in kwargs_aperture_list:
+            aperture = Aperture(**kwargs_aperture)
+            num_segments = aperture.num_segments
+            bool_array, index_array = aperture.aperture_select_array(ra, dec)
+            for k in range(len(ra)):
+                bool_ap, index = aperture.aperture_select(ra[k], dec[k])
+                assert bool_array[k] == bool_ap
+                if bool_ap is True:
+                    if isinstance(num_segments, tuple):
+                        index = np.ravel_multi_index(index, num_segments)
+                    assert index_array[k] == index
+
+    def test_select_probability(self):
+        x_grid, y_grid = np.meshgrid(
+            np.arange(-0.9, 0.95, 0.20),
+            np.arange(-0.9, 0.95, 0.20),
+        )
+        kwargs_aperture_list = [
+            {"aperture_type": "slit", "length": 2, "width": 0.5, "angle": 0.3},
+            {"aperture_type": "shell", "r_in": 0.2, "r_out": 1.0, "center_ra": 0.1},
+            {
+                "aperture_type": "frame",
+                "width_outer": 1,
+                "width_inner": 0.5,
+                "angle": -0.4,
+            },
+            {"aperture_type": "IFU_shells", "r_bins": np.linspace(0, 1.5, 4)},
+            {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid},
+        ]
+        sigma = 0.3
+        ra = np.array([0.0, 0.4, -0.7])
+        dec = np.array([0.0, -0.2, 0.9])
+        num_draws = 100000
+        np.random.seed(42)
+        for kwargs_aperture in kwargs_aperture_list:
+            aperture = Aperture(**kwargs_aperture)
+            num_bins = int(np.prod(aperture.num_segments))
+            p = aperture.select_probability(ra, dec, sigma)
+            assert p.shape == (num_bins, len(ra))
+            for k in range(len(ra)):
+                ra_ = ra[k] + np.random.normal(0, sigma, num_draws)
+                dec_ = dec[k] + np.random.normal(0, sigma, num_draws)
+                bool_ap, index = aperture.aperture_select_array(ra_, dec_)
+                p_draws = np.bincount(index[bool_ap], minlength=num_bins) / num_draws
+                npt.assert_allclose(p[:, k], p_draws, atol=0.005)
+            # all selected photons/rays are within the maximum radius
+            r_max = aperture.max_radius
+            ra_ = np.random.uniform(-2, 2, 10000)
+            dec_ = np.random.uniform(-2, 2, 10000)
+            bool_ap, _ = aperture.aperture_select_array(ra_, dec_)
+            assert np.all(np.hypot(ra_, dec_)[bool_ap] <= r_max)
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
@@ -542,6 +542,96 @@ class TestGalkin(object):
         )
         npt.assert_almost_equal(sigma_v, sigma_v_ifu[0], decimal=-1)
 
+    def test_dispersion_vectorized(self):
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.0}]
+        kwargs_light = [{"Rs": 1.5, "amp": 1.0}]
+        kwargs_anisotropy = {"r_ani": 2.0}
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_numerics = {"interpol_grid_num": 500, "max_integrate": 100}
+        x_grid, y_grid = np.meshgrid(np.linspace(-1, 1, 4), np.linspace(-1, 1, 4))
+        kwargs_aperture_list = [
+            {"aperture_type": "IFU_shells", "r_bins": np.linspace(0, 2, 3)},
+            {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid},
+        ]
+        kwargs_psf_list = [
+            {"psf_type": "GAUSSIAN", "fwhm": 0.7},
+            {"psf_type": "MOFFAT", "fwhm": 0.7, "moffat_beta": 2.5},
+        ]
+        for kwargs_aperture, kwargs_psf in zip(kwargs_aperture_list, kwargs_psf_list):
+            galkin = Galkin(
+                kwargs_model,
+                kwargs_aperture,
+                kwargs_psf,
+                kwargs_cosmo,
+                kwargs_numerics,
+            )
+            sigma_v_map = galkin.dispersion_map(
+                kwargs_mass, kwargs_light, kwargs_anisotropy, num_kin_sampling=500
+            )
+            np.random.seed(42)
+            sigma_v_map_vec = galkin.dispersion_map(
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
+                num_kin_sampling=500,
+                vectorized=True,
+            )
+            assert np.shape(sigma_v_map_vec) == np.shape(sigma_v_map)
+            npt.assert_allclose(sigma_v_map_vec, sigma_v_map, rtol=0.05)
+            # fixed random seed reproduces the estimate
+            np.random.seed(42)
+            npt.assert_almost_equal(
+                galkin.dispersion_map(
+                    kwargs_mass,
+                    kwargs_light,
+                    kwargs_anisotropy,
+                    num_kin_sampling=500,
+                    vectorized=True,
+                ),
+                sigma_v_map_vec,
+                decimal=10,
+            )
+
+            sigma_v = galkin.dispersion(
+                kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=1000
+            )
+            sigma_v_vec = galkin.dispersion(
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
+                sampling_number=1000,
+                vectorized=True,
+            )
+            npt.assert_allclose(sigma_v_vec, sigma_v, rtol=0.05)
+
+        # analytic kinematics
+        galkin = Galkin(
+            {"anisotropy_model": "OM"},
+            kwargs_aperture_list[0],
+            kwargs_psf_list[0],
+            kwargs_cosmo,
+            {},
+            analytic_kinematics=True,
+        )
+        kwargs_mass = {"theta_E": 1.2, "gamma": 2.0}
+        kwargs_light = {"r_eff": 1.5}
+        sigma_v_map = galkin.dispersion_map(
+            kwargs_mass, kwargs_light, kwargs_anisotropy, num_kin_sampling=500
+        )
+        sigma_v_map_vec = galkin.dispersion_map(
+            kwargs_mass,
+            kwargs_light,
+            kwargs_anisotropy,
+            num_kin_sampling=500,
+            vectorized=True,
+        )
+        npt.assert_allclose(sigma_v_map_vec, sigma_v_map, rtol=0.05)
+
     def test_dispersion_map_grid_convolved(self):
         """Test whether the old and new version using direct PSF convolution provide the
         same answer."""
@@ -684,6 +774,163 @@ class TestGalkin(object):
 
         npt.assert_almost_equal(sigma_v, sigma_v_ifu[0], decimal=-1)
 
+    def test_dispersion_map_grid_convolved_batch(self):
+        x_grid, y_grid = np.meshgrid(
+            np.arange(-1.9, 1.91, 0.2), np.arange(-1.5, 1.51, 0.2)
+        )
+        kwargs_ifu = {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid}
+        kwargs_model = {
+            "mass_profile_list": ["PEMD"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_numerics = {
+            "interpol_grid_num": 200,
+            "log_integration": True,
+            "max_integrate": 100,
+            "min_integrate": 0.001,
+        }
+        kwargs_mass_list = [
+            {
+                "theta_E": 1.0 + 0.1 * i,
+                "gamma": 2.0,
+                "center_x": 0.05 * i,
+                "center_y": 0,
+            }
+            for i in range(3)
+        ]
+        kwargs_light_list = [
+            {"r_eff": 0.8 + 0.2 * i, "amp": 1.0, "center_x": 0, "center_y": 0}
+            for i in range(3)
+        ]
+        kwargs_anisotropy_list = [{"r_ani": 1.0 + 0.5 * i} for i in range(3)]
+        galkin = Galkin(
+            kwargs_model,
+            kwargs_ifu,
+            kwargs_psf,
+            kwargs_cosmo,
+            kwargs_numerics,
+            analytic_kinematics=True,
+        )
+        sigma_v_batch = galkin.dispersion_map_grid_convolved_batch(
+            kwargs_mass_list,
+            kwargs_light_list,
+            kwargs_anisotropy_list,
+            supersampling_factor=3,
+        )
+        assert sigma_v_batch.shape == (3, 16, 20)
+
+        voronoi_bins = np.zeros_like(x_grid, dtype=int) - 1
+        voronoi_bins[5:10, 5:12] = 0
+        voronoi_bins[10:, :] = 1
+        sigma_v_voronoi_batch = galkin.dispersion_map_grid_convolved_batch(
+            kwargs_mass_list,
+            kwargs_light_list,
+            kwargs_anisotropy_list,
+            supersampling_factor=3,
+            voronoi_bins=voronoi_bins,
+        )
+        assert sigma_v_voronoi_batch.shape == (3, 2)
+
+        # processing the samples in chunks does not change the results
+        for voronoi_bins_, sigma_v_ in [
+            (None, sigma_v_batch),
+            (voronoi_bins, sigma_v_voronoi_batch),
+        ]:
+            sigma_v_chunks = galkin.dispersion_map_grid_convolved_batch(
+                kwargs_mass_list,
+                kwargs_light_list,
+                kwargs_anisotropy_list,
+                supersampling_factor=3,
+                voronoi_bins=voronoi_bins_,
+                chunk_size=2,
+            )
+            npt.assert_allclose(sigma_v_chunks, sigma_v_, rtol=1e-10)
+
+        for i in range(3):
+            galkin = Galkin(
+                kwargs_model,
+                kwargs_ifu,
+                kwargs_psf,
+                kwargs_cosmo,
+                kwargs_numerics,
+                analytic_kinematics=True,
+            )
+            sigma_v = galkin.dispersion_map_grid_convolved(
+                kwargs_mass_list[i],
+                kwargs_light_list[i],
+                kwargs_anisotropy_list[i],
+                supersampling_factor=3,
+            )
+            npt.assert_allclose(sigma_v_batch[i], sigma_v, rtol=1e-4)
+            sigma_v_voronoi = galkin.dispersion_map_grid_convolved(
+                kwargs_mass_list[i],
+                kwargs_light_list[i],
+                kwargs_anisotropy_list[i],
+                supersampling_factor=3,
+                voronoi_bins=voronoi_bins,
+            )
+            npt.assert_allclose(sigma_v_voronoi_batch[i], sigma_v_voronoi, rtol=1e-4)
+
+    def test_radial_profiles(self):
+        x_grid, y_grid = np.meshgrid(
+            np.arange(-1.9, 1.91, 0.2), np.arange(-1.9, 1.91, 0.2)
+        )
+        kwargs_ifu = {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid}
+        kwargs_model = {
+            "mass_profile_list": ["PEMD"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_numerics = {
+            "interpol_grid_num": 200,
+            "log_integration": True,
+            "max_integrate": 100,
+            "min_integrate": 0.001,
+        }
+        kwargs_mass = {"theta_E": 1.0, "gamma": 2.0, "center_x": 0, "center_y": 0}
+        kwargs_light = {"r_eff": 0.8, "amp": 1.0, "center_x": 0, "center_y": 0}
+        kwargs_anisotropy = {"r_ani": 1.0}
+        galkin = Galkin(
+            kwargs_model,
+            kwargs_ifu,
+            kwargs_psf,
+            kwargs_cosmo,
+            kwargs_numerics,
+            analytic_kinematics=True,
+        )
+        radial_rtol = 0.001
+        log10_Rs, log10_sigma2_IRs, log10_IRs = galkin._radial_profiles(
+            0.001, 3, kwargs_mass, kwargs_light, kwargs_anisotropy, radial_rtol
+        )
+        assert len(log10_Rs) < 300
+        assert np.all(np.diff(log10_Rs) > 0)
+        npt.assert_almost_equal(log10_Rs[[0, -1]], np.log10([0.001, 3]), decimal=10)
+        Rs = np.logspace(-2.9, 0.45, 20)
+        sigma2_IRs, IRs = galkin._I_R_sigma2_and_IR_radial(
+            Rs, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        sigma2_IRs_interp = 10 ** np.interp(np.log10(Rs), log10_Rs, log10_sigma2_IRs)
+        IRs_interp = 10 ** np.interp(np.log10(Rs), log10_Rs, log10_IRs)
+        npt.assert_allclose(sigma2_IRs_interp, sigma2_IRs, rtol=radial_rtol)
+        npt.assert_allclose(IRs_interp, IRs, rtol=radial_rtol)
+
+        sigma_v = galkin.dispersion_map_grid_convolved(
+            kwargs_mass, kwargs_light, kwargs_anisotropy, supersampling_factor=3
+        )
+        sigma_v_adaptive = galkin.dispersion_map_grid_convolved(
+            kwargs_mass,
+            kwargs_light,
+            kwargs_anisotropy,
+            supersampling_factor=3,
+            radial_rtol=radial_rtol,
+        )
+        npt.assert_allclose(sigma_v_adaptive, sigma_v, rtol=radial_rtol)
+
     def test_extract_center(self):
         """Test the extraction of the center of the IFU map."""
         assert Galkin._extract_center([{"center_x": 1, "center_y": 2}]) == (1, 2)
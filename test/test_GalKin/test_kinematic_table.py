@@ -0,0 +1,155 @@
+import os
+import numpy as np
+import numpy.testing as npt
+import pytest
+import unittest
+
+from lenstronomy.GalKin.kinematic_table import KinematicTable, build_kinematic_table
+from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+from lenstronomy.GalKin.galkin import Galkin
+
+
+class TestKinematicTable(object):
+    def setup_method(self):
+        self.file_name = "test_kinematic_table"
+        self.kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        self.kwargs_numerics = {
+            "interpol_grid_num": 1000,
+            "max_integrate": 1000,
+            "min_integrate": 0.0001,
+        }
+        self.gamma_list = np.linspace(2.0, 2.1, 5)
+        self.r_list = np.logspace(-2, 1.5, 71)
+
+    def teardown_method(self):
+        for extension in [".npy", ".json"]:
+            if os.path.exists(self.file_name + extension):
+                os.remove(self.file_name + extension)
+
+    def _compare(self, light_profile_list, kwargs_light, anisotropy_model, kwargs_ani):
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": light_profile_list,
+            "anisotropy_model": anisotropy_model,
+        }
+        numerics = NumericKinematics(
+            kwargs_model, self.kwargs_cosmo, **self.kwargs_numerics
+        )
+        numerics_table = NumericKinematics(
+            kwargs_model,
+            self.kwargs_cosmo,
+            kinematic_table=self.file_name,
+            **self.kwargs_numerics
+        )
+        kwargs_mass = [{"theta_E": 1.3, "gamma": 2.07}]
+        R = np.array([0.05, 0.3, 1.0, 3.0])
+        I_R_sigma2, I_R = numerics._I_R_sigma2_interp(
+            R, kwargs_mass, kwargs_light, kwargs_ani
+        )
+        I_R_sigma2_table, I_R_table = numerics_table._I_R_sigma2_interp(
+            R, kwargs_mass, kwargs_light, kwargs_ani
+        )
+        npt.assert_allclose(I_R_table, I_R, rtol=2e-3)
+        npt.assert_allclose(I_R_sigma2_table / I_R_table, I_R_sigma2 / I_R, rtol=3e-3)
+
+    def test_hernquist_om(self):
+        table = build_kinematic_table(
+            self.file_name,
+            "HERNQUIST",
+            "OM",
+            gamma_list=self.gamma_list,
+            anisotropy_list=np.logspace(0, 0.5, 11),
+            r_list=self.r_list,
+        )
+        assert table.light_profile == "HERNQUIST"
+        assert table.anisotropy_model == "OM"
+        self._compare(["HERNQUIST"], [{"amp": 2.0, "Rs": 0.8}], "OM", {"r_ani": 1.1})
+        self._compare_galkin()
+
+    def test_multi_gaussian(self):
+        kwargs_light = [
+            {"amp": np.array([2.0, 1.0, 0.5]), "sigma": np.array([0.1, 0.5, 2.0])}
+        ]
+        build_kinematic_table(
+            self.file_name,
+            "GAUSSIAN",
+            "const",
+            gamma_list=self.gamma_list,
+            anisotropy_list=np.linspace(0.0, 0.4, 9),
+            r_list=np.logspace(-3, 1.5, 91),
+        )
+        self._compare(["MULTI_GAUSSIAN"], kwargs_light, "const", {"beta": 0.23})
+        build_kinematic_table(
+            self.file_name,
+            "GAUSSIAN",
+            "isotropic",
+            gamma_list=self.gamma_list,
+            r_list=np.logspace(-3, 1.5, 91),
+        )
+        self._compare(["MULTI_GAUSSIAN"], kwargs_light, "isotropic", {})
+
+    def _compare_galkin(self):
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_aperture = {"aperture_type": "IFU_shells", "r_bins": np.array([0, 1])}
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        kwargs_numerics = dict(self.kwargs_numerics, kinematic_table=self.file_name)
+        galkin = Galkin(kwargs_model, kwargs_aperture, kwargs_psf, self.kwargs_cosmo)
+        galkin_table = Galkin(
+            kwargs_model,
+            kwargs_aperture,
+            kwargs_psf,
+            self.kwargs_cosmo,
+            kwargs_numerics=kwargs_numerics,
+        )
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.05}]
+        kwargs_light = [{"amp": 1.0, "Rs": 1.0}]
+        kwargs_anisotropy = {"r_ani": 2.0}
+        np.random.seed(42)
+        sigma_v = galkin.dispersion_map(
+            kwargs_mass, kwargs_light, kwargs_anisotropy, vectorized=True
+        )
+        np.random.seed(42)
+        sigma_v_table = galkin_table.dispersion_map(
+            kwargs_mass, kwargs_light, kwargs_anisotropy, vectorized=True
+        )
+        npt.assert_allclose(sigma_v_table, sigma_v, rtol=0.01)
+
+
+class TestRaise(unittest.TestCase):
+    def setUp(self):
+        self.file_name = "test_kinematic_table_raise"
+        build_kinematic_table(
+            self.file_name,
+            "HERNQUIST",
+            "OM",
+            gamma_list=[1.9, 2.1],
+            anisotropy_list=[0.5, 2],
+            r_list=[0.1, 1],
+        )
+
+    def tearDown(self):
+        for extension in [".npy", ".json"]:
+            os.remove(self.file_name + extension)
+
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            build_kinematic_table(self.file_name, "SERSIC", "OM")
+        with self.assertRaises(ValueError):
+            build_kinematic_table(self.file_name, "HERNQUIST", "GOM")
+        table = KinematicTable(self.file_name)
+        with self.assertRaises(ValueError):
+            table.sigma2_dimensionless(R=0.5, gamma=2.5, anisotropy=1)
+        with self.assertRaises(ValueError):
+            table.check_model(["SPEP"], ["HERNQUIST"], "OM")
+        with self.assertRaises(ValueError):
+            table.check_model(["SPP"], ["MULTI_GAUSSIAN"], "OM")
+        with self.assertRaises(ValueError):
+            table.check_model(["SPP"], ["HERNQUIST"], "const")
+
+
+if __name__ == "__main__":
+    pytest.main()
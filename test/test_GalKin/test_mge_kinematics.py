@@ -0,0 +1,163 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+import unittest
+
+from lenstronomy.GalKin.mge_kinematics import MGEKinematics
+from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+from lenstronomy.GalKin.galkin_model import GalkinModel
+from lenstronomy.GalKin.galkin import Galkin
+
+
+class TestMGEKinematics(object):
+    def setup_method(self):
+        self.kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        self.kwargs_numerics = {
+            "interpol_grid_num": 1000,
+            "max_integrate": 100,
+            "min_integrate": 0.0001,
+        }
+        self.kwargs_mass = [
+            {"amp": np.array([1.0, 3.0, 5.0]), "sigma": np.array([0.1, 0.8, 3.0])}
+        ]
+        self.kwargs_light = [
+            {
+                "amp": np.array([2.0, 1.0, 0.5]),
+                "sigma": np.array([0.05, 0.5, 2.0]),
+                "center_x": 0,
+                "center_y": 0,
+            }
+        ]
+
+    def _kwargs_model(self, anisotropy_model):
+        return {
+            "mass_profile_list": ["MULTI_GAUSSIAN"],
+            "light_profile_list": ["MULTI_GAUSSIAN"],
+            "anisotropy_model": anisotropy_model,
+        }
+
+    def test_I_R_sigma2(self):
+        R = np.array([0.01, 0.1, 0.5, 1.0, 3.0])
+        for anisotropy_model, kwargs_anisotropy in [
+            ("OM", {"r_ani": 1.5}),
+            ("const", {"beta": 0.2}),
+            ("isotropic", {}),
+        ]:
+            kwargs_model = self._kwargs_model(anisotropy_model)
+            mge_kinematics = MGEKinematics(
+                kwargs_model, self.kwargs_cosmo, **self.kwargs_numerics
+            )
+            numerics = NumericKinematics(
+                kwargs_model, self.kwargs_cosmo, **self.kwargs_numerics
+            )
+            I_R_sigma2, I_R = mge_kinematics._I_R_sigma2(
+                R, self.kwargs_mass, self.kwargs_light, kwargs_anisotropy
+            )
+            for i, R_i in enumerate(R):
+                I_R_sigma2_num, I_R_num = numerics._I_R_sigma2(
+                    R_i, self.kwargs_mass, self.kwargs_light, kwargs_anisotropy
+                )
+                npt.assert_allclose(I_R_sigma2[i], I_R_sigma2_num, rtol=1e-3)
+                npt.assert_allclose(I_R[i], I_R_num, rtol=3e-3)
+                I_R_sigma2_i, I_R_i = mge_kinematics._I_R_sigma2(
+                    R_i, self.kwargs_mass, self.kwargs_light, kwargs_anisotropy
+                )
+                npt.assert_almost_equal(I_R_sigma2_i / I_R_sigma2[i], 1, decimal=10)
+                assert np.ndim(I_R_sigma2_i) == 0
+            I_R_sigma2_interp, I_R_interp = mge_kinematics.I_R_sigma2_and_IR(
+                R, self.kwargs_mass, self.kwargs_light, kwargs_anisotropy
+            )
+            npt.assert_allclose(I_R_sigma2_interp, I_R_sigma2, rtol=1e-3)
+            npt.assert_allclose(I_R_interp, I_R, rtol=1e-3)
+
+    def test_galkin(self):
+        kwargs_model = self._kwargs_model("OM")
+        kwargs_anisotropy = {"r_ani": 1.5}
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        for kwargs_aperture in [
+            {
+                "aperture_type": "slit",
+                "length": 1.0,
+                "width": 0.5,
+                "center_ra": 0.1,
+                "angle": 0.3,
+            },
+            {"aperture_type": "IFU_shells", "r_bins": np.array([0, 0.3, 0.8, 1.5])},
+        ]:
+            galkin = Galkin(
+                kwargs_model,
+                kwargs_aperture,
+                kwargs_psf,
+                self.kwargs_cosmo,
+                kwargs_numerics=self.kwargs_numerics,
+            )
+            galkin_mge = Galkin(
+                kwargs_model,
+                kwargs_aperture,
+                kwargs_psf,
+                self.kwargs_cosmo,
+                kwargs_numerics=self.kwargs_numerics,
+                mge_kinematics=True,
+            )
+            np.random.seed(42)
+            sigma_v_map = galkin.dispersion_map(
+                self.kwargs_mass,
+                self.kwargs_light,
+                kwargs_anisotropy,
+                num_kin_sampling=10000,
+                vectorized=True,
+            )
+            sigma_v_map_mge = galkin_mge.dispersion_map(
+                self.kwargs_mass, self.kwargs_light, kwargs_anisotropy
+            )
+            assert np.shape(sigma_v_map_mge) == np.shape(sigma_v_map)
+            npt.assert_allclose(sigma_v_map_mge, sigma_v_map, rtol=0.01)
+
+            sigma_v = galkin.dispersion(
+                self.kwargs_mass,
+                self.kwargs_light,
+                kwargs_anisotropy,
+                sampling_number=20000,
+                vectorized=True,
+            )
+            sigma_v_mge = galkin_mge.dispersion(
+                self.kwargs_mass, self.kwargs_light, kwargs_anisotropy
+            )
+            npt.assert_allclose(sigma_v_mge, sigma_v, rtol=0.01)
+
+
+class TestRaise(unittest.TestCase):
+    def test_raise(self):
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_model = {
+            "mass_profile_list": ["MULTI_GAUSSIAN"],
+            "light_profile_list": ["MULTI_GAUSSIAN"],
+            "anisotropy_model": "OM",
+        }
+        with self.assertRaises(ValueError):
+            MGEKinematics(
+                dict(kwargs_model, light_profile_list=["HERNQUIST"]), kwargs_cosmo
+            )
+        with self.assertRaises(ValueError):
+            MGEKinematics(dict(kwargs_model, mass_profile_list=["SPP"]), kwargs_cosmo)
+        with self.assertRaises(ValueError):
+            MGEKinematics(kwargs_model, kwargs_cosmo, kinematic_table="table")
+        with self.assertRaises(ValueError):
+            GalkinModel(
+                kwargs_model,
+                kwargs_cosmo,
+                analytic_kinematics=True,
+                mge_kinematics=True,
+            )
+        with self.assertRaises(ValueError):
+            Galkin(
+                kwargs_model,
+                kwargs_aperture={"aperture_type": "shell", "r_in": 0, "r_out": 1},
+                kwargs_psf={"psf_type": "MOFFAT", "fwhm": 0.7, "moffat_beta": 2.6},
+                kwargs_cosmo=kwargs_cosmo,
+                mge_kinematics=True,
+            )
+
+
+if __name__ == "__main__":
+    pytest.main()
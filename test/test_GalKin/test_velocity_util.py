@@ -55,6 +55,25 @@ class TestVelocityUtil(object):
         assert x_d != x
         assert y_d != y
 
+    def test_displace_PSF_array(self):
+        np.random.seed(41)
+        x, y = np.zeros(1000), np.ones(1000)
+        x_d, y_d = velocity_util.displace_PSF_gaussian(x, y, FWHM=1)
+        assert len(np.unique(x_d)) == 1000
+        npt.assert_almost_equal(np.std(y_d), 1 / (2 * np.sqrt(2 * np.log(2))), 1)
+        x_d, y_d = velocity_util.displace_PSF_moffat(x, y, FWHM=1, beta=2.6)
+        assert len(np.unique(x_d)) == 1000
+        r_array = np.sqrt(x_d**2 + (y_d - 1) ** 2)
+        r_scalar = [
+            np.sqrt(
+                np.sum(np.array(velocity_util.displace_PSF_moffat(0, 0, 1, 2.6)) ** 2)
+            )
+            for i in range(1000)
+        ]
+        npt.assert_almost_equal(np.median(r_array), np.median(r_scalar), decimal=1)
+        r = velocity_util.draw_hernquist(a=1, size=1000)
+        assert r.shape == (1000,)
+
     def test_project_2d_random(self):
         r = 1
         R, x, y = velocity_util.project2d_random(r=r)
@@ -120,6 +120,9 @@ class TestJointLinear(object):
             "lens_light_model_list": lens_light_model_list,
         }
         self.imageModel = JointLinear(multi_band_list, kwargs_model)
+        self.imageModel_cholesky = JointLinear(
+            multi_band_list, kwargs_model, wls_solver="cholesky"
+        )
 
     def test_linear_response(self):
         A = self.imageModel.linear_response_matrix(
@@ -158,6 +161,27 @@ class TestJointLinear(object):
         chi2_reduced = logL * 2 / self.imageModel.num_data_evaluate
         npt.assert_almost_equal(chi2_reduced, -1, 1)
 
+    def test_likelihood_data_given_model_cholesky(self):
+        for source_marg in [False, True]:
+            logL, param = self.imageModel.likelihood_data_given_model(
+                self.kwargs_lens,
+                self.kwargs_source,
+                self.kwargs_lens_light,
+                self.kwargs_ps,
+                source_marg=source_marg,
+            )
+            logL_chol, param_chol = (
+                self.imageModel_cholesky.likelihood_data_given_model(
+                    self.kwargs_lens,
+                    self.kwargs_source,
+                    self.kwargs_lens_light,
+                    self.kwargs_ps,
+                    source_marg=source_marg,
+                )
+            )
+            npt.assert_almost_equal(logL_chol, logL, decimal=6)
+            npt.assert_almost_equal(param_chol, param, decimal=8)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -7,6 +7,9 @@ from lenstronomy.ImSim.Numerics.convolution import (
     PixelKernelConvolution,
     SubgridKernelConvolution,
     MGEConvolution,
+    KernelSpectrumCache,
+    kernel_spectrum_cache_info,
+    clear_kernel_spectrum_cache,
 )
 from lenstronomy.LightModel.light_model import LightModel
 import lenstronomy.Util.util as util
@@ -29,6 +32,88 @@ class TestPixelKernelConvolution(object):
         image_convolved = pixel_conv.convolution2d(self.model)
         npt.assert_almost_equal(np.sum(image_convolved), np.sum(self.model), decimal=2)
 
+    def test_convolution2d_batch(self):
+        kernel = np.zeros((5, 5))
+        kernel[1, 1] = 0.5
+        kernel[2, 2] = 0.3
+        kernel[3, 1] = 0.2
+        images = np.array([self.model, self.model**2, self.model.T])
+        for convolution_type in ["fft_static", "fft", "grid"]:
+            pixel_conv = PixelKernelConvolution(
+                kernel=kernel, convolution_type=convolution_type
+            )
+            images_convolved = pixel_conv.convolution2d_batch(images)
+            assert images_convolved.shape == images.shape
+            for i, image in enumerate(images):
+                npt.assert_almost_equal(
+                    images_convolved[i], pixel_conv.convolution2d(image), decimal=10
+                )
+
+    def test_fft_backend(self):
+        kernel = np.zeros((5, 5))
+        kernel[1, 1] = 0.5
+        kernel[2, 2] = 0.3
+        kernel[3, 1] = 0.2
+        pixel_conv = PixelKernelConvolution(kernel=kernel)
+        pixel_conv_scipy = PixelKernelConvolution(
+            kernel=kernel, fft_backend="scipy", fft_workers=2
+        )
+        npt.assert_almost_equal(
+            pixel_conv_scipy.convolution2d(self.model),
+            pixel_conv.convolution2d(self.model),
+            decimal=12,
+        )
+        images = np.array([self.model, self.model.T])
+        npt.assert_almost_equal(
+            pixel_conv_scipy.convolution2d_batch(images),
+            pixel_conv.convolution2d_batch(images),
+            decimal=12,
+        )
+        with pytest.raises(ValueError):
+            PixelKernelConvolution(kernel=kernel, fft_backend="wrong")
+
+    def test_kernel_spectrum_cache(self):
+        clear_kernel_spectrum_cache()
+        kernel = np.zeros((5, 5))
+        kernel[2, 2] = 0.6
+        kernel[1, 2] = 0.4
+        pixel_conv = PixelKernelConvolution(kernel=kernel)
+        image_conv = pixel_conv.convolution2d(self.model)
+        pixel_conv.convolution2d(self.model)
+        info = kernel_spectrum_cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 0
+        assert info["currsize"] == 1
+
+        # a new instance with the same kernel content re-uses the spectrum
+        pixel_conv_new = PixelKernelConvolution(kernel=np.array(kernel))
+        npt.assert_equal(pixel_conv_new.convolution2d(self.model), image_conv)
+        info = kernel_spectrum_cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 1
+
+        # different image shape or backend leads to a new entry
+        image_conv_large = pixel_conv.convolution2d(np.ones((14, 14)))
+        assert image_conv_large.shape == (14, 14)
+        PixelKernelConvolution(kernel=kernel, fft_backend="scipy").convolution2d(
+            self.model
+        )
+        info = kernel_spectrum_cache_info()
+        assert info["misses"] == 3
+        assert info["currsize"] == 3
+
+        # the instance switches back to the cached spectrum of the original shape
+        npt.assert_equal(pixel_conv.convolution2d(self.model), image_conv)
+        assert kernel_spectrum_cache_info()["hits"] == 2
+
+        clear_kernel_spectrum_cache(maxsize=0)
+        pixel_conv_new = PixelKernelConvolution(kernel=kernel)
+        pixel_conv_new.convolution2d(self.model)
+        info = kernel_spectrum_cache_info()
+        assert info["currsize"] == 0
+        assert info["maxsize"] == 0
+        clear_kernel_spectrum_cache(maxsize=128)
+
     def test_copy_transpose(self):
         kernel = np.zeros((3, 3))
         kernel[1, 1] = 1
@@ -94,6 +179,40 @@ class TestPixelKernelConvolution(object):
         npt.assert_almost_equal(np.sum(model_conv_1d * y), 0, decimal=5)
 
 
+class TestKernelSpectrumCache(object):
+    def test_lru(self):
+        cache = KernelSpectrumCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        info = cache.info()
+        assert info["hits"] == 3
+        assert info["misses"] == 1
+        assert info["currsize"] == 2
+
+        cache.maxsize = 1
+        assert cache.info()["currsize"] == 1
+        assert cache.get("c") == 3
+        cache.clear()
+        assert cache.info() == {"hits": 0, "misses": 0, "maxsize": 1, "currsize": 0}
+
+    def test_kernel_hash(self):
+        kernel = np.arange(9, dtype=float).reshape(3, 3)
+        assert KernelSpectrumCache.kernel_hash(
+            kernel
+        ) == KernelSpectrumCache.kernel_hash(np.array(kernel))
+        assert KernelSpectrumCache.kernel_hash(
+            kernel
+        ) != KernelSpectrumCache.kernel_hash(kernel.T)
+        assert KernelSpectrumCache.kernel_hash(
+            kernel
+        ) != KernelSpectrumCache.kernel_hash(kernel.reshape(1, 9))
+
+
 class TestSubgridKernelConvolution(object):
     def setup_method(self):
         self.supersampling_factor = 3
@@ -190,6 +309,25 @@ class TestSubgridKernelConvolution(object):
         )
         npt.assert_almost_equal(model_subgrid_conv, model_subgrid_conv_split, decimal=3)
 
+    def test_re_size_convolve_batch(self):
+        subgrid_conv = SubgridKernelConvolution(
+            self.kernel_sub,
+            self.supersampling_factor,
+            supersampling_kernel_size=3,
+            convolution_type="fft_static",
+        )
+        images_low_res = np.array([self.model, 2 * self.model])
+        images_high_res = np.array([self.model_sub, 2 * self.model_sub])
+        images_conv = subgrid_conv.re_size_convolve_batch(
+            images_low_res, images_high_res
+        )
+        for i in range(2):
+            npt.assert_almost_equal(
+                images_conv[i],
+                subgrid_conv.re_size_convolve(images_low_res[i], images_high_res[i]),
+                decimal=10,
+            )
+
 
 class TestMultiGaussianConvolution(object):
     def setup_method(self):
@@ -211,6 +349,19 @@ class TestMultiGaussianConvolution(object):
         image_convolved = mge_conv.convolution2d(self.model)
         npt.assert_almost_equal(np.sum(image_convolved), np.sum(self.model), decimal=2)
 
+    def test_re_size_convolve_batch(self):
+        mge_conv = MultiGaussianConvolution(
+            sigma_list=[0.5, 1, 2],
+            fraction_list=[0.5, 0.2, 0.3],
+            pixel_scale=self.delta_pix,
+        )
+        images = np.array([self.model, self.model.T**2])
+        images_conv = mge_conv.re_size_convolve_batch(images, None)
+        for i in range(2):
+            npt.assert_almost_equal(
+                images_conv[i], mge_conv.re_size_convolve(images[i], None), decimal=10
+            )
+
 
 class TestMGEConvolution(object):
     def setup_method(self):
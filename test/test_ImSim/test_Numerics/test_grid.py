@@ -36,6 +36,10 @@ class TestAdaptiveGrid(object):
         x_grid, y_grid = self._adaptive_grid.coordinates_evaluate
         print(np.shape(x_grid), "test shape")
         assert len(x_grid) == self._supersampling_factor**2 + self.nx * self.ny - 1
+        # the joint coordinates are computed once and returned as the same arrays
+        x_grid_, y_grid_ = self._adaptive_grid.coordinates_evaluate
+        assert x_grid_ is x_grid
+        assert y_grid_ is y_grid
 
     def test_subpixel_coordinates(self):
         subpixel_x, subpixel_y = self._adaptive_grid._high_res_coordinates
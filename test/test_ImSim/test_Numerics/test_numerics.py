@@ -388,6 +388,37 @@ class TestNumerics(object):
         delta = (self.image_true * self.psf_norm_factor - image_conv) / self.image_true
         npt.assert_almost_equal(delta[self._conv_pixels_partial], 0, decimal=1)
 
+    def test_re_size_convolve_batch(self):
+        x, y = util.make_grid(numPix=61, deltapix=0.05)
+        for kwargs_numerics in [
+            self.kwargs_numerics_true,
+            self.kwargs_numerics_high_res_narrow,
+            self.kwargs_numerics_low_conv_high_grid,
+            self.kwargs_numerics_low_conv_high_adaptive,
+            self.kwargs_numerics_high_adaptive,
+            self.kwargs_numerics_partial,
+        ]:
+            image_model = ImageModel(
+                self.pixel_grid,
+                self.psf_class,
+                lens_light_model_class=self.lightModel,
+                kwargs_numerics=kwargs_numerics,
+            )
+            numerics = image_model.ImageNumerics
+            ra, dec = numerics.coordinates_evaluate
+            flux_arrays, _ = self.lightModel.functions_split(ra, dec, self.kwargs_light)
+            flux_arrays = np.array([flux_arrays[0], flux_arrays[0] ** 2])
+            for unconvolved in [False, True]:
+                images = numerics.re_size_convolve_batch(
+                    flux_arrays, unconvolved=unconvolved
+                )
+                assert images.shape == (2, 61, 61)
+                for i in range(2):
+                    image = numerics.re_size_convolve(
+                        flux_arrays[i], unconvolved=unconvolved
+                    )
+                    npt.assert_almost_equal(images[i], image, decimal=8)
+
     def test_property_access(self):
         image_model = ImageModel(
             self.pixel_grid,
@@ -52,6 +52,76 @@ class TestDeLens(object):
         npt.assert_almost_equal(result[1], 0, decimal=8)
         npt.assert_almost_equal(image[0], 0, decimal=8)
 
+    def test_get_param_WLS_cholesky(self):
+        np.random.seed(42)
+        A = np.random.normal(size=(50, 6))
+        C_D_inv = np.random.uniform(0.5, 2, size=50)
+        d = np.random.normal(size=50)
+        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=True)
+        (
+            result_chol,
+            cov_error_chol,
+            image_chol,
+            log_det,
+        ) = de_lens.get_param_WLS_cholesky(A, C_D_inv, d, inv_bool=True)
+        npt.assert_almost_equal(result_chol, result, decimal=10)
+        npt.assert_almost_equal(cov_error_chol, cov_error, decimal=10)
+        npt.assert_almost_equal(image_chol, image, decimal=10)
+        npt.assert_almost_equal(
+            log_det / 2, de_lens.marginalisation_const(cov_error), decimal=8
+        )
+        npt.assert_almost_equal(
+            de_lens.marginalization_new(cov_error_chol, d_prior=None, log_det=log_det),
+            de_lens.marginalization_new(cov_error, d_prior=None),
+            decimal=8,
+        )
+
+        result_chol, cov_error_chol, image_chol = de_lens.get_param_WLS(
+            A, C_D_inv, d, inv_bool=False, solver="cholesky"
+        )
+        assert cov_error_chol is None
+        npt.assert_almost_equal(result_chol, result, decimal=10)
+        npt.assert_almost_equal(image_chol, image, decimal=10)
+
+        with pytest.raises(ValueError):
+            de_lens.get_param_WLS(A, C_D_inv, d, solver="wrong")
+
+    def test_wls_stability_cholesky(self):
+        A = np.array([[1, 2, 3], [3, 2, 1]]).T
+        C_D_inv = np.array([0, 0, 0])
+        d = np.array([1, 2, 3])
+        result, cov_error, image, log_det = de_lens.get_param_WLS_cholesky(
+            A, C_D_inv, d
+        )
+        npt.assert_almost_equal(result, 0, decimal=8)
+        npt.assert_almost_equal(cov_error, 0, decimal=8)
+        npt.assert_almost_equal(image, 0, decimal=8)
+        assert log_det is None
+
+        C_D_inv = np.array([1, 1, 1])
+        A = np.array([[1.0, 2.0, 1.0 + 10 ** (-8.9)], [1.0, 2.0, 1.0]]).T
+        result, cov_error, image, log_det = de_lens.get_param_WLS_cholesky(
+            A, C_D_inv, d, inv_bool=False
+        )
+        npt.assert_almost_equal(result, 0, decimal=8)
+        npt.assert_almost_equal(image, 0, decimal=8)
+        assert cov_error is None
+        assert log_det is None
+
+    def test_cholesky_inverse_fallback(self, monkeypatch):
+        A = np.array([[1, 2, 3], [3, 2, 1]]).T
+        C_D_inv = np.array([1, 1, 1])
+        d = np.array([1, 2, 3])
+        _, cov_error_inv, _ = de_lens.get_param_WLS(A, C_D_inv, d)
+
+        # a failed inversion of the Cholesky factor falls back to the direct inverse
+        def dpotri(c, lower=0):
+            return np.zeros_like(c), 1
+
+        monkeypatch.setattr(de_lens.linalg.lapack, "dpotri", dpotri)
+        _, cov_error, _, _ = de_lens.get_param_WLS_cholesky(A, C_D_inv, d)
+        npt.assert_almost_equal(cov_error, cov_error_inv, decimal=8)
+
     def test_marginalisation_const(self):
         A = np.array([[1, 2, 3], [3, 2, 1]]).T
         C_D_inv = np.array([1, 1, 1])
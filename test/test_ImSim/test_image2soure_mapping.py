@@ -1,5 +1,6 @@
 __author__ = "sibirrer"
 
+import copy
 import numpy as np
 import numpy.testing as npt
 import lenstronomy.Util.util as util
@@ -337,6 +338,78 @@ class TestMultiSourcePlane(object):
             decimal=10,
         )
 
+    def test_ray_shooting_cache(self):
+        x, y = util.make_grid(numPix=10, deltapix=0.5)
+        for mapping in [
+            self.singlePlane_singlePlane,
+            self.singlePlane_pseudoMulti,
+            self.multi_single,
+            self.multi_multi,
+        ]:
+            flux_split, n = mapping.image_flux_split(
+                x, y, self.kwargs_lens, self.kwargs_light
+            )
+            flux_joint = mapping.image_flux_joint(
+                x, y, self.kwargs_lens, self.kwargs_light
+            )
+            mapping.set_ray_shooting_cache(True)
+            for i in range(2):
+                flux_split_cache, n_cache = mapping.image_flux_split(
+                    x, y, self.kwargs_lens, self.kwargs_light
+                )
+                npt.assert_almost_equal(flux_split_cache, flux_split, decimal=10)
+                assert n_cache == n
+            flux_joint_cache = mapping.image_flux_joint(
+                x, y, self.kwargs_lens, self.kwargs_light
+            )
+            npt.assert_almost_equal(flux_joint_cache, flux_joint, decimal=10)
+            assert mapping.ray_shooting_cache.hits == 2
+            assert mapping.ray_shooting_cache.misses == 1
+
+            # changed lens model
+            kwargs_lens = copy.deepcopy(self.kwargs_lens)
+            kwargs_lens[0]["theta_E"] = 1.1
+            flux_joint_new = mapping.image_flux_joint(
+                x, y, kwargs_lens, self.kwargs_light
+            )
+            assert mapping.ray_shooting_cache.misses == 2
+            mapping.set_ray_shooting_cache(False)
+            assert mapping.ray_shooting_cache is None
+            npt.assert_almost_equal(
+                flux_joint_new,
+                mapping.image_flux_joint(x, y, kwargs_lens, self.kwargs_light),
+                decimal=10,
+            )
+
+    def test_static_lens(self):
+        x, y = util.make_grid(numPix=10, deltapix=0.5)
+        for mapping in [self.singlePlane_singlePlane, self.multi_multi]:
+            flux_split, n = mapping.image_flux_split(
+                x, y, self.kwargs_lens, self.kwargs_light
+            )
+            mapping.set_static_lens(True, max_grids=2)
+            assert mapping.static_lens is True
+            for i in range(2):
+                # re-created coordinate grids are recognized
+                flux_split_static, _ = mapping.image_flux_split(
+                    x.copy(), y.copy(), self.kwargs_lens, self.kwargs_light
+                )
+                npt.assert_almost_equal(flux_split_static, flux_split, decimal=10)
+            assert mapping.ray_shooting_cache.hits == 1
+            assert mapping.ray_shooting_cache.misses == 1
+
+            kwargs_lens = copy.deepcopy(self.kwargs_lens)
+            kwargs_lens[0]["theta_E"] = 1.1
+            flux_joint = mapping.image_flux_joint(x, y, kwargs_lens, self.kwargs_light)
+            assert mapping.ray_shooting_cache.misses == 2
+            mapping.set_static_lens(False)
+            assert mapping.static_lens is False
+            npt.assert_almost_equal(
+                flux_joint,
+                mapping.image_flux_joint(x, y, kwargs_lens, self.kwargs_light),
+                decimal=10,
+            )
+
     def test__re_order_split(self):
         lens_model = LensModel(
             lens_model_list=["SIS", "SIS"],
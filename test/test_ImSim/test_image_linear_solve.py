@@ -1,5 +1,6 @@
 __author__ = "sibirrer"
 
+import copy
 import numpy as np
 
 from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
@@ -11,6 +12,7 @@ import lenstronomy.Util.simulation_util as sim_util
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
 import numpy.testing as npt
+import pytest
 
 
 class TestImageLinearFit(object):
@@ -87,6 +89,16 @@ class TestImageLinearFit(object):
             point_source_class,
             kwargs_numerics=kwargs_numerics,
         )
+        self.imageLinearFit_cholesky = ImageLinearFit(
+            data_class,
+            psf_class,
+            lens_model_class,
+            source_model_class,
+            lens_light_model_class,
+            point_source_class,
+            kwargs_numerics=kwargs_numerics,
+            wls_solver="cholesky",
+        )
         image_sim = sim_util.simulate_simple(
             self.imageLinearFit,
             self.kwargs_lens,
@@ -116,6 +128,119 @@ class TestImageLinearFit(object):
         npt.assert_almost_equal(logL - logLmarg, 0, decimal=-3)
         assert logLmarg < logL
 
+    def test_likelihood_data_given_model_cholesky(self):
+        for source_marg in [False, True]:
+            logL, param = self.imageLinearFit.likelihood_data_given_model(
+                self.kwargs_lens,
+                self.kwargs_source,
+                self.kwargs_lens_light,
+                self.kwargs_ps,
+                source_marg=source_marg,
+            )
+            logL_chol, param_chol = (
+                self.imageLinearFit_cholesky.likelihood_data_given_model(
+                    self.kwargs_lens,
+                    self.kwargs_source,
+                    self.kwargs_lens_light,
+                    self.kwargs_ps,
+                    source_marg=source_marg,
+                )
+            )
+            npt.assert_almost_equal(logL_chol, logL, decimal=6)
+            npt.assert_almost_equal(param_chol, param, decimal=8)
+
+        with pytest.raises(ValueError):
+            ImageLinearFit(
+                self.imageLinearFit.Data,
+                self.imageLinearFit.PSF,
+                wls_solver="wrong",
+            )
+
+    def test_response_cache(self):
+        n_extended = self.imageLinearFit.SourceModel.num_param_linear(
+            self.kwargs_source
+        ) + self.imageLinearFit.LensLightModel.num_param_linear(self.kwargs_lens_light)
+        A = self.imageLinearFit.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        self.imageLinearFit.set_response_cache(True)
+        for i in range(2):
+            A_cache = self.imageLinearFit.linear_response_matrix(
+                self.kwargs_lens,
+                self.kwargs_source,
+                self.kwargs_lens_light,
+                self.kwargs_ps,
+            )
+            # the point source image positions are solved stochastically in each call,
+            # only the source and lens light rows are compared
+            npt.assert_almost_equal(A_cache[:n_extended], A[:n_extended], decimal=10)
+        assert self.imageLinearFit._lens_light_cache.hits == 1
+        assert self.imageLinearFit.source_mapping.ray_shooting_cache.hits == 1
+
+        # changing the lens light and the lens model
+        kwargs_lens_light = copy.deepcopy(self.kwargs_lens_light)
+        kwargs_lens_light[0]["R_sersic"] *= 1.1
+        kwargs_lens = copy.deepcopy(self.kwargs_lens)
+        kwargs_lens[0]["theta_E"] *= 1.1
+        A_cache = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens, self.kwargs_source, kwargs_lens_light, self.kwargs_ps
+        )
+        self.imageLinearFit.set_response_cache(False)
+        A = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens, self.kwargs_source, kwargs_lens_light, self.kwargs_ps
+        )
+        npt.assert_almost_equal(A_cache[:n_extended], A[:n_extended], decimal=10)
+
+    def test_response_cache_adaptive(self):
+        supersampled_indexes = np.zeros((100, 100), dtype=bool)
+        supersampled_indexes[40:60, 40:60] = True
+        kwargs_numerics = {
+            "supersampling_factor": 2,
+            "compute_mode": "adaptive",
+            "supersampled_indexes": supersampled_indexes,
+        }
+        image_linear_fit = ImageLinearFit(
+            self.imageLinearFit.Data,
+            self.imageLinearFit.PSF,
+            self.imageLinearFit.LensModel,
+            self.imageLinearFit.SourceModel,
+            self.imageLinearFit.LensLightModel,
+            kwargs_numerics=kwargs_numerics,
+        )
+        image_linear_fit.set_response_cache(True)
+        for i in range(2):
+            image_linear_fit.linear_response_matrix(
+                self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, []
+            )
+        assert image_linear_fit._lens_light_cache.hits == 1
+        assert image_linear_fit.source_mapping.ray_shooting_cache.hits == 1
+
+    def test_static_lens(self):
+        image = self.imageLinearFit.image(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        self.imageLinearFit.set_response_cache(True)
+        self.imageLinearFit.set_static_lens(True)
+        assert self.imageLinearFit.static_lens is True
+        # the numerics (and coordinate grids) are re-initialized with a PSF update
+        self.imageLinearFit.update_psf(self.imageLinearFit.PSF)
+        self.imageLinearFit.image(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        self.imageLinearFit.update_psf(self.imageLinearFit.PSF)
+        image_static = self.imageLinearFit.image(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        npt.assert_almost_equal(image_static, image, decimal=8)
+        assert self.imageLinearFit.source_mapping.ray_shooting_cache.hits == 1
+        # turning off the static lens mode falls back to the response cache
+        self.imageLinearFit.set_static_lens(False)
+        assert self.imageLinearFit.static_lens is False
+        assert self.imageLinearFit.source_mapping.ray_shooting_cache is not None
+        self.imageLinearFit.set_response_cache(False)
+        self.imageLinearFit.set_static_lens(False)
+        assert self.imageLinearFit.source_mapping.ray_shooting_cache is None
+
     def test_image_linear_solve(self):
         model, error_map, cov_param, param = self.imageLinearFit.image_linear_solve(
             self.kwargs_lens,
@@ -141,6 +266,24 @@ class TestImageLinearFit(object):
         assert n == 3
         assert m == 100 * 100
 
+    def test_linear_response_matrix_batch(self):
+        # the batched response matrix needs to match the one computed image by image
+        A = self.imageLinearFit.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        x_grid, y_grid = self.imageLinearFit.ImageNumerics.coordinates_evaluate
+        source_light, _ = self.imageLinearFit.source_mapping.image_flux_split(
+            x_grid, y_grid, self.kwargs_lens, self.kwargs_source
+        )
+        lens_light, _ = self.imageLinearFit.LensLightModel.functions_split(
+            x_grid, y_grid, self.kwargs_lens_light
+        )
+        for i, flux in enumerate(source_light + lens_light):
+            image = self.imageLinearFit.ImageNumerics.re_size_convolve(flux)
+            npt.assert_almost_equal(
+                A[i], self.imageLinearFit.image2array_masked(image), decimal=10
+            )
+
     def test_linear_param_from_kwargs(self):
         param = self.imageLinearFit.linear_param_from_kwargs(
             self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
@@ -0,0 +1,141 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+import unittest
+
+from lenstronomy.LensModel.MultiPlane.barnes_hut import BarnesHutDeflection, benchmark
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Profiles.tnfw import TNFW
+from lenstronomy.LensModel.Profiles.point_mass import PointMass
+
+
+class TestBarnesHutDeflection(object):
+    def setup_method(self):
+        np.random.seed(42)
+        n = 300
+        self.kwargs_tnfw = [
+            {
+                "Rs": 0.02,
+                "alpha_Rs": 0.005 * np.random.uniform(0.5, 1),
+                "r_trunc": 0.2,
+                "center_x": np.random.uniform(-3, 3),
+                "center_y": np.random.uniform(-3, 3),
+            }
+            for _ in range(n)
+        ]
+        self.kwargs_point_mass = [
+            {
+                "theta_E": 0.01 * np.random.uniform(0.5, 1),
+                "center_x": np.random.uniform(-3, 3),
+                "center_y": np.random.uniform(-3, 3),
+            }
+            for _ in range(n)
+        ]
+        self.x = np.random.uniform(-2, 2, 500)
+        self.y = np.random.uniform(-2, 2, 500)
+
+    def _exact(self, profile, kwargs_list):
+        f_x, f_y = np.zeros_like(self.x), np.zeros_like(self.y)
+        for kwargs in kwargs_list:
+            f_x_, f_y_ = profile.derivatives(self.x, self.y, **kwargs)
+            f_x += f_x_
+            f_y += f_y_
+        return f_x, f_y
+
+    def test_derivatives(self):
+        for lens_model, profile, kwargs_list in [
+            ("TNFW", TNFW(), self.kwargs_tnfw),
+            ("POINT_MASS", PointMass(), self.kwargs_point_mass),
+        ]:
+            f_x, f_y = self._exact(profile, kwargs_list)
+            alpha_max = np.max(np.sqrt(f_x**2 + f_y**2))
+
+            # without opening any node the sum is exact
+            tree = BarnesHutDeflection(lens_model, opening_angle=0)
+            f_x_, f_y_ = tree.derivatives(self.x, self.y, kwargs_list)
+            npt.assert_almost_equal(f_x_, f_x, decimal=10)
+            npt.assert_almost_equal(f_y_, f_y, decimal=10)
+
+            tree = BarnesHutDeflection(
+                lens_model, opening_angle=0.3, order=4, leaf_size=8
+            )
+            f_x_, f_y_ = tree.derivatives(self.x, self.y, kwargs_list)
+            npt.assert_array_less(np.abs(f_x_ - f_x), 0.005 * alpha_max)
+            npt.assert_array_less(np.abs(f_y_ - f_y), 0.005 * alpha_max)
+            assert tree.num_nodes > 1
+
+        # scalar input
+        f_x_, f_y_ = tree.derivatives(1.0, 0.5, self.kwargs_point_mass)
+        assert np.ndim(f_x_) == 0
+
+    def test_tree_reuse(self):
+        tree = BarnesHutDeflection("TNFW")
+        assert tree.num_nodes == 0
+        tree.set_halos(self.kwargs_tnfw)
+        nodes = tree._nodes
+        tree.set_halos(self.kwargs_tnfw)
+        assert tree._nodes is nodes
+        self.kwargs_tnfw[0]["center_x"] += 0.1
+        tree.set_halos(self.kwargs_tnfw)
+        assert tree._nodes is not nodes
+
+    def test_benchmark(self):
+        result = benchmark(
+            "TNFW", self.kwargs_tnfw, self.x, self.y, opening_angle=0.3, leaf_size=8
+        )
+        assert result["max_relative_error"] < 0.005
+        for key in ["time_exact", "time_build", "time_tree"]:
+            assert result[key] > 0
+
+    def test_multi_plane(self):
+        lens_model_list = ["SIE"] + ["TNFW"] * len(self.kwargs_tnfw)
+        redshift_list = [0.5] + [0.3] * 150 + [0.6] * 150
+        kwargs_lens = [
+            {"theta_E": 1, "e1": 0.1, "e2": 0, "center_x": 0, "center_y": 0}
+        ] + self.kwargs_tnfw
+        lens_model = LensModel(
+            lens_model_list,
+            z_source=1.5,
+            lens_redshift_list=redshift_list,
+            multi_plane=True,
+        )
+        lens_model_tree = LensModel(
+            lens_model_list,
+            z_source=1.5,
+            lens_redshift_list=redshift_list,
+            multi_plane=True,
+            plane_grouping=True,
+            tree_planes={0.3: {"opening_angle": 0.3}, 0.6: None},
+        )
+        assert len(lens_model_tree.lens_model.multi_plane_base._trees) == 2
+        beta_x, beta_y = lens_model.ray_shooting(self.x, self.y, kwargs_lens)
+        beta_x_, beta_y_ = lens_model_tree.ray_shooting(self.x, self.y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_, beta_x, decimal=3)
+        npt.assert_almost_equal(beta_y_, beta_y, decimal=3)
+
+
+class TestRaise(unittest.TestCase):
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            BarnesHutDeflection("NFW")
+        with self.assertRaises(ValueError):
+            LensModel(
+                ["TNFW", "TNFW"],
+                z_source=1.5,
+                lens_redshift_list=[0.3, 0.3],
+                multi_plane=True,
+                tree_planes={0.3: None},
+            )
+        with self.assertRaises(ValueError):
+            LensModel(
+                ["TNFW", "TNFW"],
+                z_source=1.5,
+                lens_redshift_list=[0.3, 0.3],
+                multi_plane=True,
+                plane_grouping=True,
+                tree_planes={0.4: None},
+            )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -164,6 +164,137 @@ class TestMultiPlane(object):
         lens_model_mutli_2.set_background_cosmo(cosmo)
         assert lens_model_mutli._T_z_source == lens_model_mutli_2._T_z_source
 
+    def test_distance_table(self):
+        z_source = 1.5
+        lens_model_list = ["SIS", "SIS", "SIS"]
+        kwargs_lens = [
+            {"theta_E": 1, "center_x": 0, "center_y": 0},
+            {"theta_E": 0.1, "center_x": 0.3, "center_y": 0},
+            {"theta_E": 0.1, "center_x": 0, "center_y": 0.2},
+        ]
+        redshift_list = [0.5, 0.3, 0.5]
+        lens_model_table = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+        )
+        lens_model_interp = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            cosmo_interp=True,
+            num_z_interp=1000,
+        )
+        assert lens_model_interp.distance_table is None
+        table = lens_model_table.distance_table
+        npt.assert_almost_equal(
+            lens_model_table.multi_plane_base.T_ij_list[2], 0, decimal=10
+        )
+        npt.assert_almost_equal(
+            lens_model_table.multi_plane_base.T_z_list,
+            lens_model_interp.multi_plane_base.T_z_list,
+            decimal=2,
+        )
+        x, y = lens_model_table.ray_shooting(1.0, 0.5, kwargs_lens)
+        x_interp, y_interp = lens_model_interp.ray_shooting(1.0, 0.5, kwargs_lens)
+        npt.assert_almost_equal(x, x_interp, decimal=5)
+        npt.assert_almost_equal(y, y_interp, decimal=5)
+
+        # a change of the source redshift re-uses the table of the lens redshifts
+        lens_model = LensModel(
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            z_source=z_source,
+            z_lens=0.5,
+            multi_plane=True,
+        )
+        table = lens_model.lens_model.distance_table
+        assert lens_model._lensCosmo.background.distance_table is table
+        size = table.size
+        lens_model.change_source_redshift(z_source=2)
+        assert lens_model.lens_model.distance_table is table
+        assert table.size == size + 1
+
+    def test_plane_grouping(self):
+        z_source = 1.5
+        lens_model_list = ["EPL", "SHEAR", "TNFW", "TNFW", "NFW", "TNFW", "SIS"]
+        redshift_list = [0.5, 0.5, 0.5, 0.3, 0.3, 0.3, 0.7]
+        kwargs_lens = [
+            {
+                "theta_E": 1,
+                "gamma": 2.1,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"gamma1": 0.02, "gamma2": 0.01},
+            {
+                "Rs": 0.1,
+                "alpha_Rs": 0.02,
+                "r_trunc": 1,
+                "center_x": 0.5,
+                "center_y": 0.2,
+            },
+            {
+                "Rs": 0.1,
+                "alpha_Rs": 0.03,
+                "r_trunc": 1,
+                "center_x": -0.5,
+                "center_y": 0.2,
+            },
+            {"Rs": 0.3, "alpha_Rs": 0.05, "center_x": 0.3, "center_y": -0.7},
+            {
+                "Rs": 0.1,
+                "alpha_Rs": 0.02,
+                "r_trunc": 0.5,
+                "center_x": 1,
+                "center_y": -0.5,
+            },
+            {"theta_E": 0.1, "center_x": -1, "center_y": -1},
+        ]
+        lens_model = LensModel(
+            lens_model_list,
+            z_source=z_source,
+            lens_redshift_list=redshift_list,
+            multi_plane=True,
+        )
+        lens_model_grouped = LensModel(
+            lens_model_list,
+            z_source=z_source,
+            lens_redshift_list=redshift_list,
+            multi_plane=True,
+            plane_grouping=True,
+        )
+        multi_plane_base = lens_model_grouped.lens_model.multi_plane_base
+        assert len(multi_plane_base._planes) == 3
+        # the TNFW halos at z=0.3 are stacked
+        assert [len(group) for group in multi_plane_base._planes[0][2]] == [2, 1]
+
+        x, y = np.meshgrid(np.linspace(-2, 2, 10), np.linspace(-2, 2, 10))
+        for x_, y_ in [(1.0, 0.5), (x, y), (x.flatten(), y.flatten())]:
+            beta_x, beta_y = lens_model.ray_shooting(x_, y_, kwargs_lens)
+            beta_x_, beta_y_ = lens_model_grouped.ray_shooting(x_, y_, kwargs_lens)
+            assert np.shape(beta_x_) == np.shape(beta_x)
+            npt.assert_almost_equal(beta_x_, beta_x, decimal=10)
+            npt.assert_almost_equal(beta_y_, beta_y, decimal=10)
+            f_xx, f_xy, f_yx, f_yy = lens_model.hessian(x_, y_, kwargs_lens)
+            f_xx_, f_xy_, f_yx_, f_yy_ = lens_model_grouped.hessian(x_, y_, kwargs_lens)
+            npt.assert_almost_equal(f_xx_, f_xx, decimal=5)
+            npt.assert_almost_equal(f_xy_, f_xy, decimal=5)
+
+        # deflectors that can not be stacked are evaluated one by one
+        multi_plane_base._batch_size = 1
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs_lens)
+        beta_x_, beta_y_ = lens_model_grouped.ray_shooting(x, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_, beta_x, decimal=10)
+        multi_plane_base._batch_size = 20000
+        kwargs_lens[3] = {"Rs": 0.1, "alpha_Rs": 0.03, "r_trunc": 1}
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs_lens)
+        beta_x_, beta_y_ = lens_model_grouped.ray_shooting(x, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_, beta_x, decimal=10)
+        npt.assert_almost_equal(beta_y_, beta_y, decimal=10)
+
     def test_sis_ray_tracing(self):
         z_source = 1.5
         lens_model_list = ["SIS"]
@@ -1,4 +1,8 @@
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Profiles.sis import SIS
+from lenstronomy.LensModel.Profiles.gaussian_potential import GaussianPotential
+import numpy as np
+import numpy.testing as npt
 import unittest
 
 
@@ -11,6 +15,34 @@ class TestBaseProfile(object):
         base.set_static()
         base.set_dynamic()
 
+    def test_derivatives_batch(self):
+        x = np.linspace(-2, 2, 11)
+        y = np.linspace(-1, 1, 11)
+        theta_E = np.array([0.5, 1.0, 1.5])
+        center_x = np.array([0.0, 0.1, -0.1])
+        for profile in [SIS(), GaussianPotential()]:
+            if isinstance(profile, SIS):
+                kwargs = {"theta_E": theta_E, "center_x": center_x, "center_y": 0.1}
+            else:
+                kwargs = {"amp": theta_E, "sigma_x": 1, "sigma_y": 1.5}
+            f_x, f_y = profile.derivatives_batch(x, y, **kwargs)
+            assert f_x.shape == (3, 11)
+            assert f_y.shape == (3, 11)
+            for i in range(3):
+                kwargs_i = {
+                    key: value[i] if np.ndim(value) > 0 else value
+                    for key, value in kwargs.items()
+                }
+                f_x_i, f_y_i = profile.derivatives(x, y, **kwargs_i)
+                npt.assert_almost_equal(f_x[i], f_x_i, decimal=12)
+                npt.assert_almost_equal(f_y[i], f_y_i, decimal=12)
+
+        # parameters shared among all samples
+        f_x, f_y = SIS().derivatives_batch(x, y, theta_E=1.0)
+        assert f_x.shape == (1, 11)
+        f_x_, f_y_ = SIS().derivatives(x, y, theta_E=1.0)
+        npt.assert_almost_equal(f_x[0], f_x_, decimal=12)
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
@@ -27,3 +59,7 @@ class TestRaise(unittest.TestCase):
             base.mass_3d_lens()
         with self.assertRaises(ValueError):
             base.mass_2d_lens()
+        with self.assertRaises(ValueError):
+            SIS().derivatives_batch(
+                np.ones(3), np.ones(3), theta_E=np.ones(2), center_x=np.zeros(3)
+            )
@@ -0,0 +1,134 @@
+__author__ = "sibirrer"
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import unittest
+
+from lenstronomy.LensModel.Profiles.emulated_profile import EmulatedProfile
+from lenstronomy.LensModel.profile_list_base import lens_class
+
+
+class TestEmulatedProfile(object):
+    def setup_method(self):
+        self.x = np.linspace(-3, 3, 50)
+        self.y = np.linspace(-2, 2.5, 50) + 0.05
+        self.kwargs_list = {
+            "NFW": {"Rs": 1.2, "alpha_Rs": 0.7, "center_x": 0.1, "center_y": -0.2},
+            "TNFW": {
+                "Rs": 1.2,
+                "alpha_Rs": 0.7,
+                "r_trunc": 5.0,
+                "center_x": 0.1,
+                "center_y": -0.2,
+            },
+            "SERSIC": {
+                "k_eff": 0.7,
+                "R_sersic": 1.2,
+                "n_sersic": 3.0,
+                "center_x": 0.1,
+                "center_y": -0.2,
+            },
+            "MULTI_GAUSSIAN": {
+                "amp": np.array([1.0, 2.0]),
+                "sigma": np.array([0.5, 1.5]),
+                "center_x": 0.1,
+                "center_y": -0.2,
+            },
+            "NFW_ELLIPSE_POTENTIAL": {
+                "Rs": 1.2,
+                "alpha_Rs": 0.7,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0.1,
+                "center_y": -0.2,
+            },
+            "HERNQUIST_ELLIPSE_POTENTIAL": {
+                "sigma0": 0.7,
+                "Rs": 1.2,
+                "e1": -0.1,
+                "e2": 0.05,
+                "center_x": 0.1,
+                "center_y": -0.2,
+            },
+        }
+
+    def test_derivatives(self):
+        for lens_model, kwargs in self.kwargs_list.items():
+            profile = lens_class(lens_model)
+            emulated = EmulatedProfile(lens_model, accuracy=0.0001)
+            f_x, f_y = profile.derivatives(self.x, self.y, **kwargs)
+            f_x_emu, f_y_emu = emulated.derivatives(self.x, self.y, **kwargs)
+            alpha_max = np.max(np.sqrt(f_x**2 + f_y**2))
+            npt.assert_allclose(f_x_emu, f_x, rtol=0, atol=alpha_max * 2e-4)
+            npt.assert_allclose(f_y_emu, f_y, rtol=0, atol=alpha_max * 2e-4)
+            assert emulated.emulation_error < 2e-4
+
+    def test_hessian(self):
+        for lens_model, kwargs in self.kwargs_list.items():
+            profile = lens_class(lens_model)
+            emulated = EmulatedProfile(lens_model)
+            f_xx, f_xy, f_yx, f_yy = profile.hessian(self.x, self.y, **kwargs)
+            hessian_emu = emulated.hessian(self.x, self.y, **kwargs)
+            f_max = np.max(np.abs([f_xx, f_xy, f_yy]))
+            for value, value_emu in zip([f_xx, f_xy, f_yx, f_yy], hessian_emu):
+                npt.assert_allclose(value_emu, value, rtol=0, atol=f_max * 5e-3)
+
+    def test_function(self):
+        kwargs = self.kwargs_list["NFW"]
+        emulated = EmulatedProfile("NFW")
+        npt.assert_almost_equal(
+            emulated.function(self.x, self.y, **kwargs),
+            lens_class("NFW").function(self.x, self.y, **kwargs),
+            decimal=10,
+        )
+
+    def test_table_reuse(self):
+        emulated = EmulatedProfile("TNFW_ELLIPSE_POTENTIAL", rtol=0.01)
+        profile = lens_class("TNFW_ELLIPSE_POTENTIAL")
+        kwargs = {
+            "Rs": 1.2,
+            "alpha_Rs": 0.7,
+            "r_trunc": 5.0,
+            "e1": 0.1,
+            "e2": -0.05,
+            "center_x": 0.1,
+            "center_y": -0.2,
+        }
+        emulated.derivatives(self.x, self.y, **kwargs)
+        assert emulated.num_tables == 1
+        # changes in center, ellipticity and amplitude re-use the table
+        kwargs_new = dict(kwargs, alpha_Rs=1.5, e1=-0.2, center_x=0.5)
+        f_x_emu, f_y_emu = emulated.derivatives(self.x, self.y, **kwargs_new)
+        f_x, f_y = profile.derivatives(self.x, self.y, **kwargs_new)
+        npt.assert_allclose(f_x_emu, f_x, rtol=0, atol=1e-3)
+        npt.assert_allclose(f_y_emu, f_y, rtol=0, atol=1e-3)
+        # shape parameters within the tolerance
+        emulated.derivatives(self.x, self.y, **dict(kwargs, Rs=1.201))
+        assert emulated.num_tables == 1
+        emulated.derivatives(self.x, self.y, **dict(kwargs, Rs=1.5))
+        assert emulated.num_tables == 2
+
+    def test_extrapolation(self):
+        # cored profile with finite mass: alpha ~ r inside and ~ 1/r outside
+        emulated = EmulatedProfile("MULTI_GAUSSIAN", r_min=0.01, r_max=50)
+        profile = lens_class("MULTI_GAUSSIAN")
+        kwargs = {"amp": np.array([1.0, 2.0]), "sigma": np.array([0.5, 1.5])}
+        r = np.array([0.0001, 1000])
+        f_x_emu, _ = emulated.derivatives(r, 0, **kwargs)
+        f_x, _ = profile.derivatives(r, 0, **kwargs)
+        npt.assert_allclose(f_x_emu, f_x, rtol=1e-3)
+        f_xx_emu, _, _, f_yy_emu = emulated.hessian(r, 0, **kwargs)
+        f_xx, _, _, f_yy = profile.hessian(r, 0, **kwargs)
+        npt.assert_allclose(f_xx_emu, f_xx, rtol=1e-3)
+        npt.assert_allclose(f_yy_emu, f_yy, rtol=1e-3)
+
+
+class TestRaise(unittest.TestCase):
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            EmulatedProfile("SERSIC_ELLIPSE_KAPPA")
+
+
+if __name__ == "__main__":
+    pytest.main()
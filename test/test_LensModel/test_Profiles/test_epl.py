@@ -1,6 +1,8 @@
 __author__ = "sibirrer"
 
 
+import subprocess
+import sys
 import numpy as np
 import pytest
 import numpy.testing as npt
@@ -258,5 +260,69 @@ class TestEPLQPhi(object):
                         npt.assert_almost_equal(f_y, f_y_qphi, decimal=4)
 
 
+class TestEPLBackend(object):
+    """Tests the numba backend of the EPL profile against the default one."""
+
+    def setup_method(self):
+        from lenstronomy.LensModel.Profiles.epl import EPL
+
+        self.epl = EPL()
+        self.epl_numba = EPL(backend="numba")
+
+    def test_backend(self):
+        x, y = util.make_grid(numPix=20, deltapix=0.2)
+        x = np.append(x, 0)
+        y = np.append(y, 0)
+        kwargs = {
+            "theta_E": 1.2,
+            "gamma": 2.2,
+            "e1": 0.1,
+            "e2": -0.2,
+            "center_x": 0,
+            "center_y": 0,
+        }
+        for func in ["function", "derivatives", "hessian"]:
+            values = getattr(self.epl, func)(x, y, **kwargs)
+            values_numba = getattr(self.epl_numba, func)(x, y, **kwargs)
+            npt.assert_almost_equal(values_numba, values, decimal=8)
+        f_x, f_y = self.epl.derivatives(1.0, 0.5, **kwargs)
+        f_x_numba, f_y_numba = self.epl_numba.derivatives(1.0, 0.5, **kwargs)
+        assert np.shape(f_x_numba) == np.shape(f_x)
+        npt.assert_almost_equal(f_x_numba, f_x, decimal=10)
+
+        # parallel kernels, evaluated in a separate process as numba's threading layer
+        # may break fork-based multiprocessing pools of other tests after a prange call
+        code = """
+import numpy as np
+import numpy.testing as npt
+from lenstronomy.Util import numba_util, util
+from lenstronomy.LensModel.Profiles.epl import EPL
+
+numba_util.prange_enabled = True
+numba_util.prange_min_size = 0
+x, y = util.make_grid(numPix=20, deltapix=0.2)
+kwargs = %r
+values_parallel = EPL(backend="numba").derivatives(x, y, **kwargs)
+npt.assert_almost_equal(values_parallel, EPL().derivatives(x, y, **kwargs), decimal=8)
+"""
+        subprocess.run([sys.executable, "-c", code % kwargs], check=True, timeout=600)
+
+        # batched parameters fall back to the scipy implementation
+        theta_E = np.array([1.0, 1.5])
+        f_x, f_y = self.epl_numba.derivatives(
+            np.array([1.0, 1.0]), 0.5, theta_E, 2.1, 0.1, 0.0
+        )
+        f_x_, f_y_ = self.epl.derivatives(
+            np.array([1.0, 1.0]), 0.5, theta_E, 2.1, 0.1, 0.0
+        )
+        npt.assert_almost_equal(f_x, f_x_, decimal=10)
+
+    def test_raise(self):
+        from lenstronomy.LensModel.Profiles.epl import EPL
+
+        with pytest.raises(ValueError):
+            EPL(backend="fortran")
+
+
 if __name__ == "__main__":
     pytest.main()
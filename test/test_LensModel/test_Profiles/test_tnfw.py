@@ -27,6 +27,29 @@ class TestTNFW(object):
         np.testing.assert_almost_equal(xdef_t, xdef, 5)
         np.testing.assert_almost_equal(ydef_t, ydef, 5)
 
+    def test_derivatives_batch(self):
+        x = np.linspace(-1, 1, 20)
+        y = np.linspace(-0.5, 1, 20)
+        kwargs = {
+            "Rs": np.array([0.1, 0.2, 0.5]),
+            "alpha_Rs": np.array([0.01, 0.02, 0.03]),
+            "r_trunc": np.array([1.0, 2.0, 5.0]),
+            "center_x": 0.1,
+            "center_y": 0,
+        }
+        f_x, f_y = self.tnfw.derivatives_batch(x, y, **kwargs)
+        for i in range(3):
+            f_x_i, f_y_i = self.tnfw.derivatives(
+                x,
+                y,
+                Rs=kwargs["Rs"][i],
+                alpha_Rs=kwargs["alpha_Rs"][i],
+                r_trunc=kwargs["r_trunc"][i],
+                center_x=0.1,
+            )
+            npt.assert_almost_equal(f_x[i], f_x_i, decimal=12)
+            npt.assert_almost_equal(f_y[i], f_y_i, decimal=12)
+
     def test_potential_limit(self):
         Rs = 0.2
         alpha_Rs = 0.1
@@ -0,0 +1,74 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Solver.fixed_lens_equation_solver import (
+    FixedLensEquationSolver,
+)
+from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
+
+
+class TestFixedLensEquationSolver(object):
+    def setup_method(self):
+        self.lensModel = LensModel(["SPEP", "SIS", "SHEAR"])
+        self.kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 1.9,
+                "e1": 0.2,
+                "e2": -0.03,
+                "center_x": 0.1,
+                "center_y": -0.1,
+            },
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"gamma1": 0.03, "gamma2": -0.02},
+        ]
+        self.solver = FixedLensEquationSolver(
+            self.lensModel, self.kwargs_lens, min_distance=0.02, search_window=5
+        )
+
+    def test_image_position_from_source(self):
+        lensEquationSolver = LensEquationSolver(self.lensModel)
+        np.random.seed(42)
+        for i in range(10):
+            source_x, source_y = np.random.uniform(-0.2, 0.2, 2)
+            x_pos, y_pos = lensEquationSolver.image_position_from_source(
+                source_x, source_y, self.kwargs_lens, min_distance=0.02, search_window=5
+            )
+            x_pos_fixed, y_pos_fixed = self.solver.image_position_from_source(
+                source_x, source_y
+            )
+            assert len(x_pos_fixed) == len(x_pos)
+            npt.assert_almost_equal(x_pos_fixed, x_pos, decimal=8)
+            npt.assert_almost_equal(y_pos_fixed, y_pos, decimal=8)
+            beta_x, beta_y = self.lensModel.ray_shooting(
+                x_pos_fixed, y_pos_fixed, self.kwargs_lens
+            )
+            npt.assert_almost_equal(beta_x, source_x, decimal=10)
+            npt.assert_almost_equal(beta_y, source_y, decimal=10)
+
+        x_pos, y_pos = self.solver.image_position_from_source(
+            0.05, 0.02, magnification_limit=2, arrival_time_sort=False
+        )
+        mag = self.lensModel.magnification(x_pos, y_pos, self.kwargs_lens)
+        assert np.all(np.abs(mag) >= 2)
+
+    def test_candidate_solutions(self):
+        x_mins, y_mins = self.solver.candidate_solutions(0.05, 0.02)
+        assert len(x_mins) >= 4
+        # the linear interpolation in the triangles is close to the solutions
+        beta_x, beta_y = self.lensModel.ray_shooting(x_mins, y_mins, self.kwargs_lens)
+        assert np.min(np.abs(beta_x - 0.05)) < 0.02
+
+        x_critical, y_critical = self.solver.critical_triangles
+        assert x_critical.shape[1] == 3
+        assert len(x_critical) > 0
+        mag = self.lensModel.magnification(
+            np.mean(x_critical, axis=1), np.mean(y_critical, axis=1), self.kwargs_lens
+        )
+        assert np.median(np.abs(mag)) > 10
+
+
+if __name__ == "__main__":
+    pytest.main()
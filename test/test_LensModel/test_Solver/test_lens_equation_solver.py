@@ -121,6 +121,164 @@ class TestLensEquationSolver(object):
         source_x, source_y = lensModel.ray_shooting(x_pos, y_pos, kwargs_lens)
         npt.assert_almost_equal(sourcePos_x, source_x, decimal=10)
 
+    def test_vectorized(self):
+        lens_model_list = ["SPEP", "SIS", "SHEAR"]
+        kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 1.9,
+                "e1": 0.2,
+                "e2": -0.03,
+                "center_x": 0.1,
+                "center_y": -0.1,
+            },
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"gamma1": 0.03, "gamma2": -0.02},
+        ]
+        sourcePos_x, sourcePos_y = 0.05, -0.03
+        kwargs_solver = {
+            "min_distance": 0.05,
+            "search_window": 5,
+            "precision_limit": 10 ** (-10),
+            "num_iter_max": 100,
+        }
+        for multi_plane in [False, True]:
+            lensModel = LensModel(
+                lens_model_list,
+                z_source=1.0,
+                lens_redshift_list=[0.5, 0.3, 0.5],
+                multi_plane=multi_plane,
+            )
+            lensEquationSolver = LensEquationSolver(lensModel)
+            x_pos, y_pos = lensEquationSolver.image_position_from_source(
+                sourcePos_x, sourcePos_y, kwargs_lens, **kwargs_solver
+            )
+            x_pos_vec, y_pos_vec = lensEquationSolver.image_position_from_source(
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                solver="vectorized",
+                **kwargs_solver,
+            )
+            assert len(x_pos_vec) == len(x_pos) == 4
+            npt.assert_almost_equal(x_pos_vec, x_pos, decimal=8)
+            npt.assert_almost_equal(y_pos_vec, y_pos, decimal=8)
+            source_x, source_y = lensModel.ray_shooting(
+                x_pos_vec, y_pos_vec, kwargs_lens
+            )
+            npt.assert_almost_equal(source_x, sourcePos_x, decimal=10)
+            npt.assert_almost_equal(source_y, sourcePos_y, decimal=10)
+
+        # candidates far away from a solution stop at the maximum number of iterations
+        x_min, y_min, delta = lensEquationSolver.refine_solutions(
+            np.array([x_pos[0] + 0.01, 3.0]),
+            np.array([y_pos[0], 3.0]),
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            num_iter_max=5,
+            verbose=True,
+            min_distance=0.05,
+        )
+        assert delta[0] < 10 ** (-10)
+        assert delta[1] > 10 ** (-10)
+        x_min, y_min, delta = lensEquationSolver._find_gradient_decent_vectorized(
+            np.array([]), np.array([]), sourcePos_x, sourcePos_y, kwargs_lens
+        )
+        assert len(x_min) == 0
+
+        with pytest.raises(ValueError):
+            lensEquationSolver.image_position_from_source(
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                solver="vectorized",
+                non_linear=True,
+            )
+
+    def test_hierarchical(self):
+        lens_model_list = ["SPEP", "SIS", "SHEAR"]
+        kwargs_lens = [
+            {
+                "theta_E": 1,
+                "gamma": 2,
+                "e1": 0.2,
+                "e2": -0.03,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"theta_E": 1, "center_x": 1.5, "center_y": 0},
+            {"gamma1": 0.01, "gamma2": 0},
+        ]
+        sourcePos_x, sourcePos_y = 0.1, -0.1
+        kwargs_solver = {
+            "min_distance": 0.05,
+            "search_window": 10,
+            "precision_limit": 10 ** (-10),
+            "num_iter_max": 10,
+        }
+        for multi_plane in [False, True]:
+            lensModel = LensModel(
+                lens_model_list,
+                z_source=1.0,
+                lens_redshift_list=[0.5, 0.5, 0.5],
+                multi_plane=multi_plane,
+            )
+            lensEquationSolver = LensEquationSolver(lensModel)
+            x_pos, y_pos = lensEquationSolver.image_position_from_source(
+                sourcePos_x, sourcePos_y, kwargs_lens, **kwargs_solver
+            )
+            for solver in ["lenstronomy", "vectorized"]:
+                x_pos_h, y_pos_h = lensEquationSolver.image_position_from_source(
+                    sourcePos_x,
+                    sourcePos_y,
+                    kwargs_lens,
+                    solver=solver,
+                    hierarchical=True,
+                    **kwargs_solver,
+                )
+                assert len(x_pos_h) == len(x_pos) == 4
+                npt.assert_almost_equal(x_pos_h, x_pos, decimal=8)
+                npt.assert_almost_equal(y_pos_h, y_pos, decimal=8)
+
+        # the hierarchical search ray-traces only a fraction of the full grid
+        num_rays = []
+        ray_shooting = lensModel.ray_shooting
+
+        def ray_shooting_count(x, y, kwargs, **kwargs_ray_shooting):
+            num_rays.append(np.size(x))
+            return ray_shooting(x, y, kwargs, **kwargs_ray_shooting)
+
+        lensModel.ray_shooting = ray_shooting_count
+        lensEquationSolver.candidate_solutions(
+            sourcePos_x, sourcePos_y, kwargs_lens, min_distance=0.05, search_window=10
+        )
+        num_rays_grid = np.sum(num_rays)
+        num_rays = []
+        x_mins, y_mins, delta_map, pixel_width = lensEquationSolver.candidate_solutions(
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=10,
+            hierarchical=True,
+        )
+        assert np.sum(num_rays) < num_rays_grid / 10
+        assert pixel_width == 0.05
+        assert len(x_mins) >= 4
+
+        # search window without images
+        x_mins, y_mins, delta_map, pixel_width = lensEquationSolver.candidate_solutions(
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            x_center=30,
+            hierarchical=True,
+        )
+        assert len(x_mins) == 0
+
     def test_central_image(self):
         lens_model_list = ["SPEP", "SIS", "SHEAR"]
         kwargs_spep = {
@@ -177,6 +177,79 @@ class TestLensModel(object):
         # assert delta_x == 1 + 0.19470019576785122/(8*np.pi)
         # assert delta_y == 1 + 0.19470019576785122/(8*np.pi)
 
+    def test_ray_shooting_batch(self):
+        kwargs_batch = [
+            {"theta_E": np.array([0.9, 1.0, 1.1]), "center_x": 0, "center_y": 0},
+            {"gamma1": np.array([0.01, 0.02, -0.03]), "gamma2": 0.0},
+        ]
+        x, y = np.linspace(-1, 1, 10), np.linspace(1, -0.5, 10)
+        for lensModel in [
+            LensModel(["SIS", "SHEAR"]),
+            LensModel(
+                ["SIS", "SHEAR"],
+                multi_plane=True,
+                lens_redshift_list=[0.5, 0.3],
+                z_source=2,
+            ),
+        ]:
+            beta_x, beta_y = lensModel.ray_shooting_batch(x, y, kwargs_batch)
+            assert beta_x.shape == (3, 10)
+            for i in range(3):
+                kwargs_i = [
+                    {"theta_E": [0.9, 1.0, 1.1][i], "center_x": 0, "center_y": 0},
+                    {"gamma1": [0.01, 0.02, -0.03][i], "gamma2": 0.0},
+                ]
+                beta_x_i, beta_y_i = lensModel.ray_shooting(x, y, kwargs_i)
+                npt.assert_almost_equal(beta_x[i], beta_x_i, decimal=10)
+                npt.assert_almost_equal(beta_y[i], beta_y_i, decimal=10)
+
+    def test_backend(self):
+        lens_model_list = ["EPL", "SHEAR", "EPL_MULTIPOLE_M3M4_ELL"]
+        kwargs = [
+            {
+                "theta_E": 1.0,
+                "gamma": 2.1,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0.0,
+                "center_y": 0.0,
+            },
+            {"gamma1": 0.03, "gamma2": -0.01},
+            {
+                "theta_E": 0.2,
+                "gamma": 1.9,
+                "e1": 0.0,
+                "e2": 0.1,
+                "a3_a": 0.01,
+                "delta_phi_m3": 0.1,
+                "a4_a": 0.02,
+                "delta_phi_m4": 0.2,
+                "center_x": 0.5,
+                "center_y": 0.0,
+            },
+        ]
+        lens_model = LensModel(lens_model_list)
+        lens_model_numba = LensModel(lens_model_list, backend="numba")
+        assert lens_model_numba.profile_kwargs_list[0] == {"backend": "numba"}
+        assert lens_model_numba.profile_kwargs_list[1] == {}
+        x, y = make_grid(numPix=10, deltapix=0.3)
+        for func in ["ray_shooting", "hessian", "potential"]:
+            npt.assert_almost_equal(
+                getattr(lens_model_numba, func)(x, y, kwargs),
+                getattr(lens_model, func)(x, y, kwargs),
+                decimal=8,
+            )
+        # explicit profile keyword arguments are kept
+        lens_model_numba = LensModel(
+            ["EPL", "EPL"],
+            profile_kwargs_list=[{"backend": "scipy"}, {}],
+            backend="numba",
+        )
+        assert lens_model_numba.profile_kwargs_list == [
+            {"backend": "scipy"},
+            {"backend": "numba"},
+        ]
+
     def test_arrival_time(self):
         z_lens = 0.5
         z_source = 1.5
@@ -261,6 +334,110 @@ class TestLensModel(object):
         npt.assert_almost_equal(f_yx_sq, f_yx, decimal=5)
         npt.assert_almost_equal(f_yy_sq, f_yy, decimal=5)
 
+    def test_lensing_quantities(self):
+        lens_model = LensModel(
+            lens_model_list=["SIS", "SIS"],
+            multi_plane=True,
+            lens_redshift_list=[0.2, 0.8],
+            z_source=1.5,
+        )
+        kwargs = [
+            {"theta_E": 1.0, "center_x": 0.0, "center_y": 0.0},
+            {"theta_E": 0.3, "center_x": 0.2, "center_y": 0.1},
+        ]
+        x, y = make_grid(numPix=5, deltapix=0.3)
+        diff = 0.0001
+        quantities = lens_model.lensing_quantities(
+            x,
+            y,
+            kwargs,
+            which=["kappa", "gamma", "gamma1", "magnification", "curl", "hessian"],
+            diff=diff,
+        )
+        npt.assert_almost_equal(
+            quantities["kappa"], lens_model.kappa(x, y, kwargs, diff=diff), decimal=8
+        )
+        gamma1, gamma2 = lens_model.gamma(x, y, kwargs, diff=diff)
+        npt.assert_almost_equal(quantities["gamma"][0], gamma1, decimal=8)
+        npt.assert_almost_equal(quantities["gamma"][1], gamma2, decimal=8)
+        npt.assert_almost_equal(quantities["gamma1"], gamma1, decimal=8)
+        npt.assert_almost_equal(
+            quantities["magnification"],
+            lens_model.magnification(x, y, kwargs, diff=diff),
+            decimal=8,
+        )
+        npt.assert_almost_equal(
+            quantities["curl"], lens_model.curl(x, y, kwargs, diff=diff), decimal=8
+        )
+        npt.assert_almost_equal(
+            quantities["hessian"],
+            lens_model.hessian(x, y, kwargs, diff=diff),
+            decimal=8,
+        )
+        assert "gamma2" not in quantities
+
+    def test_hessian_memo(self):
+        lens_model = LensModel(lens_model_list=["SIS"])
+        kwargs = [{"theta_E": 1.0, "center_x": 0.01, "center_y": 0.0}]
+        x, y = make_grid(numPix=5, deltapix=0.3)
+        kappa = lens_model.kappa(x, y, kwargs, diff=0.0001)
+        mag = lens_model.magnification(x, y, kwargs, diff=0.0001)
+
+        lens_model.set_hessian_memo(True)
+        npt.assert_almost_equal(lens_model.kappa(x, y, kwargs, diff=0.0001), kappa)
+        npt.assert_almost_equal(
+            lens_model.magnification(x, y, kwargs, diff=0.0001), mag
+        )
+        lens_model.gamma(x, y, kwargs, diff=0.0001)
+        assert lens_model._hessian_memo.hits == 2
+
+        # changes in the keyword arguments, the coordinates or the options re-compute
+        kwargs[0]["theta_E"] = 2.0
+        kappa_new = lens_model.kappa(x, y, kwargs, diff=0.0001)
+        npt.assert_almost_equal(kappa_new, 2 * kappa, decimal=5)
+        lens_model.kappa(x, y, kwargs)
+        lens_model.kappa(x + 0.1, y, kwargs)
+        assert lens_model._hessian_memo.hits == 2
+        lens_model.set_dynamic()
+        lens_model.kappa(x, y, kwargs)
+        assert lens_model._hessian_memo.hits == 2
+
+        lens_model.set_hessian_memo(False)
+        assert lens_model._hessian_memo is None
+
+    def test_set_emulation(self):
+        kwargs = [
+            {"Rs": 1.0, "alpha_Rs": 0.5, "r_trunc": 5.0, "center_x": 0, "center_y": 0},
+            {"theta_E": 1.0, "center_x": 0.1, "center_y": 0},
+            {"Rs": 0.5, "alpha_Rs": 0.1, "r_trunc": 2.0, "center_x": 1, "center_y": 0},
+        ]
+        x, y = make_grid(numPix=10, deltapix=0.3)
+        for kwargs_model in [
+            {},
+            {
+                "multi_plane": True,
+                "lens_redshift_list": [0.5, 0.5, 0.5],
+                "z_source": 2,
+                "plane_grouping": True,
+            },
+        ]:
+            lens_model = LensModel(["TNFW", "SIS", "TNFW"], **kwargs_model)
+            beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs)
+            kappa = lens_model.kappa(x, y, kwargs)
+            lens_model.set_emulation(True, accuracy=0.00001)
+            beta_x_emu, beta_y_emu = lens_model.ray_shooting(x, y, kwargs)
+            npt.assert_almost_equal(beta_x_emu, beta_x, decimal=4)
+            npt.assert_almost_equal(beta_y_emu, beta_y, decimal=4)
+            npt.assert_almost_equal(lens_model.kappa(x, y, kwargs), kappa, decimal=3)
+            error_list = lens_model.emulation_error_list
+            assert error_list[1] is None
+            assert error_list[0] < 0.00001 and error_list[2] < 0.00001
+
+            lens_model.set_emulation(False)
+            assert lens_model.emulation_error_list == [None, None, None]
+            beta_x_exact, _ = lens_model.ray_shooting(x, y, kwargs)
+            npt.assert_almost_equal(beta_x_exact, beta_x, decimal=10)
+
     def test_hessian_z1z2(self):
         z_source = 1.5
         lens_model_list = ["SIS"]
@@ -446,6 +623,8 @@ class TestLensModel(object):
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
+        with self.assertRaises(ValueError):
+            LensModel(["EPL"], backend="jax")
         with self.assertRaises(ValueError):
             kwargs = [{"alpha_Rs": 1, "Rs": 0.5, "center_x": 0, "center_y": 0}]
             lensModel = LensModel(
@@ -550,6 +729,12 @@ class TestRaise(unittest.TestCase):
                 z_source_convention=2,
             )
 
+    def test_lensing_quantities_raise(self):
+        lens_model = LensModel(lens_model_list=["SIS"])
+        kwargs = [{"theta_E": 1.0, "center_x": 0.0, "center_y": 0.0}]
+        with self.assertRaises(ValueError):
+            lens_model.lensing_quantities(1.0, 1.0, kwargs, which=["shear"])
+
     def test_hessian_z1z2_raise(self):
         lensModel = LensModel(
             lens_model_list=["SIS"],
@@ -53,6 +53,63 @@ class TestLensModel(object):
         assert delta_x == 1 + 0.19470019576785122 / (8 * np.pi)
         assert delta_y == 1 + 0.19470019576785122 / (8 * np.pi)
 
+    def test_ray_shooting_batch(self):
+        lens_model_list = ["EPL", "SHEAR", "NFW", "SIS", "SIE", "GAUSSIAN_POTENTIAL"]
+        lensModel = SinglePlane(lens_model_list)
+        np.random.seed(42)
+        n = 5
+        kwargs_batch = [
+            {
+                "theta_E": np.random.uniform(0.8, 1.2, n),
+                "gamma": np.random.uniform(1.8, 2.2, n),
+                "e1": np.random.uniform(-0.2, 0.2, n),
+                "e2": np.random.uniform(-0.2, 0.2, n),
+                "center_x": 0.0,
+                "center_y": np.random.normal(0, 0.05, n),
+            },
+            {"gamma1": np.random.uniform(-0.05, 0.05, n), "gamma2": 0.01},
+            {
+                "Rs": np.random.uniform(1, 2, n),
+                "alpha_Rs": np.random.uniform(0.05, 0.2, n),
+                "center_x": 0.5,
+                "center_y": 0.5,
+            },
+            {"theta_E": np.random.uniform(0.05, 0.1, n), "center_x": -1, "center_y": 0},
+            {
+                "theta_E": 0.1,
+                "e1": np.random.uniform(-0.2, 0.2, n),
+                "e2": np.random.uniform(-0.2, 0.2, n),
+                "center_x": 1,
+                "center_y": -1,
+            },
+            {
+                "amp": np.random.uniform(0.1, 0.2, n),
+                "sigma_x": 1.0,
+                "sigma_y": 1.0,
+                "center_x": 0,
+                "center_y": 0,
+            },
+        ]
+        x = np.random.uniform(-2, 2, 100)
+        y = np.random.uniform(-2, 2, 100)
+        beta_x, beta_y = lensModel.ray_shooting_batch(x, y, kwargs_batch)
+        assert beta_x.shape == (n, 100)
+        alpha_x, alpha_y = lensModel.alpha_batch(x, y, kwargs_batch, k=[0, 2])
+        for i in range(n):
+            kwargs_i = [
+                {
+                    key: value[i] if np.ndim(value) > 0 else value
+                    for key, value in kwargs.items()
+                }
+                for kwargs in kwargs_batch
+            ]
+            beta_x_i, beta_y_i = lensModel.ray_shooting(x, y, kwargs_i)
+            npt.assert_almost_equal(beta_x[i], beta_x_i, decimal=10)
+            npt.assert_almost_equal(beta_y[i], beta_y_i, decimal=10)
+            alpha_x_i, alpha_y_i = lensModel.alpha(x, y, kwargs_i, k=[0, 2])
+            npt.assert_almost_equal(alpha_x[i], alpha_x_i, decimal=10)
+            npt.assert_almost_equal(alpha_y[i], alpha_y_i, decimal=10)
+
     def test_mass_2d(self):
         lensModel = SinglePlane(["GAUSSIAN"])
         kwargs = [{"amp": 1.0, "sigma": 2.0, "center_x": 0.0, "center_y": 0.0}]
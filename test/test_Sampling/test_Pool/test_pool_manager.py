@@ -0,0 +1,98 @@
+import os
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Sampling.Pool.pool_manager import PoolManager
+
+
+class _Likelihood(object):
+    def __init__(self, center):
+        self.center = center
+        self.data = np.ones(1000)
+
+    def logL(self, args):
+        return -np.sum((np.array(args) - self.center) ** 2)
+
+    def pid(self, args):
+        return os.getpid()
+
+    def data_writeable(self, args):
+        return self.data.flags.writeable
+
+
+class TestPoolManager(object):
+    def setup_method(self):
+        self.args_list = [[0, 0], [1, 2], [1, 1]]
+
+    def test_map(self):
+        with PoolManager(processes=2) as pool_manager:
+            assert pool_manager.is_master() is True
+            assert pool_manager.is_worker() is False
+            assert pool_manager.size == 2
+            assert pool_manager.started is False
+            likelihood = _Likelihood(center=1)
+            assert pool_manager.set_likelihood(likelihood) is True
+            assert pool_manager.set_likelihood(likelihood) is False
+            logL = pool_manager.map(pool_manager.function("logL"), self.args_list)
+            npt.assert_almost_equal(logL, [-2, -1, 0], decimal=10)
+            assert pool_manager.started is True
+            pid_list = pool_manager.map(pool_manager.function("pid"), range(20))
+            assert os.getpid() not in pid_list
+
+            # updated likelihood
+            function_previous = pool_manager.function("logL")
+            pool_manager.set_likelihood(_Likelihood(center=2))
+            logL = pool_manager.map(pool_manager.function("logL"), self.args_list)
+            npt.assert_almost_equal(logL, [-8, -1, -2], decimal=10)
+            assert pool_manager.version == 2
+            with pytest.raises(RuntimeError):
+                pool_manager.map(function_previous, self.args_list)
+            # evaluation in the main process
+            npt.assert_almost_equal(function_previous([1, 1]), 0, decimal=10)
+        assert pool_manager.started is False
+
+    def test_shared_memory(self):
+        with PoolManager(
+            processes=2, shared_memory=True, shared_memory_min_bytes=1000
+        ) as pool_manager:
+            assert pool_manager.shared_memory_nbytes == 0
+            pool_manager.set_likelihood(_Likelihood(center=1))
+            logL = pool_manager.map(pool_manager.function("logL"), self.args_list)
+            npt.assert_almost_equal(logL, [-2, -1, 0], decimal=10)
+            assert pool_manager.shared_memory_nbytes == 8000
+            writeable = pool_manager.map(
+                pool_manager.function("data_writeable"), range(4)
+            )
+            assert not any(writeable)
+            pool_manager.set_likelihood(_Likelihood(center=2))
+            logL = pool_manager.map(pool_manager.function("logL"), self.args_list)
+            npt.assert_almost_equal(logL, [-8, -1, -2], decimal=10)
+            assert pool_manager.shared_memory_nbytes == 8000
+        assert pool_manager.shared_memory_nbytes == 0
+
+    def test_serial(self):
+        pool_manager = PoolManager(processes=1)
+        pool_manager.set_likelihood(_Likelihood(center=1))
+        results = []
+        logL = pool_manager.map(
+            pool_manager.function("logL"), self.args_list, callback=results.append
+        )
+        npt.assert_almost_equal(logL, [-2, -1, 0], decimal=10)
+        assert results == logL
+        pid_list = pool_manager.map(pool_manager.function("pid"), range(3))
+        assert pid_list == [os.getpid()] * 3
+        assert pool_manager.started is False
+
+
+class TestRaise(object):
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            PoolManager(processes=0)
+        with pytest.raises(ValueError):
+            PoolManager(processes=2).function("logL")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,62 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Sampling.Pool.shared_memory import SharedArrayStore
+
+
+class _Container(object):
+    def __init__(self):
+        self.data = np.arange(10000, dtype=float).reshape(100, 100)
+        self.data_fortran = np.asfortranarray(self.data)
+        self.data_view = self.data[::2, ::3]
+        self.same_data = self.data
+        self.small = np.ones(3)
+        self.objects = np.array([None, 1], dtype=object)
+
+
+class TestSharedArrayStore(object):
+    def setup_method(self):
+        self.container = _Container()
+
+    def test_dumps_loads(self):
+        store = SharedArrayStore(min_bytes=1000)
+        payload = store.dumps(self.container)
+        # data, data_fortran and data_view are shared, same_data is a reference to data
+        assert store.num_arrays == 3
+        assert store.nbytes >= 3 * 10000 * 8 / 6
+        assert len(payload) < 10000
+
+        attached = []
+        container = SharedArrayStore.loads(payload, attached)
+        assert len(attached) == 3
+        npt.assert_almost_equal(container.data, self.container.data, decimal=10)
+        npt.assert_almost_equal(
+            container.data_fortran, self.container.data_fortran, decimal=10
+        )
+        assert container.data_fortran.flags.f_contiguous
+        npt.assert_almost_equal(
+            container.data_view, self.container.data_view, decimal=10
+        )
+        assert container.same_data is container.data
+        assert container.data.flags.writeable is False
+        assert container.small.flags.writeable is True
+        npt.assert_almost_equal(container.small, self.container.small, decimal=10)
+        assert container.objects[0] is None
+
+        del container
+        attached = []
+        store.release()
+        assert store.num_arrays == 0
+        assert store.nbytes == 0
+
+    def test_raise(self):
+        store = SharedArrayStore(min_bytes=1000)
+        payload = store.dumps(self.container)
+        store.release()
+        with pytest.raises(FileNotFoundError):
+            SharedArrayStore.loads(payload)
+
+
+if __name__ == "__main__":
+    pytest.main()
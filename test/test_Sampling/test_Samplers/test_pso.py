@@ -156,6 +156,72 @@ class TestParticleSwarmOptimizer(object):
         print(result)
         npt.assert_almost_equal(result[0], 0, decimal=6)
 
+    def test_setup_vectorized(self):
+        low = np.zeros(2)
+        high = np.ones(2)
+        pso = ParticleSwarmOptimizer(None, low, high, 10, vectorized=True)
+
+        assert pso.swarm is None
+        assert pso.positions.shape == (10, 2)
+        assert (pso.positions >= low).all()
+        assert (pso.positions <= high).all()
+        assert (pso.velocities == 0).all()
+        assert (pso.fitness == 0).all()
+        assert (pso.personal_best_fitness == -np.inf).all()
+        assert pso.global_best.fitness == -np.inf
+
+    def test_sample_vectorized(self):
+        np.random.seed(42)
+        n_particle = 100
+        n_iterations = 100
+        num_calls = []
+
+        def ln_probability(x):
+            num_calls.append(1)
+            assert np.shape(x) == (n_particle, 2)
+            return -np.sum((np.array(x) - np.array([0.5, -1])) ** 2, axis=1)
+
+        pso = ParticleSwarmOptimizer(
+            func=ln_probability,
+            low=[-10, -10],
+            high=[10, 10],
+            particle_count=n_particle,
+            vectorized=True,
+        )
+        init_pos = np.array([1, 1])
+        pso.set_global_best(
+            init_pos, [0, 0], ln_probability([init_pos] * n_particle)[0]
+        )
+        num_calls.clear()
+        num_iter = 0
+        for positions in pso.sample(n_iterations, verbose=False):
+            assert np.shape(positions) == (n_particle, 2)
+            num_iter += 1
+        assert len(num_calls) == num_iter + 1
+        npt.assert_almost_equal(pso.global_best.position, [0.5, -1], decimal=4)
+        assert np.all(pso.personal_best_fitness >= pso.fitness)
+
+    def test_optimize_vectorized_pool(self):
+        from schwimmbad.serial import SerialPool
+
+        np.random.seed(41)
+
+        def ln_probability(x):
+            return -np.sum(np.array(x) ** 2, axis=1)
+
+        pso = ParticleSwarmOptimizer(
+            ln_probability,
+            low=[-1, -1, -1],
+            high=[1, 1, 1],
+            particle_count=20,
+            pool=SerialPool(),
+            vectorized=True,
+        )
+        result, [chi2_list, pos_list, vel_list] = pso.optimize(20, verbose=False)
+        assert len(result) == 3
+        assert len(chi2_list) == len(pos_list) == len(vel_list)
+        assert pso.global_best.fitness == np.max(chi2_list)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -195,6 +195,124 @@ class TestLikelihoodModule(object):
         num_data_evaluate = self.Likelihood.num_data
         npt.assert_almost_equal(logL / num_data_evaluate, -1 / 2.0, decimal=1)
 
+    def test_logL_vectorized(self):
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        logL_list = self.Likelihood.logL_vectorized(np.array([args, args]))
+        assert len(logL_list) == 2
+        npt.assert_almost_equal(logL_list[0], self.Likelihood.logL(args), decimal=8)
+        npt.assert_almost_equal(logL_list[1], logL_list[0], decimal=8)
+
+    def test_response_cache(self):
+        kwargs_likelihood = {"source_marg": True, "check_bounds": False}
+        likelihood = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            **kwargs_likelihood,
+        )
+        likelihood_cache = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            response_cache=True,
+            **kwargs_likelihood,
+        )
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        logL = likelihood.logL(args)
+        for i in range(2):
+            npt.assert_almost_equal(likelihood_cache.logL(args), logL, decimal=8)
+
+    def test_emulation(self):
+        kwargs_model = dict(self.kwargs_model, lens_model_list=["SPEP", "TNFW"])
+        param_class = Param(kwargs_model, num_point_source_list=[4], solver_type="NONE")
+        kwargs_lens = self.kwargs_lens + [
+            {"Rs": 2.0, "alpha_Rs": 0.1, "r_trunc": 10, "center_x": 0, "center_y": 0}
+        ]
+        args = param_class.kwargs2args(
+            kwargs_lens=kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+        )
+        kwargs_likelihood = {"source_marg": False, "check_bounds": False}
+        likelihood = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=kwargs_model,
+            param_class=param_class,
+            **kwargs_likelihood,
+        )
+        likelihood_emulated = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=kwargs_model,
+            param_class=param_class,
+            kwargs_emulation={"accuracy": 0.00001},
+            **kwargs_likelihood,
+        )
+        logL = likelihood.logL(args)
+        logL_emulated = likelihood_emulated.logL(args)
+        npt.assert_almost_equal(logL_emulated / logL, 1, decimal=3)
+        image_model = likelihood_emulated.image_likelihood.imSim
+        error_list = image_model.LensModel.emulation_error_list
+        assert error_list[0] is None
+        assert error_list[1] < 0.00001
+
+    def test_profiling(self):
+        kwargs_likelihood = {
+            "source_marg": True,
+            "image_position_likelihood": True,
+            "profiler": True,
+        }
+        likelihood = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            **kwargs_likelihood,
+        )
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        logL = likelihood.logL(args)
+        npt.assert_almost_equal(logL, likelihood.logL(args), decimal=8)
+        report = likelihood.profiling_report(reset=True)
+        for stage in [
+            "args2kwargs",
+            "log_likelihood",
+            "prior_logL",
+            "image_logL",
+            "position_logL",
+            "ray_shooting",
+            "source_evaluation",
+            "lens_light_evaluation",
+            "convolution",
+            "linear_solve",
+            "chi2",
+        ]:
+            assert report[stage]["calls"] >= 2
+            assert report[stage]["total_time"] >= 0
+        assert (
+            report["image_logL"]["total_time"] <= report["log_likelihood"]["total_time"]
+        )
+        assert likelihood.profiling_report() == {}
+
+        # profiling is turned off by default
+        assert self.Likelihood.profiling_report() == {}
+
     def test_time_delay_likelihood(self):
         kwargs_likelihood = {
             "time_delay_likelihood": True,
@@ -10,6 +10,8 @@ from lenstronomy.Sampling.parameters import Param
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.Sampling.sampler import Sampler, choose_pool
+from lenstronomy.Sampling.Pool.pool_manager import PoolManager
+import numpy.testing as npt
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
 
@@ -148,6 +150,45 @@ class TestSampler(object):
 
         assert len(result) == 16
 
+    def test_pso_vectorized(self):
+        result, chain = self.sampler.pso(
+            n_particles=4,
+            n_iterations=2,
+            lower_start=None,
+            upper_start=None,
+            threadCount=1,
+            init_pos=None,
+            mpi=False,
+            print_key="PSO",
+            verbose=False,
+            vectorized=True,
+        )
+        assert len(result) == 16
+        assert len(chain[0]) == len(chain[1])
+
+    def test_pool_manager(self):
+        mean_start = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+        )
+        sigma_start = np.ones_like(mean_start) * 0.1
+        with PoolManager(processes=2) as pool_manager:
+            sampler = Sampler(
+                likelihoodModule=self.Likelihood, pool_manager=pool_manager
+            )
+            result, chain = sampler.pso(
+                n_particles=4, n_iterations=2, verbose=False, vectorized=True
+            )
+            assert len(result) == 16
+            samples, dist = sampler.mcmc_emcee(36, 2, 2, mean_start, sigma_start)
+            assert len(samples) == 36 * 2
+            npt.assert_almost_equal(
+                dist[0], self.Likelihood.logL(samples[0]), decimal=8
+            )
+            # the likelihood is only transferred once to the workers
+            assert pool_manager.version == 1
+
     def test_mcmc_emcee(self):
         n_walkers = 36
         n_run = 2
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from lenstronomy.Util.cache_util import KwargsCache, GridCache, kwargs_equal
+
+
+def test_kwargs_equal():
+    kwargs = [{"theta_E": 1.0, "center_x": np.array([0, 1])}, {"gamma1": 0.1}]
+    kwargs_copy = [{"theta_E": 1.0, "center_x": np.array([0, 1])}, {"gamma1": 0.1}]
+    assert kwargs_equal(kwargs, kwargs_copy)
+    assert kwargs_equal(None, None)
+    assert not kwargs_equal(kwargs, None)
+    assert not kwargs_equal(kwargs, kwargs_copy[:1])
+    kwargs_copy[0]["center_x"] = np.array([0, 2])
+    assert not kwargs_equal(kwargs, kwargs_copy)
+    kwargs_copy[0]["center_x"] = np.array([0, 1, 2])
+    assert not kwargs_equal(kwargs, kwargs_copy)
+    assert not kwargs_equal({"a": 1}, {"b": 1})
+    assert not kwargs_equal({"a": 1}, [1])
+    assert kwargs_equal((1, "a"), [1, "a"])
+
+
+class TestKwargsCache(object):
+    def setup_method(self):
+        self.cache = KwargsCache()
+        self.x = np.linspace(0, 1, 10)
+
+    def test_get_set(self):
+        kwargs = [{"theta_E": 1.0}]
+        assert self.cache.get((self.x,), kwargs) is None
+        self.cache.set("value", (self.x,), kwargs)
+        assert self.cache.get((self.x,), kwargs) == "value"
+        assert self.cache.get((self.x,), [{"theta_E": 1.0}]) == "value"
+        # changes in place are detected
+        kwargs[0]["theta_E"] = 2.0
+        assert self.cache.get((self.x,), kwargs) is None
+        # arrays are compared by identity
+        assert self.cache.get((self.x.copy(),), [{"theta_E": 1.0}]) is None
+        assert self.cache.hits == 2
+        assert self.cache.misses == 3
+        self.cache.reset()
+        assert self.cache.get((self.x,), [{"theta_E": 1.0}]) is None
+
+
+class TestGridCache(object):
+    def setup_method(self):
+        self.cache = GridCache(max_grids=2)
+        self.x = np.linspace(0, 1, 10)
+
+    def test_get_set(self):
+        kwargs = [{"theta_E": 1.0}]
+        assert self.cache.get((self.x,), kwargs) is None
+        self.cache.set("value", (self.x,), kwargs)
+        # arrays are compared by value
+        assert self.cache.get((self.x.copy(),), kwargs) == "value"
+        assert self.cache.get((self.x + 1,), kwargs) is None
+        self.cache.set("value 2", (self.x + 1,), kwargs)
+        self.cache.set("value 3", (self.x + 2,), kwargs)
+        assert self.cache.num_grids == 2
+        assert self.cache.get((self.x,), kwargs) is None
+        assert self.cache.get((self.x + 1,), kwargs) == "value 2"
+        assert self.cache.get((self.x[:5] + 1,), kwargs) is None
+
+        # changes of the keyword arguments delete all grids
+        kwargs[0]["theta_E"] = 2.0
+        assert self.cache.get((self.x + 2,), kwargs) is None
+        self.cache.set("value 4", (self.x,), kwargs)
+        assert self.cache.num_grids == 1
+        assert self.cache.get((self.x,), kwargs) == "value 4"
+        assert self.cache.hits == 3
+        self.cache.reset()
+        assert self.cache.num_grids == 0
+        assert self.cache.get((self.x,), kwargs) is None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -371,6 +371,17 @@ def test_re_size():
     npt.assert_equal(grid_same, grid)
 
 
+def test_re_size_batch():
+    grid = np.zeros((3, 200, 100))
+    grid[:, 100, 50] = 4
+    grid[1, 20, 10] = 8
+    grid_small = image_util.re_size_batch(grid, factor=2)
+    for i in range(3):
+        npt.assert_equal(grid_small[i], image_util.re_size(grid[i], factor=2))
+    grid_same = image_util.re_size_batch(grid, factor=1)
+    npt.assert_equal(grid_same, grid)
+
+
 def test_stack_images():
     numPix = 10
     image1 = np.ones((numPix, numPix))
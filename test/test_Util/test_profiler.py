@@ -0,0 +1,69 @@
+import time
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Util.profiler import Profiler, NullProfiler
+
+
+class TestProfiler(object):
+    def setup_method(self):
+        self.profiler = Profiler()
+
+    def test_timer(self):
+        for i in range(3):
+            with self.profiler.timer("sleep"):
+                time.sleep(0.001)
+        with self.profiler.timer("pass"):
+            pass
+        report = self.profiler.report()
+        assert list(report.keys()) == ["sleep", "pass"]
+        assert report["sleep"]["calls"] == 3
+        assert report["sleep"]["total_time"] >= 0.003
+        npt.assert_almost_equal(
+            report["sleep"]["mean_time"], report["sleep"]["total_time"] / 3, decimal=10
+        )
+        assert report["pass"]["calls"] == 1
+
+        # exceptions are propagated and the time is recorded
+        with pytest.raises(ValueError):
+            with self.profiler.timer("error"):
+                raise ValueError()
+        assert self.profiler.report()["error"]["calls"] == 1
+
+        self.profiler.reset()
+        assert self.profiler.report() == {}
+
+    def test_add(self):
+        self.profiler.add("stage", 1.0)
+        self.profiler.add("stage", 2.0, calls=3)
+        report = self.profiler.report()
+        assert report["stage"]["calls"] == 4
+        npt.assert_almost_equal(report["stage"]["total_time"], 3.0, decimal=10)
+        npt.assert_almost_equal(report["stage"]["mean_time"], 0.75, decimal=10)
+
+    def test_format_report(self):
+        self.profiler.add("ray_shooting", 0.5, calls=10)
+        table = Profiler.format_report(self.profiler.report(), title="test")
+        lines = table.split("\n")
+        assert lines[0] == "test"
+        assert "ray_shooting" in lines[2]
+        assert "50.0000" in lines[2]
+        self.profiler.print_report()
+
+        table = Profiler.format_report({})
+        assert len(table.split("\n")) == 1
+
+
+class TestNullProfiler(object):
+    def test_null_profiler(self):
+        profiler = NullProfiler()
+        assert profiler.enabled is False
+        with profiler.timer("stage"):
+            pass
+        profiler.add("stage", 1.0)
+        profiler.reset()
+        assert profiler.report() == {}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,125 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+import lenstronomy.Util.simulation_util as sim_util
+from lenstronomy.Data.imaging_data import ImageData
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_model import ImageModel
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LightModel.light_model import LightModel
+from lenstronomy.Workflow.adaptive_supersampling import AdaptiveSupersampling
+
+
+class TestAdaptiveSupersampling(object):
+    def setup_method(self):
+        numPix = 40
+        kwargs_data = sim_util.data_configure_simple(
+            numPix, deltaPix=0.05, exposure_time=1000, background_rms=0.01
+        )
+        data_class = ImageData(**kwargs_data)
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.1, "pixel_size": 0.05}
+        self.kwargs_lens = [
+            {"theta_E": 0.6, "e1": 0.1, "e2": 0, "center_x": 0, "center_y": 0}
+        ]
+        self.kwargs_source = [
+            {
+                "amp": 10,
+                "R_sersic": 0.05,
+                "n_sersic": 1,
+                "center_x": 0.05,
+                "center_y": 0,
+            }
+        ]
+        self.kwargs_lens_light = [
+            {"amp": 10, "R_sersic": 0.3, "n_sersic": 4, "center_x": 0, "center_y": 0}
+        ]
+        self.kwargs_model = {
+            "lens_model_list": ["SIE"],
+            "source_light_model_list": ["SERSIC"],
+            "lens_light_model_list": ["SERSIC"],
+        }
+        kwargs_numerics = {"supersampling_factor": 5}
+        image_model = ImageModel(
+            data_class,
+            PSF(**kwargs_psf),
+            LensModel(["SIE"]),
+            LightModel(["SERSIC"]),
+            LightModel(["SERSIC"]),
+            kwargs_numerics=kwargs_numerics,
+        )
+        image_sim = sim_util.simulate_simple(
+            image_model, self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light
+        )
+        kwargs_data["image_data"] = image_sim
+        self.multi_band_list = [[kwargs_data, kwargs_psf, kwargs_numerics]]
+        self.kwargs_params = {
+            "kwargs_lens": self.kwargs_lens,
+            "kwargs_source": self.kwargs_source,
+            "kwargs_lens_light": self.kwargs_lens_light,
+        }
+        self.adaptive = AdaptiveSupersampling(self.multi_band_list, self.kwargs_model)
+
+    def test_supersampled_indexes(self):
+        error, model = self.adaptive.supersampling_error(
+            self.kwargs_params, supersampling_factor=5
+        )
+        assert error.shape == (40, 40)
+        assert np.all(error >= 0)
+        # the lens light center and the arc are sampled, the outskirts are not
+        assert error[20, 20] > error[0, 0]
+        supersampled = self.adaptive.supersampled_indexes(
+            self.kwargs_params, supersampling_factor=5, threshold=0.1
+        )
+        assert supersampled.dtype == bool
+        assert supersampled[20, 20]
+        assert not supersampled[0, 0]
+        assert 0 < np.sum(supersampled) < 40**2
+        supersampled_buffer = self.adaptive.supersampled_indexes(
+            self.kwargs_params,
+            supersampling_factor=5,
+            threshold=0.1,
+            num_pixel_buffer=2,
+        )
+        assert np.all(supersampled_buffer[supersampled])
+        assert np.sum(supersampled_buffer) > np.sum(supersampled)
+        # the input is not changed by the linear solver
+        assert self.kwargs_source[0]["amp"] == 10
+
+    def test_update_kwargs_numerics(self):
+        kwargs_numerics = self.adaptive.update_kwargs_numerics(
+            self.kwargs_params, threshold=0.1
+        )
+        assert kwargs_numerics["compute_mode"] == "adaptive"
+        assert kwargs_numerics["supersampling_factor"] == 5
+        assert "supersampled_indexes" not in self.multi_band_list[0][2]
+
+        # the adaptive image is close to the fully super-sampled image
+        data_class = ImageData(**self.multi_band_list[0][0])
+        psf_class = PSF(**self.multi_band_list[0][1])
+        images = []
+        for kwargs_num in [self.multi_band_list[0][2], kwargs_numerics]:
+            image_model = ImageModel(
+                data_class,
+                psf_class,
+                LensModel(["SIE"]),
+                LightModel(["SERSIC"]),
+                LightModel(["SERSIC"]),
+                kwargs_numerics=kwargs_num,
+            )
+            images.append(
+                image_model.image(
+                    self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light
+                )
+            )
+        npt.assert_allclose(images[1], images[0], atol=0.1 * 0.01 * 3)
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            self.adaptive.update_kwargs_numerics(
+                self.kwargs_params, supersampling_factor=1
+            )
+
+
+if __name__ == "__main__":
+    pytest.main()
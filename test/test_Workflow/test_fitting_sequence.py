@@ -383,6 +383,111 @@ class TestFittingSequence(object):
         assert "psf_before" in psf_iteration_list[0]
         assert "psf_after" in psf_iteration_list[0]
 
+    def test_profiling(self):
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            self.kwargs_params,
+            profiling=True,
+        )
+        fitting_list = [
+            ["PSO", {"sigma_scale": 1, "n_particles": 2, "n_iterations": 2}],
+            ["restart", None],
+            ["SIMPLEX", {"n_iterations": 2}],
+        ]
+        fittingSequence.fit_sequence(fitting_list)
+        reports = fittingSequence.profiling_reports
+        assert len(reports) == 2
+        assert reports[0][0] == "PSO"
+        assert reports[1][0] == "SIMPLEX"
+        report = reports[0][1]
+        assert report["log_likelihood"]["calls"] >= 6
+        for stage in ["image_logL", "ray_shooting", "linear_solve", "chi2"]:
+            assert stage in report
+
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            self.kwargs_params,
+        )
+        fittingSequence.fit_sequence(fitting_list[0:1])
+        assert fittingSequence.profiling_reports == []
+
+    def test_adaptive_supersampling(self):
+        multi_band_list = copy.deepcopy(self.kwargs_data_joint["multi_band_list"])
+        multi_band_list[0][2]["supersampling_factor"] = 3
+        kwargs_data_joint = {"multi_band_list": multi_band_list}
+        fittingSequence = FittingSequence(
+            kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            self.kwargs_params,
+            verbose=False,
+        )
+        fitting_list = [
+            ["adaptive_supersampling", {"threshold": 0.5, "rebuild": True}],
+            ["SIMPLEX", {"n_iterations": 2}],
+        ]
+        fittingSequence.fit_sequence(fitting_list)
+        kwargs_numerics = fittingSequence.multi_band_list[0][2]
+        assert kwargs_numerics["compute_mode"] == "adaptive"
+        assert kwargs_numerics["supersampling_factor"] == 3
+        supersampled_indexes = kwargs_numerics["supersampled_indexes"]
+        assert supersampled_indexes.shape == (10, 10)
+        assert kwargs_data_joint["multi_band_list"][0][2] is kwargs_numerics
+        logL = fittingSequence.best_fit_likelihood()
+        assert np.isfinite(logL)
+
+        fittingSequence.adaptive_supersampling(
+            supersampling_factor=2, compute_bands=[False]
+        )
+        assert fittingSequence.multi_band_list[0][2]["supersampling_factor"] == 3
+
+    def test_pool_processes(self):
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            self.kwargs_params,
+            pool_processes=2,
+            pool_shared_memory=True,
+            verbose=False,
+        )
+        pool_manager = fittingSequence.pool_manager
+        assert pool_manager.size == 2
+        likelihood = fittingSequence._sampling_likelihood()
+        assert fittingSequence._sampling_likelihood() is likelihood
+        fitting_list = [
+            ["PSO", {"sigma_scale": 1, "n_particles": 4, "n_iterations": 2}],
+            [
+                "PSO",
+                {"sigma_scale": 1, "n_particles": 4, "n_iterations": 2},
+            ],
+        ]
+        chain_list = fittingSequence.fit_sequence(fitting_list)
+        assert len(chain_list) == 2
+        assert pool_manager.started is True
+        assert pool_manager.version <= 2
+        fittingSequence.close_pool()
+        assert pool_manager.started is False
+        assert pool_manager.shared_memory_nbytes == 0
+
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            self.kwargs_params,
+        )
+        assert fittingSequence.pool_manager is None
+        fittingSequence.close_pool()
+
     def test_cobaya(self):
         np.random.seed(42)
 
@@ -299,6 +299,14 @@ class TestPSFIteration(object):
         assert diff_old > diff_new
         assert diff_new < 0.01
         assert "psf_variance_map" in kwargs_psf_new
+        # the static lens mode is only turned on during the iteration
+        assert self.imageModel.static_lens is False
+        # ... and also turned off again when the iteration fails
+        with pytest.raises(TypeError):
+            self.psf_fitting.update_iterative(
+                kwargs_psf, kwargs_params, wrong_keyword=True
+            )
+        assert self.imageModel.static_lens is False
 
         kwargs_psf_new = self.psf_fitting.update_iterative(
             kwargs_psf,